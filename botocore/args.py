@@ -24,8 +24,11 @@ import socket
 import botocore.exceptions
 import botocore.parsers
 import botocore.serialize
+from botocore.asynchttpsession import AsyncioHTTPSession
 from botocore.config import Config
-from botocore.endpoint import EndpointCreator
+from botocore.endpoint import AsyncEndpoint, EndpointCreator
+from botocore.http2session import HTTP2Session
+from botocore.httpsession import DNSCache
 from botocore.regions import EndpointResolverBuiltins as EPRBuiltins
 from botocore.regions import EndpointRulesetResolver
 from botocore.signers import RequestSigner
@@ -117,6 +120,7 @@ class ClientArgsCreator:
         auth_token=None,
         endpoints_ruleset_data=None,
         partition_data=None,
+        is_async=False,
     ):
         final_args = self.compute_client_args(
             service_model,
@@ -159,25 +163,57 @@ class ClientArgsCreator:
         config_kwargs['s3'] = s3_config
         new_config = Config(**config_kwargs)
         endpoint_creator = EndpointCreator(event_emitter)
+        response_parser_factory = self._response_parser_factory
+        parser_defaults = {}
+        if new_config.compile_parsers:
+            parser_defaults['compiled'] = True
+        if new_config.stream_xml_parsing:
+            parser_defaults['stream_xml'] = True
+        if new_config.lazy_response_parsing:
+            parser_defaults['lazy'] = True
+        if parser_defaults:
+            # Each client gets its own factory so that the parse plans
+            # are shared by all of the client's responses.
+            if response_parser_factory is None:
+                response_parser_factory = (
+                    botocore.parsers.ResponseParserFactory()
+                )
+            response_parser_factory = (
+                response_parser_factory.with_parser_defaults(**parser_defaults)
+            )
 
+        endpoint_kwargs = {}
+        if is_async:
+            if new_config.http_protocol == 'h2':
+                raise botocore.exceptions.InvalidConfigError(
+                    error_msg='HTTP/2 is not supported by async clients.'
+                )
+            endpoint_kwargs['endpoint_cls'] = AsyncEndpoint
+            endpoint_kwargs['http_session_cls'] = AsyncioHTTPSession
+        elif new_config.http_protocol == 'h2':
+            endpoint_kwargs['http_session_cls'] = HTTP2Session
+        if new_config.dns_cache is not None:
+            endpoint_kwargs['dns_cache'] = DNSCache(**new_config.dns_cache)
         endpoint = endpoint_creator.create_endpoint(
             service_model,
             region_name=endpoint_region_name,
             endpoint_url=endpoint_config['endpoint_url'],
             verify=verify,
-            response_parser_factory=self._response_parser_factory,
+            response_parser_factory=response_parser_factory,
             max_pool_connections=new_config.max_pool_connections,
             proxies=new_config.proxies,
             timeout=(new_config.connect_timeout, new_config.read_timeout),
             socket_options=socket_options,
             client_cert=new_config.client_cert,
             proxies_config=new_config.proxies_config,
+            **endpoint_kwargs,
         )
 
         # Emit event to allow service-specific or customer customization of serializer kwargs
         event_name = f'creating-serializer.{service_name}'
         serializer_kwargs = {
-            'timestamp_precision': botocore.serialize.TIMESTAMP_PRECISION_DEFAULT
+            'timestamp_precision': botocore.serialize.TIMESTAMP_PRECISION_DEFAULT,
+            'compiled': bool(new_config.compile_serializers),
         }
         event_emitter.emit(
             event_name,
@@ -190,6 +226,7 @@ class ClientArgsCreator:
             protocol,
             parameter_validation,
             timestamp_precision=serializer_kwargs['timestamp_precision'],
+            compiled=serializer_kwargs['compiled'],
         )
         response_parser = botocore.parsers.create_parser(protocol)
 
@@ -209,6 +246,8 @@ class ClientArgsCreator:
             account_id_endpoint_mode,
             s3_disable_express_session_auth,
             auth_scheme_preference,
+            compile_ruleset=bool(new_config.compile_endpoint_rulesets),
+            endpoint_cache_size=new_config.endpoint_cache_size,
         )
 
         # Copy the session's user agent factory and adds client configuration.
@@ -312,6 +351,9 @@ class ClientArgsCreator:
                 disable_request_compression=(
                     client_config.disable_request_compression
                 ),
+                request_compression_codecs=(
+                    client_config.request_compression_codecs
+                ),
                 client_context_params=client_config.client_context_params,
                 sigv4a_signing_region_set=(
                     client_config.sigv4a_signing_region_set
@@ -324,6 +366,16 @@ class ClientArgsCreator:
                 ),
                 account_id_endpoint_mode=client_config.account_id_endpoint_mode,
                 auth_scheme_preference=client_config.auth_scheme_preference,
+                compile_serializers=client_config.compile_serializers,
+                compile_parsers=client_config.compile_parsers,
+                stream_xml_parsing=client_config.stream_xml_parsing,
+                lazy_response_parsing=client_config.lazy_response_parsing,
+                compile_endpoint_rulesets=(
+                    client_config.compile_endpoint_rulesets
+                ),
+                endpoint_cache_size=client_config.endpoint_cache_size,
+                http_protocol=client_config.http_protocol,
+                dns_cache=client_config.dns_cache,
                 s3_disable_express_session_auth=(
                     client_config.s3.get('disable_s3_express_session_auth')
                     if client_config.s3 is not None
@@ -343,6 +395,9 @@ class ClientArgsCreator:
         )
         self._compute_signature_version_config(client_config, config_kwargs)
         self._compute_s3_disable_express_session_auth(config_kwargs)
+        self._compute_endpoint_cache_size(config_kwargs)
+        self._compute_http_protocol(config_kwargs)
+        self._compute_dns_cache(config_kwargs)
         s3_config = self.compute_s3_config(client_config)
 
         is_s3_service = self._is_s3_service(service_name)
@@ -678,6 +733,10 @@ class ClientArgsCreator:
             disabled = ensure_boolean(disabled)
         config_kwargs['disable_request_compression'] = disabled
 
+        codecs = config_kwargs.get('request_compression_codecs')
+        if codecs is not None:
+            self._validate_request_compression_codecs(codecs)
+
     def _compute_s3_disable_express_session_auth(self, config_kwargs):
         disable_express = config_kwargs.get('s3_disable_express_session_auth')
         if disable_express is None:
@@ -692,6 +751,90 @@ class ClientArgsCreator:
             disable_express
         )
 
+    def _compute_endpoint_cache_size(self, config_kwargs):
+        cache_size = config_kwargs.get('endpoint_cache_size')
+        if cache_size is None:
+            return
+        if (
+            not isinstance(cache_size, int)
+            or isinstance(cache_size, bool)
+            or cache_size < 1
+        ):
+            raise botocore.exceptions.InvalidConfigError(
+                error_msg=(
+                    f'Invalid value "{cache_size}" for endpoint_cache_size. '
+                    'Value must be a positive integer.'
+                )
+            )
+
+    def _compute_http_protocol(self, config_kwargs):
+        http_protocol = config_kwargs.get('http_protocol')
+        if http_protocol is None:
+            return
+        if http_protocol not in ('http/1.1', 'h2'):
+            raise botocore.exceptions.InvalidConfigError(
+                error_msg=(
+                    f'Invalid value "{http_protocol}" for http_protocol. '
+                    'Valid values are: http/1.1, h2.'
+                )
+            )
+
+    def _compute_dns_cache(self, config_kwargs):
+        dns_cache = config_kwargs.get('dns_cache')
+        if dns_cache is None:
+            return
+        if not isinstance(dns_cache, dict):
+            raise botocore.exceptions.InvalidConfigError(
+                error_msg=(
+                    f'Invalid value "{dns_cache}" for dns_cache. Value must '
+                    'be a dictionary.'
+                )
+            )
+        valid_options = {
+            'ttl': 'a positive number',
+            'negative_ttl': 'a non-negative number',
+            'max_size': 'a positive integer',
+        }
+        for key, value in dns_cache.items():
+            if key not in valid_options:
+                raise botocore.exceptions.InvalidConfigError(
+                    error_msg=(
+                        f'Invalid dns_cache option "{key}". Valid options '
+                        f'are: {", ".join(valid_options)}.'
+                    )
+                )
+            valid_types = int if key == 'max_size' else (int, float)
+            if (
+                not isinstance(value, valid_types)
+                or isinstance(value, bool)
+                or value < 0
+                or (value == 0 and key != 'negative_ttl')
+            ):
+                raise botocore.exceptions.InvalidConfigError(
+                    error_msg=(
+                        f'Invalid value "{value}" for dns_cache option '
+                        f'{key}. Value must be {valid_options[key]}.'
+                    )
+                )
+
+    def _validate_request_compression_codecs(self, codecs):
+        if not isinstance(codecs, dict):
+            raise botocore.exceptions.InvalidConfigError(
+                error_msg=(
+                    f'Invalid value "{codecs}" for '
+                    'request_compression_codecs. Value must be a dictionary.'
+                )
+            )
+        for encoding, codec in codecs.items():
+            if not callable(getattr(codec, 'compress', None)):
+                raise botocore.exceptions.InvalidConfigError(
+                    error_msg=(
+                        f'Invalid codec "{codec}" for encoding {encoding} '
+                        'in request_compression_codecs. Codecs must have a '
+                        'compress method.'
+                    )
+                )
+
     def _validate_min_compression_size(self, min_size):
         min_allowed_min_size = 1
         max_allowed_min_size = 1048576
@@ -739,6 +882,8 @@ class ClientArgsCreator:
         account_id_endpoint_mode,
         s3_disable_express_session_auth,
         auth_scheme_preference,
+        compile_ruleset=False,
+        endpoint_cache_size=None,
     ):
         if endpoints_ruleset_data is None:
             return None
@@ -796,6 +941,8 @@ class ClientArgsCreator:
             use_ssl=is_secure,
             requested_auth_scheme=sig_version,
             auth_scheme_preference=auth_scheme_preference,
+            compile_ruleset=compile_ruleset,
+            cache_size=endpoint_cache_size,
         )
 
     def compute_endpoint_resolver_builtin_defaults(
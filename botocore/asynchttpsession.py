@@ -0,0 +1,676 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""An HTTP session that sends requests without blocking the event loop.
+
+:class:`AsyncioHTTPSession` implements the same ``send(request)`` contract
+as :class:`botocore.httpsession.URLLib3Session`, except that ``send`` and
+``close`` are coroutines.  It speaks HTTP/1.1 directly over
+``asyncio`` streams, so it has no dependencies outside of the standard
+library.
+"""
+
+import asyncio
+import contextlib
+import functools
+import io
+import logging
+import os
+import socket
+import ssl
+import time
+
+from urllib3.util.connection import allowed_gai_family
+
+from botocore.awsrequest import AWSResponse, HeadersDict
+from botocore.compat import ensure_bytes, urlparse
+from botocore.exceptions import (
+    BotoCoreError,
+    ConnectionClosedError,
+    ConnectTimeoutError,
+    EndpointConnectionError,
+    HTTPClientError,
+    ProxyConnectionError,
+    ReadTimeoutError,
+    SSLError,
+)
+from botocore.httpsession import (
+    DEFAULT_TIMEOUT,
+    MAX_POOL_CONNECTIONS,
+    PoolStatsRecorder,
+    ProxyConfiguration,
+    create_urllib3_context,
+    get_cert_path,
+    mask_proxy_url,
+)
+
+logger = logging.getLogger(__name__)
+BUFFER_SIZE = 1024 * 128
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+
+class _BufferedRawResponse:
+    """The raw body of a response read by :class:`AsyncioHTTPSession`.
+
+    Bodies of responses that aren't streamed are read in full before
+    ``send`` returns, so this provides the parts of the urllib3 response
+    interface botocore relies on over an in-memory buffer.
+    """
+
+    def __init__(self, body):
+        self._body = io.BytesIO(body)
+
+    def read(self, amt=None):
+        return self._body.read(amt)
+
+    def stream(self, amt=BUFFER_SIZE):
+        while chunk := self._body.read(amt):
+            yield chunk
+
+    def close(self):
+        self._body.close()
+
+
+@contextlib.contextmanager
+def _translate_errors(request):
+    try:
+        yield
+    except asyncio.TimeoutError as e:
+        raise ReadTimeoutError(endpoint_url=request.url, error=e)
+    except ssl.SSLError as e:
+        raise SSLError(endpoint_url=request.url, error=e)
+    except (
+        ConnectionError,
+        asyncio.IncompleteReadError,
+        asyncio.LimitOverrunError,
+    ) as e:
+        raise ConnectionClosedError(
+            error=e, request=request, endpoint_url=request.url
+        )
+    except HTTPClientError:
+        raise
+    except Exception as e:
+        message = 'Exception received when sending asyncio HTTP request'
+        logger.debug(message, exc_info=True)
+        raise HTTPClientError(error=e)
+
+
+class _StreamingRawResponse:
+    """The raw body of a response streamed by :class:`AsyncioHTTPSession`.
+
+    The body is read from the connection as it's consumed, through
+    coroutine versions of the parts of the urllib3 response interface
+    botocore relies on.  As with the blocking session, ``read_timeout``
+    limits how long each read waits for data rather than the time taken to
+    read the whole body.
+
+    ``release`` is called once, with whether the connection can be reused,
+    when the end of the body is read or when the body is closed or fails to
+    be read before then.
+    """
+
+    def __init__(
+        self, reader, request, read_timeout, length, chunked, release
+    ):
+        self._reader = reader
+        self._request = request
+        self._read_timeout = read_timeout
+        # The number of bytes left in the body, or in the current chunk of
+        # a chunked body, or None if the server closing the connection ends
+        # the body.
+        self._remaining = length
+        self._chunked = chunked
+        self._release = release
+        self._buffer = b''
+        self._complete = False
+        if length == 0 and not chunked:
+            self._finish(reusable=True)
+
+    async def read(self, amt=None):
+        if amt is None:
+            chunks = []
+            while chunk := await self.read(BUFFER_SIZE):
+                chunks.append(chunk)
+            return b''.join(chunks)
+        if self._buffer:
+            data = self._buffer[:amt]
+            self._buffer = self._buffer[amt:]
+            return data
+        return await self._read_unbuffered(amt)
+
+    async def stream(self, amt=BUFFER_SIZE):
+        while chunk := await self.read(amt):
+            yield chunk
+
+    async def peek(self, size):
+        """Return up to ``size`` bytes of the body without consuming them.
+
+        Fewer bytes are only returned when the body ends first.
+        """
+        while len(self._buffer) < size:
+            chunk = await self._read_unbuffered(size - len(self._buffer))
+            if not chunk:
+                break
+            self._buffer += chunk
+        return self._buffer[:size]
+
+    def read_buffered(self):
+        """Return and consume the bytes of the body read by ``peek``."""
+        data, self._buffer = self._buffer, b''
+        return data
+
+    def close(self):
+        self._buffer = b''
+        self._finish(reusable=False)
+
+    def _finish(self, reusable):
+        if not self._complete:
+            self._complete = True
+            self._release(reusable)
+
+    async def _read_unbuffered(self, amt):
+        if self._complete or amt <= 0:
+            return b''
+        with _translate_errors(self._request):
+            try:
+                return await self._read_from_connection(amt)
+            except BaseException:
+                self._finish(reusable=False)
+                raise
+
+    def _wait(self, awaitable):
+        return asyncio.wait_for(awaitable, self._read_timeout)
+
+    async def _read_trailers(self):
+        # Discard any trailers up to the terminating empty line.
+        line = None
+        while line not in (b'\r\n', b'\n', b''):
+            line = await self._wait(self._reader.readline())
+
+    async def _read_from_connection(self, amt):
+        if self._chunked and self._remaining == 0:
+            size_line = await self._wait(self._reader.readline())
+            self._remaining = int(size_line.split(b';', 1)[0].strip(), 16)
+            if self._remaining == 0:
+                await self._read_trailers()
+                self._finish(reusable=True)
+                return b''
+        if self._remaining is None:
+            data = await self._wait(self._reader.read(amt))
+            if not data:
+                self._finish(reusable=False)
+            return data
+        data = await self._wait(self._reader.read(min(amt, self._remaining)))
+        if not data:
+            raise asyncio.IncompleteReadError(data, self._remaining)
+        self._remaining -= len(data)
+        if self._remaining == 0:
+            if self._chunked:
+                await self._wait(self._reader.readexactly(2))
+            else:
+                self._finish(reusable=True)
+        return data
+
+
+class _Connection:
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    @property
+    def is_dropped(self):
+        return self.reader.at_eof() or self.writer.is_closing()
+
+    def close(self):
+        self.writer.close()
+
+    async def wait_closed(self):
+        try:
+            await self.writer.wait_closed()
+        except (OSError, ssl.SSLError):
+            # The connection is being discarded, so errors from the
+            # peer closing it first don't matter.
+            pass
+
+
+class AsyncioHTTPSession:
+    """An asyncio HTTP/1.1 client that supports connection pooling.
+
+    This accepts the same arguments as
+    :class:`botocore.httpsession.URLLib3Session`.  Up to
+    ``max_pool_connections`` idle connections are kept per host so they
+    can be reused by later requests.  Any number of requests can be in
+    flight at once; connections beyond the pool size are closed once their
+    response has been read.
+
+    Proxies are not supported and sending a request that would be routed
+    through a proxy raises ``ProxyConnectionError``.
+
+    asyncio opens connections and does their TLS handshake in one step, so
+    the TLS handshake time in the session's pool statistics includes the
+    time taken to open the TCP connection.
+    """
+
+    def __init__(
+        self,
+        verify=True,
+        proxies=None,
+        timeout=None,
+        max_pool_connections=MAX_POOL_CONNECTIONS,
+        socket_options=None,
+        client_cert=None,
+        proxies_config=None,
+        dns_cache=None,
+    ):
+        self._verify = verify
+        self._proxy_config = ProxyConfiguration(
+            proxies=proxies, proxies_settings=proxies_config
+        )
+        if timeout is None:
+            timeout = DEFAULT_TIMEOUT
+        if isinstance(timeout, (int, float)):
+            self._connect_timeout = self._read_timeout = timeout
+        else:
+            self._connect_timeout, self._read_timeout = timeout
+
+        self._cert_file = None
+        self._key_file = None
+        if isinstance(client_cert, str):
+            self._cert_file = client_cert
+        elif isinstance(client_cert, tuple):
+            self._cert_file, self._key_file = client_cert
+
+        self._max_pool_connections = max_pool_connections
+        self._socket_options = socket_options
+        if socket_options is None:
+            self._socket_options = []
+        self._ssl_context = None
+        self._idle_connections = {}
+        self._in_use = {}
+        self._pool_stats = PoolStatsRecorder()
+        self._dns_cache = dns_cache
+
+    def _get_ssl_context(self):
+        if self._ssl_context is None:
+            context = create_urllib3_context()
+            if self._verify:
+                cert_path = get_cert_path(self._verify)
+                if os.path.isdir(cert_path):
+                    context.load_verify_locations(capath=cert_path)
+                else:
+                    context.load_verify_locations(cafile=cert_path)
+                # urllib3 matches hostnames itself, so the vendored
+                # context disables it.  asyncio relies on the context.
+                context.check_hostname = True
+            else:
+                context.verify_mode = ssl.CERT_NONE
+            if self._cert_file:
+                context.load_cert_chain(self._cert_file, self._key_file)
+            self._ssl_context = context
+        return self._ssl_context
+
+    def _path_url(self, parsed_url):
+        path = parsed_url.path
+        if not path:
+            path = '/'
+        if parsed_url.query:
+            path = path + '?' + parsed_url.query
+        return path
+
+    def _host_header(self, parsed_url):
+        host = parsed_url.hostname
+        if ':' in host:
+            host = f'[{host}]'
+        port = parsed_url.port
+        if port is not None and port != DEFAULT_PORTS[parsed_url.scheme]:
+            host = f'{host}:{port}'
+        return host
+
+    def _chunked(self, headers):
+        transfer_encoding = headers.get('Transfer-Encoding', b'')
+        transfer_encoding = ensure_bytes(transfer_encoding)
+        return transfer_encoding.lower() == b'chunked'
+
+    def get_pool_stats(self):
+        """Return statistics of the session's connection pool.
+
+        :rtype: botocore.httpsession.ConnectionPoolStats
+        """
+        return self._pool_stats.get_stats()
+
+    def get_dns_cache_stats(self):
+        """Return statistics of the session's DNS cache.
+
+        :rtype: botocore.httpsession.DNSCacheStats
+        :return: The statistics, or None if the session has no DNS cache.
+        """
+        if self._dns_cache is None:
+            return None
+        return self._dns_cache.get_stats()
+
+    def add_pool_listener(self, listener):
+        """Add a listener called with the session's connection pool events.
+
+        See :class:`botocore.httpsession.PoolStatsRecorder` for the events
+        and their arguments.
+        """
+        self._pool_stats.add_listener(listener)
+
+    async def close(self):
+        idle_connections = self._idle_connections
+        self._idle_connections = {}
+        connections = [
+            connection
+            for connections in idle_connections.values()
+            for connection in connections
+        ]
+        for connection in connections:
+            connection.close()
+        for connection in connections:
+            await connection.wait_closed()
+
+    async def warm_up(self, url, connections=1, parallel=False):
+        """Opens connections to ``url`` and adds them to the pool.
+
+        At most ``max_pool_connections`` idle connections are kept, counting
+        the ones already in the pool.  Connections that fail to open are
+        logged and discarded.
+
+        :param url: The URL of the endpoint to open connections to.
+        :param connections: The number of connections to open.
+        :param parallel: Whether to open the connections concurrently.
+        :return: The number of idle connections to the endpoint in the pool.
+        """
+        key = self._get_pool_key(url)
+        idle = self._idle_connections.setdefault(key, [])
+        for connection in [c for c in idle if c.is_dropped]:
+            idle.remove(connection)
+            connection.close()
+        count = min(connections, self._max_pool_connections) - len(idle)
+        if parallel:
+            results = await asyncio.gather(
+                *(self._open_connection(key, url) for _ in range(count)),
+                return_exceptions=True,
+            )
+        else:
+            results = []
+            for _ in range(count):
+                try:
+                    results.append(await self._open_connection(key, url))
+                except BotoCoreError as e:
+                    results.append(e)
+        for result in results:
+            if isinstance(result, BaseException):
+                if not isinstance(result, BotoCoreError):
+                    raise result
+                logger.debug('Failed to open connection: %s', result)
+            else:
+                self._release_connection(key, result)
+        return len(self._idle_connections.get(key, []))
+
+    def _get_pool_key(self, url):
+        proxy_url = self._proxy_config.proxy_url_for(url)
+        if proxy_url:
+            raise ProxyConnectionError(
+                proxy_url=mask_proxy_url(proxy_url),
+                error='proxies are not supported by AsyncioHTTPSession',
+            )
+        parsed_url = urlparse(url)
+        scheme = parsed_url.scheme
+        return (
+            scheme,
+            parsed_url.hostname,
+            parsed_url.port or DEFAULT_PORTS[scheme],
+        )
+
+    async def send(self, request):
+        key = self._get_pool_key(request.url)
+        parsed_url = urlparse(request.url)
+        # Requests are counted while they wait for a connection too, so
+        # that concurrent requests see the connections opened for others.
+        # They're counted until their response body has been read.
+        self._in_use[key] = self._in_use.get(key, 0) + 1
+        try:
+            connection = await self._get_connection(key, request)
+        except BaseException:
+            self._in_use[key] -= 1
+            raise
+        try:
+            status, headers, raw = await self._send_request(
+                key, connection, request, parsed_url
+            )
+        except BaseException:
+            self._finish_response(key, connection, False, False)
+            raise
+        if request.stream_output and status < 300:
+            return AWSResponse(request.url, status, headers, raw)
+        body = await raw.read()
+        return AWSResponse(
+            request.url, status, headers, _BufferedRawResponse(body)
+        )
+
+    async def _get_connection(self, key, request):
+        idle = self._idle_connections.get(key)
+        while idle:
+            connection = idle.pop()
+            if not connection.is_dropped:
+                self._pool_stats.record_request(key[1], key[2], True, False)
+                return connection
+            connection.close()
+        # Connections opened while the pool's worth of connections are in
+        # use are discarded once the pool is full again.
+        exhausted = self._in_use[key] > self._max_pool_connections
+        self._pool_stats.record_request(key[1], key[2], False, exhausted)
+        return await self._open_connection(key, request.url)
+
+    async def _open_connection(self, key, url):
+        scheme, host, port = key
+        ssl_context = None
+        if scheme == 'https':
+            ssl_context = self._get_ssl_context()
+        try:
+            addresses = await self._resolve(host, port)
+            for address in addresses[:-1]:
+                try:
+                    start = time.perf_counter()
+                    reader, writer = await self._connect(
+                        host, address, port, ssl_context
+                    )
+                    break
+                except ssl.SSLError:
+                    # The other addresses serve the same certificate, so a
+                    # TLS failure isn't retried with them.
+                    raise
+                except (OSError, asyncio.TimeoutError):
+                    logger.debug(
+                        "Failed to connect to %s (%s), trying the next "
+                        "address.",
+                        host,
+                        address,
+                    )
+            else:
+                start = time.perf_counter()
+                reader, writer = await self._connect(
+                    host, addresses[-1], port, ssl_context
+                )
+        except asyncio.TimeoutError as e:
+            raise ConnectTimeoutError(endpoint_url=url, error=e)
+        except ssl.SSLError as e:
+            raise SSLError(endpoint_url=url, error=e)
+        except (OSError, socket.gaierror) as e:
+            raise EndpointConnectionError(endpoint_url=url, error=e)
+        tls_handshake_time = None
+        if ssl_context is not None:
+            tls_handshake_time = time.perf_counter() - start
+        self._pool_stats.record_connection(host, port, tls_handshake_time)
+        sock = writer.get_extra_info('socket')
+        if sock is not None:
+            for option in self._socket_options:
+                sock.setsockopt(*option)
+        return _Connection(reader, writer)
+
+    async def _resolve(self, host, port):
+        if self._dns_cache is None:
+            return [host]
+        addresses = self._dns_cache.lookup(host)
+        if addresses is None:
+            try:
+                addrinfo = await asyncio.get_running_loop().getaddrinfo(
+                    host,
+                    port,
+                    family=allowed_gai_family(),
+                    type=socket.SOCK_STREAM,
+                )
+            except socket.gaierror as e:
+                self._dns_cache.store_error(host, e)
+                raise
+            addresses = self._dns_cache.store(host, addrinfo)
+        return addresses
+
+    async def _connect(self, host, address, port, ssl_context):
+        return await asyncio.wait_for(
+            asyncio.open_connection(
+                address,
+                port,
+                ssl=ssl_context,
+                server_hostname=host if ssl_context else None,
+                limit=BUFFER_SIZE,
+            ),
+            self._connect_timeout,
+        )
+
+    def _release_connection(self, key, connection):
+        idle = self._idle_connections.setdefault(key, [])
+        if len(idle) < self._max_pool_connections:
+            idle.append(connection)
+        else:
+            logger.debug(
+                "Connection pool is full, discarding connection: %s", key[1]
+            )
+            connection.close()
+            self._pool_stats.record_discard(key[1], key[2])
+
+    async def _send_request(self, key, connection, request, parsed_url):
+        with _translate_errors(request):
+            await self._write_request(connection.writer, request, parsed_url)
+            return await self._read_response(key, connection, request)
+
+    def _finish_response(self, key, connection, keep_alive, reusable):
+        self._in_use[key] -= 1
+        if keep_alive and reusable:
+            self._release_connection(key, connection)
+        else:
+            connection.close()
+
+    async def _write_request(self, writer, request, parsed_url):
+        lines = [
+            f'{request.method} {self._path_url(parsed_url)} HTTP/1.1'.encode(
+                'latin-1'
+            )
+        ]
+        if 'host' not in request.headers:
+            host = self._host_header(parsed_url)
+            lines.append(b'Host: ' + host.encode('idna'))
+        for name, value in request.headers.items():
+            # The body is always written right after the headers, so
+            # requests are never sent with ``Expect: 100-continue``.
+            if name.lower() == 'expect':
+                continue
+            if isinstance(value, str):
+                value = value.encode('latin-1')
+            lines.append(name.encode('latin-1') + b': ' + value)
+        writer.write(b'\r\n'.join(lines) + b'\r\n\r\n')
+        chunked = self._chunked(request.headers)
+        for chunk in self._iter_body(request.body):
+            if chunked:
+                # Written as separate segments so the chunk isn't copied
+                # just to frame it.
+                writer.writelines((b'%x\r\n' % len(chunk), chunk, b'\r\n'))
+            else:
+                writer.write(chunk)
+            await asyncio.wait_for(writer.drain(), self._read_timeout)
+        if chunked:
+            writer.write(b'0\r\n\r\n')
+        await asyncio.wait_for(writer.drain(), self._read_timeout)
+
+    def _iter_body(self, body):
+        if not body:
+            return
+        if isinstance(body, str):
+            yield body.encode('utf-8')
+        elif isinstance(body, (bytes, bytearray, memoryview)):
+            yield bytes(body)
+        elif hasattr(body, 'read'):
+            while chunk := body.read(BUFFER_SIZE):
+                yield ensure_bytes(chunk)
+        else:
+            for chunk in body:
+                if chunk:
+                    yield ensure_bytes(chunk)
+
+    async def _read_line(self, reader):
+        return await asyncio.wait_for(reader.readline(), self._read_timeout)
+
+    async def _read_response(self, key, connection, request):
+        reader = connection.reader
+        # Interim (1xx) responses are skipped; there is no body to read.
+        status = 100
+        while 100 <= status < 200:
+            status_line = await self._read_line(reader)
+            if not status_line:
+                raise ConnectionClosedError(
+                    request=request, endpoint_url=request.url
+                )
+            version, status, _ = self._parse_status_line(status_line)
+            headers = await self._read_headers(reader)
+        connection_header = headers.get('connection', '').lower()
+        keep_alive = version == 'HTTP/1.1' and connection_header != 'close'
+        transfer_encoding = headers.get('transfer-encoding', '').lower()
+        chunked = False
+        if request.method == 'HEAD' or status in (204, 304):
+            length = 0
+        elif transfer_encoding == 'chunked':
+            length = 0
+            chunked = True
+        elif 'content-length' in headers:
+            length = int(headers['content-length'])
+        else:
+            # The body is delimited by the server closing the connection.
+            length = None
+            keep_alive = False
+        release = functools.partial(
+            self._finish_response, key, connection, keep_alive
+        )
+        raw = _StreamingRawResponse(
+            reader, request, self._read_timeout, length, chunked, release
+        )
+        return status, headers, raw
+
+    def _parse_status_line(self, status_line):
+        parts = status_line.decode('latin-1').rstrip('\r\n').split(' ', 2)
+        if len(parts) < 2 or not parts[0].startswith('HTTP/'):
+            raise ValueError(f'Invalid HTTP status line: {status_line!r}')
+        reason = parts[2] if len(parts) == 3 else ''
+        return parts[0], int(parts[1]), reason
+
+    async def _read_headers(self, reader):
+        headers = HeadersDict()
+        while True:
+            line = await self._read_line(reader)
+            if line in (b'\r\n', b'\n', b''):
+                return headers
+            name, _, value = line.decode('latin-1').partition(':')
+            name = name.strip()
+            value = value.strip()
+            if name in headers:
+                value = f'{headers[name]}, {value}'
+            headers[name] = value
@@ -18,6 +18,7 @@ import functools
 import hmac
 import json
 import logging
+import threading
 import time
 from collections.abc import Mapping
 from email.utils import formatdate
@@ -28,6 +29,7 @@ from botocore.compat import (
     HAS_CRT,
     MD5_AVAILABLE,  # noqa: F401
     HTTPHeaders,
+    OrderedDict,
     encodebytes,
     ensure_unicode,
     get_current_datetime,
@@ -76,6 +78,14 @@ SIGNED_HEADERS_BLACKLIST = [
 ]
 UNSIGNED_PAYLOAD = 'UNSIGNED-PAYLOAD'
 STREAMING_UNSIGNED_PAYLOAD_TRAILER = 'STREAMING-UNSIGNED-PAYLOAD-TRAILER'
+# The number of SigV4 signing keys that are cached.  A signing key only
+# changes with the secret key, date, region and service, so one key is
+# needed per day for each set of credentials, region and service in use.
+SIGNING_KEY_CACHE_SIZE = 256
+# The number of percent encoded query string keys and values that are
+# cached for SigV4, and the length of the longest value that is cached.
+QUERY_COMPONENT_CACHE_SIZE = 1024
+MAX_CACHED_QUERY_COMPONENT_LENGTH = 128
 
 
 def _host_from_url(url):
@@ -97,6 +107,48 @@ def _host_from_url(url):
     return host
 
 
+# Derived SigV4 signing keys, shared across signers so that signing a
+# request takes a single HMAC instead of five.  Keys are cached by a digest
+# of the secret key, so that the secret key itself is never kept here.
+_SIGNING_KEYS = OrderedDict()
+_SIGNING_KEYS_LOCK = threading.Lock()
+
+
+def _derive_signing_key(secret_key, date, region_name, service_name):
+    cache_key = (
+        sha256(secret_key.encode('utf-8')).digest(),
+        date,
+        region_name,
+        service_name,
+    )
+    with _SIGNING_KEYS_LOCK:
+        key = _SIGNING_KEYS.get(cache_key)
+        if key is not None:
+            _SIGNING_KEYS.move_to_end(cache_key)
+            return key
+    key = f"AWS4{secret_key}".encode()
+    for msg in (date, region_name, service_name, 'aws4_request'):
+        key = hmac.new(key, msg.encode('utf-8'), sha256).digest()
+    with _SIGNING_KEYS_LOCK:
+        _SIGNING_KEYS[cache_key] = key
+        if len(_SIGNING_KEYS) > SIGNING_KEY_CACHE_SIZE:
+            _SIGNING_KEYS.popitem(last=False)
+    return key
+
+
+@functools.lru_cache(maxsize=QUERY_COMPONENT_CACHE_SIZE)
+def _quote_cached_query_component(value):
+    return quote(value, safe='-_.~')
+
+
+def _quote_query_component(value):
+    # Query string keys and most values, such as ``Action`` and ``Version``,
+    # repeat across requests, so their encoding is cached.
+    if len(value) <= MAX_CACHED_QUERY_COMPONENT_LENGTH:
+        return _quote_cached_query_component(value)
+    return quote(value, safe='-_.~')
+
+
 def _get_body_as_dict(request):
     # For query services, request.data is form-encoded and is already a
     # dict, but for other services such as rest-json it could be a json
@@ -245,11 +297,13 @@ class SigV4Auth(BaseSigner):
         in the StringToSign.
         """
         header_map = HTTPHeaders()
+        has_host = False
         for name, value in request.headers.items():
             lname = name.lower()
             if lname not in SIGNED_HEADERS_BLACKLIST:
                 header_map[lname] = value
-        if 'host' not in header_map:
+                has_host = has_host or lname == 'host'
+        if not has_host:
             # TODO: We should set the host ourselves, instead of relying on our
             # HTTP client to set it for us.
             header_map['host'] = _host_from_url(request.url)
@@ -272,7 +326,10 @@ class SigV4Auth(BaseSigner):
             params = params.items()
         for key, value in params:
             key_val_pairs.append(
-                (quote(key, safe='-_.~'), quote(str(value), safe='-_.~'))
+                (
+                    _quote_query_component(key),
+                    _quote_query_component(str(value)),
+                )
             )
         sorted_key_vals = []
         # Sort by the URI-encoded key names, and in the case of
@@ -305,12 +362,16 @@ class SigV4Auth(BaseSigner):
         case, sorting them in alphabetical order and then joining
         them into a string, separated by newlines.
         """
+        # Group the values of each header in a single pass over the headers.
+        header_values = {}
+        for key, value in headers_to_sign.items():
+            if key in header_values:
+                header_values[key].append(self._header_value(value))
+            else:
+                header_values[key] = [self._header_value(value)]
         headers = []
-        sorted_header_names = sorted(set(headers_to_sign))
-        for key in sorted_header_names:
-            value = ','.join(
-                self._header_value(v) for v in headers_to_sign.get_all(key)
-            )
+        for key in sorted(header_values):
+            value = ','.join(header_values[key])
             headers.append(f'{key}:{ensure_unicode(value)}')
         return '\n'.join(headers)
 
@@ -323,7 +384,7 @@ class SigV4Auth(BaseSigner):
         return ' '.join(value.split())
 
     def signed_headers(self, headers_to_sign):
-        headers = sorted(n.lower().strip() for n in set(headers_to_sign))
+        headers = sorted({n.lower().strip() for n in headers_to_sign})
         return ';'.join(headers)
 
     def _is_streaming_checksum_payload(self, request):
@@ -338,6 +399,13 @@ class SigV4Auth(BaseSigner):
             # When payload signing is disabled, we use this static string in
             # place of the payload checksum.
             return UNSIGNED_PAYLOAD
+        data = request.data
+        if isinstance(data, (bytes, str)):
+            # The checksum of an immutable body is reused when the request
+            # is signed again, e.g. when it's retried.
+            cached = request.context.get('payload_sha256')
+            if cached is not None and cached[0] is data:
+                return cached[1]
         request_body = request.body
         if request_body and hasattr(request_body, 'seek'):
             position = request_body.tell()
@@ -353,7 +421,10 @@ class SigV4Auth(BaseSigner):
         elif request_body:
             # The request serialization has ensured that
             # request.body is a bytes() type.
-            return sha256(request_body).hexdigest()
+            hex_checksum = sha256(request_body).hexdigest()
+            if isinstance(data, (bytes, str)):
+                request.context['payload_sha256'] = (data, hex_checksum)
+            return hex_checksum
         else:
             return EMPTY_SHA256_HASH
 
@@ -372,7 +443,7 @@ class SigV4Auth(BaseSigner):
         path = self._normalize_url_path(urlsplit(request.url).path)
         cr.append(path)
         cr.append(self.canonical_query_string(request))
-        headers_to_sign = self.headers_to_sign(request)
+        headers_to_sign = self._get_headers_to_sign(request)
         cr.append(self.canonical_headers(headers_to_sign) + '\n')
         cr.append(self.signed_headers(headers_to_sign))
         if 'X-Amz-Content-SHA256' in request.headers:
@@ -387,20 +458,15 @@ class SigV4Auth(BaseSigner):
         return normalized_path
 
     def scope(self, request):
-        scope = [self.credentials.access_key]
-        scope.append(request.context['timestamp'][0:8])
-        scope.append(self._region_name)
-        scope.append(self._service_name)
-        scope.append('aws4_request')
-        return '/'.join(scope)
+        return (
+            f'{self.credentials.access_key}/{self.credential_scope(request)}'
+        )
 
     def credential_scope(self, request):
-        scope = []
-        scope.append(request.context['timestamp'][0:8])
-        scope.append(self._region_name)
-        scope.append(self._service_name)
-        scope.append('aws4_request')
-        return '/'.join(scope)
+        return (
+            f'{request.context["timestamp"][0:8]}/{self._region_name}/'
+            f'{self._service_name}/aws4_request'
+        )
 
     def string_to_sign(self, request, canonical_request):
         """
@@ -415,13 +481,12 @@ class SigV4Auth(BaseSigner):
         return '\n'.join(sts)
 
     def signature(self, string_to_sign, request):
-        key = self.credentials.secret_key
-        k_date = self._sign(
-            (f"AWS4{key}").encode(), request.context["timestamp"][0:8]
+        k_signing = _derive_signing_key(
+            self.credentials.secret_key,
+            request.context["timestamp"][0:8],
+            self._region_name,
+            self._service_name,
         )
-        k_region = self._sign(k_date, self._region_name)
-        k_service = self._sign(k_region, self._service_name)
-        k_signing = self._sign(k_service, 'aws4_request')
         return self._sign(k_signing, string_to_sign, hex=True)
 
     def add_auth(self, request):
@@ -432,19 +497,31 @@ class SigV4Auth(BaseSigner):
         # This could be a retry.  Make sure the previous
         # authorization header is removed first.
         self._modify_request_before_signing(request)
-        canonical_request = self.canonical_request(request)
-        logger.debug("Calculating signature using v4 auth.")
-        logger.debug('CanonicalRequest:\n%s', canonical_request)
-        string_to_sign = self.string_to_sign(request, canonical_request)
-        logger.debug('StringToSign:\n%s', string_to_sign)
-        signature = self.signature(string_to_sign, request)
-        logger.debug('Signature:\n%s', signature)
-
-        self._inject_signature_to_request(request, signature)
+        # The headers to sign are selected once, and shared with the steps
+        # below through the request context like the timestamp.
+        request.context['headers_to_sign'] = self.headers_to_sign(request)
+        try:
+            canonical_request = self.canonical_request(request)
+            logger.debug("Calculating signature using v4 auth.")
+            logger.debug('CanonicalRequest:\n%s', canonical_request)
+            string_to_sign = self.string_to_sign(request, canonical_request)
+            logger.debug('StringToSign:\n%s', string_to_sign)
+            signature = self.signature(string_to_sign, request)
+            logger.debug('Signature:\n%s', signature)
+
+            self._inject_signature_to_request(request, signature)
+        finally:
+            del request.context['headers_to_sign']
+
+    def _get_headers_to_sign(self, request):
+        headers_to_sign = request.context.get('headers_to_sign')
+        if headers_to_sign is None:
+            headers_to_sign = self.headers_to_sign(request)
+        return headers_to_sign
 
     def _inject_signature_to_request(self, request, signature):
         auth_str = [f'AWS4-HMAC-SHA256 Credential={self.scope(request)}']
-        headers_to_sign = self.headers_to_sign(request)
+        headers_to_sign = self._get_headers_to_sign(request)
         auth_str.append(
             f"SignedHeaders={self.signed_headers(headers_to_sign)}"
         )
@@ -13,11 +13,15 @@
 # language governing permissions and limitations under the License.
 import functools
 import logging
+import socket
+import threading
+import time
 from collections.abc import Mapping
 
 import urllib3.util
 from urllib3.connection import HTTPConnection, VerifiedHTTPSConnection
 from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
 
 import botocore.utils
 from botocore.compat import (
@@ -63,9 +67,14 @@ class AWSConnection:
 
     """
 
+    # Set by the pool the connection belongs to, see AWSConnectionPool.
+    pool_stats = None
+    dns_cache = None
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._original_response_cls = self.response_class
+        self._socket_connected_at = None
         # This variable is set when we receive an early response from the
         # server. If this value is set to True, any calls to send() are noops.
         # This value is reset to false every time _send_request is called.
@@ -76,6 +85,57 @@ class AWSConnection:
         self._expect_header_set = False
         self._send_called = False
 
+    def _new_conn(self):
+        if self.dns_cache is None:
+            sock = super()._new_conn()
+        else:
+            sock = self._new_conn_from_dns_cache()
+        self._socket_connected_at = time.perf_counter()
+        return sock
+
+    def _new_conn_from_dns_cache(self):
+        host = self._dns_host
+        try:
+            addresses = self.dns_cache.resolve(host, self.port)
+        except socket.gaierror as e:
+            raise NewConnectionError(
+                self, f"Failed to resolve '{host}' ({e})"
+            ) from e
+        # urllib3 connects to _dns_host, while the host name is still used
+        # for the Host header and TLS.  Each address is tried in turn.
+        try:
+            for address in addresses[:-1]:
+                self._dns_host = address
+                try:
+                    return super()._new_conn()
+                except (NewConnectionError, ConnectTimeoutError):
+                    logger.debug(
+                        "Failed to connect to %s (%s), trying the next "
+                        "address.",
+                        host,
+                        address,
+                    )
+            self._dns_host = addresses[-1]
+            return super()._new_conn()
+        finally:
+            self._dns_host = host
+
+    def connect(self):
+        if self.pool_stats is None:
+            return super().connect()
+        self._socket_connected_at = None
+        super().connect()
+        tls_handshake_time = None
+        if isinstance(self, VerifiedHTTPSConnection):
+            # Connecting opens the socket first and then does the TLS
+            # handshake, which is what is left of the time since.
+            tls_handshake_time = (
+                time.perf_counter() - self._socket_connected_at
+            )
+        self.pool_stats.record_connection(
+            self.host, self.port, tls_handshake_time
+        )
+
     def close(self):
         super().close()
         # Reset all of our instance state we were tracking.
@@ -240,11 +300,62 @@ class AWSHTTPSConnection(AWSConnection, VerifiedHTTPSConnection):
     """An HTTPSConnection that supports 100 Continue behavior."""
 
 
-class AWSHTTPConnectionPool(HTTPConnectionPool):
+class AWSConnectionPool:
+    """Mixin for HTTPConnectionPool adding use statistics and a DNS cache.
+
+    ``pool_stats`` is set by the session owning the pool to the object
+    recording them, and ``dns_cache`` to the ``DNSCache`` the pool's
+    connections resolve host names with, if any.  Taking connections from
+    and returning them to the pool is serialized so that whether the pool
+    was empty or full at the time is known exactly.  Pools never block, so
+    an empty pool means all of its ``maxsize`` connections are in use and a
+    new one is opened, which is discarded when it's returned to the full
+    pool.
+    """
+
+    pool_stats = None
+    dns_cache = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+
+    def _new_conn(self):
+        conn = super()._new_conn()
+        conn.dns_cache = self.dns_cache
+        return conn
+
+    def _get_conn(self, timeout=None):
+        stats = self.pool_stats
+        if stats is None:
+            return super()._get_conn(timeout)
+        with self._stats_lock:
+            exhausted = self.pool is not None and self.pool.empty()
+            conn = super()._get_conn(timeout)
+        conn.pool_stats = stats
+        stats.record_request(
+            self.host, self.port, conn.sock is not None, exhausted
+        )
+        return conn
+
+    def _put_conn(self, conn):
+        stats = self.pool_stats
+        if stats is None:
+            return super()._put_conn(conn)
+        with self._stats_lock:
+            discarded = (
+                conn is not None and self.pool is not None and self.pool.full()
+            )
+            super()._put_conn(conn)
+        if discarded:
+            stats.record_discard(self.host, self.port)
+
+
+class AWSHTTPConnectionPool(AWSConnectionPool, HTTPConnectionPool):
     ConnectionCls = AWSHTTPConnection
 
 
-class AWSHTTPSConnectionPool(HTTPSConnectionPool):
+class AWSHTTPSConnectionPool(AWSConnectionPool, HTTPSConnectionPool):
     ConnectionCls = AWSHTTPSConnection
 
 
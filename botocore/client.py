@@ -11,6 +11,7 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 import logging
+import threading
 
 from botocore import (
     UNSIGNED,  # noqa: F401
@@ -24,9 +25,12 @@ from botocore.auth import (
     resolve_auth_type,
 )
 from botocore.awsrequest import prepare_request_dict
-from botocore.compress import maybe_compress_request
+from botocore.compress import (
+    CompressionStatsRecorder,
+    maybe_compress_request,
+)
 from botocore.config import Config
-from botocore.context import with_current_context
+from botocore.context import start_as_current_context, with_current_context
 from botocore.credentials import RefreshableCredentials
 from botocore.discovery import (
     EndpointDiscoveryHandler,
@@ -39,17 +43,18 @@ from botocore.exceptions import (
     DataNotFoundError,
     InvalidEndpointDiscoveryConfigurationError,
     OperationNotPageableError,
+    UnknownClientMethodError,
     UnknownServiceError,
     UnknownSignatureVersionError,
 )
 from botocore.history import get_global_history_recorder
-from botocore.hooks import first_non_none_response
+from botocore.hooks import HandlerChainCache, first_non_none_response
 from botocore.httpchecksum import (
     apply_request_checksum,
     resolve_checksum_context,
 )
 from botocore.model import ServiceModel
-from botocore.paginate import Paginator
+from botocore.paginate import AsyncPaginator, Paginator
 from botocore.retries import adaptive, standard
 from botocore.useragent import UserAgentString, register_feature_id
 from botocore.utils import (
@@ -87,6 +92,7 @@ class ClientCreator:
         config_store=None,
         user_agent_creator=None,
         auth_token_resolver=None,
+        model_registry=None,
     ):
         self._loader = loader
         self._endpoint_resolver = endpoint_resolver
@@ -103,6 +109,7 @@ class ClientCreator:
         self._config_store = config_store
         self._user_agent_creator = user_agent_creator
         self._auth_token_resolver = auth_token_resolver
+        self._model_registry = model_registry
 
     def create_client(
         self,
@@ -116,6 +123,7 @@ class ClientCreator:
         api_version=None,
         client_config=None,
         auth_token=None,
+        is_async=False,
     ):
         responses = self._event_emitter.emit(
             'choose-service-name', service_name=service_name
@@ -126,7 +134,7 @@ class ClientCreator:
             endpoints_ruleset_data = self._load_service_endpoints_ruleset(
                 service_name, api_version
             )
-            partition_data = self._loader.load_data('partitions')
+            partition_data = self._load_partition_data()
         except UnknownServiceError:
             endpoints_ruleset_data = None
             partition_data = None
@@ -136,7 +144,7 @@ class ClientCreator:
                 service_name,
             )
 
-        cls = self._create_client_class(service_name, service_model)
+        cls = self._create_client_class(service_name, service_model, is_async)
         region_name, client_config = self._normalize_fips_region(
             region_name, client_config
         )
@@ -171,8 +179,26 @@ class ClientCreator:
             auth_token,
             endpoints_ruleset_data,
             partition_data,
+            is_async,
         )
         service_client = cls(**client_args)
+        calling_client = service_client
+        if is_async:
+            calling_client = _LazySyncClient(
+                lambda: self.create_client(
+                    service_name,
+                    region_name,
+                    is_secure,
+                    endpoint_url,
+                    verify,
+                    credentials,
+                    scoped_config,
+                    api_version,
+                    client_config,
+                    auth_token,
+                )
+            )
+            service_client._sync_client = calling_client
         self._register_retries(service_client)
         self._register_s3_events(
             client=service_client,
@@ -180,27 +206,65 @@ class ClientCreator:
             endpoint_url=None,
             client_config=client_config,
             scoped_config=scoped_config,
+            calling_client=calling_client,
+        )
+        self._register_s3express_events(
+            client=service_client, calling_client=calling_client
         )
-        self._register_s3express_events(client=service_client)
         self._register_s3_control_events(client=service_client)
         self._register_importexport_events(client=service_client)
         self._register_endpoint_discovery(
-            service_client, endpoint_url, client_config
+            service_client,
+            endpoint_url,
+            client_config,
+            calling_client=calling_client,
         )
         return service_client
 
+    def create_async_client(self, *args, **kwargs):
+        """Creates a client whose operation methods are coroutines.
+
+        This accepts the same arguments as ``create_client``.
+        """
+        return self.create_client(*args, is_async=True, **kwargs)
+
     def create_client_class(self, service_name, api_version=None):
         service_model = self._load_service_model(service_name, api_version)
         return self._create_client_class(service_name, service_model)
 
-    def _create_client_class(self, service_name, service_model):
+    def _create_client_class(
+        self, service_name, service_model, is_async=False
+    ):
+        service_id = service_model.service_id.hyphenize()
+        event_name = f'creating-client-class.{service_id}'
+        if self._model_registry is None:
+            return self._build_client_class(
+                service_model, event_name, is_async
+            )
+        # Handlers of creating-client-class can customize the class, so a
+        # class can only be shared between sessions with the same handlers.
+        key = (
+            service_name,
+            service_model,
+            self._event_emitter.get_handlers(event_name),
+            is_async,
+        )
+        return self._model_registry.get_or_create(
+            'client-class',
+            key,
+            lambda: self._build_client_class(
+                service_model, event_name, is_async
+            ),
+            size=lambda cls: len(cls._PY_TO_OP_NAME),
+        )
+
+    def _build_client_class(self, service_model, event_name, is_async=False):
         class_attributes = self._create_methods(service_model)
         py_name_to_operation_name = self._create_name_mapping(service_model)
         class_attributes['_PY_TO_OP_NAME'] = py_name_to_operation_name
-        bases = [BaseClient]
-        service_id = service_model.service_id.hyphenize()
+        bases = [AsyncBaseClient if is_async else BaseClient]
         self._event_emitter.emit(
-            f'creating-client-class.{service_id}',
+            event_name,
             class_attributes=class_attributes,
             base_classes=bases,
         )
@@ -234,6 +298,16 @@ class ClientCreator:
         return region_name, client_config
 
     def _load_service_model(self, service_name, api_version=None):
+        if self._model_registry is not None:
+            return self._model_registry.get_or_create(
+                'service-model',
+                self._registry_key(service_name, api_version),
+                lambda: self._create_service_model(service_name, api_version),
+                size=lambda service_model: len(service_model.shape_names),
+            )
+        return self._create_service_model(service_name, api_version)
+
+    def _create_service_model(self, service_name, api_version):
         json_model = self._loader.load_service_model(
             service_name, 'service-2', api_version=api_version
         )
@@ -241,10 +315,38 @@ class ClientCreator:
         return service_model
 
     def _load_service_endpoints_ruleset(self, service_name, api_version=None):
+        if self._model_registry is not None:
+            return self._model_registry.get_or_create(
+                'endpoint-rule-set',
+                self._registry_key(service_name, api_version),
+                lambda: self._loader.load_service_model(
+                    service_name,
+                    'endpoint-rule-set-1',
+                    api_version=api_version,
+                ),
+            )
         return self._loader.load_service_model(
             service_name, 'endpoint-rule-set-1', api_version=api_version
         )
 
+    def _load_partition_data(self):
+        if self._model_registry is not None:
+            return self._model_registry.get_or_create(
+                'partitions',
+                self._registry_key(),
+                lambda: self._loader.load_data('partitions'),
+            )
+        return self._loader.load_data('partitions')
+
+    def _registry_key(self, *args):
+        # Models are only shared between loaders that would load the same
+        # data for the same arguments.
+        return (
+            type(self._loader),
+            tuple(getattr(self._loader, 'search_paths', ())),
+            tuple(getattr(self._loader, 'extras_types', ())),
+        ) + args
+
     def _register_retries(self, client):
         retry_mode = client.meta.config.retries['mode']
         if retry_mode == 'standard':
@@ -319,7 +421,9 @@ class ClientCreator:
             return client_retries['mode']
         return config_store.get_config_variable('retry_mode') or 'legacy'
 
-    def _register_endpoint_discovery(self, client, endpoint_url, config):
+    def _register_endpoint_discovery(
+        self, client, endpoint_url, config, calling_client=None
+    ):
         if endpoint_url is not None:
             # Don't register any handlers in the case of a custom endpoint url
             return
@@ -340,7 +444,7 @@ class ClientCreator:
         if enabled and self._requires_endpoint_discovery(client, enabled):
             discover = enabled is True
             manager = EndpointDiscoveryManager(
-                client, always_discover=discover
+                calling_client or client, always_discover=discover
             )
             handler = EndpointDiscoveryHandler(manager)
             handler.register(events, service_id)
@@ -386,10 +490,13 @@ class ClientCreator:
         endpoint_url=None,
         client_config=None,
         scoped_config=None,
+        calling_client=None,
     ):
         if client.meta.service_model.service_name != 's3':
             return
-        S3ExpressIdentityResolver(client, RefreshableCredentials).register()
+        S3ExpressIdentityResolver(
+            calling_client or client, RefreshableCredentials
+        ).register(client.meta.events)
 
     def _register_s3_events(
         self,
@@ -398,10 +505,13 @@ class ClientCreator:
         endpoint_url,
         client_config,
         scoped_config,
+        calling_client=None,
     ):
         if client.meta.service_model.service_name != 's3':
             return
-        S3RegionRedirectorv2(None, client).register()
+        S3RegionRedirectorv2(
+            None, client, calling_client=calling_client
+        ).register()
         self._set_s3_presign_signature_version(
             client.meta, client_config, scoped_config
         )
@@ -548,6 +658,7 @@ class ClientCreator:
         auth_token,
         endpoints_ruleset_data,
         partition_data,
+        is_async=False,
     ):
         args_creator = ClientArgsCreator(
             self._event_emitter,
@@ -571,6 +682,7 @@ class ClientCreator:
             auth_token,
             endpoints_ruleset_data,
             partition_data,
+            is_async=is_async,
         )
 
     def _create_methods(self, service_model):
@@ -916,6 +1028,8 @@ class BaseClient:
     # xform_name() does the ListObjects->list_objects conversion, but
     # we need the reverse mapping here.
     _PY_TO_OP_NAME = {}
+    _PAGINATOR_CLS = Paginator
+    _WAITER_CLS = waiter.Waiter
 
     def __init__(
         self,
@@ -940,6 +1054,7 @@ class BaseClient:
         self._cache = {}
         self._loader = loader
         self._client_config = client_config
+        self._compression_stats = CompressionStatsRecorder()
         self.meta = ClientMeta(
             event_emitter,
             self._client_config,
@@ -947,9 +1062,12 @@ class BaseClient:
             service_model,
             self._PY_TO_OP_NAME,
             partition,
+            endpoint=endpoint,
+            compression_stats=self._compression_stats,
         )
         self._exceptions_factory = exceptions_factory
         self._exceptions = None
+        self._handler_chains = HandlerChainCache()
         self._user_agent_creator = user_agent_creator
         if self._user_agent_creator is None:
             self._user_agent_creator = (
@@ -978,6 +1096,76 @@ class BaseClient:
         """Closes underlying endpoint connections."""
         self._endpoint.close()
 
+    def warm_up(
+        self, connections=1, operation_name=None, params=None, parallel=False
+    ):
+        """Opens connections to the client's endpoint ahead of requests.
+
+        Opening a connection involves looking up the endpoint's host name
+        and, for HTTPS endpoints, a TLS handshake.  Warming up the client
+        keeps this out of its first requests.  The connections are added to
+        the client's connection pool, which holds at most
+        ``max_pool_connections`` connections to each host, and are used by
+        later requests to the same host.
+
+        :type connections: int
+        :param connections: The number of connections to open.
+
+        :type operation_name: string
+        :param operation_name: The name of the operation to open connections
+            for.  This is the same name as the method name on the client.
+            With ``params``, this resolves the endpoint the operation would
+            be sent to, which matters for services whose endpoint depends on
+            the request, such as S3 where buckets are usually addressed by
+            their own host.  If not given, the endpoint resolved from the
+            client's configuration alone is used.
+
+        :type params: dict
+        :param params: The parameters the operation would be called with.
+
+        :type parallel: bool
+        :param parallel: Whether to open the connections concurrently, each
+            in its own thread.
+
+        :rtype: int
+        :return: The number of connections to the endpoint that are open in
+            the pool.  Connections that could not be opened are not counted.
+        """
+        endpoint_url = self._get_warm_up_url(operation_name, params)
+        return self._endpoint.warm_up(
+            endpoint_url, connections=connections, parallel=parallel
+        )
+
+    def _get_warm_up_url(self, operation_name, params):
+        if operation_name is None:
+            operation_model = None
+            params = {}
+            request_context = {}
+        else:
+            try:
+                operation_name = self._PY_TO_OP_NAME[operation_name]
+            except KeyError:
+                raise UnknownClientMethodError(method_name=operation_name)
+            operation_model = self._service_model.operation_model(
+                operation_name
+            )
+            request_context = {
+                'client_region': self.meta.region_name,
+                'client_config': self.meta.config,
+                'has_streaming_input': operation_model.has_streaming_input,
+                'auth_type': operation_model.resolved_auth_type,
+                'unsigned_payload': operation_model.unsigned_payload,
+            }
+            params = self._emit_api_params(
+                api_params=dict(params or {}),
+                operation_model=operation_model,
+                context=request_context,
+            )
+        endpoint_url, _, _ = self._resolve_endpoint_ruleset(
+            operation_model, params, request_context
+        )
+        return endpoint_url
+
     def _register_handlers(self):
         # Register the handler required to sign requests.
         service_id = self.meta.service_model.service_id.hyphenize()
@@ -995,8 +1183,34 @@ class BaseClient:
     def _service_model(self):
         return self.meta.service_model
 
+    def _get_handler_chain(self, event, operation_name):
+        # The handlers for the per-operation events are resolved once and
+        # reused until handlers are registered or unregistered.
+        return self._handler_chains.get_handler_chain(
+            self.meta.events,
+            event,
+            self._service_model.service_id,
+            operation_name,
+        )
+
     @with_current_context()
     def _make_api_call(self, operation_name, api_params):
+        operation_model, request_dict, request_context, event_response = (
+            self._prepare_api_call(operation_name, api_params)
+        )
+        if event_response is not None:
+            http, parsed_response = event_response
+        else:
+            http, parsed_response = self._make_request(
+                operation_model, request_dict, request_context
+            )
+        return self._finish_api_call(
+            operation_model, http, parsed_response, request_context
+        )
+
+    def _prepare_api_call(self, operation_name, api_params):
+        # Builds the request for an API call.  If a before-call handler
+        # provides a response, it is returned and the request is not sent.
         operation_model = self._service_model.operation_model(operation_name)
         service_name = self._service_model.service_name
         history_recorder.record(
@@ -1057,28 +1271,29 @@ class BaseClient:
         )
         resolve_checksum_context(request_dict, operation_model, api_params)
 
-        service_id = self._service_model.service_id.hyphenize()
-        handler, event_response = self.meta.events.emit_until_response(
-            f'before-call.{service_id}.{operation_name}',
+        before_call = self._get_handler_chain('before-call', operation_name)
+        handler, event_response = before_call.emit_until_response(
             model=operation_model,
             params=request_dict,
             request_signer=self._request_signer,
             context=request_context,
         )
 
-        if event_response is not None:
-            http, parsed_response = event_response
-        else:
+        if event_response is None:
             maybe_compress_request(
-                self.meta.config, request_dict, operation_model
+                self.meta.config,
+                request_dict,
+                operation_model,
+                stats=self._compression_stats,
             )
             apply_request_checksum(request_dict)
-            http, parsed_response = self._make_request(
-                operation_model, request_dict, request_context
-            )
+        return operation_model, request_dict, request_context, event_response
 
-        self.meta.events.emit(
-            f'after-call.{service_id}.{operation_name}',
+    def _finish_api_call(
+        self, operation_model, http, parsed_response, request_context
+    ):
+        operation_name = operation_model.name
+        self._get_handler_chain('after-call', operation_name).emit(
             http_response=http,
             parsed=parsed_response,
             model=operation_model,
@@ -1099,8 +1314,9 @@ class BaseClient:
         try:
             return self._endpoint.make_request(operation_model, request_dict)
         except Exception as e:
-            self.meta.events.emit(
-                f'after-call-error.{self._service_model.service_id.hyphenize()}.{operation_model.name}',
+            self._get_handler_chain(
+                'after-call-error', operation_model.name
+            ).emit(
                 exception=e,
                 context=request_context,
             )
@@ -1142,17 +1358,16 @@ class BaseClient:
         # Emit an event that allows users to modify the parameters at the
         # beginning of the method. It allows handlers to modify existing
         # parameters or return a new set of parameters to use.
-        service_id = self._service_model.service_id.hyphenize()
-        responses = self.meta.events.emit(
-            f'provide-client-params.{service_id}.{operation_name}',
+        responses = self._get_handler_chain(
+            'provide-client-params', operation_name
+        ).emit(
             params=api_params,
             model=operation_model,
             context=context,
         )
         api_params = first_non_none_response(responses, default=api_params)
 
-        self.meta.events.emit(
-            f'before-parameter-build.{service_id}.{operation_name}',
+        self._get_handler_chain('before-parameter-build', operation_name).emit(
             params=api_params,
             model=operation_model,
             context=context,
@@ -1234,12 +1449,13 @@ class BaseClient:
             raise OperationNotPageableError(operation_name=operation_name)
         else:
             actual_operation_name = self._PY_TO_OP_NAME[operation_name]
+            paginator_cls = self._PAGINATOR_CLS
 
             # Create a new paginate method that will serve as a proxy to
             # the underlying Paginator.paginate method. This is needed to
             # attach a docstring to the method.
             def paginate(self, **kwargs):
-                return Paginator.paginate(self, **kwargs)
+                return paginator_cls.paginate(self, **kwargs)
 
             paginator_config = self._cache['page_config'][
                 actual_operation_name
@@ -1263,7 +1479,7 @@ class BaseClient:
 
             # Create the new paginator class
             documented_paginator_cls = type(
-                paginator_class_name, (Paginator,), {'paginate': paginate}
+                paginator_class_name, (paginator_cls,), {'paginate': paginate}
             )
 
             operation_model = self._service_model.operation_model(
@@ -1338,7 +1554,7 @@ class BaseClient:
             raise ValueError(f"Waiter does not exist: {waiter_name}")
 
         return waiter.create_waiter_with_client(
-            mapping[waiter_name], model, self
+            mapping[waiter_name], model, self, waiter_cls=self._WAITER_CLS
         )
 
     @CachedProperty
@@ -1371,6 +1587,114 @@ class BaseClient:
         return self._request_signer._credentials
 
 
+class AsyncBaseClient(BaseClient):
+    """A client whose operation methods are coroutines.
+
+    Async clients are created with ``Session.create_async_client``.  They
+    send requests with an :class:`botocore.endpoint.AsyncEndpoint`, so a
+    single event loop can have many requests in flight.  Their paginators
+    are iterated with ``async for`` and their waiters' ``wait`` methods are
+    coroutines.  Refreshable credentials are refreshed in the event loop's
+    default executor.
+    """
+
+    _PAGINATOR_CLS = AsyncPaginator
+    _WAITER_CLS = waiter.AsyncWaiter
+    # The blocking client that handlers make calls with.
+    _sync_client = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """Closes underlying endpoint connections."""
+        await self._endpoint.close()
+        if self._sync_client is not None:
+            self._sync_client.close()
+
+    async def warm_up(
+        self, connections=1, operation_name=None, params=None, parallel=False
+    ):
+        """Opens connections to the client's endpoint ahead of requests.
+
+        This takes the same arguments as :meth:`BaseClient.warm_up`.  With
+        ``parallel``, the connections are opened concurrently on the event
+        loop.
+        """
+        endpoint_url = self._get_warm_up_url(operation_name, params)
+        return await self._endpoint.warm_up(
+            endpoint_url, connections=connections, parallel=parallel
+        )
+
+    async def _make_api_call(self, operation_name, api_params):
+        with start_as_current_context():
+            await self._refresh_credentials()
+            operation_model, request_dict, request_context, event_response = (
+                self._prepare_api_call(operation_name, api_params)
+            )
+            if event_response is not None:
+                http, parsed_response = event_response
+            else:
+                http, parsed_response = await self._make_request(
+                    operation_model, request_dict, request_context
+                )
+            return self._finish_api_call(
+                operation_model, http, parsed_response, request_context
+            )
+
+    async def _refresh_credentials(self):
+        # Requests are signed synchronously, so credentials that need to
+        # be refreshed are refreshed before the request is built.
+        credentials = self._get_credentials()
+        if isinstance(credentials, RefreshableCredentials):
+            await credentials.get_frozen_credentials_async()
+
+    async def _make_request(
+        self, operation_model, request_dict, request_context
+    ):
+        try:
+            return await self._endpoint.make_request(
+                operation_model, request_dict
+            )
+        except Exception as e:
+            self._get_handler_chain(
+                'after-call-error', operation_model.name
+            ).emit(
+                exception=e,
+                context=request_context,
+            )
+            raise
+
+
+class _LazySyncClient:
+    """A blocking client that is only created when it is first used.
+
+    Handlers run synchronously, so handlers that make calls with an async
+    client, such as the S3 region redirector, make them with this client
+    instead.  These calls are rarely needed, so most async clients never
+    create it.  They block the event loop while they are made.
+    """
+
+    def __init__(self, create_client):
+        self._create_client = create_client
+        self._client = None
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name):
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = self._create_client()
+        return getattr(self._client, name)
+
+    def close(self):
+        if self._client is not None:
+            self._client.close()
+
+
 class ClientMeta:
     """Holds additional client methods.
 
@@ -1392,6 +1716,8 @@ class ClientMeta:
         service_model,
         method_to_api_mapping,
         partition,
+        endpoint=None,
+        compression_stats=None,
     ):
         self.events = events
         self._client_config = client_config
@@ -1399,6 +1725,8 @@ class ClientMeta:
         self._service_model = service_model
         self._method_to_api_mapping = method_to_api_mapping
         self._partition = partition
+        self._endpoint = endpoint
+        self._compression_stats = compression_stats
 
     @property
     def service_model(self):
@@ -1424,6 +1752,49 @@ class ClientMeta:
     def partition(self):
         return self._partition
 
+    def get_pool_stats(self):
+        """Return statistics of the client's HTTP connection pools.
+
+        The statistics count from when the client was created.  They are
+        useful to size ``max_pool_connections``: requests made while the
+        pool was exhausted and connections discarded because the pool was
+        full mean there were more concurrent requests than pooled
+        connections.  The ``connection-created``,
+        ``connection-pool-exhausted`` and ``connection-discarded`` events
+        are emitted, suffixed with the hyphenized service ID, as they
+        happen.
+
+        :rtype: botocore.httpsession.ConnectionPoolStats
+        :return: The statistics, or None if the client's HTTP session
+            doesn't keep them.
+        """
+        return self._endpoint.get_pool_stats()
+
+    def get_dns_cache_stats(self):
+        """Return statistics of the client's DNS cache.
+
+        :rtype: botocore.httpsession.DNSCacheStats
+        :return: The statistics, or None if the client was not configured
+            with a ``dns_cache`` or its HTTP session doesn't keep them.
+        """
+        return self._endpoint.get_dns_cache_stats()
+
+    def get_compression_stats(self):
+        """Return statistics of the request bodies the client compressed.
+
+        The ratio of compressed to uncompressed bytes and the time spent
+        compressing are useful to choose a compression level, or a codec,
+        with the ``request_compression_codecs`` config option.
+
+        :rtype: dict
+        :return: A dictionary mapping operation names to
+            ``botocore.compress.CompressionStats`` for each operation that
+            had a request compressed.
+        """
+        if self._compression_stats is None:
+            return {}
+        return self._compression_stats.get_stats()
+
 
 def _get_configured_signature_version(
     service_name, client_config, scoped_config
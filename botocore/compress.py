@@ -11,32 +11,127 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 """
-NOTE: All functions in this module are considered private and are
-subject to abrupt breaking changes. Please do not use them directly.
+NOTE: Except for ``GzipCodec`` and ``CompressionStats``, everything in this
+module is considered private and is subject to abrupt breaking changes.
+Please do not use it directly.
 
 """
 
 import io
 import logging
+import queue
+import threading
+import time
+import weakref
 from gzip import GzipFile
 from gzip import compress as gzip_compress
+from typing import NamedTuple
 
 from botocore.compat import urlencode
+from botocore.exceptions import InvalidConfigError
 from botocore.useragent import register_feature_id
 from botocore.utils import determine_content_length
 
 logger = logging.getLogger(__name__)
 
+# Bodies of streaming operations at least this large are compressed by a
+# worker thread, so compression overlaps with sending the body.
+THREADED_COMPRESSION_MIN_SIZE = 4 * 1024 * 1024
+_READ_SIZE = 64 * 1024
+_MAX_PENDING_BLOCKS = 8
 
-def maybe_compress_request(config, request_dict, operation_model):
-    """Attempt to compress the request body using the modeled encodings."""
+
+class CompressionStats(NamedTuple):
+    """Statistics of the requests a client compressed for an operation.
+
+    ``requests`` is the number of request bodies compressed, of which
+    ``streamed`` were compressed as they were sent.  The sizes of streamed
+    bodies aren't known when they're compressed, so ``uncompressed_bytes``,
+    ``compressed_bytes`` and ``compression_time``, the total number of
+    seconds spent compressing, only count the other requests.
+    """
+
+    requests: int
+    streamed: int
+    uncompressed_bytes: int
+    compressed_bytes: int
+    compression_time: float
+
+    @property
+    def ratio(self):
+        """The compressed size of bodies as a fraction of their size."""
+        if not self.uncompressed_bytes:
+            return None
+        return self.compressed_bytes / self.uncompressed_bytes
+
+
+class CompressionStatsRecorder:
+    """Records ``CompressionStats`` for each operation."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def record(
+        self, operation_name, uncompressed_size, compressed_size, elapsed
+    ):
+        # Sizes are None for bodies compressed as they're sent.
+        streamed = uncompressed_size is None or compressed_size is None
+        with self._lock:
+            stats = self._stats.get(operation_name)
+            if stats is None:
+                stats = CompressionStats(0, 0, 0, 0, 0.0)
+            if streamed:
+                stats = stats._replace(
+                    requests=stats.requests + 1, streamed=stats.streamed + 1
+                )
+            else:
+                stats = stats._replace(
+                    requests=stats.requests + 1,
+                    uncompressed_bytes=(
+                        stats.uncompressed_bytes + uncompressed_size
+                    ),
+                    compressed_bytes=stats.compressed_bytes + compressed_size,
+                    compression_time=stats.compression_time + elapsed,
+                )
+            self._stats[operation_name] = stats
+
+    def get_stats(self):
+        with self._lock:
+            return dict(self._stats)
+
+
+def maybe_compress_request(config, request_dict, operation_model, stats=None):
+    """Attempt to compress the request body using the modeled encodings.
+
+    The first of the operation's encodings with a codec, from the client's
+    ``request_compression_codecs`` or botocore's own, is used.  If
+    ``stats`` is a ``CompressionStatsRecorder``, the compression is
+    recorded in it.
+    """
     if _should_compress_request(config, request_dict, operation_model):
+        codecs = COMPRESSION_MAPPING
+        if config.request_compression_codecs:
+            codecs = {**codecs, **config.request_compression_codecs}
         for encoding in operation_model.request_compression['encodings']:
-            encoder = COMPRESSION_MAPPING.get(encoding)
-            if encoder is not None:
+            codec = codecs.get(encoding)
+            if codec is not None:
                 logger.debug('Compressing request with %s encoding.', encoding)
-                request_dict['body'] = encoder(request_dict['body'])
+                body = request_dict['body']
+                uncompressed_size = determine_content_length(body)
+                start = time.perf_counter()
+                request_dict['body'] = codec.compress(
+                    body, streaming=operation_model.has_streaming_input
+                )
+                elapsed = time.perf_counter() - start
                 _set_compression_header(request_dict['headers'], encoding)
+                if stats is not None:
+                    stats.record(
+                        operation_model.name,
+                        uncompressed_size,
+                        determine_content_length(request_dict['body']),
+                        elapsed,
+                    )
                 return
             else:
                 logger.debug('Unsupported compression encoding: %s', encoding)
@@ -88,24 +183,74 @@ def _get_body_size(body):
     return size
 
 
-def _gzip_compress_body(body):
+class GzipCodec:
+    """Compresses request bodies with gzip.
+
+    This is the codec botocore uses for the ``gzip`` encoding.  Register
+    an instance with the ``request_compression_codecs`` config option to
+    change the compression level.
+
+    :type level: int
+    :param level: The compression level, from 0 for no compression to 9,
+        the default, for the most compression.
+    """
+
+    def __init__(self, level=9):
+        if (
+            isinstance(level, bool)
+            or not isinstance(level, int)
+            or not 0 <= level <= 9
+        ):
+            raise InvalidConfigError(
+                error_msg=(
+                    f'Invalid gzip compression level: {level}. Value must '
+                    'be an integer between 0 and 9.'
+                )
+            )
+        self.level = level
+
+    def compress(self, body, streaming=False):
+        """Compress a request body.
+
+        :param body: The body, as ``str``, ``bytes`` or a file-like object.
+
+        :type streaming: bool
+        :param streaming: Whether the body is the streaming input of the
+            operation, in which case it doesn't need a known length.
+
+        :returns: The compressed body.
+        """
+        return _gzip_compress_body(body, streaming, self.level)
+
+
+def _gzip_compress_body(body, streaming=False, level=9):
     register_feature_id('GZIP_REQUEST_COMPRESSION')
     if isinstance(body, str):
-        return gzip_compress(body.encode('utf-8'))
+        return gzip_compress(body.encode('utf-8'), compresslevel=level)
     elif isinstance(body, (bytes, bytearray)):
-        return gzip_compress(body)
+        return gzip_compress(body, compresslevel=level)
     elif hasattr(body, 'read'):
         if hasattr(body, 'seek') and hasattr(body, 'tell'):
+            if streaming:
+                # Streaming operations don't need the length of the body
+                # up front, so it can be compressed as it's sent.
+                size = determine_content_length(body)
+                threaded = (
+                    size is not None and size >= THREADED_COMPRESSION_MIN_SIZE
+                )
+                return GzipCompressedBody(body, threaded=threaded, level=level)
             current_position = body.tell()
-            compressed_obj = _gzip_compress_fileobj(body)
+            compressed_obj = _gzip_compress_fileobj(body, level)
             body.seek(current_position)
             return compressed_obj
-        return _gzip_compress_fileobj(body)
+        return _gzip_compress_fileobj(body, level)
 
 
-def _gzip_compress_fileobj(body):
+def _gzip_compress_fileobj(body, level=9):
     compressed_obj = io.BytesIO()
-    with GzipFile(fileobj=compressed_obj, mode='wb') as gz:
+    with GzipFile(
+        fileobj=compressed_obj, mode='wb', compresslevel=level
+    ) as gz:
         while True:
             chunk = body.read(8192)
             if not chunk:
@@ -117,6 +262,153 @@ def _gzip_compress_fileobj(body):
     return compressed_obj
 
 
+class GzipCompressedBody:
+    """A file-like object that gzip compresses a seekable body as it's read.
+
+    Only the compressed data that hasn't been read yet is kept in memory.
+    Seeking to the start, as is done before a request is retried, seeks
+    the body back to where it started and compresses it again.
+
+    If ``threaded`` is true, the body is compressed by a worker thread up
+    to ``_MAX_PENDING_BLOCKS`` blocks ahead of the reader.
+    """
+
+    def __init__(self, raw, threaded=False, level=9):
+        self._raw = raw
+        self._start_position = raw.tell()
+        self._threaded = threaded
+        self._level = level
+        # The body must compress to the same bytes each time it's read,
+        # e.g. to hash it for signing and then send it.
+        self._mtime = int(time.time())
+        self._worker = None
+        self._reset()
+
+    def _reset(self):
+        self._compressor = _GzipCompressor(self._raw, self._level, self._mtime)
+        self._block = memoryview(b'')
+        self._position = 0
+
+    def tell(self):
+        return self._position
+
+    def seek(self, offset, whence=0):
+        if offset != 0 or whence != 0:
+            raise io.UnsupportedOperation(
+                'Can only seek to the start of a compressed body'
+            )
+        self._stop_worker()
+        self._raw.seek(self._start_position)
+        self._reset()
+        return 0
+
+    def read(self, size=-1):
+        if size is not None and size < 0:
+            size = None
+        pieces = []
+        while size is None or size > 0:
+            if not self._block:
+                block = self._next_block()
+                if block is None:
+                    break
+                self._block = memoryview(block)
+                continue
+            piece = self._block[:size]
+            self._block = self._block[len(piece) :]
+            pieces.append(piece)
+            if size is not None:
+                size -= len(piece)
+        data = b''.join(pieces)
+        self._position += len(data)
+        return data
+
+    def close(self):
+        self._stop_worker()
+
+    def _next_block(self):
+        if not self._threaded:
+            return self._compressor.compress_block()
+        if self._worker is None:
+            self._start_worker()
+        block = self._blocks.get()
+        if isinstance(block, Exception):
+            # Later reads return the end of the body rather than waiting
+            # for a worker that has stopped.
+            self._blocks.put(None)
+            raise block
+        if block is None:
+            # Keep returning the end of the body for any later reads.
+            self._blocks.put(None)
+        return block
+
+    def _start_worker(self):
+        self._blocks = queue.Queue(_MAX_PENDING_BLOCKS)
+        stopped = threading.Event()
+        # The worker doesn't reference this object, so it's stopped if
+        # the body is garbage collected before it's read to the end.
+        self._stop = weakref.finalize(self, stopped.set)
+        self._worker = threading.Thread(
+            target=_compress_in_thread,
+            args=(self._compressor, self._blocks, stopped),
+            daemon=True,
+        )
+        self._worker.start()
+
+    def _stop_worker(self):
+        if self._worker is not None:
+            self._stop()
+            self._worker.join()
+            self._worker = None
+
+
+class _GzipCompressor:
+    def __init__(self, raw, level, mtime):
+        self._raw = raw
+        self._output = io.BytesIO()
+        self._gzip = GzipFile(
+            fileobj=self._output, mode='wb', compresslevel=level, mtime=mtime
+        )
+        self._complete = False
+
+    def compress_block(self):
+        # Returns the next block of compressed data, or None at the end of
+        # the body.
+        while not self._complete:
+            chunk = self._raw.read(_READ_SIZE)
+            if isinstance(chunk, str):
+                chunk = chunk.encode('utf-8')
+            if chunk:
+                self._gzip.write(chunk)
+            else:
+                self._gzip.close()
+                self._complete = True
+            block = self._output.getvalue()
+            if block:
+                self._output.seek(0)
+                self._output.truncate()
+                return block
+        return None
+
+
+def _compress_in_thread(compressor, blocks, stopped):
+    def put(item):
+        while not stopped.is_set():
+            try:
+                blocks.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    try:
+        while True:
+            block = compressor.compress_block()
+            if not put(block) or block is None:
+                return
+    except Exception as e:
+        put(e)
+
+
 def _set_compression_header(headers, encoding):
     ce_header = headers.get('Content-Encoding')
     if ce_header is None:
@@ -125,4 +417,4 @@ def _set_compression_header(headers, encoding):
         headers['Content-Encoding'] = f'{ce_header},{encoding}'
 
 
-COMPRESSION_MAPPING = {'gzip': _gzip_compress_body}
+COMPRESSION_MAPPING = {'gzip': GzipCodec()}
@@ -232,6 +232,23 @@ class Config:
 
         Defaults to None.
 
+    :type request_compression_codecs: dict
+    :param request_compression_codecs: A dictionary mapping content encodings
+        to the codecs used to compress request bodies with them, in addition
+        to botocore's own.  A request is compressed with the first of the
+        encodings its operation supports that has a codec.  A codec is an
+        object with a ``compress(body, streaming=False)`` method returning
+        the compressed body, where ``body`` is ``str``, ``bytes`` or a
+        file-like object and ``streaming`` is whether the operation accepts
+        a body of unknown length.  For example, to compress with gzip at a
+        lower level than the default of 9::
+
+            from botocore.compress import GzipCodec
+
+            Config(request_compression_codecs={'gzip': GzipCodec(level=6)})
+
+        Defaults to None.
+
     :type sigv4a_signing_region_set: string
     :param sigv4a_signing_region_set: A set of AWS regions to apply the signature for
         when using SigV4a for signing. Set to ``*`` to represent all regions.
@@ -296,6 +313,99 @@ class Config:
         auth scheme names used to determine the client's auth scheme preference.
 
         Defaults to None.
+
+    :type compile_serializers: bool
+    :param compile_serializers: Setting to True compiles the input shape of
+        each operation into specialized serialization functions the first
+        time the operation is called, which speeds up serializing
+        subsequent requests.  This is supported for the ``json``,
+        ``rest-json``, ``query`` and ``ec2`` protocols and ignored for
+        the others.
+
+        Defaults to None.
+
+    :type compile_parsers: bool
+    :param compile_parsers: Setting to True compiles the output shape of
+        each operation into a specialized parse plan the first time a
+        response for the operation is parsed, which speeds up parsing
+        subsequent responses.
+
+        Defaults to None.
+
+    :type stream_xml_parsing: bool
+    :param stream_xml_parsing: Setting to True parses XML response bodies
+        incrementally, discarding each element once it has been parsed,
+        instead of building the complete element tree first.  This reduces
+        the peak memory used to parse large responses from services that
+        use the ``query``, ``ec2`` and ``rest-xml`` protocols.
+
+        Defaults to None.
+
+    :type lazy_response_parsing: bool
+    :param lazy_response_parsing: Setting to True returns responses whose
+        nested structures, lists, maps, timestamps and blobs are parsed
+        the first time they are accessed rather than up front.  Responses
+        are still ``dict`` objects, so this only reduces the time spent
+        parsing responses of which only a few members are used.  This
+        implies ``compile_parsers``.
+
+        Defaults to None.
+
+    :type compile_endpoint_rulesets: bool
+    :param compile_endpoint_rulesets: Setting to True compiles the
+        service's endpoint ruleset into specialized functions as it is
+        used, which speeds up resolving endpoints for parameters whose
+        endpoint has not been cached yet, such as requests to many
+        different S3 buckets.
+
+        Defaults to None.
+
+    :type endpoint_cache_size: int
+    :param endpoint_cache_size: The number of resolved endpoints the
+        client caches.  Setting this gives the client its own endpoint
+        cache that, besides exact parameter values, also caches which rules
+        of the endpoint ruleset were matched.  Parameters that only differ
+        in ways the ruleset does not distinguish, such as the names of
+        different S3 buckets that can all be addressed the same way, then
+        reuse those rules rather than evaluating the ruleset again.  When
+        not set, endpoints are cached in a cache of 100 entries that is
+        shared by all clients.
+
+        Defaults to None.
+
+    :type http_protocol: str
+    :param http_protocol: The HTTP protocol used to send requests. Valid
+        values are:
+
+        * ``http/1.1`` -- Requests are sent over HTTP/1.1, with one
+          connection for each request in flight.
+
+        * ``h2`` -- Requests to HTTPS endpoints that negotiate HTTP/2 are
+          sent as concurrent streams of a few shared connections, of which
+          at most ``max_pool_connections`` are opened to each host.
+          Requests to other endpoints are still sent over HTTP/1.1.  This
+          requires the ``h2`` package, which is installed by
+          ``pip install botocore[h2]``, and is not supported by async
+          clients.
+
+        Defaults to None.
+
+    :type dns_cache: dict
+    :param dns_cache: A dictionary configuring a cache of the addresses host
+        names resolve to, so that opening a connection doesn't need a DNS
+        lookup each time.  Each client has its own cache, and an empty
+        dictionary enables it with the default settings.  Connections to a
+        host name are spread round-robin across its addresses.  Valid keys
+        are:
+
+        * ``ttl`` -- The number of seconds addresses are cached for.
+          Defaults to 30.
+        * ``negative_ttl`` -- The number of seconds failed lookups are
+          cached for, or 0 to not cache them.  Defaults to 5.
+        * ``max_size`` -- The number of host names cached, after which the
+          least recently used are evicted.  Defaults to 1024.
+
+        Defaults to None.
     """
 
     OPTION_DEFAULTS = OrderedDict(
@@ -324,12 +434,21 @@ class Config:
             ('tcp_keepalive', None),
             ('request_min_compression_size_bytes', None),
             ('disable_request_compression', None),
+            ('request_compression_codecs', None),
             ('client_context_params', None),
             ('sigv4a_signing_region_set', None),
             ('request_checksum_calculation', None),
             ('response_checksum_validation', None),
             ('account_id_endpoint_mode', None),
             ('auth_scheme_preference', None),
+            ('compile_serializers', None),
+            ('compile_parsers', None),
+            ('stream_xml_parsing', None),
+            ('lazy_response_parsing', None),
+            ('compile_endpoint_rulesets', None),
+            ('endpoint_cache_size', None),
+            ('http_protocol', None),
+            ('dns_cache', None),
         ]
     )
 
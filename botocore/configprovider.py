@@ -73,6 +73,19 @@ BOTOCORE_DEFAUT_SESSION_VARIABLES = {
     'profile': (None, ['AWS_DEFAULT_PROFILE', 'AWS_PROFILE'], None, None),
     'region': ('region', 'AWS_DEFAULT_REGION', None, None),
     'data_path': ('data_path', 'AWS_DATA_PATH', None, None),
+    'data_cache_path': ('data_cache_path', 'AWS_DATA_CACHE_PATH', None, None),
+    'lazy_load_models': (
+        'lazy_load_models',
+        'AWS_LAZY_LOAD_MODELS',
+        False,
+        utils.ensure_boolean,
+    ),
+    'share_service_models': (
+        'share_service_models',
+        'AWS_SHARE_SERVICE_MODELS',
+        False,
+        utils.ensure_boolean,
+    ),
     'config_file': (None, 'AWS_CONFIG_FILE', '~/.aws/config', None),
     'ca_bundle': ('ca_bundle', 'AWS_CA_BUNDLE', None, None),
     'api_versions': ('api_versions', None, {}, None),
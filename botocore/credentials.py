@@ -11,6 +11,7 @@
 # distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
+import asyncio
 import base64
 import datetime
 import getpass
@@ -697,6 +698,19 @@ class RefreshableCredentials(Credentials):
         self._refresh()
         return self._frozen_credentials
 
+    async def get_frozen_credentials_async(self):
+        """Return immutable credentials without blocking the event loop.
+
+        This is the same as ``get_frozen_credentials``, except that when
+        the credentials need to be refreshed the refresh is run in the
+        running event loop's default executor.
+
+        """
+        if self.refresh_needed():
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._refresh)
+        return self._frozen_credentials
+
 
 class DeferredRefreshableCredentials(RefreshableCredentials):
     """Refreshable credentials that don't require initial credentials.
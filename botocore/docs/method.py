@@ -222,9 +222,16 @@ def document_model_driven_method(
     example_section.style.new_paragraph()
     example_section.style.bold('Request Syntax')
 
+    # Shapes are shared between every reference with the same traits, so
+    # the request and response need separate contexts to tell a streaming
+    # input apart from a streaming output when both use the same shape.
     context = {
         'special_shape_types': {
             'streaming_input_shape': operation_model.get_streaming_input(),
+        },
+    }
+    response_context = {
+        'special_shape_types': {
             'streaming_output_shape': operation_model.get_streaming_output(),
             'eventstream_output_shape': operation_model.get_event_stream_output(),
         },
@@ -298,7 +305,7 @@ def document_model_driven_method(
             service_name=operation_model.service_model.service_name,
             operation_name=operation_model.name,
             event_emitter=event_emitter,
-            context=context,
+            context=response_context,
         ).document_example(
             return_example_section,
             operation_model.output_shape,
@@ -317,7 +324,7 @@ def document_model_driven_method(
             service_name=operation_model.service_model.service_name,
             operation_name=operation_model.name,
             event_emitter=event_emitter,
-            context=context,
+            context=response_context,
         ).document_params(
             return_description_section,
             operation_model.output_shape,
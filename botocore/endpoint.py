@@ -12,6 +12,7 @@
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 
+import asyncio
 import datetime
 import logging
 import os
@@ -20,16 +21,19 @@ import time
 import uuid
 
 from botocore import parsers
+from botocore.asynchttpsession import AsyncioHTTPSession
 from botocore.awsrequest import create_request_object
 from botocore.compat import get_current_datetime
+from botocore.eventstream import buffer_initial_event
 from botocore.exceptions import HTTPClientError, InvalidConfigError
 from botocore.history import get_global_history_recorder
-from botocore.hooks import first_non_none_response
+from botocore.hooks import HandlerChainCache, first_non_none_response
 from botocore.httpchecksum import handle_checksum_body
 from botocore.httpsession import URLLib3Session
-from botocore.response import StreamingBody
+from botocore.response import AsyncStreamingBody, StreamingBody
 from botocore.utils import (
     get_environ_proxies,
+    is_async_stream,
     is_valid_endpoint_url,
     is_valid_ipv6_endpoint_url,
 )
@@ -38,6 +42,9 @@ logger = logging.getLogger(__name__)
 history_recorder = get_global_history_recorder()
 DEFAULT_TIMEOUT = 60
 MAX_POOL_CONNECTIONS = 10
+# The protocols whose parsers read the initial-response event of an event
+# stream while parsing the response.
+INITIAL_RESPONSE_PROTOCOLS = ('json', 'smithy-rpc-v2-cbor')
 
 
 def convert_to_response_dict(http_response, operation_model):
@@ -68,7 +75,10 @@ def convert_to_response_dict(http_response, operation_model):
         response_dict['body'] = http_response.raw
     elif operation_model.has_streaming_output:
         length = response_dict['headers'].get('content-length')
-        response_dict['body'] = StreamingBody(http_response.raw, length)
+        body_cls = StreamingBody
+        if is_async_stream(http_response.raw):
+            body_cls = AsyncStreamingBody
+        response_dict['body'] = body_cls(http_response.raw, length)
     else:
         response_dict['body'] = http_response.content
     return response_dict
@@ -95,6 +105,7 @@ class Endpoint:
     ):
         self._endpoint_prefix = endpoint_prefix
         self._event_emitter = event_emitter
+        self._handler_chains = HandlerChainCache()
         self.host = host
         self._lock = threading.Lock()
         if response_parser_factory is None:
@@ -110,6 +121,35 @@ class Endpoint:
     def close(self):
         self.http_session.close()
 
+    def warm_up(self, url, connections=1, parallel=False):
+        return self.http_session.warm_up(
+            url, connections=connections, parallel=parallel
+        )
+
+    def get_pool_stats(self):
+        # The HTTP session class is pluggable, and other sessions may not
+        # keep statistics.
+        get_pool_stats = getattr(self.http_session, 'get_pool_stats', None)
+        if get_pool_stats is None:
+            return None
+        return get_pool_stats()
+
+    def get_dns_cache_stats(self):
+        get_dns_cache_stats = getattr(
+            self.http_session, 'get_dns_cache_stats', None
+        )
+        if get_dns_cache_stats is None:
+            return None
+        return get_dns_cache_stats()
+
+    def _get_handler_chain(self, event, operation_model):
+        return self._handler_chains.get_handler_chain(
+            self._event_emitter,
+            event,
+            operation_model.service_model.service_id,
+            operation_model.name,
+        )
+
     def make_request(self, operation_model, request_dict):
         logger.debug(
             "Making request for %s with params: %s",
@@ -127,10 +167,7 @@ class Endpoint:
                     operation_model.has_event_stream_output,
                 ]
             )
-            service_id = operation_model.service_model.service_id.hyphenize()
-            event_name = f'request-created.{service_id}.{operation_model.name}'
-            self._event_emitter.emit(
-                event_name,
+            self._get_handler_chain('request-created', operation_model).emit(
                 request=request,
                 operation_name=operation_model.name,
             )
@@ -205,17 +242,35 @@ class Endpoint:
             exception,
         ):
             attempts += 1
-            self._update_retries_context(context, attempts, success_response)
-            # If there is a stream associated with the request, we need
-            # to reset it before attempting to send the request again.
-            # This will ensure that we resend the entire contents of the
-            # body.
-            request.reset_stream()
-            # Create a new request when retried (including a new signature).
-            request = self.create_request(request_dict, operation_model)
+            request = self._create_retry_request(
+                request,
+                request_dict,
+                operation_model,
+                attempts,
+                success_response,
+            )
             success_response, exception = self._get_response(
                 request, operation_model, context
             )
+        return self._handle_final_response(
+            attempts, success_response, exception
+        )
+
+    def _create_retry_request(
+        self, request, request_dict, operation_model, attempts, response
+    ):
+        self._update_retries_context(
+            request_dict['context'], attempts, response
+        )
+        # If there is a stream associated with the request, we need
+        # to reset it before attempting to send the request again.
+        # This will ensure that we resend the entire contents of the
+        # body.
+        request.reset_stream()
+        # Create a new request when retried (including a new signature).
+        return self.create_request(request_dict, operation_model)
+
+    def _handle_final_response(self, attempts, success_response, exception):
         if (
             success_response is not None
             and 'ResponseMetadata' in success_response[1]
@@ -239,6 +294,21 @@ class Endpoint:
         success_response, exception = self._do_get_response(
             request, operation_model, context
         )
+        self._emit_response_received(
+            success_response, exception, operation_model, context
+        )
+        return success_response, exception
+
+    def _emit_response_received(
+        self, success_response, exception, operation_model, context
+    ):
+        response_received = self._get_handler_chain(
+            'response-received', operation_model
+        )
+        if not response_received:
+            # Nothing is listening, so don't bother building the
+            # response dict for the handlers.
+            return
         kwargs_to_emit = {
             'response_dict': None,
             'parsed_response': None,
@@ -251,30 +321,11 @@ class Endpoint:
             kwargs_to_emit['response_dict'] = convert_to_response_dict(
                 http_response, operation_model
             )
-        service_id = operation_model.service_model.service_id.hyphenize()
-        self._event_emitter.emit(
-            f"response-received.{service_id}.{operation_model.name}",
-            **kwargs_to_emit,
-        )
-        return success_response, exception
+        response_received.emit(**kwargs_to_emit)
 
     def _do_get_response(self, request, operation_model, context):
         try:
-            logger.debug("Sending http request: %s", request)
-            history_recorder.record(
-                'HTTP_REQUEST',
-                {
-                    'method': request.method,
-                    'headers': request.headers,
-                    'streaming': operation_model.has_streaming_input,
-                    'url': request.url,
-                    'body': request.body,
-                },
-            )
-            service_id = operation_model.service_model.service_id.hyphenize()
-            event_name = f"before-send.{service_id}.{operation_model.name}"
-            responses = self._event_emitter.emit(event_name, request=request)
-            http_response = first_non_none_response(responses)
+            http_response = self._emit_before_send(request, operation_model)
             if http_response is None:
                 http_response = self._send(request)
         except HTTPClientError as e:
@@ -284,6 +335,29 @@ class Endpoint:
                 "Exception received when sending HTTP request.", exc_info=True
             )
             return (None, e)
+        return self._parse_http_response(
+            http_response, operation_model, context
+        )
+
+    def _emit_before_send(self, request, operation_model):
+        # Returns the response provided by a before-send handler, if any.
+        logger.debug("Sending http request: %s", request)
+        history_recorder.record(
+            'HTTP_REQUEST',
+            {
+                'method': request.method,
+                'headers': request.headers,
+                'streaming': operation_model.has_streaming_input,
+                'url': request.url,
+                'body': request.body,
+            },
+        )
+        responses = self._get_handler_chain(
+            'before-send', operation_model
+        ).emit(request=request)
+        return first_non_none_response(responses)
+
+    def _parse_http_response(self, http_response, operation_model, context):
         # This returns the http_response and the parsed_data.
         response_dict = convert_to_response_dict(
             http_response, operation_model
@@ -303,8 +377,7 @@ class Endpoint:
 
         protocol = operation_model.service_model.resolved_protocol
         customized_response_dict = {}
-        self._event_emitter.emit(
-            f"before-parse.{service_id}.{operation_model.name}",
+        self._get_handler_chain('before-parse', operation_model).emit(
             operation_model=operation_model,
             response_dict=response_dict,
             customized_response_dict=customized_response_dict,
@@ -355,10 +428,31 @@ class Endpoint:
         response=None,
         caught_exception=None,
     ):
-        service_id = operation_model.service_model.service_id.hyphenize()
-        event_name = f"needs-retry.{service_id}.{operation_model.name}"
-        responses = self._event_emitter.emit(
-            event_name,
+        retry_delay = self._get_retry_delay(
+            attempts,
+            operation_model,
+            request_dict,
+            response,
+            caught_exception,
+        )
+        if retry_delay is None:
+            return False
+        time.sleep(retry_delay)
+        return True
+
+    def _get_retry_delay(
+        self,
+        attempts,
+        operation_model,
+        request_dict,
+        response,
+        caught_exception,
+    ):
+        # Returns the number of seconds to sleep before retrying the
+        # request, or None if it should not be retried.
+        responses = self._get_handler_chain(
+            'needs-retry', operation_model
+        ).emit(
             response=response,
             endpoint=self,
             operation=operation_model,
@@ -368,21 +462,159 @@ class Endpoint:
         )
         handler_response = first_non_none_response(responses)
         if handler_response is None or handler_response is False:
-            return False
-        else:
-            # Request needs to be retried, and we need to sleep
-            # for the specified number of times.
-            logger.debug(
-                "Response received to retry, sleeping for %s seconds",
-                handler_response,
-            )
-            time.sleep(handler_response)
-            return True
+            return None
+        # Request needs to be retried, and we need to sleep
+        # for the specified number of times.
+        logger.debug(
+            "Response received to retry, sleeping for %s seconds",
+            handler_response,
+        )
+        return handler_response
 
     def _send(self, request):
         return self.http_session.send(request)
 
 
+class AsyncEndpoint(Endpoint):
+    """An endpoint that makes requests without blocking the event loop.
+
+    ``make_request`` and ``close`` are coroutines, as are the ``send`` and
+    ``close`` methods of the HTTP session, which defaults to
+    :class:`botocore.asynchttpsession.AsyncioHTTPSession`.  Streaming
+    bodies and event streams are read from the connection as they're
+    consumed, through :class:`botocore.response.AsyncStreamingBody` and
+    :class:`botocore.eventstream.AsyncEventStream`.  Event handlers are
+    still invoked synchronously.
+    """
+
+    def __init__(
+        self,
+        host,
+        endpoint_prefix,
+        event_emitter,
+        response_parser_factory=None,
+        http_session=None,
+    ):
+        if http_session is None:
+            http_session = AsyncioHTTPSession()
+        super().__init__(
+            host,
+            endpoint_prefix,
+            event_emitter,
+            response_parser_factory=response_parser_factory,
+            http_session=http_session,
+        )
+
+    async def close(self):
+        await self.http_session.close()
+
+    async def warm_up(self, url, connections=1, parallel=False):
+        return await self.http_session.warm_up(
+            url, connections=connections, parallel=parallel
+        )
+
+    async def make_request(self, operation_model, request_dict):
+        logger.debug(
+            "Making request for %s with params: %s",
+            operation_model,
+            request_dict,
+        )
+        return await self._send_request(request_dict, operation_model)
+
+    async def _send_request(self, request_dict, operation_model):
+        attempts = 1
+        context = request_dict['context']
+        self._update_retries_context(context, attempts)
+        request = self.create_request(request_dict, operation_model)
+        success_response, exception = await self._get_response(
+            request, operation_model, context
+        )
+        while await self._needs_retry(
+            attempts,
+            operation_model,
+            request_dict,
+            success_response,
+            exception,
+        ):
+            attempts += 1
+            request = self._create_retry_request(
+                request,
+                request_dict,
+                operation_model,
+                attempts,
+                success_response,
+            )
+            success_response, exception = await self._get_response(
+                request, operation_model, context
+            )
+        return self._handle_final_response(
+            attempts, success_response, exception
+        )
+
+    async def _get_response(self, request, operation_model, context):
+        success_response, exception = await self._do_get_response(
+            request, operation_model, context
+        )
+        self._emit_response_received(
+            success_response, exception, operation_model, context
+        )
+        return success_response, exception
+
+    async def _do_get_response(self, request, operation_model, context):
+        try:
+            http_response = self._emit_before_send(request, operation_model)
+            if http_response is None:
+                http_response = await self._send(request)
+                await self._buffer_initial_event(
+                    http_response, operation_model
+                )
+        except HTTPClientError as e:
+            return (None, e)
+        except Exception as e:
+            logger.debug(
+                "Exception received when sending HTTP request.", exc_info=True
+            )
+            return (None, e)
+        return self._parse_http_response(
+            http_response, operation_model, context
+        )
+
+    async def _buffer_initial_event(self, http_response, operation_model):
+        # Parsing is synchronous, so the initial-response event is read from
+        # the connection before the response is parsed.
+        protocol = operation_model.service_model.resolved_protocol
+        if (
+            http_response.status_code < 300
+            and operation_model.has_event_stream_output
+            and protocol in INITIAL_RESPONSE_PROTOCOLS
+            and is_async_stream(http_response.raw)
+        ):
+            await buffer_initial_event(http_response.raw)
+
+    async def _needs_retry(
+        self,
+        attempts,
+        operation_model,
+        request_dict,
+        response=None,
+        caught_exception=None,
+    ):
+        retry_delay = self._get_retry_delay(
+            attempts,
+            operation_model,
+            request_dict,
+            response,
+            caught_exception,
+        )
+        if retry_delay is None:
+            return False
+        await asyncio.sleep(retry_delay)
+        return True
+
+    async def _send(self, request):
+        return await self.http_session.send(request)
+
+
 class EndpointCreator:
     def __init__(self, event_emitter):
         self._event_emitter = event_emitter
@@ -401,6 +633,8 @@ class EndpointCreator:
         socket_options=None,
         client_cert=None,
         proxies_config=None,
+        endpoint_cls=Endpoint,
+        dns_cache=None,
     ):
         if not is_valid_endpoint_url(
             endpoint_url
@@ -412,6 +646,11 @@ class EndpointCreator:
         endpoint_prefix = service_model.endpoint_prefix
 
         logger.debug('Setting %s timeout as %s', endpoint_prefix, timeout)
+        session_kwargs = {}
+        if dns_cache is not None:
+            # Only passed when configured, so that custom session classes
+            # are only required to accept it then.
+            session_kwargs['dns_cache'] = dns_cache
         http_session = http_session_cls(
             timeout=timeout,
             proxies=proxies,
@@ -420,9 +659,19 @@ class EndpointCreator:
             socket_options=socket_options,
             client_cert=client_cert,
             proxies_config=proxies_config,
+            **session_kwargs,
         )
+        # Sessions that don't keep pool statistics have nothing to emit.
+        add_pool_listener = getattr(http_session, 'add_pool_listener', None)
+        if add_pool_listener is not None:
+            service_id = service_model.service_id.hyphenize()
+            add_pool_listener(
+                lambda event_name, **kwargs: self._event_emitter.emit(
+                    f'{event_name}.{service_id}', **kwargs
+                )
+            )
 
-        return Endpoint(
+        return endpoint_cls(
             endpoint_url,
             endpoint_prefix=endpoint_prefix,
             event_emitter=self._event_emitter,
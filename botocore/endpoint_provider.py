@@ -18,11 +18,29 @@ subject to abrupt breaking changes. Please do not use them directly.
 To view the raw JSON that the objects in this module represent, please
 go to any `endpoint-rule-set.json` file in /botocore/data/<service>/<api version>/
 or you can look at the test files in /tests/unit/data/endpoints/valid-rules/
+
+Rule sets are interpreted by walking the rule objects for every evaluation.
+A ``RuleSet`` created with ``compiled=True`` instead compiles its rules into
+closures: templates are parsed, library functions are looked up and scope
+copies are limited to rules that assign variables, once per rule rather than
+once per evaluation.  Tree rules compile their sub-rules the first time their
+conditions are met, so only the parts of a rule set that are used get
+compiled.
+
+An ``EndpointProvider`` created with a ``cache_size`` uses its own
+``EndpointCache`` of that size.  Besides exact parameter values, it caches the
+rules matched for parameters that ``ParameterAnalysis`` determines to be
+equivalent, so that resolving endpoints for many different bucket names, for
+example, only evaluates the rule set once.
 """
 
 import logging
 import re
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
 from enum import Enum
+from operator import methodcaller
 from string import Formatter
 from typing import NamedTuple
 
@@ -159,6 +177,182 @@ class RuleSetStandardLibrary:
             scope_vars[assign] = result
         return result
 
+    def compile_template_string(self, value):
+        """Return a function that resolves a template string.
+
+        :type value: str
+        :rtype: callable
+        """
+        parts = []
+        for literal, reference, _, _ in STRING_FORMATTER.parse(value):
+            if reference is not None:
+                parts.append((literal, tuple(reference.split("#"))))
+            else:
+                parts.append((literal, None))
+
+        def resolve_template_string(scope_vars):
+            result = ""
+            for literal, template_params in parts:
+                if template_params is not None:
+                    template_value = scope_vars
+                    for param in template_params:
+                        template_value = template_value[param]
+                    result += f"{literal}{template_value}"
+                else:
+                    result += literal
+            return result
+
+        return resolve_template_string
+
+    def compile_value(self, value):
+        """Return a function that evaluates ``value`` like ``resolve_value``.
+
+        :type value: Any
+        :rtype: callable
+        """
+        if self.is_func(value):
+            return self.compile_function(value)
+        elif self.is_ref(value):
+            return methodcaller("get", value["ref"])
+        elif self.is_template(value):
+            return self.compile_template_string(value)
+        return lambda scope_vars: value
+
+    def compile_function(self, func_signature):
+        """Return a function that calls a library function like
+        ``call_function``.
+
+        :type func_signature: dict
+        :rtype: callable
+        """
+        func_name = self.convert_func_name(func_signature["fn"])
+        func = getattr(self, func_name, None)
+        if func is None:
+            # Raise the same error as call_function(), but only if the
+            # function is actually called.
+            def func(*args):
+                return getattr(self, func_name)(*args)
+
+        argv = func_signature["argv"]
+        func_args = [self.compile_value(arg) for arg in argv]
+        assign = func_signature.get("assign")
+        if assign is None:
+            compiled = self._compile_builtin_function(
+                func_name, func, argv, func_args
+            )
+            if compiled is not None:
+                return compiled
+            if len(func_args) == 1:
+                (func_arg,) = func_args
+                return lambda scope_vars: func(func_arg(scope_vars))
+            elif func_args and all(map(self._is_literal, argv[1:])):
+                # Only the first argument needs to be resolved, which is
+                # the common case of a value checked against literals.
+                first_arg = func_args[0]
+                literals = argv[1:]
+                if len(literals) == 1:
+                    (literal,) = literals
+                    return lambda scope_vars: func(
+                        first_arg(scope_vars), literal
+                    )
+                return lambda scope_vars: func(
+                    first_arg(scope_vars), *literals
+                )
+            elif len(func_args) == 2:
+                first_arg, second_arg = func_args
+                return lambda scope_vars: func(
+                    first_arg(scope_vars), second_arg(scope_vars)
+                )
+            return lambda scope_vars: func(
+                *[func_arg(scope_vars) for func_arg in func_args]
+            )
+
+        def call_function(scope_vars):
+            result = func(*[func_arg(scope_vars) for func_arg in func_args])
+            if assign in scope_vars:
+                raise EndpointResolutionError(
+                    msg=f"Assignment {assign} already exists in "
+                    "scoped variables and cannot be overwritten"
+                )
+            scope_vars[assign] = result
+            return result
+
+        return call_function
+
+    def _is_literal(self, value):
+        return not (
+            self.is_func(value)
+            or self.is_ref(value)
+            or self.is_template(value)
+        )
+
+    def _compile_builtin_function(self, func_name, func, argv, func_args):
+        compile_function = self._COMPILED_FUNCTIONS.get(func_name)
+        # Functions overridden by a subclass are always called.
+        if compile_function is None or getattr(
+            type(self), func_name
+        ) is not getattr(RuleSetStandardLibrary, func_name):
+            return None
+        return compile_function(self, func, argv, func_args)
+
+    def _compile_equals(self, func, argv, func_args, value_type):
+        # Inlines the comparison of a value with a literal of the expected
+        # type, calling the library function when the value has a
+        # different type so that it raises the same error.
+        if len(argv) != 2 or not isinstance(argv[1], value_type):
+            return None
+        first_arg = func_args[0]
+        expected = argv[1]
+
+        def equals(scope_vars):
+            value = first_arg(scope_vars)
+            if type(value) is value_type:
+                return value == expected
+            return func(value, expected)
+
+        return equals
+
+    def _compile_boolean_equals(self, func, argv, func_args):
+        return self._compile_equals(func, argv, func_args, bool)
+
+    def _compile_string_equals(self, func, argv, func_args):
+        if not self._is_literal(argv[1]):
+            return None
+        return self._compile_equals(func, argv, func_args, str)
+
+    def _compile_get_attr(self, func, argv, func_args):
+        # Paths that name a single attribute are looked up directly.
+        if (
+            len(argv) != 2
+            or not isinstance(argv[1], str)
+            or "." in argv[1]
+            or GET_ATTR_RE.search(argv[1]) is not None
+        ):
+            return None
+        first_arg = func_args[0]
+        name = argv[1]
+        return lambda scope_vars: first_arg(scope_vars)[name]
+
+    def _compile_not(self, func, argv, func_args):
+        if len(func_args) != 1:
+            return None
+        (func_arg,) = func_args
+        return lambda scope_vars: not func_arg(scope_vars)
+
+    def _compile_is_set(self, func, argv, func_args):
+        if len(func_args) != 1:
+            return None
+        (func_arg,) = func_args
+        return lambda scope_vars: func_arg(scope_vars) is not None
+
+    _COMPILED_FUNCTIONS = {
+        "boolean_equals": _compile_boolean_equals,
+        "string_equals": _compile_string_equals,
+        "get_attr": _compile_get_attr,
+        "_not": _compile_not,
+        "is_set": _compile_is_set,
+    }
+
     def is_set(self, value):
         """Evaluates whether a value is set.
 
@@ -435,6 +629,79 @@ class BaseRule:
                 return False
         return True
 
+    def compile(self, rule_lib, match=False):
+        """Return a function that evaluates the rule like ``evaluate``.
+
+        With ``match`` set, an endpoint is returned as a ``RuleMatch``
+        that also records how the endpoint was found.
+
+        :type rule_lib: RuleSetStandardLibrary
+        :type match: bool
+        :rtype: callable
+        """
+        raise NotImplementedError()
+
+    @property
+    def assigns_variables(self):
+        """Whether evaluating the rule's conditions adds to its scope."""
+        return any("assign" in condition for condition in self.conditions)
+
+    def _compile_path(self, rule_lib):
+        assignments = self.compile_assignments(rule_lib)
+        return () if assignments is None else (assignments,)
+
+    def compile_conditions(self, rule_lib):
+        """Return a function that determines if all conditions are met.
+
+        :type rule_lib: RuleSetStandardLibrary
+        :rtype: callable
+        """
+        return self._compile_conditions(self.conditions, rule_lib)
+
+    def compile_assignments(self, rule_lib):
+        """Return a function that only evaluates the conditions that assign
+        variables and determines if they are met, or ``None`` if the rule
+        doesn't assign any variables.
+
+        :type rule_lib: RuleSetStandardLibrary
+        :rtype: callable
+        """
+        if not self.assigns_variables:
+            return None
+        return self._compile_conditions(
+            [
+                condition
+                for condition in self.conditions
+                if "assign" in condition
+            ],
+            rule_lib,
+        )
+
+    def _compile_conditions(self, func_signatures, rule_lib):
+        conditions = [
+            rule_lib.compile_function(func_signature)
+            for func_signature in func_signatures
+        ]
+        if not conditions:
+            return lambda scope_vars: True
+        elif len(conditions) == 1:
+            (condition,) = conditions
+
+            def evaluate_condition(scope_vars):
+                result = condition(scope_vars)
+                return result is not False and result is not None
+
+            return evaluate_condition
+
+        def evaluate_conditions(scope_vars):
+            for condition in conditions:
+                result = condition(scope_vars)
+                if result is False or result is None:
+                    return False
+            return True
+
+        return evaluate_conditions
+
 
 class RuleSetEndpoint(NamedTuple):
     """A resolved endpoint object returned by a rule."""
@@ -444,6 +711,17 @@ class RuleSetEndpoint(NamedTuple):
     headers: dict
 
 
+class RuleMatch(NamedTuple):
+    """An endpoint along with the rules that were matched to find it."""
+
+    endpoint: RuleSetEndpoint
+    # The functions that assign the variables of the matched rules, from
+    # the outermost tree rule to the endpoint rule.
+    path: tuple
+    # The function that renders the endpoint from the matched scope.
+    render: Callable
+
+
 class EndpointRule(BaseRule):
     def __init__(self, endpoint, **kwargs):
         super().__init__(**kwargs)
@@ -469,6 +747,69 @@ class EndpointRule(BaseRule):
 
         return None
 
+    def compile(self, rule_lib, match=False):
+        conditions = self.compile_conditions(rule_lib)
+        url = rule_lib.compile_value(self.endpoint["url"])
+        properties = self.compile_properties(
+            self.endpoint.get("properties", {}), rule_lib
+        )
+        headers = [
+            (header, [rule_lib.compile_value(item) for item in values])
+            for header, values in self.endpoint.get("headers", {}).items()
+        ]
+
+        def render(scope_vars):
+            return RuleSetEndpoint(
+                url=url(scope_vars),
+                properties=properties(scope_vars),
+                headers={
+                    header: [value(scope_vars) for value in values]
+                    for header, values in headers
+                },
+            )
+
+        if match:
+            path = self._compile_path(rule_lib)
+
+            def evaluate(scope_vars):
+                if conditions(scope_vars):
+                    return RuleMatch(render(scope_vars), path, render)
+                return None
+
+            return evaluate
+
+        def evaluate(scope_vars):
+            if conditions(scope_vars):
+                return render(scope_vars)
+            return None
+
+        return evaluate
+
+    def compile_properties(self, properties, rule_lib):
+        """Return a function that resolves ``properties`` like
+        ``resolve_properties``.
+
+        :type properties: dict/list/str
+        :type rule_lib: RuleSetStandardLibrary
+        :rtype: callable
+        """
+        if isinstance(properties, list):
+            items = [
+                self.compile_properties(prop, rule_lib) for prop in properties
+            ]
+            return lambda scope_vars: [item(scope_vars) for item in items]
+        elif isinstance(properties, dict):
+            items = [
+                (key, self.compile_properties(value, rule_lib))
+                for key, value in properties.items()
+            ]
+            return lambda scope_vars: {
+                key: item(scope_vars) for key, item in items
+            }
+        elif rule_lib.is_template(properties):
+            return rule_lib.compile_template_string(properties)
+        return lambda scope_vars: properties
+
     def resolve_properties(self, properties, scope_vars, rule_lib):
         """Traverse `properties` attribute, resolving any template strings.
 
@@ -526,6 +867,17 @@ class ErrorRule(BaseRule):
             raise EndpointResolutionError(msg=error)
         return None
 
+    def compile(self, rule_lib, match=False):
+        conditions = self.compile_conditions(rule_lib)
+        error = rule_lib.compile_value(self.error)
+
+        def evaluate(scope_vars):
+            if conditions(scope_vars):
+                raise EndpointResolutionError(msg=error(scope_vars))
+            return None
+
+        return evaluate
+
 
 class TreeRule(BaseRule):
     """A tree rule is non-terminal meaning it will never be returned to a provider.
@@ -552,6 +904,54 @@ class TreeRule(BaseRule):
                     return rule_result
         return None
 
+    def compile(self, rule_lib, match=False):
+        conditions = self.compile_conditions(rule_lib)
+        evaluate_rules = None
+
+        def evaluate(scope_vars):
+            nonlocal evaluate_rules
+            if conditions(scope_vars):
+                if evaluate_rules is None:
+                    evaluate_rules = _compile_rules(
+                        self.rules, rule_lib, match
+                    )
+                return evaluate_rules(scope_vars)
+            return None
+
+        if match:
+            path = self._compile_path(rule_lib)
+
+            def evaluate_match(scope_vars):
+                result = evaluate(scope_vars)
+                if result is not None:
+                    return result._replace(path=path + result.path)
+                return None
+
+            return evaluate_match
+        return evaluate
+
+
+def _compile_rules(rules, rule_lib, match=False):
+    # Returns a function that evaluates rules in order and returns the
+    # first result.  Only rules that assign variables can change their
+    # scope, so only those get a copy of it.
+    compiled_rules = [
+        (rule.compile(rule_lib, match), rule.assigns_variables)
+        for rule in rules
+    ]
+
+    def evaluate_rules(scope_vars):
+        for evaluate, assigns_variables in compiled_rules:
+            if assigns_variables:
+                rule_result = evaluate(scope_vars.copy())
+            else:
+                rule_result = evaluate(scope_vars)
+            if rule_result:
+                return rule_result
+        return None
+
+    return evaluate_rules
+
 
 class RuleCreator:
     endpoint = EndpointRule
@@ -656,13 +1056,22 @@ class RuleSet:
     """Collection of rules to derive a routable service endpoint."""
 
     def __init__(
-        self, version, parameters, rules, partitions, documentation=None
+        self,
+        version,
+        parameters,
+        rules,
+        partitions,
+        documentation=None,
+        compiled=False,
     ):
         self.version = version
         self.parameters = self._ingest_parameter_spec(parameters)
         self.rules = [RuleCreator.create(**rule) for rule in rules]
         self.rule_lib = RuleSetStandardLibrary(partitions)
         self.documentation = documentation
+        self._compiled = compiled
+        self._evaluate_rules = None
+        self._match_rules = None
 
     def _ingest_parameter_spec(self, parameters):
         return {
@@ -695,25 +1104,499 @@ class RuleSet:
         :type input_parameters: dict
         """
         self.process_input_parameters(input_parameters)
+        if self._compiled:
+            if self._evaluate_rules is None:
+                self._evaluate_rules = _compile_rules(
+                    self.rules, self.rule_lib
+                )
+            return self._evaluate_rules(input_parameters)
         for rule in self.rules:
             evaluation = rule.evaluate(input_parameters.copy(), self.rule_lib)
             if evaluation is not None:
                 return evaluation
         return None
 
+    def match(self, input_parameters):
+        """Evaluate input parameters against compiled rules, returning the
+        first match along with the path of rules that led to it.
+        ``input_parameters`` must already be processed.
+
+        :type input_parameters: dict
+        :rtype: RuleMatch
+        """
+        if self._match_rules is None:
+            self._match_rules = _compile_rules(
+                self.rules, self.rule_lib, match=True
+            )
+        return self._match_rules(input_parameters)
+
+    def replay(self, rule_match, input_parameters):
+        """Render the endpoint of a previous match for new parameters.
+
+        The conditions along the matched path that assign variables are
+        re-evaluated to rebuild the scope the endpoint is rendered from.
+        ``None`` is returned if any of them is no longer met.  The other
+        conditions are not evaluated, so the parameters must be known to
+        match the same rules, such as by having the same
+        ``ParameterAnalysis`` key.  ``input_parameters`` must already be
+        processed.
+
+        :type rule_match: RuleMatch
+        :type input_parameters: dict
+        :rtype: RuleSetEndpoint
+        """
+        for assignments in rule_match.path:
+            if not assignments(input_parameters):
+                return None
+        return rule_match.render(input_parameters)
+
+
+# Placeholder recorded in cache keys when computing a part of the key raises.
+_ERROR = object()
+_MISSING = object()
+# Marks the end of the conditions of a rule that is known to be reached.
+_STOP = object()
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return tuple(
+            sorted((key, _freeze(item)) for key, item in value.items())
+        )
+    elif isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _is_true(value):
+    if value is _ERROR:
+        return _ERROR
+    return value is not None and value is not False
+
+
+def _compute_steps(steps, scope_vars, key):
+    # Returns True once a rule that ends the evaluation of the rule set is
+    # reached.
+    for step in steps:
+        if step is _STOP:
+            return True
+        name, compute, contribute, children = step
+        value = scope_vars.get(name, _MISSING)
+        if value is _MISSING:
+            try:
+                value = compute(scope_vars)
+            except Exception:
+                # Matching the rules raises for these parameters, so the
+                # value itself never affects a match.
+                value = _ERROR
+            scope_vars[name] = value
+        if contribute is not None:
+            key.append(contribute(value))
+        # The functions that follow a condition are only evaluated if it is
+        # met, which is determined by the key.
+        if children and value is not None and value is not False:
+            if value is not _ERROR and _compute_steps(
+                children, scope_vars, key
+            ):
+                return True
+    return False
+
+
+class ParameterAnalysis:
+    """Determines which properties of the input parameters affect the rules
+    that are matched in a rule set.
+
+    Resolving the same rule set for different values of a string parameter,
+    such as different bucket names, often matches the same rules.  Rather
+    than the raw value of a string parameter, only the results of the
+    conditions that use it are made part of the key returned by
+    ``cache_key``.  Values assigned from such conditions are followed
+    through the rule set the same way.  When a parameter or assigned value
+    is used in a way that can't be evaluated outside of its rule, its value
+    is made part of the key instead.  Uses in endpoint URLs, properties,
+    headers and errors never affect which rules are matched, so parameters
+    that are only used there are not part of the key at all.
+
+    The conditions are arranged in a tree so that computing a key skips the
+    conditions that follow one that isn't met, and stops at a rule that is
+    known to end the evaluation of the rule set.  Two sets of parameters
+    with the same key match the same rules.
+    """
+
+    def __init__(self, ruleset):
+        self._rule_lib = ruleset.rule_lib
+        self._parameters = ruleset.parameters
+        self._roots = {
+            name: _Derivation(name)
+            for name, spec in self._parameters.items()
+            if spec.parameter_type is str
+        }
+        self._names = {}
+        self._referenced = set()
+        self._assigned = set()
+        root_step = _Derivation(None)
+        self._analyze_rules(ruleset.rules, self._roots, root_step)
+        # Rules can also refer to input parameters that aren't declared.
+        undeclared = self._referenced - self._assigned - set(self._parameters)
+        self.referenced_parameters = tuple(
+            name for name in self._parameters if name in self._referenced
+        ) + tuple(sorted(undeclared))
+        self._compiled_steps = self._compile_steps(root_step)
+        self._raw_parameters = tuple(
+            name
+            for name in self.referenced_parameters
+            if name not in self._roots or self._roots[name].frozen
+        )
+
+    def cache_key(self, input_parameters):
+        """Return a key that only changes with the properties of the
+        parameters that affect which rules are matched.
+
+        :type input_parameters: dict
+        :rtype: tuple
+        """
+        key = []
+        _compute_steps(self._compiled_steps, input_parameters.copy(), key)
+        for name in self._raw_parameters:
+            key.append(_freeze(input_parameters.get(name)))
+        return tuple(key)
+
+    def _analyze_rules(self, rules, derived, parent, reached=True):
+        # ``parent`` is the step of the last condition before the rules
+        # that is computed for keys.  ``reached`` is whether all conditions
+        # before the rules are computed, so that the rules are known to be
+        # evaluated if those conditions are met.
+        for rule in rules:
+            rule_derived = dict(derived)
+            rule_parent = parent
+            rule_reached = reached
+            for func_signature in rule.conditions:
+                if "assign" in func_signature:
+                    self._assigned.add(func_signature["assign"])
+                step = self._analyze_condition(
+                    func_signature, rule_derived, rule_parent
+                )
+                if step is None:
+                    rule_reached = False
+                else:
+                    rule_parent = step
+            if isinstance(rule, TreeRule):
+                self._analyze_rules(
+                    rule.rules, rule_derived, rule_parent, rule_reached
+                )
+                continue
+            elif isinstance(rule, EndpointRule):
+                self._referenced.update(self._references(rule.endpoint))
+            elif isinstance(rule, ErrorRule):
+                self._referenced.update(self._references(rule.error))
+            if rule_reached:
+                # Evaluating the rule set ends with this rule if its
+                # conditions are met, so the rules after it don't matter.
+                rule_parent.children.append(_STOP)
+
+    def _analyze_condition(
+        self, func_signature, derived, parent, nested=False
+    ):
+        # Returns the step that computes the function for cache keys, if
+        # the function can be computed outside of its rule.
+        references = self._references(func_signature)
+        self._referenced.update(references)
+        if not references.intersection(derived):
+            if nested or not references.issubset(self._parameters):
+                return None
+            # The condition only depends on parameters whose values are
+            # part of the key.  It is still computed so that the conditions
+            # that follow it are skipped when it isn't met.
+            step = self._add_step(func_signature, parent)
+            step.contributes = False
+            return step
+        if not all(
+            name in derived or name in self._parameters for name in references
+        ):
+            # The function depends on values assigned from parameters that
+            # aren't derived, so it can only be evaluated within its rule.
+            # Values derived from parameters that it uses directly become
+            # part of the key, functions it calls are analyzed on their own.
+            for arg in func_signature["argv"]:
+                if self._rule_lib.is_func(arg):
+                    self._analyze_condition(arg, derived, parent, nested=True)
+                else:
+                    for name in self._references(arg):
+                        if name in derived:
+                            derived[name].frozen = True
+            return None
+        func_signature = self._rewrite(func_signature, derived)
+        assign = func_signature.pop("assign", None)
+        step = self._add_step(func_signature, parent)
+        step.contributes = True
+        if nested:
+            step.frozen = True
+        if assign is not None:
+            derived[assign] = step
+        return step
+
+    def _add_step(self, func_signature, parent):
+        signature = repr(func_signature)
+        # Only the same condition at the start of consecutive rules is
+        # computed by a single step, so that steps are computed in the
+        # order that the rules are evaluated.
+        if parent.children:
+            step = parent.children[-1]
+            if step is not _STOP and step.signature == signature:
+                return step
+        # Steps that compute the same function share their name, so that
+        # it is only computed once per key.
+        name = self._names.setdefault(
+            signature, f"derived{_letters(len(self._names))}"
+        )
+        step = _Derivation(name)
+        step.signature = signature
+        step.compute = self._rule_lib.compile_function(func_signature)
+        parent.children.append(step)
+        return step
+
+    def _contribution(self, step):
+        if not step.contributes:
+            return None
+        elif step.frozen:
+            return _freeze
+        return _is_true
+
+    def _compile_steps(self, parent):
+        return tuple(
+            step
+            if step is _STOP
+            else (
+                step.name,
+                step.compute,
+                self._contribution(step),
+                self._compile_steps(step) if step.children else None,
+            )
+            for step in parent.children
+        )
+
+    def _references(self, value):
+        if isinstance(value, dict):
+            if self._rule_lib.is_ref(value):
+                return {value["ref"]}
+            references = set()
+            for key, item in value.items():
+                if key != "assign":
+                    references.update(self._references(item))
+            return references
+        elif isinstance(value, list):
+            references = set()
+            for item in value:
+                references.update(self._references(item))
+            return references
+        elif self._rule_lib.is_template(value):
+            return {
+                reference.split("#")[0]
+                for _, reference, _, _ in STRING_FORMATTER.parse(value)
+                if reference is not None
+            }
+        return set()
+
+    def _rewrite(self, value, derived):
+        # Refers to derived values by the names ``cache_key`` stores them
+        # under rather than by the names they are assigned to in the rule.
+        if self._rule_lib.is_func(value):
+            rewritten = dict(value)
+            rewritten["argv"] = [
+                self._rewrite(arg, derived) for arg in value["argv"]
+            ]
+            return rewritten
+        elif self._rule_lib.is_ref(value):
+            derivation = derived.get(value["ref"])
+            if derivation is not None:
+                return {"ref": derivation.name}
+        elif self._rule_lib.is_template(value):
+            result = ""
+            for literal, reference, _, _ in STRING_FORMATTER.parse(value):
+                result += literal.replace("{", "{{").replace("}", "}}")
+                if reference is not None:
+                    name, separator, path = reference.partition("#")
+                    if name in derived:
+                        name = derived[name].name
+                    result += f"{{{name}{separator}{path}}}"
+            return result
+        return value
+
+
+class _Derivation:
+    # A parameter, or a function of parameters that is computed for cache
+    # keys by ParameterAnalysis along with the functions that follow it.
+    def __init__(self, name):
+        self.name = name
+        self.signature = None
+        self.compute = None
+        self.children = []
+        # Whether the result is part of cache keys at all.
+        self.contributes = True
+        # Whether the value itself rather than whether it is set is part
+        # of cache keys.
+        self.frozen = False
+
+
+def _letters(number):
+    # Template strings can only refer to names made up of letters.
+    letters = ""
+    while True:
+        number, remainder = divmod(number, 26)
+        letters += chr(ord("A") + remainder)
+        if not number:
+            return letters
+
+
+class EndpointCacheInfo(NamedTuple):
+    """Statistics of an ``EndpointCache``."""
+
+    hits: int
+    derived_hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class EndpointCache:
+    """A least recently used cache of endpoints resolved from a rule set.
+
+    Endpoints are cached by the values of the parameters the rule set
+    references.  On a miss, the parameters are keyed with
+    ``ParameterAnalysis.cache_key``.  If the rules matched for another set
+    of parameters with the same key are found, the endpoint is rendered
+    from them without evaluating the rest of the rule set, which is
+    counted as a derived hit.  Failed resolutions are never cached.
+    """
+
+    def __init__(self, ruleset, maxsize=CACHE_SIZE):
+        self._ruleset = ruleset
+        self._maxsize = maxsize
+        self._analysis = None
+        self._endpoints = OrderedDict()
+        self._matches = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._derived_hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def resolve_endpoint(self, input_parameters):
+        """Return the endpoint for the input parameters.
+
+        :type input_parameters: dict
+        :rtype: RuleSetEndpoint
+        """
+        if self._analysis is None:
+            self._analysis = ParameterAnalysis(self._ruleset)
+        for name, value in input_parameters.items():
+            if isinstance(value, list):
+                input_parameters[name] = tuple(value)
+        key = tuple(
+            input_parameters.get(name)
+            for name in self._analysis.referenced_parameters
+        )
+        with self._lock:
+            endpoint = self._endpoints.get(key)
+            if endpoint is not None:
+                self._endpoints.move_to_end(key)
+                self._hits += 1
+                return endpoint
+
+        params_for_error = input_parameters.copy()
+        self._ruleset.process_input_parameters(input_parameters)
+        match_key = self._analysis.cache_key(input_parameters)
+        with self._lock:
+            rule_match = self._matches.get(match_key)
+            if rule_match is not None:
+                self._matches.move_to_end(match_key)
+        if rule_match is not None:
+            endpoint = self._ruleset.replay(
+                rule_match, input_parameters.copy()
+            )
+        if endpoint is None:
+            rule_match = self._ruleset.match(input_parameters)
+            if rule_match is None:
+                param_string = "\n".join(
+                    f"{name}: {value}"
+                    for name, value in params_for_error.items()
+                )
+                raise EndpointResolutionError(
+                    msg=f"No endpoint found for parameters:\n{param_string}"
+                )
+            endpoint = rule_match.endpoint
+            with self._lock:
+                self._misses += 1
+                self._store(self._matches, match_key, rule_match)
+                self._store(self._endpoints, key, endpoint)
+        else:
+            with self._lock:
+                self._derived_hits += 1
+                self._store(self._endpoints, key, endpoint)
+        return endpoint
+
+    def _store(self, cache, key, value):
+        cache[key] = value
+        cache.move_to_end(key)
+        if len(cache) > self._maxsize:
+            cache.popitem(last=False)
+            self._evictions += 1
+
+    def cache_info(self):
+        """Return statistics about the cache.
+
+        :rtype: EndpointCacheInfo
+        """
+        with self._lock:
+            return EndpointCacheInfo(
+                hits=self._hits,
+                derived_hits=self._derived_hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                maxsize=self._maxsize,
+                currsize=len(self._endpoints),
+            )
+
 
 class EndpointProvider:
     """Derives endpoints from a RuleSet for given input parameters."""
 
-    def __init__(self, ruleset_data, partition_data, excluded_params=None):
-        self.ruleset = RuleSet(**ruleset_data, partitions=partition_data)
+    def __init__(
+        self,
+        ruleset_data,
+        partition_data,
+        excluded_params=None,
+        compiled=False,
+        cache_size=None,
+    ):
+        self.ruleset = RuleSet(
+            **ruleset_data, partitions=partition_data, compiled=compiled
+        )
         self._excluded_params = excluded_params or frozenset()
+        self._cache = None
+        if cache_size is not None:
+            self._cache = EndpointCache(self.ruleset, maxsize=cache_size)
 
     def resolve_endpoint(self, **input_parameters):
         for param in self._excluded_params:
             input_parameters.pop(param, None)
+        if self._cache is not None:
+            return self._cache.resolve_endpoint(input_parameters)
         return self._resolve_endpoint(**input_parameters)
 
+    def cache_info(self):
+        """Return statistics about the provider's endpoint cache.
+
+        Only providers created with a ``cache_size`` have their own cache,
+        ``None`` is returned for others.
+
+        :rtype: EndpointCacheInfo
+        """
+        if self._cache is None:
+            return None
+        return self._cache.cache_info()
+
     @lru_cache_weakref(maxsize=CACHE_SIZE)
     def _resolve_endpoint(self, **input_parameters):
         """Match input parameters to a rule.
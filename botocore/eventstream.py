@@ -13,7 +13,7 @@
 """Binary Event Stream Decoding"""
 
 from binascii import crc32
-from struct import unpack
+from struct import unpack, unpack_from
 
 from botocore.exceptions import EventStreamError
 
@@ -133,7 +133,7 @@ class DecodeUtils:
         :rtype: (int, int)
         :returns: A tuple containing the (parsed integer value, bytes consumed)
         """
-        value = unpack(DecodeUtils.UINT8_BYTE_FORMAT, data[:1])[0]
+        value = unpack_from(DecodeUtils.UINT8_BYTE_FORMAT, data)[0]
         return value, 1
 
     @staticmethod
@@ -146,7 +146,7 @@ class DecodeUtils:
         :rtype: (int, int)
         :returns: A tuple containing the (parsed integer value, bytes consumed)
         """
-        value = unpack(DecodeUtils.UINT32_BYTE_FORMAT, data[:4])[0]
+        value = unpack_from(DecodeUtils.UINT32_BYTE_FORMAT, data)[0]
         return value, 4
 
     @staticmethod
@@ -159,7 +159,7 @@ class DecodeUtils:
         :rtype: (int, int)
         :returns: A tuple containing the (parsed integer value, bytes consumed)
         """
-        value = unpack(DecodeUtils.INT8_BYTE_FORMAT, data[:1])[0]
+        value = unpack_from(DecodeUtils.INT8_BYTE_FORMAT, data)[0]
         return value, 1
 
     @staticmethod
@@ -173,7 +173,7 @@ class DecodeUtils:
         :rtype: (int, int)
         :returns: A tuple containing the (parsed integer value, bytes consumed)
         """
-        value = unpack(DecodeUtils.INT16_BYTE_FORMAT, data[:2])[0]
+        value = unpack_from(DecodeUtils.INT16_BYTE_FORMAT, data)[0]
         return value, 2
 
     @staticmethod
@@ -187,7 +187,7 @@ class DecodeUtils:
         :rtype: (int, int)
         :returns: A tuple containing the (parsed integer value, bytes consumed)
         """
-        value = unpack(DecodeUtils.INT32_BYTE_FORMAT, data[:4])[0]
+        value = unpack_from(DecodeUtils.INT32_BYTE_FORMAT, data)[0]
         return value, 4
 
     @staticmethod
@@ -201,7 +201,7 @@ class DecodeUtils:
         :rtype: (int, int)
         :returns: A tuple containing the (parsed integer value, bytes consumed)
         """
-        value = unpack(DecodeUtils.INT64_BYTE_FORMAT, data[:8])[0]
+        value = unpack_from(DecodeUtils.INT64_BYTE_FORMAT, data)[0]
         return value, 8
 
     @staticmethod
@@ -224,9 +224,9 @@ class DecodeUtils:
         :returns: A tuple containing the (parsed byte array, bytes consumed).
         """
         uint_byte_format = DecodeUtils.UINT_BYTE_FORMAT[length_byte_size]
-        length = unpack(uint_byte_format, data[:length_byte_size])[0]
+        length = unpack_from(uint_byte_format, data)[0]
         bytes_end = length + length_byte_size
-        array_bytes = data[length_byte_size:bytes_end]
+        array_bytes = bytes(data[length_byte_size:bytes_end])
         return array_bytes, bytes_end
 
     @staticmethod
@@ -264,7 +264,7 @@ class DecodeUtils:
         :rtype: (bytes, int)
         :returns: A tuple containing the (uuid bytes, bytes consumed).
         """
-        return data[:16], 16
+        return bytes(data[:16]), 16
 
     @staticmethod
     def unpack_prelude(data):
@@ -356,7 +356,9 @@ class EventStreamHeaderParser:
 
     Expects all of the header data upfront and creates a dictionary of headers
     to return. This object can be reused multiple times to parse the headers
-    from multiple event stream messages.
+    from multiple event stream messages. The header data is parsed through a
+    ``memoryview`` so that advancing past each header does not copy the rest
+    of the data.
     """
 
     # Maps header type to appropriate unpacking function
@@ -390,15 +392,20 @@ class EventStreamHeaderParser:
     def parse(self, data):
         """Parses the event stream headers from an event stream message.
 
-        :type data: bytes
+        :type data: bytes-like object
         :param data: The bytes that correspond to the headers section of an
         event stream message.
 
         :rtype: dict
         :returns: A dictionary of header key, value pairs.
         """
-        self._data = data
-        return self._parse_headers()
+        self._data = memoryview(data)
+        try:
+            return self._parse_headers()
+        finally:
+            # Don't keep a view of the data, which would prevent a
+            # bytearray passed in from being resized.
+            self._data = None
 
     def _parse_headers(self):
         headers = {}
@@ -440,10 +447,16 @@ class EventStreamBuffer:
 
     A buffer class that wraps bytes from an event stream providing parsed
     messages as they become available via an iterable interface.
+
+    The data is kept in a ``bytearray`` with the offset of the next message
+    to parse, and messages are parsed through a ``memoryview`` of it, so
+    parsing a message only copies its payload.  The bytes of the parsed
+    messages are dropped the next time data is added.
     """
 
     def __init__(self):
-        self._data = b''
+        self._data = bytearray()
+        self._offset = 0
         self._prelude = None
         self._header_parser = EventStreamHeaderParser()
 
@@ -453,6 +466,11 @@ class EventStreamBuffer:
         :type data: bytes
         :param data: The bytes to add to the buffer to be used when parsing
         """
+        if self._offset:
+            # Deleting from the start of a bytearray doesn't move the rest
+            # of the data, so this is cheap even for large buffers.
+            del self._data[: self._offset]
+            self._offset = 0
         self._data += data
 
     def _validate_prelude(self, prelude):
@@ -463,53 +481,61 @@ class EventStreamBuffer:
             raise InvalidPayloadLength(prelude.payload_length)
 
     def _parse_prelude(self):
-        prelude_bytes = self._data[:_PRELUDE_LENGTH]
-        raw_prelude, _ = DecodeUtils.unpack_prelude(prelude_bytes)
-        prelude = MessagePrelude(*raw_prelude)
-        # The minus 4 removes the prelude crc from the bytes to be checked
-        _validate_checksum(prelude_bytes[: _PRELUDE_LENGTH - 4], prelude.crc)
+        with memoryview(self._data) as data:
+            prelude_bytes = data[self._offset : self._offset + _PRELUDE_LENGTH]
+            raw_prelude, _ = DecodeUtils.unpack_prelude(prelude_bytes)
+            prelude = MessagePrelude(*raw_prelude)
+            # The minus 4 removes the prelude crc from the bytes to be checked
+            _validate_checksum(
+                prelude_bytes[: _PRELUDE_LENGTH - 4], prelude.crc
+            )
         self._validate_prelude(prelude)
         return prelude
 
-    def _parse_headers(self):
-        header_bytes = self._data[_PRELUDE_LENGTH : self._prelude.headers_end]
+    def _parse_headers(self, message):
+        header_bytes = message[_PRELUDE_LENGTH : self._prelude.headers_end]
         return self._header_parser.parse(header_bytes)
 
-    def _parse_payload(self):
+    def _parse_payload(self, message):
         prelude = self._prelude
-        payload_bytes = self._data[prelude.headers_end : prelude.payload_end]
+        payload_bytes = bytes(
+            message[prelude.headers_end : prelude.payload_end]
+        )
         return payload_bytes
 
-    def _parse_message_crc(self):
+    def _parse_message_crc(self, message):
         prelude = self._prelude
-        crc_bytes = self._data[prelude.payload_end : prelude.total_length]
+        crc_bytes = message[prelude.payload_end : prelude.total_length]
         message_crc, _ = DecodeUtils.unpack_uint32(crc_bytes)
         return message_crc
 
-    def _parse_message_bytes(self):
+    def _parse_message_bytes(self, message):
         # The minus 4 includes the prelude crc to the bytes to be checked
-        message_bytes = self._data[
+        message_bytes = message[
             _PRELUDE_LENGTH - 4 : self._prelude.payload_end
         ]
         return message_bytes
 
-    def _validate_message_crc(self):
-        message_crc = self._parse_message_crc()
-        message_bytes = self._parse_message_bytes()
+    def _validate_message_crc(self, message):
+        message_crc = self._parse_message_crc(message)
+        message_bytes = self._parse_message_bytes(message)
         _validate_checksum(message_bytes, message_crc, crc=self._prelude.crc)
         return message_crc
 
     def _parse_message(self):
-        crc = self._validate_message_crc()
-        headers = self._parse_headers()
-        payload = self._parse_payload()
+        message_end = self._offset + self._prelude.total_length
+        with memoryview(self._data) as data:
+            raw_message = data[self._offset : message_end]
+            crc = self._validate_message_crc(raw_message)
+            headers = self._parse_headers(raw_message)
+            payload = self._parse_payload(raw_message)
         message = EventStreamMessage(self._prelude, headers, payload, crc)
         self._prepare_for_next_message()
         return message
 
     def _prepare_for_next_message(self):
-        # Advance the data and reset the current prelude
-        self._data = self._data[self._prelude.total_length :]
+        # Advance the offset and reset the current prelude
+        self._offset += self._prelude.total_length
         self._prelude = None
 
     def next(self):
@@ -518,13 +544,14 @@ class EventStreamBuffer:
         :rtype: EventStreamMessage
         :returns: The next event stream message
         """
-        if len(self._data) < _PRELUDE_LENGTH:
+        available = len(self._data) - self._offset
+        if available < _PRELUDE_LENGTH:
             raise StopIteration()
 
         if self._prelude is None:
             self._prelude = self._parse_prelude()
 
-        if len(self._data) < self._prelude.total_length:
+        if available < self._prelude.total_length:
             raise StopIteration()
 
         return self._parse_message()
@@ -620,3 +647,72 @@ class EventStream:
     def close(self):
         """Closes the underlying streaming body."""
         self._raw_stream.close()
+
+
+class AsyncEventStream(EventStream):
+    """Wrapper class for an event stream body that is read with coroutines.
+
+    This is the counterpart of :class:`EventStream` for the event streams
+    received by :class:`botocore.asynchttpsession.AsyncioHTTPSession`.
+    Events are yielded as they come available with ``async for``::
+
+        response = await s3.select_object_content(...)
+        async for event in response['Payload']:
+            if 'Records' in event:
+                ...
+    """
+
+    def __init__(self, raw_stream, output_shape, parser, operation_name):
+        self._event_stream_buffer = EventStreamBuffer()
+        super().__init__(raw_stream, output_shape, parser, operation_name)
+
+    def __iter__(self):
+        raise TypeError(
+            "AsyncEventStream must be iterated over with 'async for'"
+        )
+
+    async def __aiter__(self):
+        async for event in self._event_generator:
+            parsed_event = self._parse_event(event)
+            if parsed_event:
+                yield parsed_event
+
+    async def _create_raw_event_generator(self):
+        event_stream_buffer = self._event_stream_buffer
+        for event in event_stream_buffer:
+            yield event
+        async for chunk in self._raw_stream.stream():
+            event_stream_buffer.add_data(chunk)
+            for event in event_stream_buffer:
+                yield event
+
+    def get_initial_response(self):
+        # The event has already been read from the connection by
+        # buffer_initial_event, as this can't wait for it.
+        event_stream_buffer = self._event_stream_buffer
+        event_stream_buffer.add_data(self._raw_stream.read_buffered())
+        initial_event = next(event_stream_buffer, None)
+        if initial_event is not None:
+            event_type = initial_event.headers.get(':event-type')
+            if event_type == 'initial-response':
+                return initial_event
+        raise NoInitialResponseError()
+
+
+async def buffer_initial_event(raw_stream):
+    """Read the first message of an async event stream ahead of parsing.
+
+    The message is kept in the raw stream's buffer, from which
+    :meth:`AsyncEventStream.get_initial_response` reads it.
+    """
+    prelude = await raw_stream.peek(_PRELUDE_LENGTH)
+    if len(prelude) < _PRELUDE_LENGTH:
+        return
+    total_length = unpack_from('!I', prelude)[0]
+    # Invalid lengths are left for the parser to report.  The 4 bytes are
+    # the message crc.
+    max_length = (
+        _PRELUDE_LENGTH + _MAX_HEADERS_LENGTH + _MAX_PAYLOAD_LENGTH + 4
+    )
+    if total_length <= max_length:
+        await raw_stream.peek(total_length)
@@ -67,6 +67,7 @@ from botocore.signers import (
     add_generate_db_auth_token,
     add_generate_presigned_post,
     add_generate_presigned_url,
+    add_generate_presigned_urls,
 )
 from botocore.useragent import register_feature_id
 from botocore.utils import (
@@ -1523,6 +1524,7 @@ BUILTIN_HANDLERS = [
     ),
     ('creating-client-class', add_generate_presigned_url),
     ('creating-client-class.s3', add_generate_presigned_post),
+    ('creating-client-class.s3', add_generate_presigned_urls),
     ('creating-client-class.iot-data', check_openssl_supports_tls_version_1_2),
     ('creating-client-class.lex-runtime-v2', remove_lex_v2_start_conversation),
     ('creating-client-class.qbusiness', remove_qbusiness_chat),
@@ -81,6 +81,20 @@ class BaseEventHooks:
         """
         return []
 
+    def get_handler_chain(self, event_name):
+        """Return a :class:`HandlerChain` for emitting a single event.
+
+        Callers that emit the same event many times can hold on to the
+        chain instead of emitting by name.  The base implementation
+        simply emits the event each time.
+
+        :type event_name: str
+        :param event_name: The name of the event.
+
+        :rtype: HandlerChain
+        """
+        return HandlerChain(self, event_name)
+
     def register(
         self, event_name, handler, unique_id=None, unique_id_uses_count=False
     ):
@@ -201,6 +215,9 @@ class HierarchicalEmitter(BaseEventHooks):
         # This is used to ensure that unique_id's are only
         # registered once.
         self._unique_id_handlers = {}
+        # Incremented whenever the registered handlers change so that
+        # handler chains know when to resolve their handlers again.
+        self._generation = 0
 
     def _emit(self, event_name, kwargs, stop_on_response=False):
         """
@@ -220,18 +237,23 @@ class HierarchicalEmitter(BaseEventHooks):
         :return: List of (handler, response) tuples from all processed
                  handlers.
         """
-        responses = []
         # Invoke the event handlers from most specific
         # to least specific, each time stripping off a dot.
         handlers_to_call = self._lookup_cache.get(event_name)
         if handlers_to_call is None:
-            handlers_to_call = self._handlers.prefix_search(event_name)
-            self._lookup_cache[event_name] = handlers_to_call
-        elif not handlers_to_call:
+            handlers_to_call = self.get_handlers(event_name)
+        if not handlers_to_call:
             # Short circuit and return an empty response is we have
             # no handlers to call.  This is the common case where
             # for the majority of signals, nothing is listening.
             return []
+        return self._call_handlers(
+            handlers_to_call, event_name, kwargs, stop_on_response
+        )
+
+    def _call_handlers(
+        self, handlers_to_call, event_name, kwargs, stop_on_response=False
+    ):
         kwargs['event_name'] = event_name
         responses = []
         for handler in handlers_to_call:
@@ -242,6 +264,27 @@ class HierarchicalEmitter(BaseEventHooks):
                 return responses
         return responses
 
+    def get_handlers(self, event_name):
+        """Return the handlers that would be called for an event.
+
+        :type event_name: string
+        :param event_name: Name of the event
+
+        :rtype: tuple
+        :return: The handlers, in the order they would be called.
+        """
+        # Grab the cache before searching so that handlers resolved while
+        # a registration is in progress never end up in the new cache.
+        lookup_cache = self._lookup_cache
+        handlers = lookup_cache.get(event_name)
+        if handlers is None:
+            handlers = tuple(self._handlers.prefix_search(event_name))
+            lookup_cache[event_name] = handlers
+        return handlers
+
+    def get_handler_chain(self, event_name):
+        return _HierarchicalHandlerChain(self, event_name)
+
     def emit(self, event_name, **kwargs):
         """
         Emit an event by name with arguments passed as keyword args.
@@ -345,7 +388,11 @@ class HierarchicalEmitter(BaseEventHooks):
             self._handlers.append_item(event_name, handler, section=section)
         # Super simple caching strategy for now, if we change the registrations
         # clear the cache.  This has the opportunity for smarter invalidations.
+        self._invalidate_handlers()
+
+    def _invalidate_handlers(self):
         self._lookup_cache = {}
+        self._generation += 1
 
     def unregister(
         self,
@@ -386,7 +433,7 @@ class HierarchicalEmitter(BaseEventHooks):
                 handler = self._unique_id_handlers.pop(unique_id)['handler']
         try:
             self._handlers.remove_item(event_name, handler)
-            self._lookup_cache = {}
+            self._invalidate_handlers()
         except ValueError:
             pass
 
@@ -415,6 +462,14 @@ class EventAliaser(BaseEventHooks):
         aliased_event_name = self._alias_event_name(event_name)
         return self._emitter.emit_until_response(aliased_event_name, **kwargs)
 
+    def get_handlers(self, event_name):
+        aliased_event_name = self._alias_event_name(event_name)
+        return self._emitter.get_handlers(aliased_event_name)
+
+    def get_handler_chain(self, event_name):
+        aliased_event_name = self._alias_event_name(event_name)
+        return _get_handler_chain(self._emitter, aliased_event_name)
+
     def register(
         self, event_name, handler, unique_id=None, unique_id_uses_count=False
     ):
@@ -503,6 +558,113 @@ class EventAliaser(BaseEventHooks):
         )
 
 
+class HandlerChain:
+    """The handlers for a single event of an emitter.
+
+    A handler chain is created with ``emitter.get_handler_chain()`` and
+    emits the event it was created for.  A chain is truthy unless it
+    knows there are no handlers for the event, which lets callers skip
+    building expensive handler arguments nobody is listening for::
+
+        chain = emitter.get_handler_chain('my-event.service.operation')
+        if chain:
+            chain.emit(arg1=compute_arg1())
+
+    """
+
+    def __init__(self, emitter, event_name):
+        self._emitter = emitter
+        self.event_name = event_name
+
+    def __bool__(self):
+        return True
+
+    def emit(self, **kwargs):
+        """Emit the event, see ``BaseEventHooks.emit``."""
+        return self._emitter.emit(self.event_name, **kwargs)
+
+    def emit_until_response(self, **kwargs):
+        """Emit the event, see ``BaseEventHooks.emit_until_response``."""
+        return self._emitter.emit_until_response(self.event_name, **kwargs)
+
+
+class _HierarchicalHandlerChain(HandlerChain):
+    # Resolves the handlers for its event once and keeps them until the
+    # handlers registered with the emitter change.  Emitting an event
+    # with no handlers is then a single attribute comparison.
+    def __init__(self, emitter, event_name):
+        super().__init__(emitter, event_name)
+        self._resolved = (None, ())
+
+    def _get_handlers(self):
+        generation, handlers = self._resolved
+        current_generation = self._emitter._generation
+        if generation != current_generation:
+            handlers = self._emitter.get_handlers(self.event_name)
+            self._resolved = (current_generation, handlers)
+        return handlers
+
+    def __bool__(self):
+        return bool(self._get_handlers())
+
+    def emit(self, **kwargs):
+        handlers = self._get_handlers()
+        if not handlers:
+            return []
+        return self._emitter._call_handlers(handlers, self.event_name, kwargs)
+
+    def emit_until_response(self, **kwargs):
+        handlers = self._get_handlers()
+        if handlers:
+            responses = self._emitter._call_handlers(
+                handlers, self.event_name, kwargs, stop_on_response=True
+            )
+            if responses:
+                return responses[-1]
+        return (None, None)
+
+
+class HandlerChainCache:
+    """Handler chains for the per-operation events of a client.
+
+    Chains are keyed by event, service id and operation name so that
+    callers don't need to format the full event name on every request.
+    If a different emitter is passed in, the cached chains are dropped.
+    """
+
+    def __init__(self):
+        self._emitter = None
+        self._chains = {}
+
+    def get_handler_chain(self, emitter, event, service_id, operation_name):
+        """Return the chain for ``{event}.{service_id}.{operation_name}``.
+
+        :type service_id: botocore.model.ServiceId
+        :param service_id: The service id, it is hyphenized to build
+            the event name.
+        """
+        if emitter is not self._emitter:
+            self._chains = {}
+            self._emitter = emitter
+        key = (event, service_id, operation_name)
+        chain = self._chains.get(key)
+        if chain is None:
+            event_name = f'{event}.{service_id.hyphenize()}.{operation_name}'
+            chain = _get_handler_chain(emitter, event_name)
+            self._chains[key] = chain
+        return chain
+
+
+def _get_handler_chain(emitter, event_name):
+    # Emitters that don't derive from BaseEventHooks only need to
+    # implement emit() and emit_until_response().  The actual type is
+    # checked so that mocks specced from an emitter class still have
+    # their emit() methods called.
+    if issubclass(type(emitter), BaseEventHooks):
+        return emitter.get_handler_chain(event_name)
+    return HandlerChain(emitter, event_name)
+
+
 class _PrefixTrie:
     """Specialized prefix trie that handles wildcards.
 
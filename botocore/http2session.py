@@ -0,0 +1,907 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""An HTTP session that multiplexes requests over HTTP/2 connections.
+
+:class:`HTTP2Session` is a replacement for
+:class:`botocore.httpsession.URLLib3Session` that sends concurrent
+requests to hosts that negotiate HTTP/2 as streams of a few shared
+connections, instead of using a connection for every request in flight.
+It requires the optional ``h2`` package.
+"""
+
+import collections
+import logging
+import os
+import socket
+import ssl
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from urllib3.util.wait import wait_for_read
+
+from botocore.awsrequest import AWSResponse, HeadersDict
+from botocore.compat import ensure_bytes, urlparse
+from botocore.exceptions import (
+    ConnectionClosedError,
+    ConnectTimeoutError,
+    EndpointConnectionError,
+    HTTPClientError,
+    MissingDependencyException,
+    ProxyConnectionError,
+    ReadTimeoutError,
+    SSLError,
+)
+from botocore.httpsession import (
+    DEFAULT_TIMEOUT,
+    MAX_POOL_CONNECTIONS,
+    URLLib3Session,
+    get_cert_path,
+    mask_proxy_url,
+)
+
+try:
+    import h2.config
+    import h2.connection
+    import h2.errors
+    import h2.events
+    import h2.exceptions
+    import h2.settings
+
+    HAS_H2 = True
+except ImportError:
+    HAS_H2 = False
+
+logger = logging.getLogger(__name__)
+READ_SIZE = 65536
+# The number of streams opened on a connection before requests to the same
+# host are sent over another connection, unless the server allows fewer.
+MAX_CONCURRENT_STREAMS = 100
+# The flow control windows advertised to servers, which bound how much
+# response data is buffered for each connection and for each stream.
+CONNECTION_WINDOW_SIZE = 2**24
+STREAM_WINDOW_SIZE = 2**20
+# Connection-specific headers, which are not allowed in HTTP/2 requests.
+# ``Expect`` is dropped as well since the body is sent right away.
+_CONNECTION_HEADERS = frozenset(
+    [
+        b'connection',
+        b'expect',
+        b'host',
+        b'keep-alive',
+        b'proxy-connection',
+        b'te',
+        b'transfer-encoding',
+        b'upgrade',
+    ]
+)
+
+
+class _HTTP1Only(Exception):
+    """The server did not negotiate HTTP/2."""
+
+
+class _ConnectionUnavailable(Exception):
+    """The connection was closed before a stream could be opened on it."""
+
+
+class _H2Stream:
+    def __init__(self, stream_id, url):
+        self.stream_id = stream_id
+        self.url = url
+        self.headers = None
+        self.chunks = collections.deque()
+        self.ended = False
+        self.reset = False
+        self.error = None
+        # The number of bytes consumed from the stream that have not been
+        # returned to the server's flow control window.
+        self.unacknowledged = 0
+
+
+class _H2Connection:
+    """An HTTP/2 connection shared by the threads sending requests on it.
+
+    There is no dedicated thread reading from the socket.  Whichever thread
+    needs a frame to make progress reads from the socket while the others
+    wait, and every frame read is dispatched to the stream it belongs to
+    before the waiting threads are woken up.
+    """
+
+    def __init__(self, read_timeout):
+        # The number of requests the session has assigned to this
+        # connection.  This is guarded by the session's pool lock.
+        self.reserved = 0
+        self.max_streams = MAX_CONCURRENT_STREAMS
+        self.closed = False
+        self._read_timeout = read_timeout
+        self._cond = threading.Condition()
+        self._sock = None
+        self._connect_error = None
+        self._reading = False
+        self._streams = {}
+        self._unacknowledged = 0
+        self._h2 = h2.connection.H2Connection(
+            config=h2.config.H2Configuration(
+                client_side=True, header_encoding=None
+            )
+        )
+
+    def connect(self, create_socket):
+        with self._cond:
+            if self._sock is not None:
+                return
+            if self._connect_error is not None:
+                raise self._connect_error
+            try:
+                self._sock = create_socket()
+            except Exception as e:
+                self._connect_error = e
+                self.closed = True
+                raise
+            settings = h2.settings.SettingCodes
+            self._h2.local_settings = h2.settings.Settings(
+                client=True,
+                initial_values={
+                    settings.ENABLE_PUSH: 0,
+                    settings.MAX_CONCURRENT_STREAMS: MAX_CONCURRENT_STREAMS,
+                    settings.INITIAL_WINDOW_SIZE: STREAM_WINDOW_SIZE,
+                },
+            )
+            # Servers aren't required to know about this setting, and
+            # extended CONNECT is never used.
+            del self._h2.local_settings[settings.ENABLE_CONNECT_PROTOCOL]
+            self._h2.initiate_connection()
+            self._h2.increment_flow_control_window(
+                CONNECTION_WINDOW_SIZE - self._h2.inbound_flow_control_window
+            )
+            self._flush()
+
+    def close(self):
+        with self._cond:
+            if self._sock is None:
+                self.closed = True
+                return
+            if not self.closed:
+                self.closed = True
+                self._h2.close_connection()
+                self._flush()
+            self._fail(ConnectionError('connection closed by the client'))
+
+    def request(self, url, headers, body):
+        """Sends a request and waits for its response headers.
+
+        :param body: An iterable of the chunks of the body, or None if the
+            request has no body.
+        :returns: The ``_H2Stream`` the request was sent on.
+        """
+        with self._cond:
+            if not self._reading and self._is_readable():
+                # Handle anything the server sent while the connection
+                # was idle, such as a GOAWAY frame, before using it.
+                try:
+                    self._receive()
+                except TimeoutError as e:
+                    # Nothing could be read from a socket that looked
+                    # readable, so the connection can't be trusted.
+                    self._fail(e)
+            self._wait_for(
+                lambda: (
+                    self.closed
+                    or self._h2.open_outbound_streams
+                    < self._h2.remote_settings.max_concurrent_streams
+                ),
+                url,
+            )
+            if self.closed:
+                raise _ConnectionUnavailable()
+            try:
+                stream_id = self._h2.get_next_available_stream_id()
+            except h2.exceptions.NoAvailableStreamIDError:
+                self.closed = True
+                raise _ConnectionUnavailable()
+            stream = _H2Stream(stream_id, url)
+            self._streams[stream_id] = stream
+            self._h2.send_headers(stream_id, headers, end_stream=body is None)
+            self._flush()
+        try:
+            if body is not None:
+                self._send_body(stream, body)
+            with self._cond:
+                self._wait_for(
+                    lambda: (
+                        stream.headers is not None or stream.error is not None
+                    ),
+                    url,
+                )
+                if stream.headers is None:
+                    self._raise_stream_error(stream)
+        except BaseException:
+            self.release(stream)
+            raise
+        return stream
+
+    def read(self, stream, amt=None):
+        with self._cond:
+            if amt is not None:
+                return self._read_available(stream, amt)
+            chunks = []
+            while data := self._read_available(stream, None):
+                chunks.append(data)
+            return b''.join(chunks)
+
+    def release(self, stream):
+        """Discards a stream whose response is no longer needed."""
+        with self._cond:
+            if self._streams.pop(stream.stream_id, None) is None:
+                return
+            if not (stream.ended or stream.reset or self.closed):
+                # The server would otherwise keep sending the rest of the
+                # response.
+                try:
+                    self._h2.reset_stream(
+                        stream.stream_id, h2.errors.ErrorCodes.CANCEL
+                    )
+                except h2.exceptions.StreamClosedError:
+                    pass
+                self._flush()
+            if self.closed and not self._streams:
+                self._close_socket()
+
+    def _send_body(self, stream, body):
+        for chunk in body:
+            with self._cond:
+                view = memoryview(chunk)
+                while view:
+                    self._wait_for(
+                        lambda: (
+                            stream.ended
+                            or stream.error is not None
+                            or self._h2.local_flow_control_window(
+                                stream.stream_id
+                            )
+                            > 0
+                        ),
+                        stream.url,
+                    )
+                    if stream.error is not None:
+                        self._raise_stream_error(stream)
+                    if stream.ended:
+                        # The server responded before reading the whole
+                        # body, so the rest of it is not needed.
+                        return
+                    size = min(
+                        len(view),
+                        self._h2.local_flow_control_window(stream.stream_id),
+                        self._h2.max_outbound_frame_size,
+                    )
+                    self._h2.send_data(stream.stream_id, view[:size].tobytes())
+                    self._flush()
+                    view = view[size:]
+        with self._cond:
+            if stream.error is not None:
+                self._raise_stream_error(stream)
+            if not stream.ended:
+                self._h2.end_stream(stream.stream_id)
+                self._flush()
+
+    def _read_available(self, stream, amt):
+        # Waits for data rather than for the whole body, so reading a body
+        # of any size only times out if no data arrives for read_timeout.
+        self._wait_for(
+            lambda: stream.chunks or stream.ended or stream.error is not None,
+            stream.url,
+        )
+        if not stream.chunks and stream.error is not None:
+            self._raise_stream_error(stream)
+        if amt is None:
+            data = b''.join(stream.chunks)
+            stream.chunks.clear()
+        else:
+            data = self._take(stream, amt)
+        self._acknowledge(stream, len(data))
+        return data
+
+    def _take(self, stream, amt):
+        chunks = []
+        remaining = amt
+        while remaining > 0 and stream.chunks:
+            chunk = stream.chunks.popleft()
+            if len(chunk) > remaining:
+                stream.chunks.appendleft(chunk[remaining:])
+                chunk = chunk[:remaining]
+            chunks.append(chunk)
+            remaining -= len(chunk)
+        return b''.join(chunks)
+
+    def _acknowledge(self, stream, size):
+        stream.unacknowledged += size
+        window_size = self._h2.local_settings.initial_window_size
+        if stream.unacknowledged >= window_size // 2 and not (
+            stream.ended or stream.reset or self.closed
+        ):
+            try:
+                self._h2.increment_flow_control_window(
+                    stream.unacknowledged, stream_id=stream.stream_id
+                )
+            except h2.exceptions.StreamClosedError:
+                pass
+            stream.unacknowledged = 0
+            self._flush()
+
+    def _raise_stream_error(self, stream):
+        raise ConnectionClosedError(
+            endpoint_url=stream.url, error=stream.error
+        )
+
+    def _is_readable(self):
+        if self._sock is None or self.closed:
+            return False
+        if isinstance(self._sock, ssl.SSLSocket) and self._sock.pending():
+            # Decrypted data that was already read from the socket.
+            return True
+        try:
+            # Unlike select(), this also works with file descriptors of
+            # 1024 and above.
+            return wait_for_read(self._sock, timeout=0)
+        except OSError:
+            return True
+
+    def _wait_for(self, predicate, url):
+        # Called with the condition held.  Waits for the predicate to
+        # become true, reading from the socket unless another thread
+        # already is.  Each call fails after waiting read_timeout seconds.
+        deadline = None
+        if self._read_timeout is not None:
+            deadline = time.monotonic() + self._read_timeout
+        while not predicate():
+            if not self._reading:
+                try:
+                    self._receive()
+                except TimeoutError as e:
+                    raise ReadTimeoutError(endpoint_url=url, error=e)
+                continue
+            timeout = None
+            if deadline is not None:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    raise ReadTimeoutError(
+                        endpoint_url=url, error='Read timed out.'
+                    )
+            self._cond.wait(timeout)
+
+    def _receive(self):
+        if self._sock is None:
+            return
+        sock = self._sock
+        self._reading = True
+        self._cond.release()
+        try:
+            data = sock.recv(READ_SIZE)
+        except TimeoutError:
+            raise
+        except OSError as e:
+            data = e
+        finally:
+            self._cond.acquire()
+            self._reading = False
+            self._cond.notify_all()
+        if isinstance(data, OSError):
+            self._fail(data)
+            return
+        if not data:
+            self._fail(ConnectionError('connection closed by the server'))
+            return
+        try:
+            events = self._h2.receive_data(data)
+        except h2.exceptions.ProtocolError as e:
+            self._fail(e)
+            return
+        for event in events:
+            self._handle_event(event)
+        self._flush()
+
+    def _handle_event(self, event):
+        stream = self._streams.get(getattr(event, 'stream_id', None))
+        if isinstance(event, h2.events.DataReceived):
+            # The connection window is replenished as soon as data arrives
+            # so that streams that aren't read don't hold up the others.
+            self._unacknowledged += event.flow_controlled_length
+            if self._unacknowledged >= CONNECTION_WINDOW_SIZE // 2:
+                self._h2.increment_flow_control_window(self._unacknowledged)
+                self._unacknowledged = 0
+            if stream is not None:
+                stream.chunks.append(event.data)
+                # Padding counts against the window but is never read.
+                stream.unacknowledged += event.flow_controlled_length - len(
+                    event.data
+                )
+        elif stream is None:
+            if isinstance(event, h2.events.RemoteSettingsChanged):
+                self.max_streams = min(
+                    MAX_CONCURRENT_STREAMS,
+                    self._h2.remote_settings.max_concurrent_streams,
+                )
+            elif isinstance(event, h2.events.ConnectionTerminated):
+                self._terminate(event)
+        elif isinstance(event, h2.events.ResponseReceived):
+            stream.headers = event.headers
+        elif isinstance(event, h2.events.StreamEnded):
+            stream.ended = True
+        elif isinstance(event, h2.events.StreamReset):
+            stream.reset = True
+            if not stream.ended:
+                stream.error = (
+                    f'Stream reset by the server with error code '
+                    f'{event.error_code}'
+                )
+
+    def _terminate(self, event):
+        # The server sent GOAWAY.  Streams it has not processed, and with
+        # an error code every stream, will not receive a response.
+        self.closed = True
+        error = f'Connection terminated with error code {event.error_code}'
+        for stream in self._streams.values():
+            if stream.ended or stream.error is not None:
+                continue
+            if event.error_code or stream.stream_id > event.last_stream_id:
+                stream.error = error
+        if not self._streams:
+            self._close_socket()
+
+    def _flush(self):
+        data = self._h2.data_to_send()
+        if data and self._sock is not None:
+            try:
+                self._sock.sendall(data)
+            except OSError as e:
+                self._fail(e)
+
+    def _fail(self, error):
+        self.closed = True
+        for stream in self._streams.values():
+            if not stream.ended and stream.error is None:
+                stream.error = error
+        self._close_socket()
+        self._cond.notify_all()
+
+    def _close_socket(self):
+        sock = self._sock
+        if sock is None:
+            return
+        try:
+            # Shutting the socket down wakes up a thread blocked reading
+            # from it, which closing it alone does not.
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        sock.close()
+
+
+class _H2RawResponse:
+    """The raw body of a response received on an HTTP/2 stream.
+
+    This provides the parts of the urllib3 response interface botocore
+    relies on.  The stream is released once the body has been read or the
+    response is closed.
+    """
+
+    def __init__(self, connection, stream, on_close):
+        self._connection = connection
+        self._stream = stream
+        self._on_close = on_close
+        self._closed = False
+
+    def readable(self):
+        return True
+
+    def read(self, amt=None):
+        if self._closed:
+            return b''
+        try:
+            data = self._connection.read(self._stream, amt)
+        except BaseException:
+            self.close()
+            raise
+        stream = self._stream
+        if (not data and amt != 0) or (stream.ended and not stream.chunks):
+            self.close()
+        return data
+
+    def readinto(self, b):
+        data = self.read(len(b))
+        b[: len(data)] = data
+        return len(data)
+
+    def stream(self, amt=READ_SIZE):
+        while chunk := self.read(amt):
+            yield chunk
+
+    def close(self):
+        if not self._closed:
+            self._closed = True
+            self._connection.release(self._stream)
+            self._on_close()
+
+
+class HTTP2Session(URLLib3Session):
+    """An HTTP client that multiplexes requests over HTTP/2 connections.
+
+    This accepts the same arguments as :class:`URLLib3Session`.  HTTPS
+    requests to hosts that negotiate HTTP/2 are sent as streams of up to
+    ``max_pool_connections`` connections per host, each of which carries
+    up to 100 requests at once, or fewer if the server says so.  A
+    request is only sent over another connection once the ones already
+    open are full.  Requests through HTTP proxies are tunneled with
+    ``CONNECT``.
+
+    Requests to ``http`` URLs, to hosts that only negotiate HTTP/1.1 and
+    through HTTPS proxies are sent by :class:`URLLib3Session` instead.
+
+    In the session's pool statistics, a request sent over a connection
+    that was already open counts as reused, and one that has to share a
+    connection that is already carrying as many requests as the server
+    allows, and so waits for a stream, counts as exhausted.
+    """
+
+    def __init__(
+        self,
+        verify=True,
+        proxies=None,
+        timeout=None,
+        max_pool_connections=MAX_POOL_CONNECTIONS,
+        socket_options=None,
+        client_cert=None,
+        proxies_config=None,
+        dns_cache=None,
+    ):
+        if not HAS_H2:
+            raise MissingDependencyException(
+                msg=(
+                    "Using HTTP/2 requires an additional dependency. You "
+                    "will need to pip install botocore[h2] before proceeding."
+                )
+            )
+        super().__init__(
+            verify=verify,
+            proxies=proxies,
+            timeout=timeout,
+            max_pool_connections=max_pool_connections,
+            socket_options=socket_options,
+            client_cert=client_cert,
+            proxies_config=proxies_config,
+            dns_cache=dns_cache,
+        )
+        if timeout is None:
+            timeout = DEFAULT_TIMEOUT
+        if isinstance(timeout, (int, float)):
+            self._connect_timeout = self._read_timeout = timeout
+        else:
+            self._connect_timeout, self._read_timeout = timeout
+        self._h2_ssl_context = None
+        self._pool_lock = threading.Lock()
+        self._h2_connections = {}
+        self._http1_hosts = set()
+
+    def _get_h2_ssl_context(self):
+        if self._h2_ssl_context is None:
+            context = self._get_ssl_context()
+            if self._verify:
+                cert_path = get_cert_path(self._verify)
+                if os.path.isdir(cert_path):
+                    context.load_verify_locations(capath=cert_path)
+                else:
+                    context.load_verify_locations(cafile=cert_path)
+                # urllib3 matches hostnames itself, so the vendored
+                # context disables it.  The ssl module relies on the
+                # context.
+                context.check_hostname = True
+            else:
+                context.verify_mode = ssl.CERT_NONE
+            if self._cert_file:
+                context.load_cert_chain(self._cert_file, self._key_file)
+            context.set_alpn_protocols(['h2', 'http/1.1'])
+            self._h2_ssl_context = context
+        return self._h2_ssl_context
+
+    def close(self):
+        with self._pool_lock:
+            connections = [
+                connection
+                for connections in self._h2_connections.values()
+                for connection in connections
+            ]
+            self._h2_connections = {}
+        for connection in connections:
+            connection.close()
+        super().close()
+
+    def send(self, request):
+        parsed_url = urlparse(request.url)
+        key = self._get_h2_key(parsed_url, request.url)
+        if key is None:
+            return super().send(request)
+        try:
+            return self._send_h2(request, parsed_url, key)
+        except _HTTP1Only:
+            logger.debug(
+                "%s did not negotiate HTTP/2, using HTTP/1.1 instead.",
+                parsed_url.hostname,
+            )
+            self._http1_hosts.add(key)
+            return super().send(request)
+
+    def warm_up(self, url, connections=1, parallel=False):
+        """Opens connections to ``url`` and adds them to the pool.
+
+        As each HTTP/2 connection carries many requests at once, a single
+        connection is usually enough.  Endpoints that are not used over
+        HTTP/2 are warmed up by :class:`URLLib3Session` instead.
+
+        :return: The number of connections to the endpoint in the pool.
+        """
+        parsed_url = urlparse(url)
+        key = self._get_h2_key(parsed_url, url)
+        if key is None:
+            return super().warm_up(
+                url, connections=connections, parallel=parallel
+            )
+        with self._pool_lock:
+            existing = [
+                connection
+                for connection in self._h2_connections.get(key, [])
+                if not connection.closed
+            ]
+            count = min(connections, self._max_pool_connections)
+            new = [
+                _H2Connection(self._read_timeout)
+                for _ in range(count - len(existing))
+            ]
+            self._h2_connections[key] = existing + new
+
+        def connect(connection):
+            try:
+                connection.connect(lambda: self._create_socket(key, url))
+            except _HTTP1Only:
+                raise
+            except Exception:
+                logger.debug(
+                    'Failed to open HTTP/2 connection to %s',
+                    parsed_url.hostname,
+                    exc_info=True,
+                )
+                return False
+            return True
+
+        try:
+            if parallel and len(new) > 1:
+                with ThreadPoolExecutor(len(new)) as executor:
+                    connected = list(executor.map(connect, new))
+            else:
+                connected = [connect(connection) for connection in new]
+        except _HTTP1Only:
+            logger.debug(
+                "%s did not negotiate HTTP/2, using HTTP/1.1 instead.",
+                parsed_url.hostname,
+            )
+            self._http1_hosts.add(key)
+            for connection in new:
+                connection.close()
+            return super().warm_up(
+                url, connections=connections, parallel=parallel
+            )
+        return len(existing) + sum(connected)
+
+    def _get_h2_key(self, parsed_url, url):
+        # Returns the key of the pool of HTTP/2 connections to use for the
+        # URL, or None if it isn't sent over HTTP/2.
+        proxy_url = self._proxy_config.proxy_url_for(url)
+        key = (parsed_url.hostname, parsed_url.port or 443, proxy_url)
+        if (
+            parsed_url.scheme != 'https'
+            or key in self._http1_hosts
+            or (proxy_url and not proxy_url.startswith('http:'))
+        ):
+            return None
+        return key
+
+    def _send_h2(self, request, parsed_url, key):
+        headers = self._get_request_headers(request, parsed_url)
+        body = None
+        if request.body:
+            body = self._iter_body(request.body)
+        while True:
+            connection = self._get_connection(key, request.url)
+            try:
+                stream = connection.request(request.url, headers, body)
+                break
+            except _ConnectionUnavailable:
+                # Nothing was sent, so the request can go over another
+                # connection.
+                self._release_connection(connection)
+            except HTTPClientError:
+                self._release_connection(connection)
+                raise
+            except Exception as e:
+                self._release_connection(connection)
+                message = 'Exception received when sending HTTP/2 request'
+                logger.debug(message, exc_info=True)
+                raise HTTPClientError(error=e)
+        status, response_headers = self._get_response_headers(stream)
+        raw = _H2RawResponse(
+            connection,
+            stream,
+            lambda: self._release_connection(connection),
+        )
+        http_response = AWSResponse(request.url, status, response_headers, raw)
+        if not request.stream_output:
+            http_response.content
+        return http_response
+
+    def _get_connection(self, key, url):
+        with self._pool_lock:
+            connections = [
+                connection
+                for connection in self._h2_connections.get(key, [])
+                if not connection.closed
+            ]
+            self._h2_connections[key] = connections
+            reused = True
+            exhausted = False
+            for connection in connections:
+                if connection.reserved < connection.max_streams:
+                    break
+            else:
+                if len(connections) < self._max_pool_connections:
+                    connection = _H2Connection(self._read_timeout)
+                    if connections:
+                        # The server's limit is only known once the new
+                        # connection is open, but is likely the same.
+                        connection.max_streams = connections[0].max_streams
+                    connections.append(connection)
+                    reused = False
+                else:
+                    connection = min(connections, key=lambda c: c.reserved)
+                    exhausted = True
+            connection.reserved += 1
+        self._pool_stats.record_request(key[0], key[1], reused, exhausted)
+        try:
+            connection.connect(lambda: self._create_socket(key, url))
+        except BaseException:
+            self._release_connection(connection)
+            raise
+        return connection
+
+    def _release_connection(self, connection):
+        with self._pool_lock:
+            connection.reserved -= 1
+
+    def _create_socket(self, key, url):
+        host, port, proxy_url = key
+        try:
+            if proxy_url:
+                sock = self._create_tunnel(host, port, proxy_url)
+            else:
+                sock = self._open_socket(host, port)
+            for option in self._socket_options:
+                sock.setsockopt(*option)
+            start = time.perf_counter()
+            sock = self._get_h2_ssl_context().wrap_socket(
+                sock, server_hostname=host
+            )
+            tls_handshake_time = time.perf_counter() - start
+        except TimeoutError as e:
+            raise ConnectTimeoutError(endpoint_url=url, error=e)
+        except ssl.SSLError as e:
+            raise SSLError(endpoint_url=url, error=e)
+        except OSError as e:
+            raise EndpointConnectionError(endpoint_url=url, error=e)
+        if sock.selected_alpn_protocol() != 'h2':
+            sock.close()
+            raise _HTTP1Only()
+        sock.settimeout(self._read_timeout)
+        self._pool_stats.record_connection(host, port, tls_handshake_time)
+        return sock
+
+    def _open_socket(self, host, port):
+        if self._dns_cache is None:
+            return socket.create_connection(
+                (host, port), self._connect_timeout
+            )
+        return self._dns_cache.create_connection(
+            (host, port), self._connect_timeout
+        )
+
+    def _create_tunnel(self, host, port, proxy_url):
+        parsed_proxy_url = urlparse(proxy_url)
+        if ':' in host:
+            host = f'[{host}]'
+        target = f'{host}:{port}'
+        lines = [f'CONNECT {target} HTTP/1.1', f'Host: {target}']
+        proxy_headers = self._proxy_config.proxy_headers_for(proxy_url)
+        for name, value in proxy_headers.items():
+            lines.append(f'{name}: {value}')
+        try:
+            sock = self._open_socket(
+                parsed_proxy_url.hostname, parsed_proxy_url.port or 80
+            )
+            sock.sendall(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1'))
+            with sock.makefile('rb') as response:
+                status_line = response.readline()
+                while response.readline() not in (b'\r\n', b'\n', b''):
+                    pass
+        except OSError as e:
+            raise ProxyConnectionError(
+                proxy_url=mask_proxy_url(proxy_url), error=e
+            )
+        status = status_line.split(None, 2)[1:2]
+        if status != [b'200']:
+            sock.close()
+            raise ProxyConnectionError(
+                proxy_url=mask_proxy_url(proxy_url),
+                error=f'Tunnel connection failed: {status_line!r}',
+            )
+        return sock
+
+    def _get_request_headers(self, request, parsed_url):
+        authority = request.headers.get('Host')
+        if authority is None:
+            authority = parsed_url.hostname
+            if ':' in authority:
+                authority = f'[{authority}]'
+            if parsed_url.port not in (None, 443):
+                authority = f'{authority}:{parsed_url.port}'
+            authority = authority.encode('idna')
+        headers = [
+            (b':method', request.method.encode('latin-1')),
+            (b':authority', self._to_bytes(authority)),
+            (b':scheme', b'https'),
+            (b':path', self._path_url(request.url).encode('latin-1')),
+        ]
+        for name, value in request.headers.items():
+            name = self._to_bytes(name).lower()
+            if name not in _CONNECTION_HEADERS:
+                headers.append((name, self._to_bytes(value)))
+        return headers
+
+    def _to_bytes(self, value):
+        if isinstance(value, str):
+            return value.encode('latin-1')
+        return value
+
+    def _iter_body(self, body):
+        if isinstance(body, str):
+            yield body.encode('utf-8')
+        elif isinstance(body, (bytes, bytearray, memoryview)):
+            yield body
+        elif hasattr(body, 'read'):
+            while chunk := body.read(READ_SIZE):
+                yield ensure_bytes(chunk)
+        else:
+            for chunk in body:
+                if chunk:
+                    yield ensure_bytes(chunk)
+
+    def _get_response_headers(self, stream):
+        status = None
+        headers = HeadersDict()
+        for name, value in stream.headers:
+            if name == b':status':
+                status = int(value)
+            elif not name.startswith(b':'):
+                name = name.decode('latin-1')
+                value = value.decode('latin-1')
+                if name in headers:
+                    value = f'{headers[name]}, {value}'
+                headers[name] = value
+        return status, headers
@@ -20,9 +20,13 @@ checksum to the request.
 """
 
 import base64
+import collections
 import io
 import logging
+import os
+import threading
 from binascii import crc32
+from concurrent.futures import ThreadPoolExecutor
 from hashlib import sha1, sha256, sha512
 
 from botocore.compat import HAS_CRT, has_minimum_crt_version, urlparse
@@ -32,13 +36,15 @@ from botocore.exceptions import (
     MissingDependencyException,
 )
 from botocore.model import StructureShape
-from botocore.response import StreamingBody
+from botocore.response import AsyncStreamingBody, StreamingBody
 from botocore.useragent import register_feature_id
 from botocore.utils import (
     conditionally_calculate_md5,
     determine_content_length,
     get_checksum_algorithm_headers,
     has_checksum_header,
+    is_async_stream,
+    lru_cache_weakref,
 )
 
 if HAS_CRT:
@@ -78,54 +84,161 @@ class BaseChecksum:
         return self.b64digest()
 
 
-class Crc32Checksum(BaseChecksum):
+class _CrcCombiner:
+    """Combines the CRCs of two byte strings into the CRC of both.
+
+    CRCs are polynomials over GF(2), with their bits in reflected order as
+    in zlib's ``crc32_combine``.  Appending ``n`` bytes to some data
+    multiplies its CRC by x^(8n) modulo the CRC polynomial before the CRC
+    of the appended bytes is added, so the CRC of ``a + b`` is
+    ``crc(a) * x^(8 * len(b)) mod p`` XOR ``crc(b)``.
+    """
+
+    def __init__(self, polynomial, width):
+        self.width = width
+        self._polynomial = polynomial
+        # In reflected order the most significant bit is x^0.
+        self._one = 1 << (width - 1)
+        # x^(2^k) mod p, extended as needed by _power.  Combiners are
+        # shared by threads, so the table is only extended with the lock
+        # held.
+        self._powers = [self._one >> 1]
+        self._powers_lock = threading.Lock()
+
+    def combine(self, crc1, crc2, length2):
+        return self._multiply(self._shift(length2), crc1) ^ crc2
+
+    def _multiply(self, a, b):
+        product = 0
+        bit = self._one
+        while a:
+            if a & bit:
+                product ^= b
+                a ^= bit
+            bit >>= 1
+            if b & 1:
+                b = (b >> 1) ^ self._polynomial
+            else:
+                b >>= 1
+        return product
+
+    @lru_cache_weakref(maxsize=128)
+    def _shift(self, length):
+        # Returns x^(8 * length) mod p.
+        shift = self._one
+        k = 3
+        while length:
+            if length & 1:
+                shift = self._multiply(self._power(k), shift)
+            length >>= 1
+            k += 1
+        return shift
+
+    def _power(self, k):
+        # Returns x^(2^k) mod p.
+        powers = self._powers
+        if k >= len(powers):
+            with self._powers_lock:
+                while k >= len(powers):
+                    power = powers[-1]
+                    powers.append(self._multiply(power, power))
+        return powers[k]
+
+
+_CRC32_COMBINER = _CrcCombiner(0xEDB88320, 32)
+_CRC32C_COMBINER = _CrcCombiner(0x82F63B78, 32)
+_CRC64NVME_COMBINER = _CrcCombiner(0x9A6C9329AC4BC9B5, 64)
+
+
+class BaseCrcChecksum(BaseChecksum):
+    # CRCs of separate parts of a body can be combined, so large file
+    # bodies are split into parts that are checksummed by a thread pool.
+    # The CRC functions release the GIL while they run.
+    _PARALLEL_PART_SIZE = 8 * 1024 * 1024
+    _MAX_WORKERS = min(os.cpu_count() or 1, 8)
+    _COMBINER = None
+
     def __init__(self):
-        self._int_crc32 = 0
+        self._int_crc = 0
+
+    def _crc(self, chunk, crc):
+        raise NotImplementedError("_crc")
 
     def update(self, chunk):
-        self._int_crc32 = crc32(chunk, self._int_crc32) & 0xFFFFFFFF
+        self._int_crc = self._crc(chunk, self._int_crc)
 
     def digest(self):
-        return self._int_crc32.to_bytes(4, byteorder="big")
+        return self._int_crc.to_bytes(
+            self._COMBINER.width // 8, byteorder="big"
+        )
 
+    def combine(self, crc, length):
+        """Update the checksum with the CRC of separately checksummed data.
 
-class CrtCrc32Checksum(BaseChecksum):
-    # Note: This class is only used if the CRT is available
-    def __init__(self):
-        self._int_crc32 = 0
+        :type crc: int
+        :param crc: The CRC of the ``length`` bytes that follow the data
+            this checksum has been updated with so far.
 
-    def update(self, chunk):
-        new_checksum = crt_checksums.crc32(chunk, self._int_crc32)
-        self._int_crc32 = new_checksum & 0xFFFFFFFF
+        :type length: int
+        :param length: The number of bytes ``crc`` was calculated over.
+        """
+        self._int_crc = self._COMBINER.combine(self._int_crc, crc, length)
 
-    def digest(self):
-        return self._int_crc32.to_bytes(4, byteorder="big")
+    def _handle_fileobj(self, fileobj):
+        content_length = determine_content_length(fileobj)
+        if (
+            self._MAX_WORKERS < 2
+            or content_length is None
+            or content_length < 2 * self._PARALLEL_PART_SIZE
+        ):
+            super()._handle_fileobj(fileobj)
+            return
+        start_position = fileobj.tell()
+        pending = collections.deque()
+        with ThreadPoolExecutor(self._MAX_WORKERS) as executor:
+            for part in iter(
+                lambda: fileobj.read(self._PARALLEL_PART_SIZE), b""
+            ):
+                future = executor.submit(self._crc, part, 0)
+                pending.append((future, len(part)))
+                # Limit the number of parts held in memory at once.
+                if len(pending) > self._MAX_WORKERS:
+                    future, length = pending.popleft()
+                    self.combine(future.result(), length)
+            for future, length in pending:
+                self.combine(future.result(), length)
+        fileobj.seek(start_position)
 
 
-class CrtCrc32cChecksum(BaseChecksum):
-    # Note: This class is only used if the CRT is available
-    def __init__(self):
-        self._int_crc32c = 0
+class Crc32Checksum(BaseCrcChecksum):
+    _COMBINER = _CRC32_COMBINER
 
-    def update(self, chunk):
-        new_checksum = crt_checksums.crc32c(chunk, self._int_crc32c)
-        self._int_crc32c = new_checksum & 0xFFFFFFFF
+    def _crc(self, chunk, crc):
+        return crc32(chunk, crc) & 0xFFFFFFFF
 
-    def digest(self):
-        return self._int_crc32c.to_bytes(4, byteorder="big")
+
+class CrtCrc32Checksum(BaseCrcChecksum):
+    # Note: This class is only used if the CRT is available
+    _COMBINER = _CRC32_COMBINER
+
+    def _crc(self, chunk, crc):
+        return crt_checksums.crc32(chunk, crc) & 0xFFFFFFFF
 
 
-class CrtCrc64NvmeChecksum(BaseChecksum):
+class CrtCrc32cChecksum(BaseCrcChecksum):
     # Note: This class is only used if the CRT is available
-    def __init__(self):
-        self._int_crc64nvme = 0
+    _COMBINER = _CRC32C_COMBINER
 
-    def update(self, chunk):
-        new_checksum = crt_checksums.crc64nvme(chunk, self._int_crc64nvme)
-        self._int_crc64nvme = new_checksum & 0xFFFFFFFFFFFFFFFF
+    def _crc(self, chunk, crc):
+        return crt_checksums.crc32c(chunk, crc) & 0xFFFFFFFF
 
-    def digest(self):
-        return self._int_crc64nvme.to_bytes(8, byteorder="big")
+
+class CrtCrc64NvmeChecksum(BaseCrcChecksum):
+    # Note: This class is only used if the CRT is available
+    _COMBINER = _CRC64NVME_COMBINER
+
+    def _crc(self, chunk, crc):
+        return crt_checksums.crc64nvme(chunk, crc) & 0xFFFFFFFFFFFFFFFF
 
 
 class CrtXxhash64Checksum(BaseChecksum):
@@ -198,7 +311,19 @@ class Sha512Checksum(BaseChecksum):
 
 
 class AwsChunkedWrapper:
+    """Encode a stream with the aws-chunked content encoding.
+
+    Each frame is kept as a list of segments (the chunk header, the data
+    read from the stream and the trailing CRLF) that ``read`` and
+    ``readinto`` copy from directly, tracking their position in the
+    current segment instead of re-slicing an encoded buffer.
+    """
+
     _DEFAULT_CHUNK_SIZE = 1024 * 1024
+    # Streams whose readinto() returns the same data as read() does, so
+    # chunks can be read into a buffer that is reused for every chunk.
+    _READINTO_TYPES = (io.BytesIO, io.BufferedReader, io.FileIO)
+    _CRLF = memoryview(b"\r\n")
 
     def __init__(
         self,
@@ -210,6 +335,7 @@ class AwsChunkedWrapper:
         self._raw = raw
         self._checksum_name = checksum_name
         self._checksum_cls = checksum_cls
+        self._buffer = None
         self._reset()
 
         if chunk_size is None:
@@ -217,7 +343,8 @@ class AwsChunkedWrapper:
         self._chunk_size = chunk_size
 
     def _reset(self):
-        self._remaining = b""
+        self._segments = collections.deque()
+        self._position = 0
         self._complete = False
         self._checksum = None
         if self._checksum_cls:
@@ -236,32 +363,69 @@ class AwsChunkedWrapper:
         if size is not None and size <= 0:
             size = None
 
-        # If the underlying body is done and we have nothing left then
-        # end the stream
-        if self._complete and not self._remaining:
-            return b""
-
-        # While we're not done and want more bytes
-        want_more_bytes = size is None or size > len(self._remaining)
-        while not self._complete and want_more_bytes:
-            self._remaining += self._make_chunk()
-            want_more_bytes = size is None or size > len(self._remaining)
-
-        # If size was None, we want to return everything
-        if size is None:
-            size = len(self._remaining)
+        pieces = []
+        while size is None or size > 0:
+            if not self._segments:
+                if self._complete:
+                    break
+                # The next chunk may be read into the buffer that the
+                # pieces collected so far point to.
+                pieces = [self._detach(piece) for piece in pieces]
+                self._segments.extend(self._make_frame())
+                continue
+            piece = self._take(size)
+            pieces.append(piece)
+            if size is not None:
+                size -= len(piece)
 
-        # Return a chunk up to the size asked for
-        to_return = self._remaining[:size]
-        self._remaining = self._remaining[size:]
-        return to_return
+        if len(pieces) == 1:
+            return bytes(pieces[0])
+        return b"".join(pieces)
 
-    def _make_chunk(self):
+    def readinto(self, b):
+        view = memoryview(b).cast("B")
+        written = 0
+        while written < len(view):
+            if not self._segments:
+                if self._complete:
+                    break
+                self._segments.extend(self._make_frame())
+                continue
+            piece = self._take(len(view) - written)
+            view[written : written + len(piece)] = piece
+            written += len(piece)
+        return written
+
+    def _take(self, size):
+        # Returns up to ``size`` bytes of the current segment without
+        # copying them, moving on to the next segment once it is used up.
+        segment = self._segments[0]
+        start = self._position
+        if size is None or start + size >= len(segment):
+            self._segments.popleft()
+            self._position = 0
+            return segment[start:]
+        self._position = start + size
+        return segment[start : self._position]
+
+    def _detach(self, piece):
+        if isinstance(piece, memoryview) and piece.obj is self._buffer:
+            return bytes(piece)
+        return piece
+
+    def _read_chunk(self):
+        if type(self._raw) in self._READINTO_TYPES:
+            if self._buffer is None:
+                self._buffer = bytearray(self._chunk_size)
+            amount_read = self._raw.readinto(self._buffer)
+            return memoryview(self._buffer)[:amount_read]
+        return memoryview(self._raw.read(self._chunk_size))
+
+    def _make_frame(self):
         # NOTE: Chunk size is not deterministic as read could return less. This
         # means we cannot know the content length of the encoded aws-chunked
         # stream ahead of time without ensuring a consistent chunk size
-        raw_chunk = self._raw.read(self._chunk_size)
-        hex_len = hex(len(raw_chunk))[2:].encode("ascii")
+        raw_chunk = self._read_chunk()
         self._complete = not raw_chunk
 
         if self._checksum:
@@ -270,13 +434,17 @@ class AwsChunkedWrapper:
         if self._checksum and self._complete:
             name = self._checksum_name.encode("ascii")
             checksum = self._checksum.b64digest().encode("ascii")
-            return b"0\r\n%s:%s\r\n\r\n" % (name, checksum)
+            return [memoryview(b"0\r\n%s:%s\r\n\r\n" % (name, checksum))]
+
+        if self._complete:
+            return [memoryview(b"0\r\n\r\n")]
 
-        return b"%s\r\n%s\r\n" % (hex_len, raw_chunk)
+        header = memoryview(b"%x\r\n" % len(raw_chunk))
+        return [header, raw_chunk, self._CRLF]
 
     def __iter__(self):
         while not self._complete:
-            yield self._make_chunk()
+            yield b"".join(self._make_frame())
 
 
 class StreamingChecksumBody(StreamingBody):
@@ -312,6 +480,22 @@ class StreamingChecksumBody(StreamingBody):
             raise FlexibleChecksumError(error_msg=error_msg)
 
 
+class AsyncStreamingChecksumBody(AsyncStreamingBody):
+    def __init__(self, raw_stream, content_length, checksum, expected):
+        super().__init__(raw_stream, content_length)
+        self._checksum = checksum
+        self._expected = expected
+
+    async def read(self, amt=None):
+        chunk = await super().read(amt=amt)
+        self._checksum.update(chunk)
+        if amt is None or (not chunk and amt > 0):
+            self._validate_checksum()
+        return chunk
+
+    _validate_checksum = StreamingChecksumBody._validate_checksum
+
+
 def resolve_checksum_context(request, operation_model, params):
     resolve_request_checksum_algorithm(request, operation_model, params)
     resolve_response_checksum_algorithms(request, operation_model, params)
@@ -598,7 +782,10 @@ def handle_checksum_body(http_response, response, context, operation_model):
 def _handle_streaming_response(http_response, response, algorithm):
     checksum_cls = _CHECKSUM_CLS.get(algorithm)
     header_name = f"x-amz-checksum-{algorithm}"
-    return StreamingChecksumBody(
+    body_cls = StreamingChecksumBody
+    if is_async_stream(http_response.raw):
+        body_cls = AsyncStreamingChecksumBody
+    return body_cls(
         http_response.raw,
         response["headers"].get("content-length"),
         checksum_cls(),
@@ -622,6 +809,70 @@ def _handle_bytes_response(http_response, response, algorithm):
     return body
 
 
+def combine_checksums(algorithm, part_checksums):
+    """Calculate the full object checksum of an object from its parts.
+
+    This gives the checksum S3 reports for multipart uploads with the
+    ``FULL_OBJECT`` checksum type from the checksums of each part, without
+    reading the object's data again.
+
+    :type algorithm: str
+    :param algorithm: ``crc32``, ``crc32c`` or ``crc64nvme``.
+
+    :type part_checksums: iterable
+    :param part_checksums: ``(checksum, size)`` tuples for each part, in
+        order, where ``checksum`` is the base64 encoded checksum of the
+        part and ``size`` is the size of the part in bytes.
+
+    :rtype: str
+    :returns: The base64 encoded checksum of the whole object.
+    """
+    combiner = _CRC_COMBINERS.get(algorithm.lower())
+    if combiner is None:
+        raise FlexibleChecksumError(
+            error_msg=(
+                f"Full object checksums are not supported for {algorithm}"
+            )
+        )
+    crc = 0
+    for checksum, size in part_checksums:
+        part_crc = int.from_bytes(base64.b64decode(checksum), "big")
+        crc = combiner.combine(crc, part_crc, size)
+    digest = crc.to_bytes(combiner.width // 8, byteorder="big")
+    return base64.b64encode(digest).decode("ascii")
+
+
+def composite_checksum(algorithm, part_checksums):
+    """Calculate the composite checksum of an object from its parts.
+
+    This gives the checksum S3 reports for multipart uploads with the
+    ``COMPOSITE`` checksum type: the checksum of the concatenated part
+    checksums, followed by ``-`` and the number of parts.
+
+    :type algorithm: str
+    :param algorithm: The name of the checksum algorithm, such as
+        ``crc32`` or ``sha256``.
+
+    :type part_checksums: iterable
+    :param part_checksums: The base64 encoded checksum of each part, in
+        order.
+
+    :rtype: str
+    :returns: The composite checksum of the object.
+    """
+    checksum_cls = _CHECKSUM_CLS.get(algorithm.lower())
+    if checksum_cls is None:
+        raise FlexibleChecksumError(
+            error_msg=f"Unsupported checksum algorithm: {algorithm}"
+        )
+    checksum = checksum_cls()
+    parts = 0
+    for part_checksum in part_checksums:
+        checksum.update(base64.b64decode(part_checksum))
+        parts += 1
+    return f"{checksum.b64digest()}-{parts}"
+
+
 _CHECKSUM_CLS = {
     "crc32": Crc32Checksum,
     "sha1": Sha1Checksum,
@@ -658,6 +909,11 @@ if HAS_CRT:
         name in _CRT_CHECKSUM_ALGORITHMS for name in _CRT_CHECKSUM_CLS.keys()
     )
 _SUPPORTED_CHECKSUM_ALGORITHMS = list(_CHECKSUM_CLS.keys())
+_CRC_COMBINERS = {
+    "crc32": _CRC32_COMBINER,
+    "crc32c": _CRC32C_COMBINER,
+    "crc64nvme": _CRC64NVME_COMBINER,
+}
 _ALGORITHMS_PRIORITY_LIST = [
     'xxhash128',
     'xxhash3',
@@ -1,11 +1,16 @@
+import functools
 import logging
 import os
 import os.path
 import socket
 import sys
+import threading
+import time
 import warnings
 from base64 import b64encode
-from concurrent.futures import CancelledError
+from collections import OrderedDict
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from typing import NamedTuple
 
 from urllib3 import PoolManager, Timeout, proxy_from_url
 from urllib3.exceptions import (
@@ -20,6 +25,7 @@ from urllib3.exceptions import (
 from urllib3.exceptions import ReadTimeoutError as URLLib3ReadTimeoutError
 from urllib3.exceptions import SSLError as URLLib3SSLError
 from urllib3.poolmanager import PoolKey
+from urllib3.util.connection import allowed_gai_family
 from urllib3.util.retry import Retry
 from urllib3.util.ssl_ import (
     OP_NO_COMPRESSION,
@@ -82,6 +88,9 @@ logger = logging.getLogger(__name__)
 DEFAULT_TIMEOUT = 60
 MAX_POOL_CONNECTIONS = 10
 DEFAULT_CA_BUNDLE = os.path.join(os.path.dirname(__file__), 'cacert.pem')
+DNS_CACHE_TTL = 30
+DNS_CACHE_NEGATIVE_TTL = 5
+DNS_CACHE_SIZE = 1024
 BUFFER_SIZE = None
 if hasattr(PoolKey, 'key_blocksize'):
     # urllib3 2.0 implemented its own chunking logic and set
@@ -283,6 +292,264 @@ class ProxyConfiguration:
             return None, None
 
 
+class ConnectionPoolStats(NamedTuple):
+    """Statistics of the connection pools of an HTTP session.
+
+    ``requests`` is the number of times a connection was taken from a pool,
+    of which ``reused`` were served by a connection that was already open.
+    ``exhausted`` counts the requests made while all
+    ``max_pool_connections`` connections to the host were in use, and
+    ``discarded`` the connections that were closed because the pool was
+    full when they were returned to it.  Many of either mean
+    ``max_pool_connections`` is too small for the concurrency the session
+    is used with.  ``new_connections`` is the number of connections opened,
+    ``tls_handshakes`` how many of them did a TLS handshake and
+    ``tls_handshake_time`` the total number of seconds those took.
+    """
+
+    requests: int
+    reused: int
+    exhausted: int
+    discarded: int
+    new_connections: int
+    tls_handshakes: int
+    tls_handshake_time: float
+
+    @property
+    def hit_rate(self):
+        """The fraction of requests served by an open connection."""
+        if not self.requests:
+            return 0.0
+        return self.reused / self.requests
+
+
+class PoolStatsRecorder:
+    """Records the statistics of an HTTP session's connection pools.
+
+    Listeners added with ``add_listener`` are called with the name of an
+    event and keyword arguments describing it whenever a connection is
+    opened (``connection-created``, with ``host``, ``port`` and
+    ``tls_handshake_time``, which is None for plain HTTP connections), a
+    pool is exhausted (``connection-pool-exhausted``, with ``host`` and
+    ``port``) or a connection is discarded (``connection-discarded``, with
+    ``host`` and ``port``).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._listeners = []
+        self._requests = 0
+        self._reused = 0
+        self._exhausted = 0
+        self._discarded = 0
+        self._new_connections = 0
+        self._tls_handshakes = 0
+        self._tls_handshake_time = 0.0
+
+    def add_listener(self, listener):
+        self._listeners.append(listener)
+
+    def record_request(self, host, port, reused, exhausted):
+        with self._lock:
+            self._requests += 1
+            if reused:
+                self._reused += 1
+            if exhausted:
+                self._exhausted += 1
+        if exhausted:
+            self._emit('connection-pool-exhausted', host=host, port=port)
+
+    def record_discard(self, host, port):
+        with self._lock:
+            self._discarded += 1
+        self._emit('connection-discarded', host=host, port=port)
+
+    def record_connection(self, host, port, tls_handshake_time=None):
+        with self._lock:
+            self._new_connections += 1
+            if tls_handshake_time is not None:
+                self._tls_handshakes += 1
+                self._tls_handshake_time += tls_handshake_time
+        self._emit(
+            'connection-created',
+            host=host,
+            port=port,
+            tls_handshake_time=tls_handshake_time,
+        )
+
+    def get_stats(self):
+        """Return the statistics recorded so far.
+
+        :rtype: ConnectionPoolStats
+        """
+        with self._lock:
+            return ConnectionPoolStats(
+                requests=self._requests,
+                reused=self._reused,
+                exhausted=self._exhausted,
+                discarded=self._discarded,
+                new_connections=self._new_connections,
+                tls_handshakes=self._tls_handshakes,
+                tls_handshake_time=self._tls_handshake_time,
+            )
+
+    def _emit(self, event_name, **kwargs):
+        for listener in self._listeners:
+            listener(event_name, **kwargs)
+
+
+class DNSCacheStats(NamedTuple):
+    """Statistics of a ``DNSCache``."""
+
+    hits: int
+    negative_hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class _DNSCacheEntry:
+    __slots__ = ('expires', 'addresses', 'error', 'next_index')
+
+    def __init__(self, expires, addresses=None, error=None):
+        self.expires = expires
+        self.addresses = addresses
+        self.error = error
+        self.next_index = 0
+
+
+class DNSCache:
+    """Caches the addresses that host names resolve to.
+
+    Addresses are cached for ``ttl`` seconds and failed lookups for
+    ``negative_ttl`` seconds, for up to ``max_size`` host names, evicting
+    the least recently used.  Every lookup returns all of a host's
+    addresses, starting one further each time, so that connections are
+    spread round-robin across them while the others remain to fall back
+    on.  IP addresses are never looked up or cached.
+    """
+
+    def __init__(
+        self,
+        ttl=DNS_CACHE_TTL,
+        negative_ttl=DNS_CACHE_NEGATIVE_TTL,
+        max_size=DNS_CACHE_SIZE,
+    ):
+        self._ttl = ttl
+        self._negative_ttl = negative_ttl
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._hits = 0
+        self._negative_hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def resolve(self, host, port):
+        """Return the addresses of ``host``, looking them up if needed.
+
+        :raises socket.gaierror: If the lookup failed, now or within the
+            last ``negative_ttl`` seconds.
+        """
+        addresses = self.lookup(host)
+        if addresses is None:
+            try:
+                addrinfo = socket.getaddrinfo(
+                    host, port, allowed_gai_family(), socket.SOCK_STREAM
+                )
+            except socket.gaierror as e:
+                self.store_error(host, e)
+                raise
+            addresses = self.store(host, addrinfo)
+        return addresses
+
+    def lookup(self, host):
+        """Return the cached addresses of ``host``, or None if not cached.
+
+        :raises socket.gaierror: If looking up ``host`` recently failed.
+        """
+        if _is_ipaddress(host):
+            return [host.strip('[]')]
+        with self._lock:
+            entry = self._entries.get(host)
+            if entry is None or entry.expires <= time.monotonic():
+                self._misses += 1
+                return None
+            self._entries.move_to_end(host)
+            if entry.error is not None:
+                self._negative_hits += 1
+                raise socket.gaierror(*entry.error.args)
+            self._hits += 1
+            addresses = entry.addresses
+            index = entry.next_index
+            entry.next_index = (index + 1) % len(addresses)
+        return addresses[index:] + addresses[:index]
+
+    def store(self, host, addrinfo):
+        """Cache the results of ``socket.getaddrinfo`` for ``host``.
+
+        :return: The addresses of ``host``.
+        """
+        addresses = list(dict.fromkeys(info[4][0] for info in addrinfo))
+        if addresses:
+            entry = _DNSCacheEntry(
+                time.monotonic() + self._ttl, addresses=addresses
+            )
+            entry.next_index = 1 % len(addresses)
+            self._store(host, entry)
+        return addresses
+
+    def store_error(self, host, error):
+        """Cache a failure to look up ``host``."""
+        if self._negative_ttl > 0:
+            entry = _DNSCacheEntry(
+                time.monotonic() + self._negative_ttl, error=error
+            )
+            self._store(host, entry)
+
+    def create_connection(self, address, timeout):
+        """Connect to ``address`` like ``socket.create_connection``.
+
+        Each of the host's addresses is tried in turn until one connects.
+        """
+        host, port = address
+        addresses = self.resolve(host, port)
+        for address in addresses[:-1]:
+            try:
+                return socket.create_connection((address, port), timeout)
+            except OSError:
+                logger.debug(
+                    "Failed to connect to %s (%s), trying the next address.",
+                    host,
+                    address,
+                )
+        return socket.create_connection((addresses[-1], port), timeout)
+
+    def get_stats(self):
+        """Return statistics about the cache.
+
+        :rtype: DNSCacheStats
+        """
+        with self._lock:
+            return DNSCacheStats(
+                hits=self._hits,
+                negative_hits=self._negative_hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                maxsize=self._max_size,
+                currsize=len(self._entries),
+            )
+
+    def _store(self, host, entry):
+        with self._lock:
+            self._entries[host] = entry
+            self._entries.move_to_end(host)
+            if len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+
 class URLLib3Session:
     """A basic HTTP client that supports connection pooling and proxies.
 
@@ -304,11 +571,13 @@ class URLLib3Session:
         socket_options=None,
         client_cert=None,
         proxies_config=None,
+        dns_cache=None,
     ):
         self._verify = verify
         self._proxy_config = ProxyConfiguration(
             proxies=proxies, proxies_settings=proxies_config
         )
+        self._dns_cache = dns_cache
         self._pool_classes_by_scheme = {
             'http': botocore.awsrequest.AWSHTTPConnectionPool,
             'https': botocore.awsrequest.AWSHTTPSConnectionPool,
@@ -333,6 +602,7 @@ class URLLib3Session:
         self._proxy_managers = {}
         self._manager = PoolManager(**self._get_pool_manager_kwargs())
         self._manager.pool_classes_by_scheme = self._pool_classes_by_scheme
+        self._pool_stats = PoolStatsRecorder()
 
     def _proxies_kwargs(self, **kwargs):
         proxies_settings = self._proxy_config.settings
@@ -436,32 +706,119 @@ class URLLib3Session:
         # HTTP proxies expect the request_target to be the absolute url to know
         # which host to establish a connection to. urllib3 also supports
         # forwarding for HTTPS through the 'use_forwarding_for_https' parameter.
-        proxy_scheme = urlparse(proxy_url).scheme
-        using_https_forwarding_proxy = (
-            proxy_scheme == 'https'
-            and self._proxies_kwargs().get('use_forwarding_for_https', False)
-        )
-
-        if using_https_forwarding_proxy or url.startswith('http:'):
+        if self._using_https_forwarding_proxy(proxy_url) or url.startswith(
+            'http:'
+        ):
             return url
         else:
             return self._path_url(url)
 
+    def _using_https_forwarding_proxy(self, proxy_url):
+        proxy_scheme = urlparse(proxy_url).scheme
+        return proxy_scheme == 'https' and self._proxies_kwargs().get(
+            'use_forwarding_for_https', False
+        )
+
     def _chunked(self, headers):
         transfer_encoding = headers.get('Transfer-Encoding', b'')
         transfer_encoding = ensure_bytes(transfer_encoding)
         return transfer_encoding.lower() == b'chunked'
 
+    def get_pool_stats(self):
+        """Return statistics of the session's connection pools.
+
+        :rtype: ConnectionPoolStats
+        """
+        return self._pool_stats.get_stats()
+
+    def get_dns_cache_stats(self):
+        """Return statistics of the session's DNS cache.
+
+        :rtype: DNSCacheStats
+        :return: The statistics, or None if the session has no DNS cache.
+        """
+        if self._dns_cache is None:
+            return None
+        return self._dns_cache.get_stats()
+
+    def add_pool_listener(self, listener):
+        """Add a listener called with the session's connection pool events.
+
+        See :class:`PoolStatsRecorder` for the events and their arguments.
+        """
+        self._pool_stats.add_listener(listener)
+
     def close(self):
         self._manager.clear()
         for manager in self._proxy_managers.values():
             manager.clear()
 
+    def warm_up(self, url, connections=1, parallel=False):
+        """Opens connections to ``url`` and adds them to the pool.
+
+        At most as many connections as the pool has room for are opened,
+        counting the idle connections already in it.  Connections that fail
+        to open are logged and discarded.
+
+        :param url: The URL of the endpoint to open connections to.
+        :param connections: The number of connections to open.
+        :param parallel: Whether to open the connections in separate threads.
+        :return: The number of idle connections to the endpoint in the pool.
+
+        Connections to HTTPS endpoints through a proxy are tunneled through
+        it with HTTP CONNECT, as they are when a request is sent.
+        """
+        proxy_url = self._proxy_config.proxy_url_for(url)
+        manager = self._get_connection_manager(url, proxy_url)
+        pool = manager.connection_from_url(url)
+        pool.pool_stats = self._pool_stats
+        pool.dns_cache = self._dns_cache
+        self._setup_ssl_cert(pool, url, self._verify)
+        # Every idle connection is taken from the pool so that the pool
+        # doesn't hand out the same connection twice.
+        conns = [
+            pool._get_conn()
+            for _ in range(min(connections, pool.pool.qsize()))
+        ]
+        tunnel = (
+            proxy_url is not None
+            and url.startswith('https:')
+            and not self._using_https_forwarding_proxy(proxy_url)
+        )
+        warm_up_conn = functools.partial(self._warm_up_conn, pool, tunnel)
+        if parallel and len(conns) > 1:
+            with ThreadPoolExecutor(len(conns)) as executor:
+                connected = list(executor.map(warm_up_conn, conns))
+        else:
+            connected = [warm_up_conn(conn) for conn in conns]
+        for conn, is_connected in zip(conns, connected):
+            pool._put_conn(conn if is_connected else None)
+        return sum(connected)
+
+    def _warm_up_conn(self, pool, tunnel, conn):
+        if conn.sock is not None:
+            return True
+        try:
+            if tunnel:
+                # As urlopen does for new connections through a proxy.
+                pool._prepare_proxy(conn)
+            else:
+                conn.connect()
+        except Exception:
+            logger.debug(
+                'Failed to open connection to %s', conn.host, exc_info=True
+            )
+            conn.close()
+            return False
+        return True
+
     def send(self, request):
         try:
             proxy_url = self._proxy_config.proxy_url_for(request.url)
             manager = self._get_connection_manager(request.url, proxy_url)
             conn = manager.connection_from_url(request.url)
+            conn.pool_stats = self._pool_stats
+            conn.dns_cache = self._dns_cache
             self._setup_ssl_cert(conn, request.url, self._verify)
             if ensure_boolean(
                 os.environ.get('BOTO_EXPERIMENTAL__ADD_PROXY_HOST_HEADER', '')
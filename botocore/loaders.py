@@ -100,12 +100,43 @@ applied to the model after it is loaded. Data in these files might represent
 information that doesn't quite fit in the original models, but is still needed
 for the sdk. For instance, additional operation parameters might be added here
 which don't represent the actual service api.
+
+
+Model Cache
+===========
+
+Parsing the JSON for large models (``ec2``, ``sagemaker``, etc.) and merging
+in their extras files is a noticeable part of creating a client in a new
+process.  A ``Loader`` can optionally be given a ``ModelCache``, which stores
+the fully merged result of ``load_service_model`` on disk so that subsequent
+processes can skip both steps.  The cache is enabled by setting the
+``data_cache_path`` config variable (``AWS_DATA_CACHE_PATH``) to a directory
+that is only writable by trusted users.
+
+
+Lazy Loading
+============
+
+Most processes only ever call a handful of operations, yet the largest
+service models define thousands of shapes.  When a ``Loader`` is created
+with ``lazy_load_models=True`` (``AWS_LAZY_LOAD_MODELS``), the
+``operations`` and ``shapes`` of a service model are not decoded up front.
+Instead, the loader builds an index of where each entry starts in the model
+file and decodes an entry the first time it is accessed.  The index is
+stored in the model cache, if one is configured, so that later processes
+only need to read the file.
 """
 
+import hashlib
 import logging
 import os
+import pickle
+import re
+import stat
+import tempfile
+from collections.abc import MutableMapping
 
-from botocore import BOTOCORE_ROOT
+from botocore import BOTOCORE_ROOT, __version__
 from botocore.compat import HAS_GZIP, OrderedDict, json
 from botocore.exceptions import DataNotFoundError, UnknownServiceError
 from botocore.utils import deep_merge
@@ -123,6 +154,18 @@ if HAS_GZIP:
 
 logger = logging.getLogger(__name__)
 
+# The top level keys of each model type that are decoded lazily when
+# lazy loading is enabled.
+LAZY_MODEL_KEYS = {
+    'service-2': ('operations', 'shapes'),
+}
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_ORDERED_JSON_DECODER = json.JSONDecoder(object_pairs_hook=OrderedDict)
+# Values skipped over while building an index are discarded immediately,
+# so there is no need to pay for an OrderedDict per object.
+_SKIPPING_JSON_DECODER = json.JSONDecoder()
+
 
 def instance_cache(func):
     """Cache the result of a method on a per instance basis.
@@ -173,11 +216,7 @@ class JSONFileLoader:
         if not os.path.isfile(full_path):
             return
 
-        # By default the file will be opened with locale encoding on Python 3.
-        # We specify "utf8" here to ensure the correct behavior.
-        with open_method(full_path, 'rb') as fp:
-            payload = fp.read().decode('utf-8')
-
+        payload = _read_text_file(full_path, open_method)
         logger.debug("Loading JSON file: %s", full_path)
         return json.loads(payload, object_pairs_hook=OrderedDict)
 
@@ -198,7 +237,240 @@ class JSONFileLoader:
         return None
 
 
-def create_loader(search_path_string=None):
+def _read_text_file(full_path, open_method):
+    # By default the file will be opened with locale encoding on Python 3.
+    # We specify "utf8" here to ensure the correct behavior.
+    with open_method(full_path, 'rb') as fp:
+        return fp.read().decode('utf-8')
+
+
+def _skip_whitespace(text, idx):
+    return _WHITESPACE.match(text, idx).end()
+
+
+def _index_json_object(text, idx, nested_keys=()):
+    """Index the JSON object that starts at ``idx``.
+
+    Returns a tuple of the index and the position just past the end of
+    the object.  The index maps each key of the object to a tuple of the
+    offset at which its value starts, and, for keys in ``nested_keys``
+    whose values are objects, the index of that nested object (otherwise
+    None).
+
+    """
+    if text[idx : idx + 1] != '{':
+        raise json.JSONDecodeError('Expecting object', text, idx)
+    index = {}
+    idx = _skip_whitespace(text, idx + 1)
+    if text[idx : idx + 1] == '}':
+        return index, idx + 1
+    while True:
+        if text[idx : idx + 1] != '"':
+            raise json.JSONDecodeError(
+                'Expecting property name enclosed in double quotes', text, idx
+            )
+        key, idx = json.decoder.scanstring(text, idx + 1)
+        idx = _skip_whitespace(text, idx)
+        if text[idx : idx + 1] != ':':
+            raise json.JSONDecodeError("Expecting ':' delimiter", text, idx)
+        offset = idx = _skip_whitespace(text, idx + 1)
+        nested_index = None
+        if key in nested_keys and text[idx : idx + 1] == '{':
+            nested_index, idx = _index_json_object(text, idx)
+        else:
+            _, idx = _SKIPPING_JSON_DECODER.raw_decode(text, idx)
+        index[key] = (offset, nested_index)
+        idx = _skip_whitespace(text, idx)
+        delimiter = text[idx : idx + 1]
+        idx = _skip_whitespace(text, idx + 1)
+        if delimiter == '}':
+            return index, idx
+        if delimiter != ',':
+            raise json.JSONDecodeError("Expecting ',' delimiter", text, idx)
+
+
+def build_lazy_index(text, lazy_keys):
+    """Build the index used to lazily load a JSON document.
+
+    :type text: str
+    :param text: The JSON document.  The top level value must be an object.
+
+    :type lazy_keys: iterable of str
+    :param lazy_keys: The top level keys whose values should be decoded
+        lazily, one entry at a time.
+
+    :return: An index that can be passed to ``load_lazy_json``.  The index
+        only contains offsets, so it can be persisted and reused for as
+        long as the document does not change.
+
+    """
+    index, _ = _index_json_object(
+        text, _skip_whitespace(text, 0), tuple(lazy_keys)
+    )
+    return index
+
+
+def load_lazy_json(text, index):
+    """Load a JSON document using an index from ``build_lazy_index``.
+
+    Top level values that were indexed as lazy are returned as
+    ``LazyJSONObject`` instances, all other values are decoded immediately.
+
+    """
+    data = OrderedDict()
+    for key, (offset, nested_index) in index.items():
+        if nested_index is None:
+            data[key] = _ORDERED_JSON_DECODER.raw_decode(text, offset)[0]
+        else:
+            offsets = {
+                name: nested_offset
+                for name, (nested_offset, _) in nested_index.items()
+            }
+            data[key] = LazyJSONObject(text, offsets)
+    return data
+
+
+class LazyJSONObject(MutableMapping):
+    """A JSON object whose values are decoded on first access.
+
+    Values are decoded directly from the source document using the
+    offsets provided, and are then cached.  The iteration order of the
+    keys matches the order in the source document.
+
+    """
+
+    def __init__(self, text, offsets):
+        self._text = text
+        # Keys that are added after loading have no offset; their value
+        # is always present in self._values.
+        self._offsets = dict(offsets)
+        self._values = {}
+
+    def __getitem__(self, key):
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+        offset = self._offsets[key]
+        value = _ORDERED_JSON_DECODER.raw_decode(self._text, offset)[0]
+        self._values[key] = value
+        return value
+
+    def __setitem__(self, key, value):
+        if key not in self._offsets:
+            self._offsets[key] = None
+        self._values[key] = value
+
+    def __delitem__(self, key):
+        del self._offsets[key]
+        self._values.pop(key, None)
+
+    def __contains__(self, key):
+        return key in self._offsets
+
+    def __iter__(self):
+        return iter(self._offsets)
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({len(self)} keys)'
+
+    @property
+    def decoded_keys(self):
+        """The keys whose values have been decoded so far."""
+        return [key for key in self._offsets if key in self._values]
+
+
+class ModelCache:
+    """On-disk cache of fully loaded service models.
+
+    Entries are pickled and stored in ``cache_dir``, one file per entry.
+    The file name is derived from the botocore version and the key
+    provided by the ``Loader``, which includes the path, size and
+    modification time of every file that contributed to the model.  Any
+    change to the source data therefore results in a cache miss rather
+    than stale data being returned.
+
+    Because entries are deserialized with ``pickle``, the cache directory
+    must only be writable by trusted users.
+
+    """
+
+    CACHE_FORMAT_VERSION = 1
+
+    def __init__(self, cache_dir):
+        self._cache_dir = os.path.expanduser(os.path.expandvars(cache_dir))
+
+    @property
+    def cache_dir(self):
+        return self._cache_dir
+
+    def _cache_filename(self, key):
+        key = (self.CACHE_FORMAT_VERSION, __version__) + tuple(key)
+        digest = hashlib.sha256(repr(key).encode('utf-8')).hexdigest()
+        return os.path.join(self._cache_dir, f'{digest}.pickle')
+
+    def get(self, key):
+        """Retrieve a cached model.
+
+        :type key: tuple
+        :param key: The cache key computed by the ``Loader``.
+
+        :return: The cached model, or None if there is no usable entry.
+
+        """
+        filename = self._cache_filename(key)
+        try:
+            with open(filename, 'rb') as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            logger.debug(
+                "Unable to read model cache entry: %s", filename, exc_info=True
+            )
+            return None
+
+    def set(self, key, data):
+        """Store a model in the cache.
+
+        Failures to write the cache entry are logged and otherwise
+        ignored, as the cache is only an optimization.
+
+        :type key: tuple
+        :param key: The cache key computed by the ``Loader``.
+
+        :param data: The fully loaded model.
+
+        """
+        filename = self._cache_filename(key)
+        try:
+            os.makedirs(self._cache_dir, exist_ok=True)
+            fd, temp_filename = tempfile.mkstemp(
+                dir=self._cache_dir, suffix='.tmp'
+            )
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+                # Readers either see the previous entry or the complete
+                # new one, never a partially written file.
+                os.replace(temp_filename, filename)
+            except BaseException:
+                os.remove(temp_filename)
+                raise
+        except Exception:
+            logger.debug(
+                "Unable to write model cache entry: %s",
+                filename,
+                exc_info=True,
+            )
+
+
+def create_loader(
+    search_path_string=None, cache_path=None, lazy_load_models=False
+):
     """Create a Loader class.
 
     This factory function creates a loader given a search string path.
@@ -209,17 +481,34 @@ def create_loader(search_path_string=None):
         which is typically ``:`` on POSIX platforms and ``;`` on
         windows.
 
+    :type cache_path: str
+    :param cache_path: The AWS_DATA_CACHE_PATH value.  If provided, the
+        loader will cache fully loaded service models in this directory.
+
+    :type lazy_load_models: bool
+    :param lazy_load_models: Whether the operations and shapes of service
+        models should be decoded lazily.
+
     :return: A ``Loader`` instance.
 
     """
+    model_cache = None
+    if cache_path is not None:
+        model_cache = ModelCache(cache_path)
     if search_path_string is None:
-        return Loader()
+        return Loader(
+            model_cache=model_cache, lazy_load_models=lazy_load_models
+        )
     paths = []
     extra_paths = search_path_string.split(os.pathsep)
     for path in extra_paths:
         path = os.path.expanduser(os.path.expandvars(path))
         paths.append(path)
-    return Loader(extra_search_paths=paths)
+    return Loader(
+        extra_search_paths=paths,
+        model_cache=model_cache,
+        lazy_load_models=lazy_load_models,
+    )
 
 
 class Loader:
@@ -248,8 +537,12 @@ class Loader:
         cache=None,
         include_default_search_paths=True,
         include_default_extras=True,
+        model_cache=None,
+        lazy_load_models=False,
     ):
         self._cache = {}
+        self._model_cache = model_cache
+        self._lazy_load_models = lazy_load_models
         if file_loader is None:
             file_loader = self.FILE_LOADER_CLASS()
         self.file_loader = file_loader
@@ -276,6 +569,14 @@ class Loader:
     def extras_types(self):
         return self._extras_types
 
+    @property
+    def model_cache(self):
+        return self._model_cache
+
+    @property
+    def lazy_load_models(self):
+        return self._lazy_load_models
+
     @instance_cache
     def list_available_services(self, type_name):
         """List all known services.
@@ -414,15 +715,87 @@ class Loader:
             api_version = self.determine_latest_version(
                 service_name, type_name
             )
+
         full_path = os.path.join(service_name, api_version, type_name)
-        model = self.load_data(full_path)
+        is_json_loader = isinstance(self.file_loader, JSONFileLoader)
+        lazy_keys = LAZY_MODEL_KEYS.get(type_name)
+        cache_key = None
+        if self._lazy_load_models and lazy_keys and is_json_loader:
+            # Lazily loaded models are backed by the model file itself, so
+            # only their index is cached rather than the model.
+            model = self._load_lazy_data(full_path, lazy_keys)
+        else:
+            if self._model_cache is not None and is_json_loader:
+                cache_key = self._model_cache_key(
+                    service_name, type_name, api_version
+                )
+                model = self._model_cache.get(cache_key)
+                if model is not None:
+                    return model
+            model = self.load_data(full_path)
 
         # Load in all the extras
         extras_data = self._find_extras(service_name, type_name, api_version)
         self._extras_processor.process(model, extras_data)
 
+        if cache_key is not None:
+            self._model_cache.set(cache_key, model)
         return model
 
+    def _load_lazy_data(self, name, lazy_keys):
+        source = self._find_data_file(name)
+        if source is None:
+            raise DataNotFoundError(data_path=name)
+        full_path = source[0]
+        for ext, open_method in _JSON_OPEN_METHODS.items():
+            if full_path.endswith(ext):
+                break
+        logger.debug("Lazily loading JSON file: %s", full_path)
+        text = _read_text_file(full_path, open_method)
+        index = None
+        index_cache_key = ('lazy-index', tuple(lazy_keys)) + source
+        if self._model_cache is not None:
+            index = self._model_cache.get(index_cache_key)
+        if index is None:
+            index = build_lazy_index(text, lazy_keys)
+            if self._model_cache is not None:
+                self._model_cache.set(index_cache_key, index)
+        return load_lazy_json(text, index)
+
+    def _model_cache_key(self, service_name, type_name, api_version):
+        # The key identifies every file that load_service_model would read,
+        # so that updating, adding or removing any of them invalidates
+        # the cached entry.
+        names = [type_name]
+        for extras_type in self.extras_types:
+            names.append(f'{type_name}.{extras_type}-extras')
+        sources = tuple(
+            self._find_data_file(os.path.join(service_name, api_version, name))
+            for name in names
+        )
+        return (
+            service_name,
+            type_name,
+            api_version,
+            tuple(self.search_paths),
+            tuple(self.extras_types),
+            sources,
+        )
+
+    def _find_data_file(self, name):
+        # Mirrors the lookup order of load_data_with_path, but only stats
+        # the files instead of loading them.
+        for possible_path in self._potential_locations(name):
+            for ext in _JSON_OPEN_METHODS:
+                full_path = possible_path + ext
+                try:
+                    file_stat = os.stat(full_path)
+                except OSError:
+                    continue
+                if stat.S_ISREG(file_stat.st_mode):
+                    return full_path, file_stat.st_mtime_ns, file_stat.st_size
+        return None
+
     def _find_extras(self, service_name, type_name, api_version):
         """Creates an iterator over all the extras data."""
         for extras_type in self.extras_types:
@@ -12,6 +12,7 @@
 # language governing permissions and limitations under the License.
 """Abstractions to interact with service models."""
 
+import sys
 from collections import defaultdict
 from typing import NamedTuple
 
@@ -56,6 +57,25 @@ class ServiceId(str):
 class Shape:
     """Object representing a shape from the service model."""
 
+    # Shapes are created for every member of every structure that is
+    # serialized, parsed, validated or documented, so they use __slots__
+    # rather than a per instance __dict__.  The attributes listed in
+    # _LAZY_ATTRIBUTES are computed on first access by __getattr__ and
+    # then stored in their slot, after which they are read directly.
+    __slots__ = (
+        'name',
+        'type_name',
+        'documentation',
+        '_shape_model',
+        '_shape_resolver',
+        'serialization',
+        'metadata',
+        'required_members',
+    )
+    _LAZY_ATTRIBUTES = frozenset(
+        ['serialization', 'metadata', 'required_members']
+    )
+
     # To simplify serialization logic, all shape params that are
     # related to serialization are moved from the top level hash into
     # a 'serialization' hash.  This list below contains the names of all
@@ -131,10 +151,19 @@ class Shape:
             # be required to provide an object they won't use.
             shape_resolver = UnresolvableShapeMap()
         self._shape_resolver = shape_resolver
-        self._cache = {}
 
-    @CachedProperty
-    def serialization(self):
+    def __getattr__(self, name):
+        # Only called when normal attribute lookup fails, which for lazy
+        # attributes means their slot has not been populated yet.
+        if name not in self._LAZY_ATTRIBUTES:
+            raise AttributeError(
+                f"'{self.__class__.__name__}' object has no attribute '{name}'"
+            )
+        value = getattr(self, f'_compute_{name}')()
+        setattr(self, name, value)
+        return value
+
+    def _compute_serialization(self):
         """Serialization information about the shape.
 
         This contains information that may be needed for input serialization
@@ -166,8 +195,7 @@ class Shape:
             serialization['name'] = serialization.pop('locationName')
         return serialization
 
-    @CachedProperty
-    def metadata(self):
+    def _compute_metadata(self):
         """Metadata about the shape.
 
         This requires optional information about the shape, including:
@@ -196,8 +224,7 @@ class Shape:
                 metadata[attr] = model[attr]
         return metadata
 
-    @CachedProperty
-    def required_members(self):
+    def _compute_required_members(self):
         """A list of members that are required.
 
         A structure shape can define members that are required.
@@ -219,29 +246,39 @@ class Shape:
 
 
 class StructureShape(Shape):
-    @CachedProperty
-    def members(self):
+    __slots__ = (
+        'members',
+        'event_stream_name',
+        'error_code',
+        'is_document_type',
+        'is_tagged_union',
+    )
+    _LAZY_ATTRIBUTES = Shape._LAZY_ATTRIBUTES | frozenset(__slots__)
+
+    def _compute_members(self):
         members = self._shape_model.get('members', self.MAP_TYPE())
         # The members dict looks like:
         #    'members': {
         #        'MemberName': {'shape': 'shapeName'},
         #        'MemberName2': {'shape': 'shapeName'},
         #    }
-        # We return a dict of member name to Shape object.
+        # We return a dict of member name to Shape object.  Member names
+        # are interned as they are used as keys for every parameter and
+        # response value that is serialized or parsed.
         shape_members = self.MAP_TYPE()
         for name, shape_ref in members.items():
-            shape_members[name] = self._resolve_shape_ref(shape_ref)
+            shape_members[sys.intern(name)] = self._resolve_shape_ref(
+                shape_ref
+            )
         return shape_members
 
-    @CachedProperty
-    def event_stream_name(self):
+    def _compute_event_stream_name(self):
         for member_name, member in self.members.items():
             if member.serialization.get('eventstream'):
                 return member_name
         return None
 
-    @CachedProperty
-    def error_code(self):
+    def _compute_error_code(self):
         if not self.metadata.get('exception', False):
             return None
         error_metadata = self.metadata.get("error", {})
@@ -251,34 +288,37 @@ class StructureShape(Shape):
         # Use the exception name if there is no explicit code modeled
         return self.name
 
-    @CachedProperty
-    def is_document_type(self):
+    def _compute_is_document_type(self):
         return self.metadata.get('document', False)
 
-    @CachedProperty
-    def is_tagged_union(self):
+    def _compute_is_tagged_union(self):
         return self.metadata.get('union', False)
 
 
 class ListShape(Shape):
-    @CachedProperty
-    def member(self):
+    __slots__ = ('member',)
+    _LAZY_ATTRIBUTES = Shape._LAZY_ATTRIBUTES | frozenset(__slots__)
+
+    def _compute_member(self):
         return self._resolve_shape_ref(self._shape_model['member'])
 
 
 class MapShape(Shape):
-    @CachedProperty
-    def key(self):
+    __slots__ = ('key', 'value')
+    _LAZY_ATTRIBUTES = Shape._LAZY_ATTRIBUTES | frozenset(__slots__)
+
+    def _compute_key(self):
         return self._resolve_shape_ref(self._shape_model['key'])
 
-    @CachedProperty
-    def value(self):
+    def _compute_value(self):
         return self._resolve_shape_ref(self._shape_model['value'])
 
 
 class StringShape(Shape):
-    @CachedProperty
-    def enum(self):
+    __slots__ = ('enum',)
+    _LAZY_ATTRIBUTES = Shape._LAZY_ATTRIBUTES | frozenset(__slots__)
+
+    def _compute_enum(self):
         return self.metadata.get('enum', [])
 
 
@@ -361,11 +401,13 @@ class ServiceModel:
 
     @CachedProperty
     def error_shapes(self):
+        # Check the raw shape models first so that a Shape object is
+        # only created, and cached by the resolver, for error shapes.
+        shape_map = self._service_description.get('shapes', {})
         error_shapes = []
         for shape_name in self.shape_names:
-            error_shape = self.shape_for(shape_name)
-            if error_shape.metadata.get('exception', False):
-                error_shapes.append(error_shape)
+            if shape_map[shape_name].get('exception', False):
+                error_shapes.append(self.shape_for(shape_name))
         return error_shapes
 
     @instance_cache
@@ -760,9 +802,19 @@ class ShapeResolver:
 
     def __init__(self, shape_map):
         self._shape_map = shape_map
+        # Shapes are immutable, so every reference to the same shape name
+        # with the same member traits can share a single Shape object.
         self._shape_cache = {}
 
     def get_shape_by_name(self, shape_name, member_traits=None):
+        if member_traits:
+            cache_key = (shape_name, _freeze_member_traits(member_traits))
+        else:
+            cache_key = shape_name
+        try:
+            return self._shape_cache[cache_key]
+        except KeyError:
+            pass
         try:
             shape_model = self._shape_map[shape_name]
         except KeyError:
@@ -777,6 +829,7 @@ class ShapeResolver:
             shape_model = shape_model.copy()
             shape_model.update(member_traits)
         result = shape_cls(shape_name, shape_model, self)
+        self._shape_cache[cache_key] = result
         return result
 
     def resolve_shape_ref(self, shape_ref):
@@ -801,6 +854,18 @@ class ShapeResolver:
             return self.get_shape_by_name(shape_name, member_traits)
 
 
+def _freeze_member_traits(value):
+    # Member traits are small JSON values.  Convert them into a hashable
+    # form so they can be part of a cache key.
+    if isinstance(value, dict):
+        return tuple(
+            sorted((k, _freeze_member_traits(v)) for k, v in value.items())
+        )
+    elif isinstance(value, list):
+        return ('__list__',) + tuple(_freeze_member_traits(v) for v in value)
+    return value
+
+
 class UnresolvableShapeMap:
     """A ShapeResolver that will throw ValueErrors when shapes are resolved."""
 
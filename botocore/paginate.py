@@ -19,7 +19,7 @@ from itertools import tee
 
 import jmespath
 
-from botocore.context import with_current_context
+from botocore.context import start_as_current_context, with_current_context
 from botocore.exceptions import PaginationError
 from botocore.useragent import register_feature_id
 from botocore.utils import merge_dicts, set_value_from_jmespath
@@ -187,6 +187,21 @@ class PaginatorModel:
         return single_paginator_config
 
 
+class _PaginationState:
+    """Tracks the progress of a single pass over a ``PageIterator``."""
+
+    def __init__(self, next_token):
+        self.next_token = next_token
+        self.previous_next_token = None
+        # The number of items from result_key we've seen so far.
+        self.total_items = 0
+        self.first_request = True
+        self.starting_truncation = 0
+        self.parsed = None
+        self.num_current_response = 0
+        self.done = False
+
+
 class PageIterator:
     """An iterable object to paginate API results.
     Please note it is NOT a python iterator.
@@ -253,8 +268,15 @@ class PageIterator:
         return self._non_aggregate_part
 
     def __iter__(self):
-        current_kwargs = self._op_kwargs
-        previous_next_token = None
+        state = self._start_pagination()
+        while True:
+            response = self._make_request(self._op_kwargs)
+            self._receive_page(response, state)
+            yield response
+            if state.done or not self._advance(state):
+                break
+
+    def _start_pagination(self):
         next_token = {key: None for key in self._input_token}
         if self._starting_token is not None:
             # If the starting token exists, populate the next_token with the
@@ -262,73 +284,76 @@ class PageIterator:
             # pagination token on hand if we need to truncate after the
             # first response.
             next_token = self._parse_starting_token()[0]
-        # The number of items from result_key we've seen so far.
-        total_items = 0
-        first_request = True
+        self._inject_starting_params(self._op_kwargs)
+        return _PaginationState(next_token)
+
+    def _receive_page(self, response, state):
+        # Handles a page before it is yielded.  If the page is truncated
+        # because of max_items, no further pages are requested.
+        parsed = self._extract_parsed_response(response)
+        state.parsed = parsed
         primary_result_key = self.result_keys[0]
-        starting_truncation = 0
-        self._inject_starting_params(current_kwargs)
-        while True:
-            response = self._make_request(current_kwargs)
-            parsed = self._extract_parsed_response(response)
-            if first_request:
-                # The first request is handled differently.  We could
-                # possibly have a resume/starting token that tells us where
-                # to index into the retrieved page.
-                if self._starting_token is not None:
-                    starting_truncation = self._handle_first_request(
-                        parsed, primary_result_key, starting_truncation
-                    )
-                first_request = False
-                self._record_non_aggregate_key_values(parsed)
-            else:
-                # If this isn't the first request, we have already sliced into
-                # the first request and had to make additional requests after.
-                # We no longer need to add this to truncation.
-                starting_truncation = 0
-            current_response = primary_result_key.search(parsed)
-            if current_response is None:
-                current_response = []
-            num_current_response = len(current_response)
-            truncate_amount = 0
-            if self._max_items is not None:
-                truncate_amount = (
-                    total_items + num_current_response - self._max_items
+        if state.first_request:
+            # The first request is handled differently.  We could
+            # possibly have a resume/starting token that tells us where
+            # to index into the retrieved page.
+            if self._starting_token is not None:
+                state.starting_truncation = self._handle_first_request(
+                    parsed, primary_result_key, state.starting_truncation
                 )
-            if truncate_amount > 0:
-                self._truncate_response(
-                    parsed,
-                    primary_result_key,
-                    truncate_amount,
-                    starting_truncation,
-                    next_token,
-                )
-                yield response
-                break
-            else:
-                yield response
-                total_items += num_current_response
-                next_token = self._get_next_token(parsed)
-                if all(t is None for t in next_token.values()):
-                    break
-                if (
-                    self._max_items is not None
-                    and total_items == self._max_items
-                ):
-                    # We're on a page boundary so we can set the current
-                    # next token to be the resume token.
-                    self.resume_token = next_token
-                    break
-                if (
-                    previous_next_token is not None
-                    and previous_next_token == next_token
-                ):
-                    message = (
-                        f"The same next token was received twice: {next_token}"
-                    )
-                    raise PaginationError(message=message)
-                self._inject_token_into_kwargs(current_kwargs, next_token)
-                previous_next_token = next_token
+            state.first_request = False
+            self._record_non_aggregate_key_values(parsed)
+        else:
+            # If this isn't the first request, we have already sliced into
+            # the first request and had to make additional requests after.
+            # We no longer need to add this to truncation.
+            state.starting_truncation = 0
+        current_response = primary_result_key.search(parsed)
+        if current_response is None:
+            current_response = []
+        state.num_current_response = len(current_response)
+        truncate_amount = 0
+        if self._max_items is not None:
+            truncate_amount = (
+                state.total_items
+                + state.num_current_response
+                - self._max_items
+            )
+        if truncate_amount > 0:
+            self._truncate_response(
+                parsed,
+                primary_result_key,
+                truncate_amount,
+                state.starting_truncation,
+                state.next_token,
+            )
+            state.done = True
+
+    def _advance(self, state):
+        # Handles a page after it has been yielded.  Returns True if there
+        # is another page to request.
+        state.total_items += state.num_current_response
+        next_token = self._get_next_token(state.parsed)
+        state.next_token = next_token
+        if all(t is None for t in next_token.values()):
+            return False
+        if (
+            self._max_items is not None
+            and state.total_items == self._max_items
+        ):
+            # We're on a page boundary so we can set the current
+            # next token to be the resume token.
+            self.resume_token = next_token
+            return False
+        if (
+            state.previous_next_token is not None
+            and state.previous_next_token == next_token
+        ):
+            message = f"The same next token was received twice: {next_token}"
+            raise PaginationError(message=message)
+        self._inject_token_into_kwargs(self._op_kwargs, next_token)
+        state.previous_next_token = next_token
+        return True
 
     def search(self, expression):
         """Applies a JMESPath expression to a paginator
@@ -485,47 +510,53 @@ class PageIterator:
     def build_full_result(self):
         complete_result = {}
         for response in self:
-            page = response
-            # We want to try to catch operation object pagination
-            # and format correctly for those. They come in the form
-            # of a tuple of two elements: (http_response, parsed_responsed).
-            # We want the parsed_response as that is what the page iterator
-            # uses. We can remove it though once operation objects are removed.
-            if isinstance(response, tuple) and len(response) == 2:
-                page = response[1]
-            # We're incrementally building the full response page
-            # by page.  For each page in the response we need to
-            # inject the necessary components from the page
-            # into the complete_result.
-            for result_expression in self.result_keys:
-                # In order to incrementally update a result key
-                # we need to search the existing value from complete_result,
-                # then we need to search the _current_ page for the
-                # current result key value.  Then we append the current
-                # value onto the existing value, and re-set that value
-                # as the new value.
-                result_value = result_expression.search(page)
-                if result_value is None:
-                    continue
-                existing_value = result_expression.search(complete_result)
-                if existing_value is None:
-                    # Set the initial result
-                    set_value_from_jmespath(
-                        complete_result,
-                        result_expression.expression,
-                        result_value,
-                    )
-                    continue
-                # Now both result_value and existing_value contain something
-                if isinstance(result_value, list):
-                    existing_value.extend(result_value)
-                elif isinstance(result_value, (int, float, str)):
-                    # Modify the existing result with the sum or concatenation
-                    set_value_from_jmespath(
-                        complete_result,
-                        result_expression.expression,
-                        existing_value + result_value,
-                    )
+            self._add_to_full_result(complete_result, response)
+        return self._finish_full_result(complete_result)
+
+    def _add_to_full_result(self, complete_result, response):
+        page = response
+        # We want to try to catch operation object pagination
+        # and format correctly for those. They come in the form
+        # of a tuple of two elements: (http_response, parsed_responsed).
+        # We want the parsed_response as that is what the page iterator
+        # uses. We can remove it though once operation objects are removed.
+        if isinstance(response, tuple) and len(response) == 2:
+            page = response[1]
+        # We're incrementally building the full response page
+        # by page.  For each page in the response we need to
+        # inject the necessary components from the page
+        # into the complete_result.
+        for result_expression in self.result_keys:
+            # In order to incrementally update a result key
+            # we need to search the existing value from complete_result,
+            # then we need to search the _current_ page for the
+            # current result key value.  Then we append the current
+            # value onto the existing value, and re-set that value
+            # as the new value.
+            result_value = result_expression.search(page)
+            if result_value is None:
+                continue
+            existing_value = result_expression.search(complete_result)
+            if existing_value is None:
+                # Set the initial result
+                set_value_from_jmespath(
+                    complete_result,
+                    result_expression.expression,
+                    result_value,
+                )
+                continue
+            # Now both result_value and existing_value contain something
+            if isinstance(result_value, list):
+                existing_value.extend(result_value)
+            elif isinstance(result_value, (int, float, str)):
+                # Modify the existing result with the sum or concatenation
+                set_value_from_jmespath(
+                    complete_result,
+                    result_expression.expression,
+                    existing_value + result_value,
+                )
+
+    def _finish_full_result(self, complete_result):
         merge_dicts(complete_result, self.non_aggregate_part)
         if self.resume_token is not None:
             complete_result['NextToken'] = self.resume_token
@@ -596,6 +627,57 @@ class PageIterator:
         return dict(zip(self._input_token, deprecated_token))
 
 
+class AsyncPageIterator(PageIterator):
+    """An asynchronous iterable object to paginate API results.
+
+    This is used with the operation methods of async clients.  Use
+    ``async for`` to retrieve the pages.
+    """
+
+    async def __aiter__(self):
+        state = self._start_pagination()
+        while True:
+            response = await self._make_request(self._op_kwargs)
+            self._receive_page(response, state)
+            yield response
+            if state.done or not self._advance(state):
+                break
+
+    async def search(self, expression):
+        """Applies a JMESPath expression to a paginator
+
+        This is the asynchronous version of ``PageIterator.search`` and
+        must be iterated with ``async for``.
+
+        :type expression: str
+        :param expression: JMESPath expression to apply to each page.
+
+        :return: Returns an asynchronous iterator that yields the
+            individual elements of applying a JMESPath expression to each
+            page of results.
+        """
+        compiled = jmespath.compile(expression)
+        async for page in self:
+            results = compiled.search(page)
+            if isinstance(results, list):
+                for result in results:
+                    yield result
+            else:
+                # Yield result directly if it is not a list.
+                yield results
+
+    async def _make_request(self, current_kwargs):
+        with start_as_current_context():
+            register_feature_id('PAGINATOR')
+            return await self._method(**current_kwargs)
+
+    async def build_full_result(self):
+        complete_result = {}
+        async for response in self:
+            self._add_to_full_result(complete_result, response)
+        return self._finish_full_result(complete_result)
+
+
 class Paginator:
     PAGE_ITERATOR_CLS = PageIterator
 
@@ -702,6 +784,10 @@ class Paginator:
         }
 
 
+class AsyncPaginator(Paginator):
+    PAGE_ITERATOR_CLS = AsyncPageIterator
+
+
 class ResultKeyIterator:
     """Iterates over the results of paginated responses.
 
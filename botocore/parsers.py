@@ -93,6 +93,26 @@ encoded as JSON and XML through the following hierarchy.
                    |EventStreamXMLParser|    |EventStreamJSONParser|
                    +--------------------+    +---------------------+
 
+Compiled Parsing
+================
+
+Parsers can optionally be created in compiled mode.  Instead of
+dispatching on the type name of every node in a response, each output
+shape is compiled once into a tree of closures (a parse plan) that are
+specialized for that shape.  Types that don't have a specialized plan
+use the same ``_handle_<type>`` methods as the interpreted parser.
+Parsers created by the same ``ResponseParserFactory`` share their parse
+plans, so a plan is built once per client rather than once per response.
+
+Parsers created with ``lazy`` use parse plans that store structures,
+lists, maps, timestamps and blobs unparsed in a ``dict`` subclass, which
+parses each of them the first time it's accessed.
+
+XML parsers can also be created with ``stream_xml``, in which case
+structures and lists are built from the events of a pull parser and each
+element is discarded once it has been parsed, rather than first building
+the complete element tree of the body.
+
 Return Values
 =============
 
@@ -120,6 +140,7 @@ Each call to ``parse()`` returns a dict has this form::
 """
 
 import base64
+import functools
 import http.client
 import io
 import json
@@ -127,12 +148,19 @@ import logging
 import os
 import re
 import struct
+import threading
+from collections import ChainMap
 
 from botocore.compat import ETree, XMLParseError
-from botocore.eventstream import EventStream, NoInitialResponseError
+from botocore.eventstream import (
+    AsyncEventStream,
+    EventStream,
+    NoInitialResponseError,
+)
 from botocore.utils import (
     CachedProperty,
     ensure_boolean,
+    is_async_stream,
     is_json_value_header,
     lowercase_dict,
     merge_dicts,
@@ -147,22 +175,56 @@ DEFAULT_TIMESTAMP_PARSER = parse_timestamp
 class ResponseParserFactory:
     def __init__(self):
         self._defaults = {}
+        # Parse plans shared by the compiled parsers this factory creates,
+        # keyed on the protocol and the arguments the plans depend on.
+        self._compiled_plans = {}
+        # The members of the structures parsed from incrementally parsed
+        # XML bodies, keyed on the protocol.
+        self._stream_members = {}
 
     def set_parser_defaults(self, **kwargs):
         """Set default arguments when a parser instance is created.
 
         You can specify any kwargs that are allowed by a ResponseParser
-        class.  There are currently two arguments:
+        class.  There are currently four arguments:
 
             * timestamp_parser - A callable that can parse a timestamp string
             * blob_parser - A callable that can parse a blob type
+            * compiled - Whether to compile output shapes into parse plans
+            * stream_xml - Whether to incrementally parse XML bodies
+            * lazy - Whether to parse members when they are first accessed
 
         """
         self._defaults.update(kwargs)
 
+    def with_parser_defaults(self, **kwargs):
+        """Create a new factory that overrides some default arguments.
+
+        The new factory uses the given arguments in addition to the
+        defaults of this factory, including any defaults that are set on
+        this factory later on.
+
+        """
+        factory = self.__class__()
+        factory._defaults = ChainMap(kwargs, self._defaults)
+        return factory
+
     def create_parser(self, protocol_name):
         parser_cls = PROTOCOL_PARSERS[protocol_name]
-        return parser_cls(**self._defaults)
+        parser = parser_cls(**self._defaults)
+        if parser._compiled:
+            key = (
+                protocol_name,
+                self._defaults.get('timestamp_parser'),
+                self._defaults.get('blob_parser'),
+                bool(self._defaults.get('lazy')),
+            )
+            parser._compiled_shapes = self._compiled_plans.setdefault(key, {})
+        if parser._stream_xml and isinstance(parser, BaseXMLResponseParser):
+            parser._stream_members = self._stream_members.setdefault(
+                protocol_name, {}
+            )
+        return parser
 
 
 def create_parser(protocol):
@@ -216,13 +278,32 @@ class ResponseParser:
     # will be parsed from the body.
     KNOWN_LOCATIONS = ('header', 'headers', 'statusCode')
 
-    def __init__(self, timestamp_parser=None, blob_parser=None):
+    def __init__(
+        self,
+        timestamp_parser=None,
+        blob_parser=None,
+        compiled=False,
+        stream_xml=False,
+        lazy=False,
+    ):
         if timestamp_parser is None:
             timestamp_parser = DEFAULT_TIMESTAMP_PARSER
         self._timestamp_parser = timestamp_parser
         if blob_parser is None:
             blob_parser = self._default_blob_parser
         self._blob_parser = blob_parser
+        # Lazy parsing is implemented by the parse plans.
+        self._compiled = compiled or lazy
+        self._lazy = lazy
+        self._dict_cls = _LazyDict if lazy else dict
+        # Maps shapes to their parse plans.  Shapes are immutable and
+        # resolved shapes are shared, so the shape object itself is used
+        # as the key.
+        self._compiled_shapes = {}
+        # Plans being compiled by the current thread, which are only added
+        # to ``_compiled_shapes`` once they are complete.
+        self._compiling = threading.local()
+        self._stream_xml = stream_xml
         self._event_stream_parser = None
         if self.EVENT_STREAM_PARSER_CLS is not None:
             self._event_stream_parser = self.EVENT_STREAM_PARSER_CLS(
@@ -341,11 +422,100 @@ class ResponseParser:
         )
 
     def _parse_shape(self, shape, node):
+        if self._compiled:
+            parse = self._get_compiled(shape)
+            if parse is None:
+                return node
+            return parse(node)
         handler = getattr(
             self, f'_handle_{shape.type_name}', self._default_handle
         )
         return handler(shape, node)
 
+    def _get_compiled(self, shape):
+        # Returns the parse plan for a shape, compiling it on first use.
+        # A parse plan is a function that takes a node and returns the
+        # parsed value, or None if the node is returned unchanged.
+        # Subclasses implement a ``_compile_type_<type name>`` method for
+        # each type they specialize.
+        try:
+            return self._compiled_shapes[shape]
+        except KeyError:
+            pass
+        pending = getattr(self._compiling, 'shapes', None)
+        if pending is not None:
+            if shape in pending:
+                return pending[shape]
+            return self._compile_shape(shape, pending)
+        # The plans are shared with other threads through the factory, so
+        # a plan and the plans it refers to are compiled into a table
+        # local to this thread and only published once all of them are
+        # complete.  Otherwise another thread could use a structure plan
+        # whose members haven't all been compiled yet.
+        pending = self._compiling.shapes = {}
+        try:
+            compiled = self._compile_shape(shape, pending)
+            self._compiled_shapes.update(pending)
+        finally:
+            self._compiling.shapes = None
+        return compiled
+
+    def _compile_shape(self, shape, pending):
+        method = getattr(
+            self, f'_compile_type_{shape.type_name}', self._compile_handler
+        )
+        compiled = method(shape)
+        pending[shape] = compiled
+        return compiled
+
+    def _register_compiled(self, shape, compiled):
+        # Makes a plan that is still being compiled available to recursive
+        # references to its shape.
+        self._compiling.shapes[shape] = compiled
+
+    def _get_parse_function(self, shape):
+        parse = self._get_compiled(shape)
+        if parse is None:
+            return _return_unchanged
+        return parse
+
+    def _compile_member(self, shape):
+        # Returns the parse plan for a member of a structure or a value of
+        # a map.  When parsing lazily, members that are expensive to parse
+        # are stored unparsed and parsed the first time they're accessed.
+        parse = self._get_compiled(shape)
+        if (
+            self._lazy
+            and parse is not None
+            and shape.type_name in _LAZY_TYPE_NAMES
+        ):
+            return functools.partial(_LazyValue, parse)
+        return parse
+
+    def _compile_handler(self, shape):
+        # Types without a specialized parse plan use the same handler as
+        # the interpreted parser.
+        handler = getattr(
+            self, f'_handle_{shape.type_name}', self._default_handle
+        )
+        if handler == self._default_handle:
+            return None
+        return functools.partial(handler, shape)
+
+    def _compile_type_list(self, shape):
+        parse_member = self._get_compiled(shape.member)
+        if parse_member is None:
+            return list
+
+        def parse_list(node):
+            # Treat all lists as sparse during parsing to safely handle null
+            # elements that may be present in service responses.
+            return [
+                None if item is None else parse_member(item) for item in node
+            ]
+
+        return parse_list
+
     def _handle_list(self, shape, node):
         # Enough implementations share list serialization that it's moved
         # up here in the base class.
@@ -366,7 +536,10 @@ class ResponseParser:
     def _create_event_stream(self, response, shape):
         parser = self._event_stream_parser
         name = response['context'].get('operation_name')
-        return EventStream(response['body'], shape, parser, name)
+        event_stream_cls = EventStream
+        if is_async_stream(response['body']):
+            event_stream_cls = AsyncEventStream
+        return event_stream_cls(response['body'], shape, parser, name)
 
     def _get_first_key(self, value):
         return list(value)[0]
@@ -418,9 +591,23 @@ class ResponseParser:
 
 
 class BaseXMLResponseParser(ResponseParser):
-    def __init__(self, timestamp_parser=None, blob_parser=None):
-        super().__init__(timestamp_parser, blob_parser)
+    # The number of bytes fed to the pull parser at a time when
+    # incrementally parsing a body.
+    XML_STREAM_CHUNK_SIZE = 64 * 1024
+
+    def __init__(
+        self,
+        timestamp_parser=None,
+        blob_parser=None,
+        compiled=False,
+        stream_xml=False,
+        lazy=False,
+    ):
+        super().__init__(
+            timestamp_parser, blob_parser, compiled, stream_xml, lazy
+        )
         self._namespace_re = re.compile('{.*}')
+        self._stream_members = {}
 
     def _handle_map(self, shape, node):
         parsed = {}
@@ -456,6 +643,126 @@ class BaseXMLResponseParser(ResponseParser):
             node = [node]
         return super()._handle_list(shape, node)
 
+    def _compile_type_list(self, shape):
+        parse_list = super()._compile_type_list(shape)
+        if not shape.serialization.get('flattened'):
+            return parse_list
+
+        def parse_flattened_list(node):
+            if not isinstance(node, list):
+                node = [node]
+            return parse_list(node)
+
+        return parse_flattened_list
+
+    def _compile_type_map(self, shape):
+        key_shape = shape.key
+        value_shape = shape.value
+        key_location_name = key_shape.serialization.get('name') or 'key'
+        value_location_name = value_shape.serialization.get('name') or 'value'
+        flattened = shape.serialization.get('flattened')
+        parse_key = self._get_parse_function(key_shape)
+        parse_value = self._compile_member(value_shape) or _return_unchanged
+        node_tag = self._node_tag
+        dict_cls = self._dict_cls
+
+        def parse_map(node):
+            parsed = dict_cls()
+            if flattened and not isinstance(node, list):
+                node = [node]
+            for keyval_node in node:
+                for single_pair in keyval_node:
+                    # Within each <entry> there's a <key> and a <value>
+                    tag_name = node_tag(single_pair)
+                    if tag_name == key_location_name:
+                        key_name = parse_key(single_pair)
+                    elif tag_name == value_location_name:
+                        val_name = parse_value(single_pair)
+                    else:
+                        raise ResponseParserError(f"Unknown tag: {tag_name}")
+                parsed[key_name] = val_name
+            return parsed
+
+        return parse_map
+
+    def _compile_type_structure(self, shape):
+        members = []
+        is_exception = shape.metadata.get('exception', False)
+        is_tagged_union = shape.is_tagged_union
+        build_name_to_xml_node = self._build_name_to_xml_node
+        namespace_re = self._namespace_re
+        known_locations = self.KNOWN_LOCATIONS
+        dict_cls = self._dict_cls
+
+        def parse_structure(node):
+            if is_exception:
+                node = self._get_error_root(node)
+            xml_dict = build_name_to_xml_node(node)
+            if is_tagged_union and self._has_unknown_tagged_union_member(
+                shape, xml_dict
+            ):
+                tag = self._get_first_key(xml_dict)
+                return self._handle_unknown_tagged_union_member(tag)
+            parsed = dict_cls()
+            for member_name, xml_name, parse_member, attribute in members:
+                member_node = xml_dict.get(xml_name)
+                if member_node is not None:
+                    parsed[member_name] = parse_member(member_node)
+                elif attribute is not None:
+                    attribs = {}
+                    for key, value in node.attrib.items():
+                        new_key = namespace_re.sub(
+                            attribute.split(':')[0] + ':', key
+                        )
+                        attribs[new_key] = value
+                    if attribute in attribs:
+                        parsed[member_name] = attribs[attribute]
+            return parsed
+
+        # Register the plan before compiling the members so that recursive
+        # shapes refer back to it.
+        self._register_compiled(shape, parse_structure)
+        for member_name, member_shape in shape.members.items():
+            serialization = member_shape.serialization
+            location = serialization.get('location')
+            if location in known_locations or serialization.get('eventheader'):
+                # Members with known locations are parsed separately.
+                continue
+            attribute = None
+            if serialization.get('xmlAttribute'):
+                attribute = serialization['name']
+            members.append(
+                (
+                    member_name,
+                    self._member_key_name(member_shape, member_name),
+                    self._compile_member(member_shape) or _return_unchanged,
+                    attribute,
+                )
+            )
+        return parse_structure
+
+    def _compile_type_boolean(self, shape):
+        return _text_content_parser(_is_true)
+
+    def _compile_type_float(self, shape):
+        return _text_content_parser(float)
+
+    def _compile_type_integer(self, shape):
+        return _text_content_parser(int)
+
+    def _compile_type_string(self, shape):
+        return _text_content_parser(_return_unchanged)
+
+    def _compile_type_timestamp(self, shape):
+        return _text_content_parser(self._timestamp_parser)
+
+    def _compile_type_blob(self, shape):
+        return _text_content_parser(self._blob_parser)
+
+    _compile_type_character = _compile_type_string
+    _compile_type_double = _compile_type_float
+    _compile_type_long = _compile_type_integer
+
     def _handle_structure(self, shape, node):
         parsed = {}
         members = shape.members
@@ -553,6 +860,178 @@ class BaseXMLResponseParser(ResponseParser):
             )
         return root
 
+    def _get_stream_members(self, shape):
+        # Returns a dict that maps the XML tag of each member of a
+        # structure to a (member name, shape, flattened) tuple.  Flattened
+        # lists and maps are repeated elements, so for these members
+        # flattened is the type name and the shape of a flattened list is
+        # the shape of its items.
+        # Returns None if the structure can't be parsed incrementally
+        # because it needs its complete element (e.g. XML attributes).
+        try:
+            return self._stream_members[shape]
+        except KeyError:
+            pass
+        members = None
+        if shape.type_name == 'structure' and not (
+            shape.is_tagged_union or shape.metadata.get('exception', False)
+        ):
+            members = {}
+            for member_name, member_shape in shape.members.items():
+                serialization = member_shape.serialization
+                if serialization.get('xmlAttribute'):
+                    members = None
+                    break
+                if serialization.get(
+                    'location'
+                ) in self.KNOWN_LOCATIONS or serialization.get('eventheader'):
+                    continue
+                xml_name = self._member_key_name(member_shape, member_name)
+                flattened = None
+                if serialization.get('flattened'):
+                    flattened = member_shape.type_name
+                    if flattened == 'list':
+                        member_shape = member_shape.member
+                members[xml_name] = (member_name, member_shape, flattened)
+        # The map may be shared with other threads through the factory, so
+        # it's only added once it's complete.
+        self._stream_members[shape] = members
+        return members
+
+    def _parse_xml_stream(self, body, members):
+        """Incrementally parse an XML body.
+
+        Rather than building the complete element tree before walking
+        it, the parsed values are built from the events of a pull parser
+        and each element is discarded as soon as it has been parsed, so
+        only the elements along the current path are kept in memory.
+
+        :param body: The body as bytes or a file-like object.
+        :param members: The members of the root element, in the form
+            returned by ``_get_stream_members``.
+        :return: A tuple of the root element and a dict of the parsed
+            members.  Children of the root element that aren't members
+            are kept on the root element.
+
+        """
+        pull_parser = ETree.XMLPullParser(events=('start', 'end'))
+        stack = []
+        root = None
+        parsed = {}
+        try:
+            for chunk in self._iter_xml_stream_chunks(body):
+                pull_parser.feed(chunk)
+                for event, element in pull_parser.read_events():
+                    if event == 'start':
+                        if root is None:
+                            root = element
+                            stack.append(
+                                _XMLStreamFrame(
+                                    _XMLStreamFrame.STRUCTURE,
+                                    element,
+                                    members=members,
+                                    value=parsed,
+                                )
+                            )
+                        else:
+                            self._start_xml_stream_element(stack, element)
+                    else:
+                        self._end_xml_stream_element(stack, element)
+            pull_parser.close()
+        except XMLParseError as e:
+            raise ResponseParserError(
+                f"Unable to parse response ({e}), "
+                f"invalid XML received. Further retries may succeed:\n{body}"
+            )
+        return root, parsed
+
+    def _iter_xml_stream_chunks(self, body):
+        chunk_size = self.XML_STREAM_CHUNK_SIZE
+        if hasattr(body, 'read'):
+            yield from iter(lambda: body.read(chunk_size), b'')
+        else:
+            for start in range(0, len(body), chunk_size):
+                yield body[start : start + chunk_size]
+
+    def _start_xml_stream_element(self, stack, element):
+        parent = stack[-1]
+        if parent.depth is not None:
+            # The element is inside an element that is parsed (or skipped)
+            # as a whole once it ends.
+            parent.depth += 1
+            return
+        if parent.kind == _XMLStreamFrame.LIST:
+            name, shape, flattened = None, parent.shape.member, None
+        else:
+            member = parent.members.get(self._node_tag(element))
+            if member is None:
+                stack.append(_XMLStreamFrame(_XMLStreamFrame.SKIP, element))
+                return
+            name, shape, flattened = member
+        type_name = shape.type_name
+        if type_name == 'structure':
+            members = self._get_stream_members(shape)
+            if members is not None:
+                stack.append(
+                    _XMLStreamFrame(
+                        _XMLStreamFrame.STRUCTURE,
+                        element,
+                        name,
+                        flattened,
+                        members=members,
+                        value={},
+                    )
+                )
+                return
+        elif type_name == 'list' and not shape.serialization.get('flattened'):
+            stack.append(
+                _XMLStreamFrame(
+                    _XMLStreamFrame.LIST,
+                    element,
+                    name,
+                    flattened,
+                    shape=shape,
+                    value=[],
+                )
+            )
+            return
+        # Everything else (scalars, maps, ...) is parsed from its complete
+        # element with the regular handlers.
+        stack.append(
+            _XMLStreamFrame(
+                _XMLStreamFrame.ELEMENT, element, name, flattened, shape=shape
+            )
+        )
+
+    def _end_xml_stream_element(self, stack, element):
+        frame = stack[-1]
+        if frame.depth:
+            frame.depth -= 1
+            return
+        stack.pop()
+        if not stack:
+            return
+        parent = stack[-1]
+        if frame.kind == _XMLStreamFrame.SKIP:
+            if len(stack) > 1:
+                parent.element.remove(element)
+            # Unknown children of the root element are kept so that the
+            # response metadata can be extracted from them.
+            return
+        if frame.kind == _XMLStreamFrame.ELEMENT:
+            value = self._parse_shape(frame.shape, element)
+        else:
+            value = frame.value
+        parent.element.remove(element)
+        if parent.kind == _XMLStreamFrame.LIST:
+            parent.value.append(value)
+        elif frame.flattened == 'list':
+            parent.value.setdefault(frame.name, []).append(value)
+        elif frame.flattened == 'map':
+            parent.value.setdefault(frame.name, {}).update(value)
+        else:
+            parent.value[frame.name] = value
+
     def _replace_nodes(self, parsed):
         for key, value in parsed.items():
             if list(value):
@@ -619,6 +1098,13 @@ class QueryParser(BaseXMLResponseParser):
 
     def _parse_body_as_xml(self, response, shape, inject_metadata=True):
         xml_contents = response['body']
+        if self._stream_xml:
+            streamed = self._stream_body_as_xml(xml_contents, shape)
+            if streamed is not None:
+                root, parsed = streamed
+                if inject_metadata:
+                    self._inject_response_metadata(root, parsed)
+                return parsed
         root = self._parse_xml_string_to_dom(xml_contents)
         parsed = {}
         if shape is not None:
@@ -632,6 +1118,20 @@ class QueryParser(BaseXMLResponseParser):
             self._inject_response_metadata(root, parsed)
         return parsed
 
+    def _stream_body_as_xml(self, xml_contents, shape):
+        if shape is None:
+            return self._parse_xml_stream(xml_contents, {})
+        wrapper = shape.serialization.get('resultWrapper')
+        if wrapper is not None:
+            root, parsed = self._parse_xml_stream(
+                xml_contents, {wrapper: (wrapper, shape, None)}
+            )
+            return root, parsed.get(wrapper, {})
+        members = self._get_stream_members(shape)
+        if members is None:
+            return None
+        return self._parse_xml_stream(xml_contents, members)
+
     def _find_result_wrapped_shape(self, element_name, xml_root_node):
         mapping = self._build_name_to_xml_node(xml_root_node)
         return mapping[element_name]
@@ -724,6 +1224,71 @@ class BaseJSONParser(ResponseParser):
     def _handle_timestamp(self, shape, value):
         return self._timestamp_parser(value)
 
+    def _compile_type_structure(self, shape):
+        if shape.is_document_type:
+            return None
+        members = []
+        is_tagged_union = shape.is_tagged_union
+        dict_cls = self._dict_cls
+
+        def parse_structure(value):
+            if value is None:
+                # If the comes across the wire as "null" (None in python),
+                # we should be returning this unchanged, instead of as an
+                # empty dict.
+                return None
+            if is_tagged_union and self._has_unknown_tagged_union_member(
+                shape, value
+            ):
+                tag = self._get_first_key(value)
+                return self._handle_unknown_tagged_union_member(tag)
+            final_parsed = dict_cls()
+            for member_name, json_name, parse_member in members:
+                raw_value = value.get(json_name)
+                if raw_value is not None:
+                    if parse_member is not None:
+                        raw_value = parse_member(raw_value)
+                    final_parsed[member_name] = raw_value
+            return final_parsed
+
+        # Register the plan before compiling the members so that recursive
+        # shapes refer back to it.
+        self._register_compiled(shape, parse_structure)
+        for member_name, member_shape in shape.members.items():
+            members.append(
+                (
+                    member_name,
+                    member_shape.serialization.get('name', member_name),
+                    self._compile_member(member_shape),
+                )
+            )
+        return parse_structure
+
+    def _compile_type_map(self, shape):
+        parse_key = self._get_parse_function(shape.key)
+        parse_value = self._compile_member(shape.value) or _return_unchanged
+        lazy = self._lazy
+
+        def parse_map(value):
+            parsed = {
+                parse_key(key): parse_value(sub_value)
+                for key, sub_value in value.items()
+            }
+            if lazy:
+                return _LazyDict(parsed)
+            return parsed
+
+        return parse_map
+
+    def _compile_type_string(self, shape):
+        return None
+
+    def _compile_type_blob(self, shape):
+        return self._blob_parser
+
+    def _compile_type_timestamp(self, shape):
+        return self._timestamp_parser
+
     def _do_error_parse(self, response, shape):
         body = self._parse_body_as_json(response['body'])
         error = {"Error": {"Message": '', "Code": ''}, "ResponseMetadata": {}}
@@ -1117,7 +1682,7 @@ class JSONParser(BaseJSONParser):
 
 class BaseRestParser(ResponseParser):
     def _do_parse(self, response, shape):
-        final_parsed = {}
+        final_parsed = self._dict_cls()
         final_parsed['ResponseMetadata'] = self._populate_response_metadata(
             response
         )
@@ -1134,7 +1699,7 @@ class BaseRestParser(ResponseParser):
         self._parse_payload(response, shape, member_shapes, final_parsed)
 
     def _do_modeled_error_parse(self, response, shape):
-        final_parsed = {}
+        final_parsed = self._dict_cls()
         self._add_modeled_parse(response, shape, final_parsed)
         return final_parsed
 
@@ -1167,15 +1732,20 @@ class BaseRestParser(ResponseParser):
                     body = body.decode(self.DEFAULT_ENCODING)
                 final_parsed[payload_member_name] = body
             else:
-                original_parsed = self._initial_body_parse(response['body'])
-                final_parsed[payload_member_name] = self._parse_shape(
-                    body_shape, original_parsed
+                final_parsed[payload_member_name] = self._parse_body(
+                    response['body'], body_shape
                 )
         else:
-            original_parsed = self._initial_body_parse(response['body'])
-            body_parsed = self._parse_shape(shape, original_parsed)
+            body_parsed = self._parse_body(response['body'], shape)
+            if isinstance(body_parsed, _LazyDict):
+                # Copy the members without parsing them.
+                body_parsed = dict.items(body_parsed)
             final_parsed.update(body_parsed)
 
+    def _parse_body(self, body_contents, shape):
+        original_parsed = self._initial_body_parse(body_contents)
+        return self._parse_shape(shape, original_parsed)
+
     def _parse_non_payload_attrs(
         self, response, shape, member_shapes, final_parsed
     ):
@@ -1234,6 +1804,25 @@ class BaseRestParser(ResponseParser):
             node = [e.strip() for e in node.split(',')]
         return super()._handle_list(shape, node)
 
+    def _compile_type_list(self, shape):
+        parse_list = super()._compile_type_list(shape)
+        if shape.serialization.get('location') != 'header':
+            return parse_list
+
+        def parse_header_list(node):
+            if not isinstance(node, list):
+                # List in headers may be a comma separated string as per
+                # RFC7230
+                node = [e.strip() for e in node.split(',')]
+            return parse_list(node)
+
+        return parse_header_list
+
+    def _compile_type_string(self, shape):
+        if is_json_value_header(shape):
+            return self._compile_handler(shape)
+        return super()._compile_type_string(shape)
+
 
 class BaseRpcV2Parser(ResponseParser):
     def _do_parse(self, response, shape):
@@ -1344,6 +1933,18 @@ class RestJSONParser(BaseRestParser, BaseJSONParser):
     _handle_long = _handle_integer
     _handle_double = _handle_float
 
+    def _compile_type_boolean(self, shape):
+        return ensure_boolean
+
+    def _compile_type_integer(self, shape):
+        return int
+
+    def _compile_type_float(self, shape):
+        return float
+
+    _compile_type_long = _compile_type_integer
+    _compile_type_double = _compile_type_float
+
 
 class RpcV2CBORParser(BaseRpcV2Parser, BaseCBORParser):
     EVENT_STREAM_PARSER_CLS = EventStreamCBORParser
@@ -1409,6 +2010,13 @@ class RestXMLParser(BaseRestParser, BaseXMLResponseParser):
             return ETree.Element('')
         return self._parse_xml_string_to_dom(xml_string)
 
+    def _parse_body(self, body_contents, shape):
+        if self._stream_xml and body_contents:
+            members = self._get_stream_members(shape)
+            if members is not None:
+                return self._parse_xml_stream(body_contents, members)[1]
+        return super()._parse_body(body_contents, shape)
+
     def _do_error_parse(self, response, shape):
         # We're trying to be service agnostic here, but S3 does have a slightly
         # different response structure for its errors compared to other
@@ -1479,6 +2087,167 @@ class RestXMLParser(BaseRestParser, BaseXMLResponseParser):
         return text
 
 
+def _return_unchanged(value):
+    return value
+
+
+def _is_true(text):
+    return text == 'true'
+
+
+def _text_content_parser(func):
+    # The parse plan equivalent of the _text_content decorator.
+    def parse_text_content(node_or_string):
+        if hasattr(node_or_string, 'text'):
+            text = node_or_string.text
+            if text is None:
+                # If an XML node is empty <foo></foo>,
+                # we want to parse that as an empty string,
+                # not as a null/None value.
+                text = ''
+        else:
+            text = node_or_string
+        return func(text)
+
+    return parse_text_content
+
+
+# The types of members that are parsed on first access when parsing lazily.
+_LAZY_TYPE_NAMES = frozenset(['structure', 'list', 'map', 'timestamp', 'blob'])
+
+
+class _LazyValue:
+    """An unparsed member of a ``_LazyDict``."""
+
+    __slots__ = ('parse', 'node')
+
+    def __init__(self, parse, node):
+        self.parse = parse
+        self.node = node
+
+
+class _LazyDict(dict):
+    """A dict that parses its values the first time they're accessed.
+
+    Unparsed values are stored as ``_LazyValue`` objects, which are
+    replaced with the parsed value when a key is first looked up.  Every
+    method that exposes values is overridden, and ``__iter__`` is
+    overridden so that ``dict(...)``, ``{**...}`` and ``dict.update``
+    copy the values through ``__getitem__`` rather than from the
+    underlying storage.
+
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        value = dict.__getitem__(self, key)
+        if type(value) is _LazyValue:
+            value = value.parse(value.node)
+            dict.__setitem__(self, key, value)
+        return value
+
+    def __iter__(self):
+        return dict.__iter__(self)
+
+    def _materialize(self):
+        for key in dict.keys(self):
+            self[key]
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+
+    def items(self):
+        self._materialize()
+        return dict.items(self)
+
+    def values(self):
+        self._materialize()
+        return dict.values(self)
+
+    def pop(self, key, *args):
+        if key in self:
+            value = self[key]
+            del self[key]
+            return value
+        return dict.pop(self, key, *args)
+
+    def popitem(self):
+        self._materialize()
+        return dict.popitem(self)
+
+    def setdefault(self, key, default=None):
+        if key in self:
+            return self[key]
+        return dict.setdefault(self, key, default)
+
+    def copy(self):
+        self._materialize()
+        return dict.copy(self)
+
+    def __or__(self, other):
+        self._materialize()
+        return dict.__or__(self, other)
+
+    def __eq__(self, other):
+        self._materialize()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other):
+        self._materialize()
+        return dict.__ne__(self, other)
+
+    def __repr__(self):
+        self._materialize()
+        return dict.__repr__(self)
+
+
+class _XMLStreamFrame:
+    """An open element while incrementally parsing an XML body."""
+
+    # Structures and lists are built from their children as they end.
+    STRUCTURE = 'structure'
+    LIST = 'list'
+    # Other shapes are parsed from the complete element once it ends.
+    ELEMENT = 'element'
+    # Elements that aren't part of the output shape.
+    SKIP = 'skip'
+
+    __slots__ = (
+        'kind',
+        'element',
+        'name',
+        'flattened',
+        'members',
+        'shape',
+        'value',
+        'depth',
+    )
+
+    def __init__(
+        self,
+        kind,
+        element,
+        name=None,
+        flattened=None,
+        members=None,
+        shape=None,
+        value=None,
+    ):
+        self.kind = kind
+        self.element = element
+        self.name = name
+        self.flattened = flattened
+        self.members = members
+        self.shape = shape
+        self.value = value
+        # The number of open descendants of elements that are parsed or
+        # skipped as a whole.  None for frames built from their children.
+        self.depth = 0 if kind in (self.ELEMENT, self.SKIP) else None
+
+
 PROTOCOL_PARSERS = {
     'ec2': EC2QueryParser,
     'query': QueryParser,
@@ -483,6 +483,8 @@ class EndpointRulesetResolver:
         use_ssl=True,
         requested_auth_scheme=None,
         auth_scheme_preference=None,
+        compile_ruleset=False,
+        cache_size=None,
     ):
         self._provider = EndpointProvider(
             ruleset_data=endpoint_ruleset_data,
@@ -492,6 +494,8 @@ class EndpointRulesetResolver:
                 if service_model.service_name == 's3'
                 else None
             ),
+            compiled=compile_ruleset,
+            cache_size=cache_size,
         )
         self._param_definitions = self._provider.ruleset.parameters
         self._service_model = service_model
@@ -509,7 +513,12 @@ class EndpointRulesetResolver:
         call_args,
         request_context,
     ):
-        """Invokes the provider with params defined in the service's ruleset"""
+        """Invokes the provider with params defined in the service's ruleset
+
+        If ``operation_model`` is None, the endpoint is resolved from the
+        client context parameters and builtins alone, as for an operation
+        without any context parameters.
+        """
         if call_args is None:
             call_args = {}
 
@@ -569,17 +578,25 @@ class EndpointRulesetResolver:
         4. Built-in values such as region, FIPS usage, ...
         """
         provider_params = {}
-        # Builtin values can be customized for each operation by hooks
-        # subscribing to the ``before-endpoint-resolution.*`` event.
-        customized_builtins = self._get_customized_builtins(
-            operation_model, call_args, request_context
-        )
-        for param_name, param_def in self._param_definitions.items():
-            param_val = self._resolve_param_from_context(
-                param_name=param_name,
-                operation_model=operation_model,
-                call_args=call_args,
+        if operation_model is None:
+            customized_builtins = self._builtins
+        else:
+            # Builtin values can be customized for each operation by hooks
+            # subscribing to the ``before-endpoint-resolution.*`` event.
+            customized_builtins = self._get_customized_builtins(
+                operation_model, call_args, request_context
             )
+        for param_name, param_def in self._param_definitions.items():
+            if operation_model is None:
+                param_val = self._resolve_param_as_client_context_param(
+                    param_name
+                )
+            else:
+                param_val = self._resolve_param_from_context(
+                    param_name=param_name,
+                    operation_model=operation_model,
+                    call_args=call_args,
+                )
             if param_val is None and param_def.builtin is not None:
                 param_val = self._resolve_param_as_builtin(
                     builtin_name=param_def.builtin,
@@ -0,0 +1,143 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+"""Process wide registry of objects that can be shared across sessions.
+
+By default every ``Session`` loads its own copy of each service model and
+generates its own client classes.  Processes that create many sessions for
+the same services (for example, one session per assumed role) can opt in to
+sharing these objects by setting the ``share_service_models`` config
+variable (``AWS_SHARE_SERVICE_MODELS``).
+
+Objects are held weakly, so an entry is evicted as soon as no client in the
+process references it any more.
+"""
+
+import logging
+import threading
+import weakref
+
+SHARED_MODEL_REGISTRY = None
+_SHARED_MODEL_REGISTRY_LOCK = threading.Lock()
+logger = logging.getLogger(__name__)
+
+
+class SharedModelRegistry:
+    """A thread safe registry of weakly referenced shared objects.
+
+    Objects are grouped by kind (e.g. ``service-model``, ``client-class``)
+    and keyed on everything that was used to create them, such as the
+    service name, API version and data paths.  Objects stored in the
+    registry must be treated as immutable by their users.
+
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = weakref.WeakValueDictionary()
+        # Size estimates of the entries, dropped when their objects are.
+        self._sizes = {}
+        self._hits = {}
+        self._misses = {}
+
+    def get_or_create(self, kind, key, factory, size=None):
+        """Return the shared object for a key, creating it if needed.
+
+        :type kind: str
+        :param kind: The kind of object, used to group statistics.
+
+        :type key: tuple
+        :param key: A hashable key that uniquely identifies the object.
+
+        :param factory: A callable that takes no arguments and creates
+            the object if it is not in the registry.  The factory is
+            called without holding the registry lock.
+
+        :param size: An optional callable that takes the created object and
+            returns an estimate of its size, in a unit that suits the kind,
+            such as the number of shapes of a service model.  Objects
+            without an estimate have a size of 1.
+
+        :return: The shared object.
+
+        """
+        full_key = (kind, key)
+        with self._lock:
+            value = self._entries.get(full_key)
+            if value is not None:
+                self._hits[kind] = self._hits.get(kind, 0) + 1
+                return value
+            self._misses[kind] = self._misses.get(kind, 0) + 1
+        value = factory()
+        with self._lock:
+            # Another thread may have created the same object while the
+            # factory was running, in which case everyone uses the first.
+            existing = self._entries.get(full_key)
+            if existing is not None:
+                return existing
+            try:
+                self._entries[full_key] = value
+            except TypeError:
+                # Objects such as plain dicts can't be weakly referenced.
+                logger.debug(
+                    "Unable to share %s object of type %s", kind, type(value)
+                )
+                return value
+            if size is not None:
+                self._sizes[full_key] = size(value)
+                weakref.finalize(value, self._sizes.pop, full_key, None)
+        return value
+
+    def clear(self):
+        """Remove all entries and reset the statistics."""
+        with self._lock:
+            self._entries = weakref.WeakValueDictionary()
+            self._sizes = {}
+            self._hits.clear()
+            self._misses.clear()
+
+    def get_stats(self):
+        """Return statistics about the registry.
+
+        :rtype: dict
+        :return: A dictionary keyed on object kind.  Each value is a
+            dictionary with the number of ``hits`` and ``misses`` for that
+            kind, the number of objects currently ``cached`` and the
+            ``size`` of those objects, which is the sum of their size
+            estimates (see ``get_or_create``).
+
+        """
+        with self._lock:
+            kinds = set(self._hits) | set(self._misses)
+            cached = dict.fromkeys(kinds, 0)
+            sizes = dict.fromkeys(kinds, 0)
+            for full_key in list(self._entries.keys()):
+                kind = full_key[0]
+                cached[kind] = cached.get(kind, 0) + 1
+                sizes[kind] = sizes.get(kind, 0) + self._sizes.get(full_key, 1)
+            return {
+                kind: {
+                    'hits': self._hits.get(kind, 0),
+                    'misses': self._misses.get(kind, 0),
+                    'cached': cached[kind],
+                    'size': sizes[kind],
+                }
+                for kind in cached
+            }
+
+
+def get_shared_model_registry():
+    global SHARED_MODEL_REGISTRY
+    with _SHARED_MODEL_REGISTRY_LOCK:
+        if SHARED_MODEL_REGISTRY is None:
+            SHARED_MODEL_REGISTRY = SharedModelRegistry()
+    return SHARED_MODEL_REGISTRY
@@ -192,6 +192,87 @@ class StreamingBody(IOBase):
         self._raw_stream.close()
 
 
+class AsyncStreamingBody:
+    """Wrapper class for an http response body that is read with coroutines.
+
+    This is the counterpart of :class:`StreamingBody` for the streaming
+    responses of :class:`botocore.asynchttpsession.AsyncioHTTPSession`.
+    The content length is validated in the same way, and the body can be
+    iterated over with ``async for``::
+
+        response = await client.get_object(Bucket='bucket', Key='key')
+        async with response['Body'] as body:
+            async for chunk in body.iter_chunks():
+                ...
+    """
+
+    _DEFAULT_CHUNK_SIZE = 1024
+
+    def __init__(self, raw_stream, content_length):
+        self._raw_stream = raw_stream
+        self._content_length = content_length
+        self._amount_read = 0
+
+    async def read(self, amt=None):
+        """Read at most amt bytes from the stream.
+
+        If the amt argument is omitted, read all data.
+        """
+        chunk = await self._raw_stream.read(amt)
+        self._amount_read += len(chunk)
+        if amt is None or (not chunk and amt > 0):
+            # If the server sends empty contents or
+            # we ask to read all of the contents, then we know
+            # we need to verify the content length.
+            self._verify_content_length()
+        return chunk
+
+    def __aiter__(self):
+        """Return an async iterator to yield 1k chunks from the raw stream."""
+        return self.iter_chunks(self._DEFAULT_CHUNK_SIZE)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, type, value, traceback):
+        self.close()
+
+    async def iter_lines(self, chunk_size=_DEFAULT_CHUNK_SIZE, keepends=False):
+        """Return an async iterator to yield lines from the raw stream.
+
+        This is achieved by reading chunk of bytes (of size chunk_size) at a
+        time from the raw stream, and then yielding lines from there.
+        """
+        pending = b''
+        async for chunk in self.iter_chunks(chunk_size):
+            lines = (pending + chunk).splitlines(True)
+            for line in lines[:-1]:
+                yield line.splitlines(keepends)[0]
+            pending = lines[-1]
+        if pending:
+            yield pending.splitlines(keepends)[0]
+
+    async def iter_chunks(self, chunk_size=_DEFAULT_CHUNK_SIZE):
+        """Return an async iterator to yield chunks of chunk_size bytes from
+        the raw stream.
+        """
+        while current_chunk := await self.read(chunk_size):
+            yield current_chunk
+
+    def _verify_content_length(self):
+        if self._content_length is not None and self._amount_read != int(
+            self._content_length
+        ):
+            raise IncompleteReadError(
+                actual_bytes=self._amount_read,
+                expected_bytes=int(self._content_length),
+            )
+
+    def close(self):
+        """Close the underlying http response stream."""
+        self._raw_stream.close()
+
+
 def get_response(operation_model, http_response):
     protocol = operation_model.service_model.resolved_protocol
     response_dict = {
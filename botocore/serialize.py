@@ -29,6 +29,12 @@ high level design decisions:
   is done so that it's a) easy to test and b) not tied to a
   particular HTTP library.  See the ``serialize_to_request`` docstring
   for more details.
+* Serializers can optionally be created in compiled mode.  Instead of
+  walking the shape tree and dispatching on the type name for every
+  value, each input shape is compiled once into a tree of closures
+  that are specialized for that shape, and those closures are reused
+  for every request.  The ``json``, ``rest-json``, ``query`` and ``ec2``
+  protocols support compiled mode; the other protocols ignore it.
 
 Unicode
 -------
@@ -46,6 +52,7 @@ import json
 import math
 import re
 import struct
+import threading
 from xml.etree import ElementTree
 
 from botocore import validate
@@ -78,6 +85,7 @@ def create_serializer(
     protocol_name,
     include_validation=True,
     timestamp_precision=TIMESTAMP_PRECISION_DEFAULT,
+    compiled=False,
 ):
     """Create a serializer for the given protocol.
     :param protocol_name: The protocol name to create a serializer for.
@@ -88,11 +96,14 @@ def create_serializer(
         - 'default': Microseconds for ISO timestamps, seconds for Unix and RFC
         - 'millisecond': Millisecond precision (ISO/Unix), seconds for RFC
     :type timestamp_precision: str
+    :param compiled: Whether to compile input shapes into specialized
+        serialization functions.
+    :type compiled: bool
     :return: A serializer instance for the given protocol.
     """
     # TODO: Unknown protocols.
     serializer = SERIALIZERS[protocol_name](
-        timestamp_precision=timestamp_precision
+        timestamp_precision=timestamp_precision, compiled=compiled
     )
     if include_validation:
         validator = validate.ParamValidator()
@@ -109,12 +120,22 @@ class Serializer:
     MAP_TYPE = dict
     DEFAULT_ENCODING = 'utf-8'
 
-    def __init__(self, timestamp_precision=TIMESTAMP_PRECISION_DEFAULT):
+    def __init__(
+        self, timestamp_precision=TIMESTAMP_PRECISION_DEFAULT, compiled=False
+    ):
         if timestamp_precision not in TIMESTAMP_PRECISION_OPTIONS:
             raise ValueError(
                 f"Invalid timestamp precision found while creating serializer: {timestamp_precision}"
             )
         self._timestamp_precision = timestamp_precision
+        self._compiled = compiled
+        # Maps shapes to their compiled serialization functions.  Shapes
+        # are immutable and resolved shapes are shared, so the shape
+        # object itself is used as the key.
+        self._compiled_shapes = {}
+        # Functions being compiled by the current thread, which are only
+        # added to ``_compiled_shapes`` once they are complete.
+        self._compiling = threading.local()
 
     def serialize_to_request(self, parameters, operation_model):
         """Serialize parameters into an HTTP request.
@@ -274,6 +295,51 @@ class Serializer:
         if operation_model.service_model.is_query_compatible:
             serialized['headers']['x-amzn-query-mode'] = 'true'
 
+    def _get_compiled(self, shape):
+        # Returns the compiled serialization function for a shape,
+        # compiling it on first use.  Subclasses that support compiled
+        # mode implement a ``_compile_type_<type name>`` method for each
+        # type they specialize and a ``_compile_default`` fallback.
+        try:
+            return self._compiled_shapes[shape]
+        except KeyError:
+            pass
+        pending = getattr(self._compiling, 'shapes', None)
+        if pending is not None:
+            if shape in pending:
+                return pending[shape]
+            return self._compile_shape(shape, pending)
+        # Serializers are shared by the threads using a client, so a
+        # function and the functions it refers to are compiled into a
+        # table local to this thread and only published once all of them
+        # are complete.  Otherwise another thread could use a structure
+        # function whose members haven't all been compiled yet.
+        pending = self._compiling.shapes = {}
+        try:
+            compiled = self._compile_shape(shape, pending)
+            self._compiled_shapes.update(pending)
+        finally:
+            self._compiling.shapes = None
+        return compiled
+
+    def _compile_shape(self, shape, pending):
+        method = getattr(
+            self,
+            f'_compile_type_{shape.type_name}',
+            self._compile_default,
+        )
+        compiled = method(shape)
+        pending[shape] = compiled
+        return compiled
+
+    def _register_compiled(self, shape, compiled):
+        # Makes a function that is still being compiled available to
+        # recursive references to its shape.
+        self._compiling.shapes[shape] = compiled
+
+    def _compile_default(self, shape):
+        raise NotImplementedError('_compile_default')
+
 
 class QuerySerializer(Serializer):
     TIMESTAMP_FORMAT = 'iso8601'
@@ -293,7 +359,10 @@ class QuerySerializer(Serializer):
         body_params['Action'] = operation_model.name
         body_params['Version'] = operation_model.metadata['apiVersion']
         if shape is not None:
-            self._serialize(body_params, parameters, shape)
+            if self._compiled:
+                self._get_compiled(shape)(body_params, parameters)
+            else:
+                self._serialize(body_params, parameters, shape)
         serialized['body'] = body_params
 
         host_prefix = self._expand_host_prefix(parameters, operation_model)
@@ -385,6 +454,115 @@ class QuerySerializer(Serializer):
     def _serialize_type_double(self, serialized, value, shape, prefix=''):
         self._serialize_type_float(serialized, value, shape, prefix)
 
+    # The compiled equivalents of the _serialize_type_* methods above.
+    # Each returns a function with the signature
+    # ``(serialized, value, prefix='')``.
+
+    def _compile_type_structure(self, shape):
+        members = {}
+
+        def serialize_structure(serialized, value, prefix=''):
+            for key, member_value in value.items():
+                member_prefix, serialize_member = members[key]
+                if prefix:
+                    member_prefix = f'{prefix}.{member_prefix}'
+                serialize_member(serialized, member_value, member_prefix)
+
+        # Register the function before compiling the members so that
+        # recursive shapes refer back to it.
+        self._register_compiled(shape, serialize_structure)
+        for key, member_shape in shape.members.items():
+            members[key] = (
+                self._get_serialized_name(member_shape, key),
+                self._get_compiled(member_shape),
+            )
+        return serialize_structure
+
+    def _compile_type_list(self, shape):
+        member_shape = shape.member
+        serialize_member = self._get_compiled(member_shape)
+        flattened = self._is_shape_flattened(shape)
+        list_name = member_shape.serialization.get('name', 'member')
+        flattened_name = None
+        if flattened and member_shape.serialization.get('name'):
+            flattened_name = self._get_serialized_name(
+                member_shape, default_name=''
+            )
+
+        def serialize_list(serialized, value, prefix=''):
+            if not value:
+                # The query protocol serializes empty lists.
+                serialized[prefix] = ''
+                return
+            if not flattened:
+                list_prefix = f'{prefix}.{list_name}'
+            elif flattened_name is not None:
+                # Replace '.Original' with '.{name}'.
+                list_prefix = '.'.join(
+                    prefix.split('.')[:-1] + [flattened_name]
+                )
+            else:
+                list_prefix = prefix
+            for i, element in enumerate(value, 1):
+                serialize_member(serialized, element, f'{list_prefix}.{i}')
+
+        return serialize_list
+
+    def _compile_type_map(self, shape):
+        entry = '' if self._is_shape_flattened(shape) else '.entry'
+        key_suffix = self._get_serialized_name(shape.key, default_name='key')
+        value_suffix = self._get_serialized_name(shape.value, 'value')
+        serialize_key = self._get_compiled(shape.key)
+        serialize_value = self._get_compiled(shape.value)
+
+        def serialize_map(serialized, value, prefix=''):
+            full_prefix = prefix + entry
+            for i, key in enumerate(value, 1):
+                serialize_key(
+                    serialized, key, f'{full_prefix}.{i}.{key_suffix}'
+                )
+                serialize_value(
+                    serialized, value[key], f'{full_prefix}.{i}.{value_suffix}'
+                )
+
+        return serialize_map
+
+    def _compile_type_blob(self, shape):
+        get_base64 = self._get_base64
+
+        def serialize_blob(serialized, value, prefix=''):
+            serialized[prefix] = get_base64(value)
+
+        return serialize_blob
+
+    def _compile_type_timestamp(self, shape):
+        convert = self._convert_timestamp_to_str
+        timestamp_format = shape.serialization.get('timestampFormat')
+
+        def serialize_timestamp(serialized, value, prefix=''):
+            serialized[prefix] = convert(value, timestamp_format)
+
+        return serialize_timestamp
+
+    def _compile_type_boolean(self, shape):
+        def serialize_boolean(serialized, value, prefix=''):
+            serialized[prefix] = 'true' if value else 'false'
+
+        return serialize_boolean
+
+    def _compile_type_float(self, shape):
+        handle_float = self._handle_float
+
+        def serialize_float(serialized, value, prefix=''):
+            serialized[prefix] = handle_float(value)
+
+        return serialize_float
+
+    _compile_type_double = _compile_type_float
+
+    def _compile_default(self, shape):
+        return _assign_value
+
 
 class EC2Serializer(QuerySerializer):
     """EC2 specific customizations to the query protocol serializers.
@@ -415,6 +593,15 @@ class EC2Serializer(QuerySerializer):
             element_shape = shape.member
             self._serialize(serialized, element, element_shape, element_prefix)
 
+    def _compile_type_list(self, shape):
+        serialize_member = self._get_compiled(shape.member)
+
+        def serialize_list(serialized, value, prefix=''):
+            for i, element in enumerate(value, 1):
+                serialize_member(serialized, element, f'{prefix}.{i}')
+
+        return serialize_list
+
 
 class JSONSerializer(Serializer):
     TIMESTAMP_FORMAT = 'unixtimestamp'
@@ -435,10 +622,11 @@ class JSONSerializer(Serializer):
         }
         self._handle_query_compatible_trait(operation_model, serialized)
 
-        body = self.MAP_TYPE()
         input_shape = operation_model.input_shape
         if input_shape is not None:
-            self._serialize(body, parameters, input_shape)
+            body = self._serialize_root(parameters, input_shape)
+        else:
+            body = self.MAP_TYPE()
         serialized['body'] = json.dumps(body).encode(self.DEFAULT_ENCODING)
 
         host_prefix = self._expand_host_prefix(parameters, operation_model)
@@ -447,6 +635,18 @@ class JSONSerializer(Serializer):
 
         return serialized
 
+    def _serialize_root(self, value, shape):
+        # Serializes the members of a top level shape into a new map.
+        if (
+            self._compiled
+            and shape.type_name == 'structure'
+            and not shape.is_document_type
+        ):
+            return self._get_compiled(shape)(value)
+        serialized = self.MAP_TYPE()
+        self._serialize(serialized, value, shape)
+        return serialized
+
     def _serialize(self, serialized, value, shape, key=None):
         method = getattr(
             self,
@@ -514,6 +714,90 @@ class JSONSerializer(Serializer):
     def _serialize_type_double(self, serialized, value, shape, prefix=''):
         self._serialize_type_float(serialized, value, shape, prefix)
 
+    # The compiled equivalents of the _serialize_type_* methods above.
+    # Each returns a function that takes a value and returns its
+    # serialized form, or None if the value is serialized as is.
+
+    def _compile_type_structure(self, shape):
+        if shape.is_document_type:
+            return None
+        map_type = self.MAP_TYPE
+        members = {}
+
+        def serialize_structure(value):
+            serialized = map_type()
+            for key, member_value in value.items():
+                member_key, serialize_member = members[key]
+                if serialize_member is not None:
+                    member_value = serialize_member(member_value)
+                serialized[member_key] = member_value
+            return serialized
+
+        # Register the function before compiling the members so that
+        # recursive shapes refer back to it.
+        self._register_compiled(shape, serialize_structure)
+        for key, member_shape in shape.members.items():
+            members[key] = (
+                member_shape.serialization.get('name', key),
+                self._get_compiled(member_shape),
+            )
+        return serialize_structure
+
+    def _compile_type_map(self, shape):
+        map_type = self.MAP_TYPE
+        serialize_value = self._get_compiled(shape.value)
+        if serialize_value is None:
+
+            def serialize_map(value):
+                return map_type(value.items())
+
+        else:
+
+            def serialize_map(value):
+                return map_type(
+                    (key, serialize_value(sub_value))
+                    for key, sub_value in value.items()
+                )
+
+        return serialize_map
+
+    def _compile_type_list(self, shape):
+        serialize_member = self._get_compiled(shape.member)
+        if serialize_member is None:
+            return list
+
+        def serialize_list(value):
+            return [serialize_member(item) for item in value]
+
+        return serialize_list
+
+    def _compile_type_timestamp(self, shape):
+        convert = self._convert_timestamp_to_str
+        timestamp_format = shape.serialization.get('timestampFormat')
+
+        def serialize_timestamp(value):
+            return convert(value, timestamp_format)
+
+        return serialize_timestamp
+
+    def _compile_type_blob(self, shape):
+        return self._get_base64
+
+    def _compile_type_float(self, shape):
+        handle_float = self._handle_float
+
+        def serialize_float(value):
+            if isinstance(value, decimal.Decimal):
+                value = float(value)
+            return handle_float(value)
+
+        return serialize_float
+
+    _compile_type_double = _compile_type_float
+
+    def _compile_default(self, shape):
+        return None
+
 
 class CBORSerializer(Serializer):
     UNSIGNED_INT_MAJOR_TYPE = 0
@@ -1103,8 +1387,7 @@ class RestJSONSerializer(BaseRestSerializer, JSONSerializer):
             serialized['headers']['Content-Type'] = 'application/json'
 
     def _serialize_body_params(self, params, shape):
-        serialized_body = self.MAP_TYPE()
-        self._serialize(serialized_body, params, shape)
+        serialized_body = self._serialize_root(params, shape)
         return json.dumps(serialized_body).encode(self.DEFAULT_ENCODING)
 
 
@@ -1267,6 +1550,10 @@ class RpcV2CBORSerializer(BaseRpcV2Serializer, CBORSerializer):
             serialized['headers']['Content-Type'] = header_val
 
 
+def _assign_value(serialized, value, prefix=''):
+    serialized[prefix] = value
+
+
 SERIALIZERS = {
     'ec2': EC2Serializer,
     'query': QuerySerializer,
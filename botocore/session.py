@@ -70,6 +70,7 @@ from botocore.model import ServiceModel
 from botocore.parsers import ResponseParserFactory
 from botocore.plugin import get_botocore_plugins, load_client_plugins
 from botocore.regions import EndpointResolver
+from botocore.registry import get_shared_model_registry
 from botocore.useragent import UserAgentString, register_feature_id
 from botocore.utils import (
     EVENT_ALIASES,
@@ -198,7 +199,11 @@ class Session:
     def _register_data_loader(self):
         self._components.lazy_register_component(
             'data_loader',
-            lambda: create_loader(self.get_config_variable('data_path')),
+            lambda: create_loader(
+                self.get_config_variable('data_path'),
+                self.get_config_variable('data_cache_path'),
+                self.get_config_variable('lazy_load_models'),
+            ),
         )
 
     def _register_endpoint_resolver(self):
@@ -843,7 +848,6 @@ class Session:
     def lazy_register_component(self, name, component):
         self._components.lazy_register_component(name, component)
 
-    @with_current_context()
     def create_client(
         self,
         service_name,
@@ -931,6 +935,147 @@ class Session:
         :return: A botocore client instance
 
         """
+        return self._create_client(
+            service_name,
+            region_name=region_name,
+            api_version=api_version,
+            use_ssl=use_ssl,
+            verify=verify,
+            endpoint_url=endpoint_url,
+            aws_access_key_id=aws_access_key_id,
+            aws_secret_access_key=aws_secret_access_key,
+            aws_session_token=aws_session_token,
+            config=config,
+            aws_account_id=aws_account_id,
+            is_async=False,
+        )
+
+    def create_async_client(
+        self,
+        service_name,
+        region_name=None,
+        api_version=None,
+        use_ssl=True,
+        verify=None,
+        endpoint_url=None,
+        aws_access_key_id=None,
+        aws_secret_access_key=None,
+        aws_session_token=None,
+        config=None,
+        aws_account_id=None,
+    ):
+        """Create a botocore client whose operation methods are coroutines.
+
+        The client sends requests without blocking the event loop, using
+        :class:`botocore.asynchttpsession.AsyncioHTTPSession`.  Operation
+        methods, ``close`` and waiters' ``wait`` methods must be awaited
+        and paginators are iterated with ``async for``, as are the
+        streaming bodies and event streams of responses.  The client can
+        also be used as an asynchronous context manager, which closes it
+        on exit.  This accepts the same arguments as ``create_client``.
+
+        :type service_name: string
+        :param service_name: The name of the service for which a client will
+            be created.  You can use the ``Session.get_available_services()``
+            method to get a list of all available service names.
+
+        :type region_name: string
+        :param region_name: The name of the region associated with the client.
+            A client is associated with a single region.
+
+        :type api_version: string
+        :param api_version: The API version to use.  By default, botocore will
+            use the latest API version when creating a client.  You only need
+            to specify this parameter if you want to use a previous API version
+            of the client.
+
+        :type use_ssl: boolean
+        :param use_ssl: Whether or not to use SSL.  By default, SSL is used.
+            Note that not all services support non-ssl connections.
+
+        :type verify: boolean/string
+        :param verify: Whether or not to verify SSL certificates.
+            By default SSL certificates are verified.  You can provide the
+            following values:
+
+            * False - do not validate SSL certificates.  SSL will still be
+              used (unless use_ssl is False), but SSL certificates
+              will not be verified.
+            * path/to/cert/bundle.pem - A filename of the CA cert bundle to
+              uses.  You can specify this argument if you want to use a
+              different CA cert bundle than the one used by botocore.
+
+        :type endpoint_url: string
+        :param endpoint_url: The complete URL to use for the constructed
+            client.  Normally, botocore will automatically construct the
+            appropriate URL to use when communicating with a service.  You can
+            specify a complete URL (including the "http/https" scheme) to
+            override this behavior.  If this value is provided, then
+            ``use_ssl`` is ignored.
+
+        :type aws_access_key_id: string
+        :param aws_access_key_id: The access key to use when creating
+            the client.  This is entirely optional, and if not provided,
+            the credentials configured for the session will automatically
+            be used.  You only need to provide this argument if you want
+            to override the credentials used for this specific client.
+
+        :type aws_secret_access_key: string
+        :param aws_secret_access_key: The secret key to use when creating
+            the client.  Same semantics as aws_access_key_id above.
+
+        :type aws_session_token: string
+        :param aws_session_token: The session token to use when creating
+            the client.  Same semantics as aws_access_key_id above.
+
+        :type config: botocore.client.Config
+        :param config: Advanced client configuration options. If a value
+            is specified in the client config, its value will take precedence
+            over environment variables and configuration values, but not over
+            a value passed explicitly to the method. If a default config
+            object is set on the session, the config object used when creating
+            the client will be the result of calling ``merge()`` on the
+            default config with the config provided to this call.
+
+        :type aws_account_id: string
+        :param aws_account_id: The account id to use when creating
+            the client.  Same semantics as aws_access_key_id above.
+
+        :rtype: botocore.client.AsyncBaseClient
+        :return: A botocore async client instance
+
+        """
+        return self._create_client(
+            service_name,
+            region_name=region_name,
+            api_version=api_version,
+            use_ssl=use_ssl,
+            verify=verify,
+            endpoint_url=endpoint_url,
+            aws_access_key_id=aws_access_key_id,
+            aws_secret_access_key=aws_secret_access_key,
+            aws_session_token=aws_session_token,
+            config=config,
+            aws_account_id=aws_account_id,
+            is_async=True,
+        )
+
+    @with_current_context()
+    def _create_client(
+        self,
+        service_name,
+        region_name=None,
+        api_version=None,
+        use_ssl=True,
+        verify=None,
+        endpoint_url=None,
+        aws_access_key_id=None,
+        aws_secret_access_key=None,
+        aws_session_token=None,
+        config=None,
+        aws_account_id=None,
+        is_async=False,
+    ):
         default_client_config = self.get_default_client_config()
         # If a config is provided and a default config is set, then
         # use the config resulting from merging the two.
@@ -1015,6 +1160,9 @@ class Session:
 
         user_agent_creator.set_client_features(get_context().features)
 
+        model_registry = None
+        if self.get_config_variable('share_service_models'):
+            model_registry = get_shared_model_registry()
         client_creator = botocore.client.ClientCreator(
             loader,
             endpoint_resolver,
@@ -1027,8 +1175,13 @@ class Session:
             config_store,
             user_agent_creator=user_agent_creator,
             auth_token_resolver=self.get_auth_token,
+            model_registry=model_registry,
         )
-        client = client_creator.create_client(
+        if is_async:
+            create_client = client_creator.create_async_client
+        else:
+            create_client = client_creator.create_client
+        client = create_client(
             service_name=service_name,
             region_name=region_name,
             is_secure=use_ssl,
@@ -19,6 +19,7 @@ import botocore
 import botocore.auth
 from botocore.awsrequest import create_request_object, prepare_request_dict
 from botocore.compat import OrderedDict, get_current_datetime
+from botocore.endpoint_provider import S3_UNREFERENCED_PARAMS
 from botocore.exceptions import (
     ParamValidationError,
     UnknownClientMethodError,
@@ -32,6 +33,9 @@ from botocore.utils import (
     fix_s3_host,  # noqa: F401
 )
 
+# The number of endpoints that ``generate_presigned_urls`` reuses.
+PRESIGN_ENDPOINT_CACHE_SIZE = 100
+
 
 class RequestSigner:
     """
@@ -775,43 +779,117 @@ def generate_presigned_url(
 
     :returns: The presigned url
     """
-    client_method = ClientMethod
-    params = Params
+    return _generate_presigned_url(
+        self,
+        client_method=ClientMethod,
+        params=Params,
+        expires_in=ExpiresIn,
+        http_method=HttpMethod,
+        use_global_endpoint=_should_use_global_endpoint(self),
+    )
+
+
+def add_generate_presigned_urls(class_attributes, **kwargs):
+    class_attributes['generate_presigned_urls'] = generate_presigned_urls
+
+
+def generate_presigned_urls(self, Requests):
+    """Generate presigned urls for many requests to an S3 client
+
+    This is equivalent to calling ``generate_presigned_url`` for each
+    request, except that the endpoint for each operation and set of
+    endpoint parameters (such as the bucket name) is only resolved once,
+    so ``before-endpoint-resolution`` handlers are not invoked for the
+    requests that reuse it.
+
+    :type Requests: iterable
+    :param Requests: The requests to presign. Each request is a dict of
+        the ``ClientMethod``, ``Params``, ``ExpiresIn`` and ``HttpMethod``
+        arguments of ``generate_presigned_url``, of which only
+        ``ClientMethod`` is required. For example:
+
+        .. code:: python
+
+            [
+                {
+                    'ClientMethod': 'get_object',
+                    'Params': {'Bucket': 'amzn-s3-demo-bucket', 'Key': 'a'},
+                    'ExpiresIn': 300,
+                },
+                {
+                    'ClientMethod': 'get_object',
+                    'Params': {'Bucket': 'amzn-s3-demo-bucket', 'Key': 'b'},
+                },
+            ]
+
+    :returns: A generator of the presigned urls, in the order of
+        ``Requests``. The urls are generated as the generator is consumed,
+        so ``Requests`` can be a generator itself.
+    """
+    use_global_endpoint = _should_use_global_endpoint(self)
+    resolved_endpoints = {}
+    for request in Requests:
+        yield _generate_presigned_url(
+            self,
+            client_method=request['ClientMethod'],
+            params=request.get('Params'),
+            expires_in=request.get('ExpiresIn', 3600),
+            http_method=request.get('HttpMethod'),
+            use_global_endpoint=use_global_endpoint,
+            resolved_endpoints=resolved_endpoints,
+        )
+
+
+def _generate_presigned_url(
+    client,
+    client_method,
+    params,
+    expires_in,
+    http_method,
+    use_global_endpoint,
+    resolved_endpoints=None,
+):
     if params is None:
         params = {}
-    expires_in = ExpiresIn
-    http_method = HttpMethod
     context = {
         'is_presign_request': True,
-        'use_global_endpoint': _should_use_global_endpoint(self),
+        'use_global_endpoint': use_global_endpoint,
     }
 
-    request_signer = self._request_signer
+    request_signer = client._request_signer
 
     try:
-        operation_name = self._PY_TO_OP_NAME[client_method]
+        operation_name = client._PY_TO_OP_NAME[client_method]
     except KeyError:
         raise UnknownClientMethodError(method_name=client_method)
 
-    operation_model = self.meta.service_model.operation_model(operation_name)
-    params = self._emit_api_params(
+    operation_model = client.meta.service_model.operation_model(operation_name)
+    params = client._emit_api_params(
         api_params=params,
         operation_model=operation_model,
         context=context,
     )
     bucket_is_arn = ArnParser.is_arn(params.get('Bucket', ''))
-    (
-        endpoint_url,
-        additional_headers,
-        properties,
-    ) = self._resolve_endpoint_ruleset(
-        operation_model,
-        params,
-        context,
-        ignore_signing_region=(not bucket_is_arn),
-    )
+    if resolved_endpoints is None:
+        endpoint_url, additional_headers, properties = (
+            client._resolve_endpoint_ruleset(
+                operation_model,
+                params,
+                context,
+                ignore_signing_region=(not bucket_is_arn),
+            )
+        )
+    else:
+        endpoint_url, additional_headers = _resolve_presign_endpoint(
+            client,
+            operation_model,
+            params,
+            context,
+            bucket_is_arn,
+            resolved_endpoints,
+        )
 
-    request_dict = self._convert_to_request_dict(
+    request_dict = client._convert_to_request_dict(
         api_params=params,
         operation_model=operation_model,
         endpoint_url=endpoint_url,
@@ -832,6 +910,56 @@ def generate_presigned_url(
     )
 
 
+def _resolve_presign_endpoint(
+    client, operation_model, params, context, bucket_is_arn, resolved_endpoints
+):
+    # Endpoints are reused for the operation and the parameters that are
+    # passed to the endpoint ruleset, except for the parameters that the
+    # ruleset doesn't reference.  Operations that pass values searched for
+    # in the parameters aren't reused.
+    if operation_model.operation_context_parameters:
+        cache_key = None
+    else:
+        cache_key = (operation_model.name, bucket_is_arn) + tuple(
+            params.get(param.member_name)
+            for param in operation_model.context_parameters
+            if param.name not in S3_UNREFERENCED_PARAMS
+        )
+    resolved = resolved_endpoints.get(cache_key)
+    if resolved is None:
+        endpoint_url, additional_headers, properties = (
+            client._resolve_endpoint_ruleset(
+                operation_model,
+                params,
+                context,
+                ignore_signing_region=(not bucket_is_arn),
+            )
+        )
+        signing = context.get('signing')
+        resolved = (
+            endpoint_url,
+            dict(additional_headers),
+            context.get('auth_type'),
+            None if signing is None else dict(signing),
+        )
+        if cache_key is not None:
+            if len(resolved_endpoints) >= PRESIGN_ENDPOINT_CACHE_SIZE:
+                resolved_endpoints.clear()
+            resolved_endpoints[cache_key] = resolved
+        return endpoint_url, additional_headers
+    endpoint_url, additional_headers, auth_type, signing = resolved
+    additional_headers = dict(additional_headers)
+    # Update the context the same way that resolving the endpoint does.
+    if auth_type is not None:
+        context['auth_type'] = auth_type
+    if signing is not None:
+        if 'signing' in context:
+            context['signing'].update(signing)
+        else:
+            context['signing'] = dict(signing)
+    return endpoint_url, additional_headers
+
+
 def add_generate_presigned_post(class_attributes, **kwargs):
     class_attributes['generate_presigned_post'] = generate_presigned_post
 
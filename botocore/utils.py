@@ -16,6 +16,7 @@ import datetime
 import email.message
 import functools
 import hashlib
+import inspect
 import io
 import logging
 import os
@@ -26,6 +27,7 @@ import tempfile
 import time
 import warnings
 import weakref
+from collections.abc import MutableMapping
 from datetime import datetime as _DatetimeClass
 from ipaddress import ip_address
 from pathlib import Path
@@ -262,6 +264,17 @@ def has_header(header_name, headers):
         return header_name.lower() in [key.lower() for key in headers.keys()]
 
 
+def is_async_stream(stream):
+    """Whether a raw response stream is read with coroutines.
+
+    Streaming responses from
+    :class:`botocore.asynchttpsession.AsyncioHTTPSession` have a coroutine
+    ``read`` method, and are wrapped with the async variants of the
+    streaming body types.
+    """
+    return inspect.iscoroutinefunction(getattr(stream, 'read', None))
+
+
 def get_service_module_name(service_model):
     """Returns the module name for a service
 
@@ -1590,7 +1603,7 @@ def deep_merge(base, extra):
         # If the key represents a dict on both given dicts, merge the sub-dicts
         if (
             key in base
-            and isinstance(base[key], dict)
+            and isinstance(base[key], MutableMapping)
             and isinstance(extra[key], dict)
         ):
             deep_merge(base[key], extra[key])
@@ -1739,9 +1752,14 @@ class S3RegionRedirectorv2:
     removal without prior announcement. Please do not use it directly.
     """
 
-    def __init__(self, endpoint_bridge, client, cache=None):
+    def __init__(
+        self, endpoint_bridge, client, cache=None, calling_client=None
+    ):
         self._cache = cache or {}
         self._client = weakref.proxy(client)
+        # The client to make HeadBucket calls with.  Async clients can't be
+        # called from a handler, so they provide a blocking client instead.
+        self._calling_client = weakref.proxy(calling_client or client)
 
     def register(self, event_emitter=None):
         logger.debug('Registering S3 region redirector handler')
@@ -1894,7 +1912,7 @@ class S3RegionRedirectorv2:
         else:
             # Finally, HEAD the bucket. No other choice sadly.
             try:
-                response = self._client.head_bucket(Bucket=bucket)
+                response = self._calling_client.head_bucket(Bucket=bucket)
                 headers = response['ResponseMetadata']['HTTPHeaders']
             except ClientError as e:
                 headers = e.response['ResponseMetadata']['HTTPHeaders']
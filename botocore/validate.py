@@ -179,7 +179,13 @@ class ValidationErrors:
 
 
 class ParamValidator:
-    """Validates parameters against a shape model."""
+    """Validates parameters against a shape model.
+
+    The first time a shape is validated it is compiled into a function
+    that only checks whether parameters are valid.  Parameters are only
+    walked again to collect the detailed errors when that check fails.
+
+    """
 
     # Valid Python types for scalar c2j types
     SCALAR_TYPES = {
@@ -201,6 +207,11 @@ class ParamValidator:
     # Metadata attributes that we validate beyond type checking
     VALIDATED_METADATA_ATTRS = {'required', 'min', 'document', 'union'}
 
+    def __init__(self):
+        # Maps shapes to the compiled functions that check whether a value
+        # is valid for the shape.
+        self._compiled_validators = {}
+
     def _shape_has_constraints(self, shape):
         """Whether the shape has validated constraints beyond type checking."""
         return bool(self.VALIDATED_METADATA_ATTRS & set(shape.metadata.keys()))
@@ -220,9 +231,149 @@ class ParamValidator:
 
         """
         errors = ValidationErrors()
+        if self._get_compiled(shape)(params):
+            return errors
         self._validate(params, shape, errors, name='')
         return errors
 
+    def _get_compiled(self, shape):
+        # Returns a function that takes a value and returns whether it is
+        # valid for the shape.  The function must never accept a value the
+        # _validate_<type> methods would report an error for, but it may
+        # reject a valid one, which only costs walking it with _validate.
+        # Members are compiled the first time they're validated, so only
+        # the parts of a shape that are used get compiled.
+        try:
+            return self._compiled_validators[shape]
+        except KeyError:
+            pass
+        if is_json_value_header(shape):
+            is_valid = _is_json_serializable
+        elif shape.type_name == 'structure' and shape.is_document_type:
+            is_valid = _is_valid_document
+        else:
+            method = getattr(
+                self, f'_compile_{shape.type_name}', self._compile_unknown
+            )
+            is_valid = method(shape)
+        self._compiled_validators[shape] = is_valid
+        return is_valid
+
+    def _compile_unknown(self, shape):
+        # Let _validate handle (and fail on) types it doesn't know about.
+        return _is_never_valid
+
+    def _compile_structure(self, shape):
+        valid_types = self.CONTAINER_TYPES['structure']
+        required = tuple(shape.metadata.get('required', []))
+        is_tagged_union = shape.is_tagged_union
+        member_shapes = shape.members
+        members = {}
+
+        def is_valid_structure(params):
+            if not isinstance(params, valid_types):
+                return False
+            if is_tagged_union and len(params) != 1:
+                return False
+            for required_member in required:
+                if required_member not in params:
+                    return False
+            for param, value in params.items():
+                is_valid_member = members.get(param)
+                if is_valid_member is None:
+                    if param not in member_shapes:
+                        return False
+                    is_valid_member = self._get_compiled(member_shapes[param])
+                    members[param] = is_valid_member
+                if not is_valid_member(value):
+                    return False
+            return True
+
+        return is_valid_structure
+
+    def _compile_list(self, shape):
+        valid_types = self.CONTAINER_TYPES['list']
+        min_allowed = _get_min_allowed(shape)
+        member_shape = shape.member
+        member_type = member_shape.type_name
+        is_valid_member = None
+        if (
+            member_type in self.SCALAR_TYPES
+            and not self._shape_has_constraints(member_shape)
+        ):
+            # Like _validate_list, only check the type of these members.
+            is_valid_member = _type_checker(self.SCALAR_TYPES[member_type])
+
+        def is_valid_list(param):
+            nonlocal is_valid_member
+            if not isinstance(param, valid_types):
+                return False
+            if min_allowed is not None and len(param) < min_allowed:
+                return False
+            if is_valid_member is None:
+                is_valid_member = self._get_compiled(member_shape)
+            for item in param:
+                if not is_valid_member(item):
+                    return False
+            return True
+
+        return is_valid_list
+
+    def _compile_map(self, shape):
+        valid_types = self.CONTAINER_TYPES['map']
+        is_valid_key = None
+        is_valid_value = None
+
+        def is_valid_map(param):
+            nonlocal is_valid_key, is_valid_value
+            if not isinstance(param, valid_types):
+                return False
+            if is_valid_key is None:
+                is_valid_key = self._get_compiled(shape.key)
+                is_valid_value = self._get_compiled(shape.value)
+            for key, value in param.items():
+                if not (is_valid_key(key) and is_valid_value(value)):
+                    return False
+            return True
+
+        return is_valid_map
+
+    def _compile_string(self, shape):
+        return _type_checker(
+            self.SCALAR_TYPES['string'], _get_min_allowed(shape), len
+        )
+
+    def _compile_integer(self, shape):
+        return _type_checker(
+            self.SCALAR_TYPES['integer'], _get_min_allowed(shape)
+        )
+
+    def _compile_long(self, shape):
+        return _type_checker(
+            self.SCALAR_TYPES['long'], _get_min_allowed(shape)
+        )
+
+    def _compile_double(self, shape):
+        return _type_checker(
+            self.SCALAR_TYPES['double'], _get_min_allowed(shape)
+        )
+
+    _compile_float = _compile_double
+
+    def _compile_boolean(self, shape):
+        return _type_checker(self.SCALAR_TYPES['boolean'])
+
+    def _compile_blob(self, shape):
+        return _is_valid_blob
+
+    def _compile_timestamp(self, shape):
+        def is_valid_timestamp(param):
+            return isinstance(param, datetime) or self._type_check_datetime(
+                param
+            )
+
+        return is_valid_timestamp
+
     def _check_special_validation_cases(self, shape):
         if is_json_value_header(shape):
             return self._validate_jsonvalue_string
@@ -409,6 +560,63 @@ class ParamValidator:
             return False
 
 
+def _get_min_allowed(shape):
+    # The minimum value (or length) that range_check enforces, if any.
+    if 'min' in shape.metadata:
+        return shape.metadata['min']
+    if shape.serialization.get('hostLabel'):
+        # Members that can be bound to the host have an implicit min of 1
+        return 1
+    return None
+
+
+def _type_checker(valid_types, min_allowed=None, measure=None):
+    if min_allowed is None:
+
+        def is_valid_type(param):
+            return isinstance(param, valid_types)
+
+        return is_valid_type
+    if measure is None:
+
+        def is_valid_value(param):
+            return isinstance(param, valid_types) and param >= min_allowed
+
+        return is_valid_value
+
+    def is_valid_length(param):
+        return isinstance(param, valid_types) and measure(param) >= min_allowed
+
+    return is_valid_length
+
+
+def _is_json_serializable(param):
+    try:
+        json.dumps(param)
+    except (ValueError, TypeError):
+        return False
+    return True
+
+
+def _is_valid_document(param):
+    if param is None:
+        return True
+    if isinstance(param, dict):
+        return all(_is_valid_document(value) for value in param.values())
+    if isinstance(param, list):
+        return all(_is_valid_document(entity) for entity in param)
+    return isinstance(param, (str, int, bool, float))
+
+
+def _is_valid_blob(param):
+    # File like objects are also allowed for blob types.
+    return isinstance(param, (bytes, bytearray, str)) or hasattr(param, 'read')
+
+
+def _is_never_valid(param):
+    return False
+
+
 class ParamValidationDecorator:
     def __init__(self, param_validator, serializer):
         self._param_validator = param_validator
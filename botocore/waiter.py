@@ -10,13 +10,15 @@
 # distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
+import asyncio
+import inspect
 import logging
 import time
 from functools import partial
 
 import jmespath
 
-from botocore.context import with_current_context
+from botocore.context import start_as_current_context, with_current_context
 from botocore.docs.docstring import WaiterDocstring
 from botocore.useragent import register_feature_id
 from botocore.utils import get_service_module_name
@@ -27,7 +29,9 @@ from .exceptions import ClientError, WaiterConfigError, WaiterError
 logger = logging.getLogger(__name__)
 
 
-def create_waiter_with_client(waiter_name, waiter_model, client):
+def create_waiter_with_client(
+    waiter_name, waiter_model, client, waiter_cls=None
+):
     """
 
     :type waiter_name: str
@@ -41,10 +45,16 @@ def create_waiter_with_client(waiter_name, waiter_model, client):
     :type client: botocore.client.BaseClient
     :param client: The botocore client associated with the service.
 
+    :type waiter_cls: type
+    :param waiter_cls: The waiter class to create.  Defaults to
+        ``Waiter``; use ``AsyncWaiter`` for async clients.
+
     :rtype: botocore.waiter.Waiter
     :return: The waiter object.
 
     """
+    if waiter_cls is None:
+        waiter_cls = Waiter
     single_waiter_config = waiter_model.get_waiter(waiter_name)
     operation_name = xform_name(single_waiter_config.operation)
     operation_method = NormalizedOperationMethod(
@@ -54,8 +64,15 @@ def create_waiter_with_client(waiter_name, waiter_model, client):
     # Create a new wait method that will serve as a proxy to the underlying
     # Waiter.wait method. This is needed to attach a docstring to the
     # method.
-    def wait(self, **kwargs):
-        Waiter.wait(self, **kwargs)
+    if inspect.iscoroutinefunction(waiter_cls.wait):
+
+        async def wait(self, **kwargs):
+            await waiter_cls.wait(self, **kwargs)
+
+    else:
+
+        def wait(self, **kwargs):
+            waiter_cls.wait(self, **kwargs)
 
     wait.__doc__ = WaiterDocstring(
         waiter_name=waiter_name,
@@ -71,7 +88,9 @@ def create_waiter_with_client(waiter_name, waiter_model, client):
     )
 
     # Create the new waiter class
-    documented_waiter_cls = type(waiter_class_name, (Waiter,), {'wait': wait})
+    documented_waiter_cls = type(
+        waiter_class_name, (waiter_cls,), {'wait': wait}
+    )
 
     # Return an instance of the new waiter class.
     return documented_waiter_cls(
@@ -92,7 +111,17 @@ class NormalizedOperationMethod:
 
     def __call__(self, **kwargs):
         try:
-            return self._client_method(**kwargs)
+            response = self._client_method(**kwargs)
+        except ClientError as e:
+            return e.response
+        if inspect.isawaitable(response):
+            # The operation methods of async clients return coroutines.
+            return self._await_response(response)
+        return response
+
+    async def _await_response(self, response):
+        try:
+            return await response
         except ClientError as e:
             return e.response
 
@@ -336,17 +365,34 @@ class Waiter:
 
     @with_current_context(partial(register_feature_id, 'WAITER'))
     def wait(self, **kwargs):
-        acceptors = list(self.config.acceptors)
-        current_state = 'waiting'
+        sleep_amount, max_attempts = self._get_wait_config(kwargs)
+        check_response = self._create_response_checker(max_attempts)
+        while True:
+            response = self._operation_method(**kwargs)
+            if check_response(response):
+                return
+            time.sleep(sleep_amount)
+
+    def _get_wait_config(self, kwargs):
         # pop the invocation specific config
         config = kwargs.pop('WaiterConfig', {})
         sleep_amount = config.get('Delay', self.config.delay)
         max_attempts = config.get('MaxAttempts', self.config.max_attempts)
+        return sleep_amount, max_attempts
+
+    def _create_response_checker(self, max_attempts):
+        # Returns a function that is called with each response.  It returns
+        # True once the waiter has succeeded and raises a WaiterError when
+        # it fails.
+        acceptors = list(self.config.acceptors)
+        current_state = 'waiting'
         last_matched_acceptor = None
         num_attempts = 0
+        acceptor = None
 
-        while True:
-            response = self._operation_method(**kwargs)
+        def check_response(response):
+            nonlocal current_state, last_matched_acceptor, num_attempts
+            nonlocal acceptor
             num_attempts += 1
             for acceptor in acceptors:
                 if acceptor.matcher_func(response):
@@ -372,7 +418,7 @@ class Waiter:
                 logger.debug(
                     "Waiting complete, waiter matched the success state."
                 )
-                return
+                return True
             if current_state == 'failure':
                 reason = f'Waiter encountered a terminal failure state: {acceptor.explanation}'
                 raise WaiterError(
@@ -393,4 +439,25 @@ class Waiter:
                     reason=reason,
                     last_response=response,
                 )
-            time.sleep(sleep_amount)
+            return False
+
+        return check_response
+
+
+class AsyncWaiter(Waiter):
+    """A waiter for the operation methods of async clients.
+
+    ``wait`` is a coroutine that sleeps between attempts without blocking
+    the event loop.
+    """
+
+    async def wait(self, **kwargs):
+        with start_as_current_context():
+            register_feature_id('WAITER')
+            sleep_amount, max_attempts = self._get_wait_config(kwargs)
+            check_response = self._create_response_checker(max_attempts)
+            while True:
+                response = await self._operation_method(**kwargs)
+                if check_response(response):
+                    return
+                await asyncio.sleep(sleep_amount)
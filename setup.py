@@ -30,6 +30,7 @@ requires = [
 
 extras_require = {
     'crt': ['awscrt==0.36.0'],
+    'h2': ['h2>=4.1.0,<5.0.0'],
 }
 
 setup(
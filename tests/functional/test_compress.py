@@ -12,12 +12,22 @@
 # language governing permissions and limitations under the License.
 
 import gzip
+import io
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 import pytest
 
-from botocore.compress import COMPRESSION_MAPPING
+import botocore.compress
+from botocore.compress import COMPRESSION_MAPPING, GzipCodec
 from botocore.config import Config
-from tests import ALL_SERVICES, ClientHTTPStubber, patch_load_service_model
+from tests import (
+    ALL_SERVICES,
+    ClientHTTPStubber,
+    mock,
+    patch_load_service_model,
+)
 from tests.functional.test_useragent import (
     get_captured_ua_strings,
     parse_registered_feature_ids,
@@ -72,6 +82,45 @@ FAKE_MODEL = {
     },
 }
 
+FAKE_STREAMING_MODEL = {
+    "version": "2.0",
+    "documentation": "",
+    "metadata": {
+        "apiVersion": "2020-02-02",
+        "endpointPrefix": "otherservice",
+        "protocol": "rest-json",
+        "serviceFullName": "Other Service",
+        "serviceId": "Other Service",
+        "signatureVersion": "v4",
+        "signingName": "otherservice",
+        "uid": "otherservice-2020-02-02",
+    },
+    "operations": {
+        "MockStreamingOperation": {
+            "name": "MockStreamingOperation",
+            "http": {"method": "PUT", "requestUri": "/"},
+            "input": {"shape": "MockStreamingOperationRequest"},
+            "documentation": "",
+            "requestcompression": {
+                "encodings": ["gzip"],
+            },
+        },
+    },
+    "shapes": {
+        "MockStreamingOperationRequest": {
+            "type": "structure",
+            "members": {
+                "Body": {"shape": "MockStreamingBody", "documentation": ""},
+            },
+            "payload": "Body",
+        },
+        "MockStreamingBody": {
+            "type": "blob",
+            "streaming": True,
+        },
+    },
+}
+
 FAKE_RULESET = {
     "version": "1.0",
     "parameters": {},
@@ -88,6 +137,29 @@ FAKE_RULESET = {
     ],
 }
 
+# Resolves to the configured endpoint_url.
+FAKE_ENDPOINT_URL_RULESET = {
+    "version": "1.0",
+    "parameters": {
+        "Endpoint": {
+            "builtIn": "SDK::Endpoint",
+            "required": True,
+            "type": "String",
+        },
+    },
+    "rules": [
+        {
+            "conditions": [],
+            "type": "endpoint",
+            "endpoint": {
+                "url": {"ref": "Endpoint"},
+                "properties": {},
+                "headers": {},
+            },
+        }
+    ],
+}
+
 
 def _all_compression_operations():
     for service_model in ALL_SERVICES:
@@ -133,6 +205,32 @@ def test_compression(patched_session, monkeypatch):
         assert serialized_body.encode('utf-8') == actual_body
 
 
+def test_compression_with_configured_codec(patched_session, monkeypatch):
+    patch_load_service_model(
+        patched_session, monkeypatch, FAKE_MODEL, FAKE_RULESET
+    )
+    client = patched_session.create_client(
+        "otherservice",
+        region_name="us-west-2",
+        config=Config(
+            request_min_compression_size_bytes=100,
+            request_compression_codecs={"gzip": GzipCodec(level=1)},
+        ),
+    )
+    with ClientHTTPStubber(client, strict=True) as http_stubber:
+        http_stubber.add_response(status=200, body=b"<response/>")
+        params_list = [
+            {"MockOpParam": f"MockOpParamValue{i}"} for i in range(1, 21)
+        ]
+        client.mock_operation(MockOpParamList=params_list)
+        body = http_stubber.requests[0].body
+        assert body[8] == 4
+        assert gzip.decompress(body).startswith(b"Action=MockOperation")
+    stats = client.meta.get_compression_stats()["MockOperation"]
+    assert stats.requests == 1
+    assert stats.compressed_bytes == len(body)
+
+
 def test_user_agent_has_gzip_feature_id(patched_session, monkeypatch):
     patch_load_service_model(
         patched_session, monkeypatch, FAKE_MODEL, FAKE_RULESET
@@ -152,3 +250,76 @@ def test_user_agent_has_gzip_feature_id(patched_session, monkeypatch):
     ua_string = get_captured_ua_strings(http_stubber)[0]
     feature_list = parse_registered_feature_ids(ua_string)
     assert 'L' in feature_list
+
+
+class RecordingHandler(BaseHTTPRequestHandler):
+    """Records chunked request bodies, failing the first request."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_PUT(self):
+        body = b''
+        while size := int(self.rfile.readline(), 16):
+            body += self.rfile.read(size)
+            self.rfile.readline()
+        self.rfile.readline()
+        self.server.bodies.append(body)
+        status = 500 if len(self.server.bodies) == 1 else 200
+        self.send_response(status)
+        self.send_header('Content-Length', '2')
+        self.end_headers()
+        self.wfile.write(b'{}')
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def recording_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), RecordingHandler)
+    server.bodies = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize("threaded", [False, True])
+def test_streaming_compression(
+    patched_session, monkeypatch, recording_server, threaded
+):
+    patch_load_service_model(
+        patched_session,
+        monkeypatch,
+        FAKE_STREAMING_MODEL,
+        FAKE_ENDPOINT_URL_RULESET,
+    )
+    host, port = recording_server.server_address
+    client = patched_session.create_client(
+        "otherservice",
+        region_name="us-west-2",
+        endpoint_url=f"http://{host}:{port}",
+    )
+    data = os.urandom(200000)
+    # Threaded compression is used from this size.
+    min_size = len(data) if threaded else len(data) + 1
+    with (
+        mock.patch.object(
+            botocore.compress, "THREADED_COMPRESSION_MIN_SIZE", min_size
+        ),
+        mock.patch.object(
+            botocore.compress,
+            "_compress_in_thread",
+            wraps=botocore.compress._compress_in_thread,
+        ) as compress_in_thread,
+    ):
+        client.mock_streaming_operation(Body=io.BytesIO(data))
+    assert compress_in_thread.called == threaded
+    # The body is compressed as it's sent, and again for the retry of the
+    # failed first request.
+    assert len(recording_server.bodies) == 2
+    for body in recording_server.bodies:
+        assert gzip.decompress(body) == data
+    stats = client.meta.get_compression_stats()["MockStreamingOperation"]
+    assert stats.streamed == 1
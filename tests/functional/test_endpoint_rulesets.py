@@ -200,35 +200,66 @@ def iter_e2e_test_cases_that_produce(endpoints=False, errors=False):
                 )
 
 
+@pytest.mark.parametrize('compiled', [False, True])
 @pytest.mark.parametrize(
     'service_name, input_params, expected_endpoint',
     iter_provider_test_cases_that_produce(endpoints=True),
 )
 def test_endpoint_provider_test_cases_yielding_endpoints(
-    partitions, service_name, input_params, expected_endpoint
+    partitions, service_name, input_params, expected_endpoint, compiled
 ):
     ruleset = LOADER.load_service_model(service_name, 'endpoint-rule-set-1')
-    endpoint_provider = EndpointProvider(ruleset, partitions)
+    endpoint_provider = EndpointProvider(
+        ruleset, partitions, compiled=compiled
+    )
     endpoint = endpoint_provider.resolve_endpoint(**input_params)
     assert endpoint.url == expected_endpoint['url']
     assert endpoint.properties == expected_endpoint.get('properties', {})
     assert endpoint.headers == expected_endpoint.get('headers', {})
 
 
+@pytest.mark.parametrize('compiled', [False, True])
 @pytest.mark.parametrize(
     'service_name, input_params, expected_error',
     iter_provider_test_cases_that_produce(errors=True),
 )
 def test_endpoint_provider_test_cases_yielding_errors(
-    partitions, service_name, input_params, expected_error
+    partitions, service_name, input_params, expected_error, compiled
 ):
     ruleset = LOADER.load_service_model(service_name, 'endpoint-rule-set-1')
-    endpoint_provider = EndpointProvider(ruleset, partitions)
+    endpoint_provider = EndpointProvider(
+        ruleset, partitions, compiled=compiled
+    )
     with pytest.raises(EndpointResolutionError) as exc_info:
         endpoint_provider.resolve_endpoint(**input_params)
     assert str(exc_info.value) == expected_error
 
 
+@pytest.mark.parametrize("service_name", ALL_SERVICES)
+def test_endpoint_provider_test_cases_with_cache(partitions, service_name):
+    # All test cases of a service share a provider so that they are
+    # resolved from each other's cached rules.
+    ruleset = LOADER.load_service_model(service_name, 'endpoint-rule-set-1')
+    endpoint_provider = EndpointProvider(ruleset, partitions, cache_size=100)
+    test_cases = get_endpoint_tests_for_service(service_name)['testCases']
+    for _ in range(2):
+        for test_case in test_cases:
+            input_params = test_case.get('params', {})
+            expected_object = test_case['expect']
+            if 'endpoint' in expected_object:
+                expected_endpoint = expected_object['endpoint']
+                endpoint = endpoint_provider.resolve_endpoint(**input_params)
+                assert endpoint.url == expected_endpoint['url']
+                assert endpoint.properties == expected_endpoint.get(
+                    'properties', {}
+                )
+                assert endpoint.headers == expected_endpoint.get('headers', {})
+            else:
+                with pytest.raises(EndpointResolutionError) as exc_info:
+                    endpoint_provider.resolve_endpoint(**input_params)
+                assert str(exc_info.value) == expected_object['error']
+
+
 @pytest.mark.parametrize(
     'service_name, op_name, op_params, builtin_params, expected_endpoint',
     iter_e2e_test_cases_that_produce(endpoints=True),
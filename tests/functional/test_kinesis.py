@@ -10,8 +10,11 @@
 # distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
+import asyncio
 import json
+import struct
 from base64 import b64decode
+from binascii import crc32
 from uuid import uuid4
 
 from tests import BaseSessionTest, ClientHTTPStubber
@@ -85,3 +88,83 @@ class TestKinesisListStreams(BaseSessionTest):
             self.assert_base64encoded_str_equals(
                 record_barfoo["Data"], "barfoo"
             )
+
+
+def encode_event(event_type, payload):
+    headers = b''
+    for name, value in (
+        (b':message-type', b'event'),
+        (b':event-type', event_type),
+        (b':content-type', b'application/json'),
+    ):
+        headers += struct.pack('!B', len(name)) + name
+        headers += struct.pack('!BH', 7, len(value)) + value
+    total_length = 12 + len(headers) + len(payload) + 4
+    prelude = struct.pack('!II', total_length, len(headers))
+    message = prelude + struct.pack('!I', crc32(prelude)) + headers + payload
+    return message + struct.pack('!I', crc32(message))
+
+
+class TestKinesisAsyncSubscribeToShard(BaseSessionTest):
+    def setUp(self):
+        super().setUp()
+        self.consumer_arn = (
+            "arn:aws:kinesis:us-east-1:123456789012:stream/test-stream/"
+            "consumer/test-consumer:1"
+        )
+
+    async def handle(self, reader, writer):
+        await reader.readuntil(b"\r\n\r\n")
+        writer.write(
+            b"HTTP/1.1 200 OK\r\n"
+            b"Content-Type: application/vnd.amazon.eventstream\r\n"
+            b"Transfer-Encoding: chunked\r\n\r\n"
+        )
+        for message in self.messages:
+            writer.write(b"%x\r\n%s\r\n" % (len(message), message))
+            await writer.drain()
+            # Each event is only sent once the previous one was received.
+            await self.received.get()
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
+        writer.close()
+
+    def test_streams_events(self):
+        self.messages = [
+            encode_event(b"initial-response", b"{}"),
+            encode_event(
+                b"SubscribeToShardEvent",
+                b'{"Records": [], "ContinuationSequenceNumber": "1",'
+                b' "MillisBehindLatest": 0}',
+            ),
+        ]
+
+        async def subscribe():
+            self.received = asyncio.Queue()
+            server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            client = self.session.create_async_client(
+                "kinesis", "us-east-1", endpoint_url=f"http://127.0.0.1:{port}"
+            )
+            try:
+                async with client:
+                    response = await client.subscribe_to_shard(
+                        ConsumerARN=self.consumer_arn,
+                        ShardId="shardId-000000000000",
+                        StartingPosition={"Type": "LATEST"},
+                    )
+                    self.received.put_nowait(True)
+                    events = []
+                    async for event in response["EventStream"]:
+                        events.append(event)
+                        self.received.put_nowait(True)
+                    return events
+            finally:
+                server.close()
+
+        events = asyncio.run(subscribe())
+        self.assertEqual(len(events), 1)
+        self.assertEqual(
+            events[0]["SubscribeToShardEvent"]["ContinuationSequenceNumber"],
+            "1",
+        )
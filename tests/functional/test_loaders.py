@@ -13,8 +13,9 @@
 import os
 import shutil
 
+import botocore.session
 from botocore import loaders
-from tests import temporary_file, unittest
+from tests import ClientHTTPStubber, temporary_file, unittest
 
 
 class TestLoaderAllowsDataPathOverride(unittest.TestCase):
@@ -39,3 +40,28 @@ class TestLoaderAllowsDataPathOverride(unittest.TestCase):
             new_content = loader.load_data('_retry')
             # This should contain the content we just created.
             self.assertEqual(new_content, {"foo": "bar"})
+
+
+class TestLazyLoadedModels(unittest.TestCase):
+    def test_lazy_client_only_decodes_used_shapes(self):
+        session = botocore.session.Session()
+        session.set_config_variable('lazy_load_models', True)
+        client = session.create_client(
+            'sqs',
+            region_name='us-west-2',
+            aws_access_key_id='foo',
+            aws_secret_access_key='bar',
+        )
+        with ClientHTTPStubber(client) as stubber:
+            stubber.add_response(body=b'{"QueueUrls": ["https://queue"]}')
+            response = client.list_queues()
+        self.assertEqual(response['QueueUrls'], ['https://queue'])
+
+        loader = session.get_component('data_loader')
+        # This is the same cached model the client was created from.
+        shapes = loader.load_service_model(
+            'sqs', 'service-2', api_version=None
+        )['shapes']
+        self.assertIsInstance(shapes, loaders.LazyJSONObject)
+        self.assertIn('ListQueuesRequest', shapes.decoded_keys)
+        self.assertNotIn('SendMessageRequest', shapes.decoded_keys)
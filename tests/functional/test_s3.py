@@ -10,6 +10,7 @@
 # distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
+import asyncio
 import datetime
 import io
 import re
@@ -24,6 +25,7 @@ from botocore.config import Config
 from botocore.exceptions import (
     ClientError,
     ConnectionError,
+    FlexibleChecksumError,
     InvalidS3UsEast1RegionalEndpointConfigError,
     ParamValidationError,
     UnsupportedS3AccesspointConfigurationError,
@@ -33,6 +35,7 @@ from tests import (
     BaseSessionTest,
     ClientHTTPStubber,
     FreezeTime,
+    SessionHTTPStubber,
     create_session,
     get_checksum_cls,
     mock,
@@ -1890,6 +1893,33 @@ class TestRegionRedirect(BaseS3OperationTest):
             )
             self.assertEqual(http_stubber.requests[1].url, fixed_url)
 
+    def test_region_redirect_with_async_client(self):
+        # Without the region in the redirect, the bucket's region is looked
+        # up with HeadBucket, which async clients make with a blocking
+        # client.
+        async def list_objects(client):
+            async with client:
+                return await client.list_objects(Bucket="foo")
+
+        with SessionHTTPStubber(self.session) as http_stubber:
+            client = self.session.create_async_client("s3", "us-west-2")
+            http_stubber.add_response(
+                status=301, body=self.redirect_response["body"]
+            )
+            http_stubber.add_response(
+                headers={"x-amz-bucket-region": "eu-central-1"}
+            )
+            http_stubber.add_response(**self.success_response)
+            response = asyncio.run(list_objects(client))
+
+        self.assertEqual(response["ResponseMetadata"]["HTTPStatusCode"], 200)
+        self.assertEqual(len(http_stubber.requests), 3)
+        self.assertEqual(http_stubber.requests[1].method, "HEAD")
+        self.assertEqual(
+            http_stubber.requests[2].url,
+            "https://foo.s3.eu-central-1.amazonaws.com/?encoding-type=url",
+        )
+
     def test_resign_request_in_us_east_1(self):
         region_headers = {"x-amz-bucket-region": "eu-central-1"}
 
@@ -3834,6 +3864,81 @@ def _verify_presigned_url_addressing(
     assert actual == expected_url
 
 
+class TestS3WarmUp(BaseS3ClientConfigurationTest):
+    def warm_up(self, client, **kwargs):
+        with mock.patch.object(client._endpoint, 'warm_up') as warm_up:
+            client.warm_up(**kwargs)
+        return warm_up.call_args[0][0]
+
+    def test_warm_up_without_operation_uses_regional_endpoint(self):
+        client = self.create_s3_client()
+        self.assertEqual(
+            self.warm_up(client), "https://s3.us-west-2.amazonaws.com"
+        )
+
+    def test_warm_up_uses_bucket_endpoint(self):
+        client = self.create_s3_client()
+        url = self.warm_up(
+            client,
+            operation_name="get_object",
+            params={"Bucket": "mybucket", "Key": "mykey"},
+        )
+        self.assertEqual(url, "https://mybucket.s3.us-west-2.amazonaws.com")
+
+    def test_warm_up_uses_path_style_config(self):
+        client = self.create_s3_client(
+            config=Config(s3={"addressing_style": "path"})
+        )
+        url = self.warm_up(
+            client,
+            operation_name="list_objects_v2",
+            params={"Bucket": "mybucket"},
+        )
+        self.assertEqual(url, "https://s3.us-west-2.amazonaws.com/mybucket")
+
+
+class TestS3AsyncGetObject(BaseSessionTest):
+    async def handle(self, reader, writer):
+        await reader.readuntil(b"\r\n\r\n")
+        writer.write(
+            b"HTTP/1.1 200 OK\r\n"
+            b"Content-Length: 11\r\n"
+            b"x-amz-checksum-crc32: %s\r\n\r\n" % self.checksum
+        )
+        for part in (b"hello", b" world"):
+            writer.write(part)
+            await writer.drain()
+            await asyncio.sleep(0.01)
+        writer.close()
+
+    def get_object(self):
+        async def read_body():
+            server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            client = self.session.create_async_client(
+                "s3", "us-west-2", endpoint_url=f"http://127.0.0.1:{port}"
+            )
+            try:
+                async with client:
+                    response = await client.get_object(
+                        Bucket="mybucket", Key="mykey"
+                    )
+                    return [chunk async for chunk in response["Body"]]
+            finally:
+                server.close()
+
+        return asyncio.run(read_body())
+
+    def test_streams_body(self):
+        self.checksum = b"DUoRhQ=="
+        self.assertEqual(b"".join(self.get_object()), b"hello world")
+
+    def test_validates_checksum_of_streamed_body(self):
+        self.checksum = b"duorhq=="
+        with self.assertRaises(FlexibleChecksumError):
+            self.get_object()
+
+
 class TestS3XMLPayloadEscape(BaseS3OperationTest):
     def assert_correct_crc32_checksum(self, request):
         checksum = get_checksum_cls()()
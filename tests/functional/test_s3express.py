@@ -10,6 +10,7 @@
 # distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
+import asyncio
 import datetime
 
 import pytest
@@ -20,7 +21,7 @@ from botocore.auth import S3ExpressAuth
 from botocore.awsrequest import AWSRequest
 from botocore.credentials import Credentials, RefreshableCredentials
 from botocore.utils import S3ExpressIdentityCache
-from tests import ClientHTTPStubber, mock
+from tests import ClientHTTPStubber, SessionHTTPStubber, mock
 
 ACCESS_KEY = "AKIDEXAMPLE"
 SECRET_KEY = "wJalrXUtnFEMI/K7MDENG+bPxRfiCYEXAMPLEKEY"
@@ -243,6 +244,35 @@ class TestS3ExpressRequests:
         # Confirm actual PutObject request was signed with Session credentials
         self._assert_s3express_credentials(stubber.requests[1].headers)
 
+    def test_get_object_with_async_client(self, mock_datetime):
+        mock_datetime.now.return_value = DATE
+        session = botocore.session.Session()
+
+        async def get_object(client):
+            async with client:
+                return await self._call_get_object(client)
+
+        with SessionHTTPStubber(session) as stubber:
+            client = session.create_async_client(
+                's3',
+                'us-west-2',
+                aws_access_key_id=ACCESS_KEY,
+                aws_secret_access_key=SECRET_KEY,
+                aws_session_token=TOKEN,
+            )
+            stubber.add_response(body=CREATE_SESSION_RESPONSE)
+            stubber.add_response()
+
+            asyncio.run(get_object(client))
+
+        # The session is created with a blocking client.
+        assert len(stubber.requests) == 2
+        _assert_expected_create_session_call(
+            stubber.requests[0], S3EXPRESS_BUCKET
+        )
+        self._assert_standard_sigv4_signature(stubber.requests[0].headers)
+        self._assert_s3express_credentials(stubber.requests[1].headers)
+
     def test_cache_with_multiple_requests(
         self, default_s3_client, mock_datetime
     ):
@@ -14,9 +14,11 @@
 # language governing permissions and limitations under the License.
 import base64
 import datetime
+import hmac
 import io
 import json
 import time
+from hashlib import sha256
 
 import botocore.auth
 import botocore.credentials
@@ -605,6 +607,26 @@ class TestSigV4(unittest.TestCase):
             '1dabba21cdad44541f6b15796f8d22978fc7ea10c46aeceeeeb66c23b3ac7604',
         )
 
+    def test_payload_checksum_is_reused_for_same_body(self):
+        request = AWSRequest()
+        request.data = '\u2713'.encode()
+        request.url = 'https://amazonaws.com'
+        auth = self.create_signer()
+        with mock.patch('botocore.auth.sha256', wraps=sha256) as sha256_mock:
+            first_payload = auth.payload(request)
+            second_payload = auth.payload(request)
+        self.assertEqual(first_payload, second_payload)
+        self.assertEqual(sha256_mock.call_count, 1)
+
+    def test_payload_checksum_is_not_reused_for_new_body(self):
+        request = AWSRequest()
+        request.data = '\u2713'.encode()
+        request.url = 'https://amazonaws.com'
+        auth = self.create_signer()
+        auth.payload(request)
+        request.data = b'foo'
+        self.assertEqual(auth.payload(request), sha256(b'foo').hexdigest())
+
     def test_payload_not_signed_if_disabled_in_context(self):
         request = AWSRequest()
         request.data = '\u2713'.encode()
@@ -625,6 +647,36 @@ class TestSigV4(unittest.TestCase):
         sha_header = request.headers['X-Amz-Content-SHA256']
         self.assertEqual(sha_header, 'UNSIGNED-PAYLOAD')
 
+    def test_add_auth_selects_headers_to_sign_once(self):
+        request = AWSRequest()
+        request.url = 'https://s3.us-west-2.amazonaws.com/'
+        request.method = 'GET'
+        auth = self.create_signer('s3', 'us-west-2')
+        with mock.patch.object(
+            auth, 'headers_to_sign', wraps=auth.headers_to_sign
+        ) as headers_to_sign:
+            auth.add_auth(request)
+        self.assertEqual(headers_to_sign.call_count, 1)
+        self.assertIn(
+            'SignedHeaders=host;x-amz-date,', request.headers['Authorization']
+        )
+        self.assertNotIn('headers_to_sign', request.context)
+
+    def test_canonical_headers_joins_repeated_headers(self):
+        auth = self.create_signer()
+        original = HTTPHeaders()
+        original['foo'] = 'one'
+        original['bar'] = 'two'
+        original['foo'] = 'three'
+        headers = auth.canonical_headers(original)
+        self.assertEqual(headers, 'bar:two\nfoo:one,three')
+
+    def test_canonical_query_string_encodes_long_values(self):
+        auth = self.create_signer()
+        value = 'a b' * 100
+        actual = auth._canonical_query_string_params({'foo bar': value})
+        self.assertEqual(actual, f'foo%20bar={value.replace(" ", "%20")}')
+
     def test_collapse_multiple_spaces(self):
         auth = self.create_signer()
         original = HTTPHeaders()
@@ -675,6 +727,64 @@ class TestSigV4(unittest.TestCase):
         expected = 's3.us-west-2.amazonaws.com'
         self.assertEqual(actual, expected)
 
+    def test_signature_uses_derived_signing_key(self):
+        request = AWSRequest()
+        request.context['timestamp'] = '20140310T170255Z'
+        auth = self.create_signer('s3', 'us-west-2')
+        key = b'AWS4bar'
+        for msg in (b'20140310', b'us-west-2', b's3', b'aws4_request'):
+            key = hmac.new(key, msg, sha256).digest()
+        expected = hmac.new(key, b'string-to-sign', sha256).hexdigest()
+        self.assertEqual(auth.signature('string-to-sign', request), expected)
+
+    def test_signing_key_is_shared_across_signers(self):
+        request = AWSRequest()
+        request.context['timestamp'] = '20140310T170255Z'
+        botocore.auth._SIGNING_KEYS.clear()
+        self.create_signer().signature('string-to-sign', request)
+        with mock.patch('botocore.auth.hmac.new', wraps=hmac.new) as hmac_new:
+            botocore.auth.S3SigV4Auth(
+                self.credentials, 'myservice', 'us-west-2'
+            ).signature('string-to-sign', request)
+        self.assertEqual(len(botocore.auth._SIGNING_KEYS), 1)
+        # Only the final signature is calculated.
+        self.assertEqual(hmac_new.call_count, 1)
+
+    def test_signing_key_cache_does_not_keep_secret_key(self):
+        request = AWSRequest()
+        request.context['timestamp'] = '20140310T170255Z'
+        botocore.auth._SIGNING_KEYS.clear()
+        self.create_signer().signature('string-to-sign', request)
+        (cache_key,) = botocore.auth._SIGNING_KEYS
+        self.assertNotIn(self.credentials.secret_key, cache_key)
+        self.assertEqual(cache_key[0], sha256(b'bar').digest())
+
+    def test_signing_key_changes_with_credential_scope(self):
+        request = AWSRequest()
+        request.context['timestamp'] = '20140310T170255Z'
+        signature = self.create_signer().signature('string-to-sign', request)
+        other_signatures = [
+            self.create_signer('otherservice').signature(
+                'string-to-sign', request
+            ),
+            self.create_signer(region='us-east-1').signature(
+                'string-to-sign', request
+            ),
+        ]
+        request.context['timestamp'] = '20140311T170255Z'
+        other_signatures.append(
+            self.create_signer().signature('string-to-sign', request)
+        )
+        self.credentials = botocore.credentials.Credentials(
+            access_key='foo', secret_key='baz'
+        )
+        request.context['timestamp'] = '20140310T170255Z'
+        other_signatures.append(
+            self.create_signer().signature('string-to-sign', request)
+        )
+        self.assertNotIn(signature, other_signatures)
+        self.assertEqual(len(set(other_signatures)), 4)
+
 
 class TestSigV4Resign(BaseTestWithFixedDate):
     maxDiff = None
@@ -18,10 +18,13 @@ import pytest
 from botocore import UNSIGNED, args, exceptions
 from botocore.args import ClientConfigString
 from botocore.client import ClientEndpointBridge
+from botocore.compress import GzipCodec
 from botocore.config import Config
 from botocore.configprovider import ConfigValueStore
 from botocore.credentials import Credentials
 from botocore.hooks import HierarchicalEmitter
+from botocore.http2session import HTTP2Session
+from botocore.httpsession import DNSCache
 from botocore.model import ServiceModel
 from botocore.parsers import PROTOCOL_PARSERS
 from botocore.serialize import SERIALIZERS
@@ -648,6 +651,23 @@ class TestCreateClientArgs(unittest.TestCase):
         config = client_args['client_config']
         self.assertFalse(config.disable_request_compression)
 
+    def test_request_compression_codecs(self):
+        codecs = {'gzip': GzipCodec(level=1)}
+        input_config = Config(request_compression_codecs=codecs)
+        client_args = self.call_get_client_args(client_config=input_config)
+        config = client_args['client_config']
+        self.assertIs(config.request_compression_codecs, codecs)
+
+    def test_bad_type_request_compression_codecs(self):
+        with self.assertRaises(exceptions.InvalidConfigError):
+            config = Config(request_compression_codecs=[GzipCodec()])
+            self.call_get_client_args(client_config=config)
+
+    def test_bad_codec_request_compression_codecs(self):
+        with self.assertRaises(exceptions.InvalidConfigError):
+            config = Config(request_compression_codecs={'gzip': object()})
+            self.call_get_client_args(client_config=config)
+
     def test_checksum_default_client_config(self):
         input_config = Config()
         client_args = self.call_get_client_args(client_config=input_config)
@@ -802,6 +822,129 @@ class TestCreateClientArgs(unittest.TestCase):
             config.auth_scheme_preference, ClientConfigString
         )
 
+    def test_serializer_not_compiled_by_default(self):
+        serializer = self.call_get_client_args()['serializer']
+        self.assertFalse(serializer._serializer._compiled)
+
+    def test_compile_serializers_set_on_client_config(self):
+        client_args = self.call_get_client_args(
+            client_config=Config(compile_serializers=True)
+        )
+        self.assertTrue(client_args['client_config'].compile_serializers)
+        self.assertTrue(client_args['serializer']._serializer._compiled)
+
+    def test_compile_parsers_set_on_client_config(self):
+        client_args = self.call_get_client_args(
+            client_config=Config(compile_parsers=True)
+        )
+        self.assertTrue(client_args['client_config'].compile_parsers)
+        parser_factory = client_args['endpoint']._response_parser_factory
+        self.assertTrue(parser_factory.create_parser('query')._compiled)
+
+    def test_stream_xml_parsing_set_on_client_config(self):
+        client_args = self.call_get_client_args(
+            client_config=Config(stream_xml_parsing=True)
+        )
+        self.assertTrue(client_args['client_config'].stream_xml_parsing)
+        parser_factory = client_args['endpoint']._response_parser_factory
+        parser = parser_factory.create_parser('rest-xml')
+        self.assertTrue(parser._stream_xml)
+        self.assertFalse(parser._compiled)
+
+    def test_lazy_response_parsing_set_on_client_config(self):
+        client_args = self.call_get_client_args(
+            client_config=Config(lazy_response_parsing=True)
+        )
+        self.assertTrue(client_args['client_config'].lazy_response_parsing)
+        parser_factory = client_args['endpoint']._response_parser_factory
+        parser = parser_factory.create_parser('json')
+        self.assertTrue(parser._lazy)
+        self.assertTrue(parser._compiled)
+
+    def test_endpoint_ruleset_not_compiled_by_default(self):
+        resolver = self.call_get_client_args()['endpoint_ruleset_resolver']
+        self.assertFalse(resolver._provider.ruleset._compiled)
+
+    def test_compile_endpoint_rulesets_set_on_client_config(self):
+        client_args = self.call_get_client_args(
+            client_config=Config(compile_endpoint_rulesets=True)
+        )
+        self.assertTrue(client_args['client_config'].compile_endpoint_rulesets)
+        resolver = client_args['endpoint_ruleset_resolver']
+        self.assertTrue(resolver._provider.ruleset._compiled)
+
+    def test_endpoint_cache_size_not_set_by_default(self):
+        resolver = self.call_get_client_args()['endpoint_ruleset_resolver']
+        self.assertIsNone(resolver._provider.cache_info())
+
+    def test_endpoint_cache_size_set_on_client_config(self):
+        client_args = self.call_get_client_args(
+            client_config=Config(endpoint_cache_size=500)
+        )
+        self.assertEqual(client_args['client_config'].endpoint_cache_size, 500)
+        resolver = client_args['endpoint_ruleset_resolver']
+        self.assertEqual(resolver._provider.cache_info().maxsize, 500)
+
+    def test_endpoint_cache_size_bad_value(self):
+        for cache_size in (0, -1, '100', True):
+            with self.assertRaises(exceptions.InvalidConfigError):
+                self.call_get_client_args(
+                    client_config=Config(endpoint_cache_size=cache_size)
+                )
+
+    def test_http_protocol_h2_uses_http2_session(self):
+        config = Config(http_protocol='h2')
+        with mock.patch('botocore.args.EndpointCreator') as m:
+            self.call_get_client_args(client_config=config)
+            self.assert_create_endpoint_call(m, http_session_cls=HTTP2Session)
+
+    def test_http_protocol_http1_uses_default_session(self):
+        config = Config(http_protocol='http/1.1')
+        with mock.patch('botocore.args.EndpointCreator') as m:
+            self.call_get_client_args(client_config=config)
+            self.assert_create_endpoint_call(m)
+
+    def test_http_protocol_bad_value(self):
+        with self.assertRaises(exceptions.InvalidConfigError):
+            self.call_get_client_args(
+                client_config=Config(http_protocol='http/2')
+            )
+
+    def test_http_protocol_h2_not_supported_by_async_clients(self):
+        with self.assertRaises(exceptions.InvalidConfigError):
+            self.call_get_client_args(
+                client_config=Config(http_protocol='h2'), is_async=True
+            )
+
+    def test_dns_cache_creates_cache_for_endpoint(self):
+        config = Config(dns_cache={'ttl': 10, 'max_size': 5})
+        with mock.patch('botocore.args.EndpointCreator') as m:
+            self.call_get_client_args(client_config=config)
+        create_endpoint = m.return_value.create_endpoint
+        dns_cache = create_endpoint.call_args[1]['dns_cache']
+        self.assertIsInstance(dns_cache, DNSCache)
+        self.assertEqual(dns_cache.get_stats().maxsize, 5)
+
+    def test_dns_cache_not_configured(self):
+        with mock.patch('botocore.args.EndpointCreator') as m:
+            self.call_get_client_args()
+        create_endpoint = m.return_value.create_endpoint
+        self.assertNotIn('dns_cache', create_endpoint.call_args[1])
+
+    def test_dns_cache_bad_value(self):
+        for dns_cache in (
+            True,
+            {'ttl': 0},
+            {'ttl': '10'},
+            {'negative_ttl': -1},
+            {'max_size': 1.5},
+            {'unknown': 1},
+        ):
+            with self.assertRaises(exceptions.InvalidConfigError):
+                self.call_get_client_args(
+                    client_config=Config(dns_cache=dns_cache)
+                )
+
     def test_auth_scheme_preference_bad_value(self):
         with self.assertRaises(exceptions.InvalidConfigError):
             config = Config(
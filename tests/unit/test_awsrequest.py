@@ -19,6 +19,7 @@ import socket
 import tempfile
 
 import pytest
+from urllib3.connection import HTTPConnection, VerifiedHTTPSConnection
 from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
 
 from botocore.awsrequest import (
@@ -649,6 +650,32 @@ class TestAWSHTTPConnectionPool(unittest.TestCase):
         https_connection_class = HTTPSConnectionPool.ConnectionCls
         self.assertIsNot(https_connection_class, AWSHTTPSConnection)
 
+    def test_connection_records_tls_handshake_time(self):
+        conn = AWSHTTPSConnection('example.com', 443)
+        conn.pool_stats = mock.Mock()
+
+        def connect(self):
+            self._new_conn()
+
+        with mock.patch.object(HTTPConnection, '_new_conn'):
+            with mock.patch.object(
+                VerifiedHTTPSConnection, 'connect', connect
+            ):
+                with mock.patch('time.perf_counter', side_effect=[1.0, 1.25]):
+                    conn.connect()
+        conn.pool_stats.record_connection.assert_called_once_with(
+            'example.com', 443, 0.25
+        )
+
+    def test_plain_connection_has_no_tls_handshake_time(self):
+        conn = AWSHTTPConnection('example.com', 80)
+        conn.pool_stats = mock.Mock()
+        with mock.patch.object(HTTPConnection, '_new_conn'):
+            conn.connect()
+        conn.pool_stats.record_connection.assert_called_once_with(
+            'example.com', 80, None
+        )
+
 
 class TestPrepareRequestDict(unittest.TestCase):
     def setUp(self):
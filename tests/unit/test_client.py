@@ -10,12 +10,14 @@
 # distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
+import asyncio
 import io
 from contextlib import closing
 
 import botocore
 import botocore.config
 from botocore import client, exceptions, hooks
+from botocore.asynchttpsession import AsyncioHTTPSession
 from botocore.auth import AUTH_TYPE_MAPS, BaseSigner
 from botocore.client import ClientEndpointBridge
 from botocore.configprovider import (
@@ -23,8 +25,12 @@ from botocore.configprovider import (
     ConfigValueStore,
     EnvironmentProvider,
 )
-from botocore.credentials import Credentials
-from botocore.endpoint import DEFAULT_TIMEOUT
+from botocore.credentials import (
+    Credentials,
+    ReadOnlyCredentials,
+    RefreshableCredentials,
+)
+from botocore.endpoint import DEFAULT_TIMEOUT, AsyncEndpoint
 from botocore.errorfactory import ClientExceptionsFactory
 from botocore.exceptions import (
     InvalidMaxRetryAttemptsError,
@@ -34,8 +40,11 @@ from botocore.exceptions import (
     ParamValidationError,
     UnknownSignatureVersionError,
 )
+from botocore.paginate import AsyncPaginator
+from botocore.registry import SharedModelRegistry
 from botocore.stub import Stubber
 from botocore.useragent import UserAgentString
+from botocore.waiter import AsyncWaiter
 from tests import get_botocore_default_config_mapping, mock, unittest
 
 
@@ -172,6 +181,7 @@ class TestAutoGeneratedClient(unittest.TestCase):
         exceptions_factory=None,
         config_store=None,
         user_agent_creator=None,
+        model_registry=None,
     ):
         if event_emitter is None:
             event_emitter = hooks.HierarchicalEmitter()
@@ -209,6 +219,7 @@ class TestAutoGeneratedClient(unittest.TestCase):
             exceptions_factory,
             config_store,
             user_agent_creator,
+            model_registry=model_registry,
         )
         return creator
 
@@ -232,6 +243,67 @@ class TestAutoGeneratedClient(unittest.TestCase):
         )
         self.assertTrue(service_client.__class__.__name__, 'MyService')
 
+    def test_service_model_and_class_shared_with_registry(self):
+        self.loader.search_paths = ['path']
+        self.loader.extras_types = ['sdk']
+        registry = SharedModelRegistry()
+        event_emitter = hooks.HierarchicalEmitter()
+        first = self.create_client_creator(
+            event_emitter=event_emitter, model_registry=registry
+        ).create_client('myservice', 'us-west-2', credentials=self.credentials)
+        second = self.create_client_creator(
+            event_emitter=event_emitter, model_registry=registry
+        ).create_client('myservice', 'us-west-2', credentials=self.credentials)
+        self.assertIs(first.meta.service_model, second.meta.service_model)
+        self.assertIs(first.__class__, second.__class__)
+        self.assertEqual(
+            self.loader.load_service_model.call_args_list.count(
+                mock.call('myservice', 'service-2', api_version=None)
+            ),
+            1,
+        )
+        stats = registry.get_stats()
+        self.assertEqual(stats['service-model']['hits'], 1)
+        self.assertEqual(stats['client-class']['hits'], 1)
+        service_model = first.meta.service_model
+        self.assertEqual(
+            stats['service-model']['size'], len(service_model.shape_names)
+        )
+        self.assertEqual(
+            stats['client-class']['size'],
+            len(service_model.operation_names),
+        )
+
+    def test_client_class_not_shared_with_different_handlers(self):
+        self.loader.search_paths = ['path']
+        self.loader.extras_types = ['sdk']
+        registry = SharedModelRegistry()
+        first = self.create_client_creator(
+            model_registry=registry
+        ).create_client('myservice', 'us-west-2', credentials=self.credentials)
+        event_emitter = hooks.HierarchicalEmitter()
+        event_emitter.register(
+            'creating-client-class.myservice', lambda **kwargs: None
+        )
+        second = self.create_client_creator(
+            event_emitter=event_emitter, model_registry=registry
+        ).create_client('myservice', 'us-west-2', credentials=self.credentials)
+        self.assertIs(first.meta.service_model, second.meta.service_model)
+        self.assertIsNot(first.__class__, second.__class__)
+
+    def test_service_model_not_shared_with_different_search_paths(self):
+        self.loader.search_paths = ['path']
+        self.loader.extras_types = ['sdk']
+        registry = SharedModelRegistry()
+        first = self.create_client_creator(
+            model_registry=registry
+        ).create_client('myservice', 'us-west-2', credentials=self.credentials)
+        self.loader.search_paths = ['other-path']
+        second = self.create_client_creator(
+            model_registry=registry
+        ).create_client('myservice', 'us-west-2', credentials=self.credentials)
+        self.assertIsNot(first.meta.service_model, second.meta.service_model)
+
     def test_client_name_with_amazon(self):
         self.service_description['metadata']['serviceFullName'] = (
             'Amazon MyService'
@@ -1712,6 +1784,72 @@ class TestAutoGeneratedClient(unittest.TestCase):
 
         self.endpoint.close.assert_called_once_with()
 
+    def test_client_meta_get_pool_stats(self):
+        creator = self.create_client_creator()
+        service_client = creator.create_client(
+            'myservice', 'us-west-2', credentials=self.credentials
+        )
+        self.assertIs(
+            service_client.meta.get_pool_stats(),
+            self.endpoint.get_pool_stats.return_value,
+        )
+
+    def test_client_meta_get_dns_cache_stats(self):
+        creator = self.create_client_creator()
+        service_client = creator.create_client(
+            'myservice', 'us-west-2', credentials=self.credentials
+        )
+        self.assertIs(
+            service_client.meta.get_dns_cache_stats(),
+            self.endpoint.get_dns_cache_stats.return_value,
+        )
+
+    def test_client_meta_get_compression_stats(self):
+        creator = self.create_client_creator()
+        service_client = creator.create_client(
+            'myservice', 'us-west-2', credentials=self.credentials
+        )
+        self.assertEqual(service_client.meta.get_compression_stats(), {})
+
+    def test_client_warm_up(self):
+        creator = self.create_client_creator()
+        service_client = creator.create_client(
+            'myservice', 'us-west-2', credentials=self.credentials
+        )
+        self.endpoint.warm_up.return_value = 2
+        self.assertEqual(service_client.warm_up(connections=2), 2)
+        self.endpoint.warm_up.assert_called_once_with(
+            'https://myservice.amazonaws.com',
+            connections=2,
+            parallel=False,
+        )
+
+    def test_client_warm_up_for_operation(self):
+        creator = self.create_client_creator()
+        service_client = creator.create_client(
+            'myservice', 'us-west-2', credentials=self.credentials
+        )
+        service_client.warm_up(
+            operation_name='test_operation',
+            params={'Foo': 'one'},
+            parallel=True,
+        )
+        self.endpoint.warm_up.assert_called_once_with(
+            'https://myservice.amazonaws.com',
+            connections=1,
+            parallel=True,
+        )
+        self.endpoint.make_request.assert_not_called()
+
+    def test_client_warm_up_unknown_operation(self):
+        creator = self.create_client_creator()
+        service_client = creator.create_client(
+            'myservice', 'us-west-2', credentials=self.credentials
+        )
+        with self.assertRaises(exceptions.UnknownClientMethodError):
+            service_client.warm_up(operation_name='not_an_operation')
+        self.endpoint.warm_up.assert_not_called()
+
     def test_client_internal_credential_shim(self):
         """This test exercises the internal credential shim exposed on clients.
         It's here to ensure we don't unintentionally regress behavior used with
@@ -1723,6 +1861,129 @@ class TestAutoGeneratedClient(unittest.TestCase):
         )
         self.assertEqual(service_client._get_credentials(), self.credentials)
 
+    def create_async_client(self, **kwargs):
+        self.endpoint = mock.Mock()
+        self.endpoint.host = 'https://myservice.amazonaws.com'
+        self.endpoint.make_request = mock.AsyncMock(
+            return_value=(mock.Mock(status_code=200), {'Result': 'value'})
+        )
+        self.endpoint.close = mock.AsyncMock()
+        self.endpoint_creator.create_endpoint.return_value = self.endpoint
+        creator = self.create_client_creator()
+        return creator.create_async_client(
+            'myservice',
+            'us-west-2',
+            credentials=kwargs.pop('credentials', self.credentials),
+            **kwargs,
+        )
+
+    def test_create_async_client(self):
+        service_client = self.create_async_client()
+        self.assertIsInstance(service_client, client.AsyncBaseClient)
+        call_kwargs = self.endpoint_creator.create_endpoint.call_args[1]
+        self.assertIs(call_kwargs['endpoint_cls'], AsyncEndpoint)
+        self.assertIs(call_kwargs['http_session_cls'], AsyncioHTTPSession)
+
+    def test_async_client_operations_are_awaited(self):
+        service_client = self.create_async_client()
+        response = asyncio.run(service_client.test_operation(Foo='one'))
+        self.assertEqual(response, {'Result': 'value'})
+        self.endpoint.make_request.assert_awaited_once()
+        request_dict = self.endpoint.make_request.await_args[0][1]
+        self.assertEqual(
+            request_dict['body'],
+            {'Action': 'TestOperation', 'Foo': 'one', 'Version': '2014-01-01'},
+        )
+
+    def test_async_client_raises_client_errors(self):
+        service_client = self.create_async_client()
+        self.endpoint.make_request.return_value = (
+            mock.Mock(status_code=400),
+            {'Error': {'Code': 'TestOperationErrorCode', 'Message': 'msg'}},
+        )
+        with self.assertRaises(
+            service_client.exceptions.TestOperationException
+        ):
+            asyncio.run(service_client.test_operation(Foo='one'))
+
+    def test_async_client_refreshes_credentials_before_call(self):
+        credentials = mock.Mock(spec=RefreshableCredentials)
+        credentials.get_frozen_credentials_async = mock.AsyncMock()
+        credentials.get_frozen_credentials.return_value = ReadOnlyCredentials(
+            'access-key', 'secret-key', None, None
+        )
+        service_client = self.create_async_client(credentials=credentials)
+        asyncio.run(service_client.test_operation(Foo='one'))
+        credentials.get_frozen_credentials_async.assert_awaited_once_with()
+
+    def test_async_client_context_manager_closes_endpoint(self):
+        service_client = self.create_async_client()
+
+        async def use_client():
+            async with service_client as entered:
+                self.assertIs(entered, service_client)
+
+        asyncio.run(use_client())
+        self.endpoint.close.assert_awaited_once_with()
+
+    def test_async_client_creates_sync_client_when_used(self):
+        service_client = self.create_async_client()
+        sync_client = service_client._sync_client
+        with mock.patch.object(
+            client.ClientCreator, 'create_client'
+        ) as create_client:
+            asyncio.run(service_client.close())
+            create_client.assert_not_called()
+
+            sync_client.test_operation(Foo='one')
+            create_client.assert_called_once()
+            created_client = create_client.return_value
+            created_client.test_operation.assert_called_once_with(Foo='one')
+
+            asyncio.run(service_client.close())
+            created_client.close.assert_called_once_with()
+
+    def test_async_client_warm_up(self):
+        service_client = self.create_async_client()
+        self.endpoint.warm_up = mock.AsyncMock(return_value=1)
+        self.assertEqual(asyncio.run(service_client.warm_up()), 1)
+        self.endpoint.warm_up.assert_awaited_once_with(
+            'https://myservice.amazonaws.com',
+            connections=1,
+            parallel=False,
+        )
+
+    def test_async_client_paginators_and_waiters_are_async(self):
+        self.loader.load_service_model.side_effect = [
+            self.service_description,
+            self.endpoint_ruleset,
+            {
+                'pagination': {
+                    'TestOperation': {
+                        'input_token': 'Marker',
+                        'output_token': 'Marker',
+                        'result_key': 'Users',
+                    }
+                }
+            },
+            {
+                'version': 2,
+                'waiters': {
+                    'Waiter1': {
+                        'operation': 'TestOperation',
+                        'delay': 5,
+                        'maxAttempts': 20,
+                        'acceptors': [],
+                    }
+                },
+            },
+        ]
+        service_client = self.create_async_client()
+        paginator = service_client.get_paginator('test_operation')
+        self.assertIsInstance(paginator, AsyncPaginator)
+        waiter = service_client.get_waiter('waiter1')
+        self.assertIsInstance(waiter, AsyncWaiter)
+
 
 class TestClientErrors(TestAutoGeneratedClient):
     def add_error_response(self, error_response):
@@ -10,15 +10,26 @@
 # distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
+import gc
 import gzip
 import io
+import os
 import sys
 
 import pytest
 
 import botocore
-from botocore.compress import COMPRESSION_MAPPING, maybe_compress_request
+from botocore.compress import (
+    COMPRESSION_MAPPING,
+    CompressionStats,
+    CompressionStatsRecorder,
+    GzipCodec,
+    GzipCompressedBody,
+    maybe_compress_request,
+)
 from botocore.config import Config
+from botocore.exceptions import InvalidConfigError
+from botocore.utils import determine_content_length
 from tests import mock
 
 
@@ -326,3 +337,172 @@ def test_only_compress_once():
         OP_MULTIPLE_COMPRESSIONS,
     )
     assert_request_compressed(request_dict, REQUEST_BODY_COMPRESSED)
+
+
+def _streaming_request_dict(raw):
+    request_dict = _request_dict(raw)
+    maybe_compress_request(
+        COMPRESSION_CONFIG_1_BYTE,
+        request_dict,
+        STREAMING_OP_WITH_COMPRESSION,
+    )
+    return request_dict
+
+
+@mock.patch.object(botocore.compress, 'GzipFile', StaticGzipFile)
+def test_streaming_body_compressed_as_read():
+    request_dict = _streaming_request_dict(io.BytesIO(REQUEST_BODY))
+    body = request_dict['body']
+    assert isinstance(body, GzipCompressedBody)
+    assert determine_content_length(body) is None
+    _assert_compression_header(request_dict['headers'])
+    data = b''
+    while chunk := body.read(7):
+        assert len(chunk) <= 7
+        data += chunk
+        assert body.tell() == len(data)
+    assert data == REQUEST_BODY_COMPRESSED
+
+
+@pytest.mark.parametrize('threaded', [False, True])
+def test_streaming_body_can_be_reset(threaded):
+    data = os.urandom(200000)
+    raw = io.BytesIO(b'skipped' + data)
+    raw.seek(7)
+    # The body must compress to the same bytes however much later it's
+    # read again.
+    clock = iter(range(1000000, 2000000, 10))
+    with mock.patch('time.time', lambda: next(clock)):
+        body = GzipCompressedBody(raw, threaded=threaded)
+        first_read = body.read(1000)
+        assert body.seek(0) == 0
+        assert body.tell() == 0
+        compressed = body.read()
+    assert compressed.startswith(first_read)
+    assert gzip.decompress(compressed) == data
+    assert body.read() == b''
+    body.close()
+
+
+def test_streaming_body_only_seeks_to_start():
+    body = GzipCompressedBody(io.BytesIO(REQUEST_BODY))
+    with pytest.raises(io.UnsupportedOperation):
+        body.seek(0, 2)
+    with pytest.raises(io.UnsupportedOperation):
+        body.seek(1)
+
+
+def test_large_streaming_body_compressed_in_thread():
+    data = os.urandom(5000)
+    with mock.patch.object(
+        botocore.compress, 'THREADED_COMPRESSION_MIN_SIZE', 1000
+    ):
+        body = _streaming_request_dict(io.BytesIO(data))['body']
+    assert body._threaded
+    assert gzip.decompress(body.read()) == data
+    body.close()
+
+
+def test_threaded_streaming_body_raises_read_errors():
+    raw = mock.Mock(wraps=io.BytesIO(REQUEST_BODY))
+    raw.read.side_effect = OSError('read failed')
+    body = GzipCompressedBody(raw, threaded=True)
+    with pytest.raises(OSError, match='read failed'):
+        body.read()
+    assert body.read() == b''
+    body.close()
+
+
+def test_threaded_streaming_body_stops_worker_when_collected():
+    body = GzipCompressedBody(
+        io.BytesIO(os.urandom(10 * 1024 * 1024)), threaded=True
+    )
+    body.read(1)
+    worker = body._worker
+    del body
+    gc.collect()
+    worker.join(5)
+    assert not worker.is_alive()
+
+
+class UppercaseCodec:
+    def compress(self, body, streaming=False):
+        return body.upper()
+
+
+def test_gzip_codec_level():
+    sizes = []
+    for level in (0, 1, 9):
+        compressed = GzipCodec(level=level).compress(REQUEST_BODY * 10)
+        assert gzip.decompress(compressed) == REQUEST_BODY * 10
+        sizes.append(len(compressed))
+    assert sizes[0] > sizes[1] > sizes[2]
+
+
+@pytest.mark.parametrize('level', [-1, 10, 5.0, True, '6'])
+def test_gzip_codec_invalid_level(level):
+    with pytest.raises(InvalidConfigError):
+        GzipCodec(level=level)
+
+
+def test_gzip_codec_level_for_streaming_body():
+    raw = io.BytesIO(REQUEST_BODY * 100)
+    body = GzipCodec(level=1).compress(raw, streaming=True)
+    assert isinstance(body, GzipCompressedBody)
+    compressed = body.read()
+    assert gzip.decompress(compressed) == REQUEST_BODY * 100
+    assert compressed[8] == 4  # The XFL byte of the fastest level.
+
+
+def test_configured_codec_for_unknown_encoding():
+    config = Config(
+        request_min_compression_size_bytes=1,
+        request_compression_codecs={'foo': UppercaseCodec()},
+    )
+    request_dict = _request_dict()
+    maybe_compress_request(config, request_dict, OP_UNKNOWN_COMPRESSION)
+    assert request_dict['body'] == REQUEST_BODY.upper()
+    _assert_compression_header(request_dict['headers'], 'foo')
+
+
+def test_configured_codec_replaces_default():
+    config = Config(
+        request_min_compression_size_bytes=1,
+        request_compression_codecs={'gzip': UppercaseCodec()},
+    )
+    request_dict = _request_dict()
+    maybe_compress_request(config, request_dict, OP_WITH_COMPRESSION)
+    assert request_dict['body'] == REQUEST_BODY.upper()
+
+
+def test_records_compression_stats():
+    operation_model = _make_op({'encodings': ['gzip']})
+    streaming_operation_model = _make_op({'encodings': ['gzip']}, True, {})
+    operation_model.name = streaming_operation_model.name = 'Operation'
+    stats = CompressionStatsRecorder()
+    for _ in range(2):
+        maybe_compress_request(
+            COMPRESSION_CONFIG_1_BYTE,
+            _request_dict(),
+            operation_model,
+            stats=stats,
+        )
+    maybe_compress_request(
+        COMPRESSION_CONFIG_1_BYTE,
+        _request_dict(io.BytesIO(REQUEST_BODY)),
+        streaming_operation_model,
+        stats=stats,
+    )
+    operation_stats = stats.get_stats()['Operation']
+    assert operation_stats.requests == 3
+    assert operation_stats.streamed == 1
+    assert operation_stats.uncompressed_bytes == 2 * len(REQUEST_BODY)
+    assert 0 < operation_stats.compressed_bytes < len(REQUEST_BODY) * 2
+    assert operation_stats.ratio == pytest.approx(
+        operation_stats.compressed_bytes / (2 * len(REQUEST_BODY))
+    )
+    assert operation_stats.compression_time > 0
+
+
+def test_compression_stats_ratio_without_sizes():
+    assert CompressionStats(1, 1, 0, 0, 0.0).ratio is None
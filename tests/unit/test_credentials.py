@@ -11,11 +11,13 @@
 # distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
+import asyncio
 import logging
 import os
 import shutil
 import subprocess
 import tempfile
+import threading
 import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -192,6 +194,30 @@ class TestRefreshableCredentials(TestCredentials):
         self.assertEqual(credential_set.secret_key, 'ORIGINAL-SECRET')
         self.assertEqual(credential_set.token, 'ORIGINAL-TOKEN')
 
+    def test_get_frozen_credentials_async_refreshes_in_executor(self):
+        self.mock_time.return_value = datetime.now(tzlocal())
+        refresh_threads = []
+
+        def refresh():
+            refresh_threads.append(threading.get_ident())
+            return self.metadata
+
+        self.refresher.side_effect = refresh
+        credential_set = asyncio.run(self.creds.get_frozen_credentials_async())
+        self.assertEqual(credential_set.access_key, 'NEW-ACCESS')
+        self.assertEqual(credential_set.secret_key, 'NEW-SECRET')
+        self.assertEqual(credential_set.token, 'NEW-TOKEN')
+        self.assertEqual(len(refresh_threads), 1)
+        self.assertNotEqual(refresh_threads[0], threading.get_ident())
+
+    def test_get_frozen_credentials_async_without_refresh(self):
+        self.mock_time.return_value = datetime.now(tzlocal()) - timedelta(
+            minutes=60
+        )
+        credential_set = asyncio.run(self.creds.get_frozen_credentials_async())
+        self.assertEqual(credential_set.access_key, 'ORIGINAL-ACCESS')
+        self.refresher.assert_not_called()
+
     def test_refresh_returns_empty_dict(self):
         self.refresher.return_value = {}
         self.mock_time.return_value = datetime.now(tzlocal())
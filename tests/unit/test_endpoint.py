@@ -10,6 +10,7 @@
 # distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
+import asyncio
 import datetime
 import io
 import socket
@@ -17,9 +18,16 @@ import socket
 import pytest
 
 import botocore.endpoint
+from botocore.asynchttpsession import AsyncioHTTPSession
 from botocore.config import Config
-from botocore.endpoint import DEFAULT_TIMEOUT, Endpoint, EndpointCreator
+from botocore.endpoint import (
+    DEFAULT_TIMEOUT,
+    AsyncEndpoint,
+    Endpoint,
+    EndpointCreator,
+)
 from botocore.exceptions import HTTPClientError, InvalidConfigError
+from botocore.hooks import HierarchicalEmitter
 from botocore.httpsession import URLLib3Session
 from botocore.model import (
     OperationModel,
@@ -204,10 +212,57 @@ class TestEndpointFeatures(TestEndpointBase):
         }
         self.assertEqual(response, expected_response)
 
+    def test_response_received_not_built_without_handlers(self):
+        self.op.service_model.service_id = ServiceId('EC2')
+        self.op.name = 'DescribeInstances'
+        self.endpoint._event_emitter = HierarchicalEmitter()
+        with mock.patch(
+            'botocore.endpoint.convert_to_response_dict',
+            wraps=botocore.endpoint.convert_to_response_dict,
+        ) as convert_to_response_dict:
+            self.endpoint.make_request(self.op, request_dict())
+        # The response dict is only converted once for parsing.
+        self.assertEqual(convert_to_response_dict.call_count, 1)
+
+    def test_handlers_registered_after_first_request_are_called(self):
+        self.op.service_model.service_id = ServiceId('EC2')
+        self.op.name = 'DescribeInstances'
+        emitter = HierarchicalEmitter()
+        self.endpoint._event_emitter = emitter
+        self.endpoint.make_request(self.op, request_dict())
+        received = []
+        emitter.register(
+            'response-received.ec2.DescribeInstances',
+            lambda **kwargs: received.append(kwargs['response_dict']),
+        )
+        self.endpoint.make_request(self.op, request_dict())
+        self.assertEqual(len(received), 1)
+        self.assertEqual(received[0]['status_code'], 200)
+
     def test_close(self):
         self.endpoint.close()
         self.endpoint.http_session.close.assert_called_once_with()
 
+    def test_get_pool_stats(self):
+        stats = self.endpoint.get_pool_stats()
+        self.assertIs(stats, self.http_session.get_pool_stats.return_value)
+
+    def test_get_dns_cache_stats(self):
+        stats = self.endpoint.get_dns_cache_stats()
+        self.assertIs(
+            stats, self.http_session.get_dns_cache_stats.return_value
+        )
+
+    def test_warm_up(self):
+        self.http_session.warm_up.return_value = 2
+        connections = self.endpoint.warm_up(
+            'https://example.com', connections=2, parallel=True
+        )
+        self.assertEqual(connections, 2)
+        self.http_session.warm_up.assert_called_once_with(
+            'https://example.com', connections=2, parallel=True
+        )
+
 
 class TestRetryInterface(TestEndpointBase):
     def setUp(self):
@@ -331,6 +386,92 @@ class TestEventStreamBody(TestEndpointBase):
         self.assertTrue(sent_request.stream_output)
 
 
+class TestAsyncEndpoint(TestEndpointBase):
+    def setUp(self):
+        super().setUp()
+        self._operation = mock.Mock(spec=OperationModel)
+        self._operation.name = 'DescribeInstances'
+        self._operation.metadata = {'protocol': 'query'}
+        self._operation.service_model.service_id = ServiceId('EC2')
+        self._operation.has_streaming_output = False
+        self._operation.has_event_stream_output = False
+        self.endpoint = AsyncEndpoint(
+            'https://ec2.us-west-2.amazonaws.com/',
+            endpoint_prefix='ec2',
+            event_emitter=self.event_emitter,
+        )
+        self.http_session = mock.AsyncMock()
+        self.http_session.send.return_value = mock.Mock(
+            status_code=200,
+            headers={},
+            content=b'{"Foo": "bar"}',
+        )
+        self.endpoint.http_session = self.http_session
+
+    def make_request(self, request):
+        return asyncio.run(
+            self.endpoint.make_request(self._operation, request)
+        )
+
+    def test_defaults_to_asyncio_http_session(self):
+        endpoint = AsyncEndpoint(
+            'https://ec2.us-west-2.amazonaws.com/',
+            endpoint_prefix='ec2',
+            event_emitter=self.event_emitter,
+        )
+        self.assertIsInstance(endpoint.http_session, AsyncioHTTPSession)
+
+    def test_make_request_awaits_http_session(self):
+        parser = mock.Mock()
+        parser.parse.return_value = {'Foo': 'bar'}
+        self.factory.return_value.create_parser.return_value = parser
+        http_response, parsed = self.make_request(request_dict())
+        self.http_session.send.assert_awaited_once()
+        self.assertEqual(http_response.status_code, 200)
+        self.assertEqual(parsed, {'Foo': 'bar'})
+
+    def test_retries_sleep_without_blocking(self):
+        self.event_emitter.emit.side_effect = self.get_emitter_responses(
+            num_retries=1, sleep_time=2
+        )
+        parser = mock.Mock()
+        parser.parse.return_value = {'ResponseMetadata': {}}
+        self.factory.return_value.create_parser.return_value = parser
+        r = request_dict()
+        r['context']['client_config'] = Config()
+        with mock.patch('asyncio.sleep') as sleep:
+            with mock.patch('time.sleep') as blocking_sleep:
+                response = self.make_request(r)
+        sleep.assert_awaited_once_with(2)
+        blocking_sleep.assert_not_called()
+        self.assertEqual(self.http_session.send.await_count, 2)
+        self.assertEqual(response[1]['ResponseMetadata']['RetryAttempts'], 1)
+
+    def test_raises_http_client_error_after_retries(self):
+        self.event_emitter.emit.side_effect = self.get_emitter_responses(
+            num_retries=1, num_events=3
+        )
+        self.http_session.send.side_effect = HTTPClientError(error='wrapped')
+        with mock.patch('asyncio.sleep'):
+            with self.assertRaises(HTTPClientError):
+                self.make_request(request_dict())
+        self.assertEqual(self.http_session.send.await_count, 2)
+
+    def test_close(self):
+        asyncio.run(self.endpoint.close())
+        self.http_session.close.assert_awaited_once_with()
+
+    def test_warm_up(self):
+        self.http_session.warm_up.return_value = 2
+        connections = asyncio.run(
+            self.endpoint.warm_up('https://example.com', connections=2)
+        )
+        self.assertEqual(connections, 2)
+        self.http_session.warm_up.assert_awaited_once_with(
+            'https://example.com', connections=2, parallel=False
+        )
+
+
 class TestEndpointCreator(unittest.TestCase):
     def setUp(self):
         self.service_model = mock.Mock(
@@ -496,6 +637,63 @@ class TestEndpointCreator(unittest.TestCase):
                 http_session_cls=self.mock_session,
             )
 
+    def test_emits_pool_events(self):
+        self.service_model.service_id = ServiceId('EC2')
+        self.creator.create_endpoint(
+            self.service_model,
+            region_name='us-west-2',
+            endpoint_url='https://example.com',
+            http_session_cls=self.mock_session,
+        )
+        http_session = self.mock_session.return_value
+        listener = http_session.add_pool_listener.call_args[0][0]
+        listener('connection-created', host='example.com', port=443)
+        self.creator._event_emitter.emit.assert_called_once_with(
+            'connection-created.ec2', host='example.com', port=443
+        )
+
+    def test_session_without_stats(self):
+        class CustomHTTPSession:
+            def __init__(self, **kwargs):
+                pass
+
+            def send(self, request):
+                pass
+
+            def close(self):
+                pass
+
+        endpoint = self.creator.create_endpoint(
+            self.service_model,
+            region_name='us-west-2',
+            endpoint_url='https://example.com',
+            http_session_cls=CustomHTTPSession,
+        )
+        self.assertIsNone(endpoint.get_pool_stats())
+        self.assertIsNone(endpoint.get_dns_cache_stats())
+
+    def test_dns_cache(self):
+        dns_cache = mock.Mock()
+        self.creator.create_endpoint(
+            self.service_model,
+            region_name='us-west-2',
+            endpoint_url='https://example.com',
+            dns_cache=dns_cache,
+            http_session_cls=self.mock_session,
+        )
+        session_args = self.mock_session.call_args[1]
+        self.assertIs(session_args['dns_cache'], dns_cache)
+
+    def test_dns_cache_not_passed_by_default(self):
+        self.creator.create_endpoint(
+            self.service_model,
+            region_name='us-west-2',
+            endpoint_url='https://example.com',
+            http_session_cls=self.mock_session,
+        )
+        session_args = self.mock_session.call_args[1]
+        self.assertNotIn('dns_cache', session_args)
+
     def test_can_specify_max_pool_conns(self):
         self.creator.create_endpoint(
             self.service_model,
@@ -518,3 +716,14 @@ class TestEndpointCreator(unittest.TestCase):
         )
         session_args = self.mock_session.call_args[1]
         self.assertEqual(session_args.get('socket_options'), socket_options)
+
+    def test_can_specify_endpoint_cls(self):
+        endpoint = self.creator.create_endpoint(
+            self.service_model,
+            region_name='us-west-2',
+            endpoint_url='https://example.com',
+            endpoint_cls=AsyncEndpoint,
+            http_session_cls=AsyncioHTTPSession,
+        )
+        self.assertIsInstance(endpoint, AsyncEndpoint)
+        self.assertIsInstance(endpoint.http_session, AsyncioHTTPSession)
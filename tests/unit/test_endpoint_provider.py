@@ -18,10 +18,13 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+import botocore.endpoint_provider
 from botocore.endpoint_provider import (
+    EndpointCacheInfo,
     EndpointProvider,
     EndpointRule,
     ErrorRule,
+    ParameterAnalysis,
     RuleCreator,
     RuleSet,
     RuleSetEndpoint,
@@ -201,27 +204,33 @@ def ruleset_testcases():
 ERROR_TEST_CASES, ENDPOINT_TEST_CASES = ruleset_testcases()
 
 
+@pytest.mark.parametrize("compiled", [False, True])
 @pytest.mark.parametrize(
     "ruleset,input_params,expected_error",
     ERROR_TEST_CASES,
 )
 def test_endpoint_resolution_raises(
-    partitions, ruleset, input_params, expected_error
+    partitions, ruleset, input_params, expected_error, compiled
 ):
-    endpoint_provider = EndpointProvider(ruleset, partitions)
+    endpoint_provider = EndpointProvider(
+        ruleset, partitions, compiled=compiled
+    )
     with pytest.raises(EndpointResolutionError) as exc_info:
         endpoint_provider.resolve_endpoint(**input_params)
     assert str(exc_info.value) == expected_error
 
 
+@pytest.mark.parametrize("compiled", [False, True])
 @pytest.mark.parametrize(
     "ruleset,input_params,expected_endpoint",
     ENDPOINT_TEST_CASES,
 )
 def test_endpoint_resolution(
-    partitions, ruleset, input_params, expected_endpoint
+    partitions, ruleset, input_params, expected_endpoint, compiled
 ):
-    endpoint_provider = EndpointProvider(ruleset, partitions)
+    endpoint_provider = EndpointProvider(
+        ruleset, partitions, compiled=compiled
+    )
     endpoint = endpoint_provider.resolve_endpoint(**input_params)
     assert endpoint.url == expected_endpoint["url"]
     assert endpoint.properties == expected_endpoint.get("properties", {})
@@ -402,6 +411,145 @@ def test_assign_existing_scope_var_raises(rule_lib):
     )
 
 
+def test_compiled_assign_existing_scope_var_raises(rule_lib):
+    rule = EndpointRule(
+        conditions=[
+            {
+                'fn': 'aws.parseArn',
+                'argv': ['{Bucket}'],
+                'assign': 'bucketArn',
+            },
+            {
+                'fn': 'aws.parseArn',
+                'argv': ['{Bucket}'],
+                'assign': 'bucketArn',
+            },
+        ],
+        endpoint={'url': 'foo.bar'},
+    )
+    evaluate = rule.compile(rule_lib)
+    with pytest.raises(EndpointResolutionError) as exc_info:
+        evaluate({'Bucket': 'arn:aws:s3:us-east-1:123456789012:mybucket'})
+    assert str(exc_info.value) == (
+        "Assignment bucketArn already exists in "
+        "scoped variables and cannot be overwritten"
+    )
+
+
+def test_compiled_rules_do_not_share_assignments(rule_lib):
+    # The first rule assigns a variable before failing, which must not be
+    # visible to the second rule.
+    tree = TreeRule(
+        conditions=[],
+        rules=[
+            {
+                'type': 'endpoint',
+                'conditions': [
+                    {
+                        'fn': 'aws.parseArn',
+                        'argv': [{'ref': 'Bucket'}],
+                        'assign': 'bucketArn',
+                    },
+                    {'fn': 'isSet', 'argv': [{'ref': 'Missing'}]},
+                ],
+                'endpoint': {'url': 'https://first'},
+            },
+            {
+                'type': 'endpoint',
+                'conditions': [
+                    {'fn': 'not', 'argv': [{'ref': 'bucketArn'}]},
+                ],
+                'endpoint': {'url': 'https://second'},
+            },
+        ],
+    )
+    evaluate = tree.compile(rule_lib)
+    scope_vars = {'Bucket': 'arn:aws:s3:us-east-1:123456789012:mybucket'}
+    assert evaluate(scope_vars).url == 'https://second'
+    assert scope_vars == {
+        'Bucket': 'arn:aws:s3:us-east-1:123456789012:mybucket'
+    }
+
+
+def test_compiled_tree_rule_compiles_sub_rules_when_reached(rule_lib):
+    tree = TreeRule(
+        conditions=[{'fn': 'isSet', 'argv': [{'ref': 'Region'}]}],
+        rules=[
+            {
+                'type': 'endpoint',
+                'conditions': [],
+                'endpoint': {'url': 'https://{Region}.amazonaws.com'},
+            }
+        ],
+    )
+    with patch.object(
+        EndpointRule,
+        'compile',
+        autospec=True,
+        side_effect=EndpointRule.compile,
+    ) as compile_rule:
+        evaluate = tree.compile(rule_lib)
+        assert evaluate({}) is None
+        assert compile_rule.call_count == 0
+        for _ in range(2):
+            endpoint = evaluate({'Region': 'us-west-2'})
+            assert endpoint.url == 'https://us-west-2.amazonaws.com'
+        assert compile_rule.call_count == 1
+
+
+@pytest.mark.parametrize(
+    "condition, scope_vars",
+    [
+        ({'fn': 'booleanEquals', 'argv': [{'ref': 'A'}, True]}, {'A': 'x'}),
+        ({'fn': 'stringEquals', 'argv': [{'ref': 'A'}, 'x']}, {'A': True}),
+        ({'fn': 'stringEquals', 'argv': [{'ref': 'A'}, 'x']}, {}),
+    ],
+)
+def test_compiled_equals_wrong_type_raises(rule_lib, condition, scope_vars):
+    rule = EndpointRule(conditions=[condition], endpoint={'url': 'foo.bar'})
+    with pytest.raises(EndpointResolutionError) as expected:
+        rule.evaluate(dict(scope_vars), rule_lib)
+    with pytest.raises(EndpointResolutionError) as actual:
+        rule.compile(rule_lib)(dict(scope_vars))
+    assert str(actual.value) == str(expected.value)
+
+
+def test_compiled_unknown_function_raises_when_called(rule_lib):
+    rule = EndpointRule(
+        conditions=[{'fn': 'unknownFunction', 'argv': []}],
+        endpoint={'url': 'foo.bar'},
+    )
+    evaluate = rule.compile(rule_lib)
+    with pytest.raises(AttributeError):
+        evaluate({})
+
+
+def test_compiled_uses_overridden_library_functions(partitions):
+    class CustomLibrary(RuleSetStandardLibrary):
+        def is_set(self, value):
+            return value == 'set'
+
+    rule = EndpointRule(
+        conditions=[{'fn': 'isSet', 'argv': [{'ref': 'A'}]}],
+        endpoint={'url': 'foo.bar'},
+    )
+    evaluate = rule.compile(CustomLibrary(partitions))
+    assert evaluate({'A': 'not-set'}) is None
+    assert evaluate({'A': 'set'}).url == 'foo.bar'
+
+
+def test_compiled_ruleset_compiles_rules_once(ruleset_dict, partitions):
+    ruleset = RuleSet(**ruleset_dict, partitions=partitions, compiled=True)
+    with patch(
+        'botocore.endpoint_provider._compile_rules',
+        wraps=botocore.endpoint_provider._compile_rules,
+    ) as compile_rules:
+        for region in ('us-east-1', 'us-west-2'):
+            ruleset.evaluate({'Region': region})
+    # The top level rules are compiled once.
+    assert compile_rules.call_count == 1
+
+
 def test_ruleset_unknown_parameter_type_raises(partitions):
     with pytest.raises(EndpointResolutionError) as exc_info:
         RuleSet(
@@ -515,6 +663,260 @@ def test_endpoint_reevaluates_result(endpoint_provider, monkeypatch):
     assert mock_evaluate.call_count == 2
 
 
+def _group_by_ruleset(test_cases):
+    grouped = {}
+    for ruleset, input_params, expected in test_cases:
+        key = json.dumps(ruleset, sort_keys=True)
+        grouped.setdefault(key, (ruleset, []))[1].append(
+            (input_params, expected)
+        )
+    return list(grouped.values())
+
+
+@pytest.mark.parametrize(
+    "ruleset,test_cases", _group_by_ruleset(ENDPOINT_TEST_CASES)
+)
+def test_endpoint_resolution_with_cache(partitions, ruleset, test_cases):
+    # All test cases of a rule set share a provider so that they are
+    # resolved from each other's cached rules.
+    endpoint_provider = EndpointProvider(ruleset, partitions, cache_size=100)
+    for _ in range(2):
+        for input_params, expected_endpoint in test_cases:
+            endpoint = endpoint_provider.resolve_endpoint(**input_params)
+            assert endpoint.url == expected_endpoint["url"]
+            assert endpoint.properties == expected_endpoint.get(
+                "properties", {}
+            )
+            assert endpoint.headers == expected_endpoint.get("headers", {})
+
+
+@pytest.mark.parametrize(
+    "ruleset,test_cases", _group_by_ruleset(ERROR_TEST_CASES)
+)
+def test_endpoint_resolution_with_cache_raises(
+    partitions, ruleset, test_cases
+):
+    endpoint_provider = EndpointProvider(ruleset, partitions, cache_size=100)
+    for _ in range(2):
+        for input_params, expected_error in test_cases:
+            with pytest.raises(EndpointResolutionError) as exc_info:
+                endpoint_provider.resolve_endpoint(**input_params)
+            assert str(exc_info.value) == expected_error
+
+
+BUCKET_RULESET = {
+    "version": "1.0",
+    "parameters": {
+        "Bucket": {"type": "String"},
+        "Key": {"type": "String"},
+        "UseFIPS": {"type": "Boolean", "default": False, "required": True},
+    },
+    "rules": [
+        {
+            "conditions": [
+                {"fn": "isSet", "argv": [{"ref": "Bucket"}]},
+                {
+                    "fn": "aws.parseArn",
+                    "argv": [{"ref": "Bucket"}],
+                    "assign": "bucketArn",
+                },
+            ],
+            "endpoint": {
+                "url": "https://{bucketArn#accountId}.example.com",
+            },
+            "type": "endpoint",
+        },
+        {
+            "conditions": [
+                {"fn": "isSet", "argv": [{"ref": "Bucket"}]},
+                {"fn": "booleanEquals", "argv": [{"ref": "UseFIPS"}, True]},
+                {
+                    "fn": "aws.isVirtualHostableS3Bucket",
+                    "argv": [{"ref": "Bucket"}, False],
+                },
+            ],
+            "endpoint": {"url": "https://{Bucket}.fips.example.com"},
+            "type": "endpoint",
+        },
+        {
+            "conditions": [
+                {"fn": "isSet", "argv": [{"ref": "Bucket"}]},
+                {
+                    "fn": "aws.isVirtualHostableS3Bucket",
+                    "argv": [{"ref": "Bucket"}, False],
+                },
+            ],
+            "endpoint": {
+                "url": "https://{Bucket}.example.com",
+                "properties": {"bucket": "{Bucket}"},
+            },
+            "type": "endpoint",
+        },
+        {
+            "conditions": [{"fn": "isSet", "argv": [{"ref": "Bucket"}]}],
+            "endpoint": {"url": "https://example.com/{Bucket}"},
+            "type": "endpoint",
+        },
+        {
+            "conditions": [],
+            "error": "A bucket is required",
+            "type": "error",
+        },
+    ],
+}
+
+
+@pytest.fixture
+def bucket_ruleset(partitions):
+    return RuleSet(**BUCKET_RULESET, partitions=partitions)
+
+
+def test_parameter_analysis_keys_on_matched_properties(bucket_ruleset):
+    analysis = ParameterAnalysis(bucket_ruleset)
+
+    def cache_key(**input_params):
+        bucket_ruleset.process_input_parameters(input_params)
+        return analysis.cache_key(input_params)
+
+    assert cache_key(Bucket='bucket-1') == cache_key(Bucket='bucket-2')
+    assert cache_key(Bucket='bucket-1') != cache_key(Bucket='bucket.1')
+    assert cache_key(Bucket='bucket-1') != cache_key(
+        Bucket='bucket-1', UseFIPS=True
+    )
+    assert cache_key(Bucket='bucket-1') != cache_key()
+    # Parameters that aren't referenced are not part of the key.
+    assert cache_key(Bucket='bucket-1', Key='a') == cache_key(
+        Bucket='bucket-2', Key='b'
+    )
+    assert analysis.referenced_parameters == ('Bucket', 'UseFIPS')
+
+
+def test_parameter_analysis_keys_on_assigned_values(bucket_ruleset):
+    analysis = ParameterAnalysis(bucket_ruleset)
+    # The parsed ARN is used in a template, so only whether the bucket
+    # is an ARN is part of the key.
+    first_key = analysis.cache_key(
+        {'Bucket': 'arn:aws:s3:us-west-2:123456789012:accesspoint:a'}
+    )
+    second_key = analysis.cache_key(
+        {'Bucket': 'arn:aws:s3:us-east-1:210987654321:accesspoint:b'}
+    )
+    assert first_key == second_key
+    assert first_key != analysis.cache_key({'Bucket': 'bucket'})
+
+
+def test_parameter_analysis_keys_on_values_used_within_rules(partitions):
+    ruleset = RuleSet(
+        version="1.0",
+        parameters={"Bucket": {"type": "String"}},
+        rules=[
+            {
+                "conditions": [
+                    {
+                        "fn": "aws.partition",
+                        "argv": ["us-east-1"],
+                        "assign": "partitionResult",
+                    },
+                    {
+                        "fn": "stringEquals",
+                        "argv": [
+                            {"ref": "Bucket"},
+                            "{partitionResult#name}",
+                        ],
+                    },
+                ],
+                "endpoint": {"url": "https://partition-bucket.example.com"},
+                "type": "endpoint",
+            },
+            {
+                "conditions": [],
+                "endpoint": {"url": "https://example.com"},
+                "type": "endpoint",
+            },
+        ],
+        partitions=partitions,
+    )
+    analysis = ParameterAnalysis(ruleset)
+    # The bucket is compared to a value that is only assigned within its
+    # rule, so the bucket itself is part of the key.
+    assert analysis.cache_key({'Bucket': 'a'}) != analysis.cache_key(
+        {'Bucket': 'b'}
+    )
+
+
+def test_endpoint_cache_reuses_matched_rules(partitions):
+    endpoint_provider = EndpointProvider(
+        BUCKET_RULESET, partitions, cache_size=100
+    )
+    endpoint = endpoint_provider.resolve_endpoint(Bucket='bucket-1')
+    assert endpoint.url == 'https://bucket-1.example.com'
+    with patch.object(
+        RuleSet, 'match', autospec=True, side_effect=RuleSet.match
+    ) as match:
+        endpoint = endpoint_provider.resolve_endpoint(Bucket='bucket-2')
+        assert endpoint.url == 'https://bucket-2.example.com'
+        assert endpoint.properties == {'bucket': 'bucket-2'}
+        match.assert_not_called()
+        endpoint = endpoint_provider.resolve_endpoint(Bucket='bucket.3')
+        assert endpoint.url == 'https://example.com/bucket.3'
+        assert match.call_count == 1
+    endpoint_provider.resolve_endpoint(Bucket='bucket-1', Key='key')
+    assert endpoint_provider.cache_info() == EndpointCacheInfo(
+        hits=1,
+        derived_hits=1,
+        misses=2,
+        evictions=0,
+        maxsize=100,
+        currsize=3,
+    )
+
+
+def test_endpoint_cache_evicts_least_recently_used(partitions):
+    endpoint_provider = EndpointProvider(
+        BUCKET_RULESET, partitions, cache_size=2
+    )
+    for bucket in ('a-bucket', 'b.bucket', 'a-bucket', 'c-bucket'):
+        endpoint_provider.resolve_endpoint(Bucket=bucket)
+    cache_info = endpoint_provider.cache_info()
+    assert cache_info.currsize == 2
+    assert cache_info.evictions == 1
+    assert cache_info.hits == 1
+    # The rules matched for a-bucket were kept.
+    assert cache_info.derived_hits == 1
+
+
+def test_endpoint_cache_does_not_cache_errors(partitions):
+    endpoint_provider = EndpointProvider(
+        BUCKET_RULESET, partitions, cache_size=100
+    )
+    for _ in range(2):
+        with pytest.raises(EndpointResolutionError) as exc_info:
+            endpoint_provider.resolve_endpoint(UseFIPS=True)
+        assert str(exc_info.value) == 'A bucket is required'
+    assert endpoint_provider.cache_info().currsize == 0
+
+
+def test_endpoint_cache_reevaluates_when_rules_no_longer_match(partitions):
+    endpoint_provider = EndpointProvider(
+        BUCKET_RULESET, partitions, cache_size=100
+    )
+    endpoint_provider.resolve_endpoint(
+        Bucket='arn:aws:s3:us-west-2:123456789012:accesspoint:a'
+    )
+    # Simulate parameters with the same key for which the variables of the
+    # matched rules can't be assigned.
+    with patch.object(ParameterAnalysis, 'cache_key', return_value=None):
+        endpoint = endpoint_provider.resolve_endpoint(Bucket='bucket')
+    assert endpoint.url == 'https://bucket.example.com'
+    assert endpoint_provider.cache_info().derived_hits == 0
+
+
+def test_endpoint_provider_without_cache_size_has_no_cache_info(
+    endpoint_provider,
+):
+    assert endpoint_provider.cache_info() is None
+
+
 @pytest.mark.parametrize(
     "bucket, expected_value",
     [
@@ -641,6 +1043,36 @@ def test_construct_endpoint_parametrized(
             assert result.url == expected_url
 
 
+def test_provider_params_without_operation_model(partitions):
+    event_emitter = Mock()
+    accelerate = Mock()
+    accelerate.name = 'Accelerate'
+    resolver = EndpointRulesetResolver(
+        endpoint_ruleset_data={
+            'version': '1.0',
+            'parameters': {
+                'Region': {'type': 'String', 'builtIn': 'AWS::Region'},
+                'Bucket': {'type': 'String'},
+                'Accelerate': {'type': 'Boolean'},
+            },
+            'rules': [],
+        },
+        partition_data=partitions,
+        service_model=Mock(
+            service_name='test',
+            client_context_parameters=[accelerate],
+        ),
+        builtins={'AWS::Region': 'us-west-2'},
+        client_context={'accelerate': True},
+        event_emitter=event_emitter,
+        use_ssl=True,
+        requested_auth_scheme=None,
+    )
+    params = resolver._get_provider_params(None, None, None)
+    assert params == {'Region': 'us-west-2', 'Accelerate': True}
+    event_emitter.emit.assert_not_called()
+
+
 @pytest.mark.parametrize(
     "auth_scheme_preference,expected_auth_scheme_name",
     [
@@ -12,9 +12,13 @@
 # language governing permissions and limitations under the License.
 """Unit tests for the binary event stream decoder."""
 
+import asyncio
+
 import pytest
 
+from botocore.asynchttpsession import _StreamingRawResponse
 from botocore.eventstream import (
+    AsyncEventStream,
     ChecksumMismatch,
     DecodeUtils,
     DuplicateHeader,
@@ -26,6 +30,7 @@ from botocore.eventstream import (
     InvalidPayloadLength,
     MessagePrelude,
     NoInitialResponseError,
+    buffer_initial_event,
 )
 from botocore.exceptions import EventStreamError
 from botocore.parsers import EventStreamXMLParser
@@ -339,6 +344,33 @@ def test_all_positive_cases():
         assert_message_equal(expected, decoded)
 
 
+def test_many_messages_in_one_chunk():
+    """Test many messages added at once all decode."""
+    encoded, decoded = PAYLOAD_ONE_STR_HEADER
+    event_buffer = EventStreamBuffer()
+    event_buffer.add_data(encoded * 1000)
+    messages = list(event_buffer)
+    assert len(messages) == 1000
+    for message in messages:
+        assert_message_equal(message, decoded)
+
+
+def test_messages_split_across_chunks():
+    """Test messages split at every offset across calls to add_data."""
+    data = b''.join(encoded for encoded, _ in POSITIVE_CASES)
+    expected_messages = [decoded for _, decoded in POSITIVE_CASES]
+    for chunk_size in range(1, 40):
+        event_buffer = EventStreamBuffer()
+        messages = []
+        for offset in range(0, len(data), chunk_size):
+            event_buffer.add_data(data[offset : offset + chunk_size])
+            messages.extend(event_buffer)
+        assert len(messages) == len(expected_messages)
+        for expected, message in zip(expected_messages, messages):
+            assert_message_equal(expected, message)
+            assert type(message.payload) is bytes
+
+
 @pytest.mark.parametrize(
     "encoded, exception",
     NEGATIVE_CASES,
@@ -383,6 +415,10 @@ def test_header_parser():
     parser = EventStreamHeaderParser()
     headers = parser.parse(headers_data)
     assert headers == expected_headers
+    headers = parser.parse(memoryview(bytearray(headers_data)))
+    assert headers == expected_headers
+    assert type(headers['6']) is bytes
+    assert type(headers['9']) is bytes
 
 
 def test_message_prelude_properties():
@@ -567,3 +603,94 @@ def test_event_stream_initial_response_no_event():
     event_stream = EventStream(raw_stream, output_shape, parser, '')
     with pytest.raises(NoInitialResponseError):
         event_stream.get_initial_response()
+
+
+INITIAL_RESPONSE_MESSAGE = (
+    b'\x00\x00\x00~\x00\x00\x00O\xc5\xa3\xdd\xc6\r:message-type\x07\x00'
+    b'\x05event\x0b:event-type\x07\x00\x10initial-response\r:content-type'
+    b'\x07\x00\ttext/json{"InitialResponse": "sometext"}\xf6\x98$\x83'
+)
+EVENT_MESSAGE = (
+    b"\x00\x00\x00+\x00\x00\x00\x0e4\x8b\xec{\x08event-id\x04\x00"
+    b"\x00\xa0\x0c{'foo':'bar'}\xd3\x89\x02\x85"
+)
+
+
+def create_async_raw_stream(*data):
+    # Must be called with an event loop running.
+    reader = asyncio.StreamReader()
+    for chunk in data:
+        reader.feed_data(chunk)
+    reader.feed_eof()
+    length = sum(len(chunk) for chunk in data)
+    request = mock.Mock(url='https://example.com')
+    return _StreamingRawResponse(
+        reader, request, 1, length, False, mock.Mock()
+    )
+
+
+def test_async_event_stream_iteration():
+    parser = mock.Mock(spec=EventStreamXMLParser)
+    output_shape = mock.Mock()
+
+    async def collect():
+        raw_stream = create_async_raw_stream(
+            EVENT_MESSAGE[:20], EVENT_MESSAGE[20:]
+        )
+        event_stream = AsyncEventStream(raw_stream, output_shape, parser, '')
+        return [event async for event in event_stream]
+
+    events = asyncio.run(collect())
+    assert len(events) == 1
+    response_dict = {
+        'headers': {'event-id': 0x0000A00C},
+        'body': b"{'foo':'bar'}",
+        'status_code': 200,
+    }
+    parser.parse.assert_called_with(response_dict, output_shape)
+
+
+def test_async_event_stream_cannot_be_iterated_synchronously():
+    event_stream = AsyncEventStream(mock.Mock(), None, None, '')
+    with pytest.raises(TypeError):
+        list(event_stream)
+
+
+def test_async_event_stream_initial_response():
+    parser = mock.Mock(spec=EventStreamXMLParser)
+
+    async def read_events():
+        raw_stream = create_async_raw_stream(
+            INITIAL_RESPONSE_MESSAGE, EVENT_MESSAGE
+        )
+        await buffer_initial_event(raw_stream)
+        event_stream = AsyncEventStream(raw_stream, mock.Mock(), parser, '')
+        initial_event = event_stream.get_initial_response()
+        return initial_event, [event async for event in event_stream]
+
+    initial_event, events = asyncio.run(read_events())
+    assert initial_event.headers[':event-type'] == 'initial-response'
+    assert initial_event.payload == b'{"InitialResponse": "sometext"}'
+    assert len(events) == 1
+
+
+def test_async_event_stream_initial_response_wrong_type():
+    async def get_initial_response():
+        raw_stream = create_async_raw_stream(EVENT_MESSAGE)
+        await buffer_initial_event(raw_stream)
+        event_stream = AsyncEventStream(raw_stream, None, None, '')
+        return event_stream.get_initial_response()
+
+    with pytest.raises(NoInitialResponseError):
+        asyncio.run(get_initial_response())
+
+
+def test_async_event_stream_initial_response_no_event():
+    async def get_initial_response():
+        raw_stream = create_async_raw_stream()
+        await buffer_initial_event(raw_stream)
+        event_stream = AsyncEventStream(raw_stream, None, None, '')
+        return event_stream.get_initial_response()
+
+    with pytest.raises(NoInitialResponseError):
+        asyncio.run(get_initial_response())
@@ -16,10 +16,13 @@ from functools import partial
 
 from botocore.hooks import (
     EventAliaser,
+    HandlerChain,
+    HandlerChainCache,
     HierarchicalEmitter,
     first_non_none_response,
 )
-from tests import unittest
+from botocore.model import ServiceId
+from tests import mock, unittest
 
 
 class TestHierarchicalEventEmitter(unittest.TestCase):
@@ -52,6 +55,17 @@ class TestHierarchicalEventEmitter(unittest.TestCase):
             ['foo.bar.baz', 'foo.bar.baz', 'foo.bar.baz'],
         )
 
+    def test_get_handlers(self):
+        def other_hook(**kwargs):
+            pass
+
+        self.emitter.register('foo', self.hook)
+        self.emitter.register('foo.bar', other_hook)
+        self.assertEqual(
+            self.emitter.get_handlers('foo.bar'), (other_hook, self.hook)
+        )
+        self.assertEqual(self.emitter.get_handlers('baz'), ())
+
     def test_hook_called_in_proper_order(self):
         # We should call the hooks from most specific to least
         # specific.
@@ -87,6 +101,12 @@ class TestAliasedEmitter(unittest.TestCase):
         calls = [e['event_name'] for e in self.hook_calls]
         self.assertEqual(calls, ['foo.bear.baz'])
 
+    def test_get_handlers_uses_alias(self):
+        aliases = {'bar': 'bear'}
+        emitter = self.get_emitter(event_aliases=aliases)
+        emitter.register('foo.bear.baz', self.hook)
+        self.assertEqual(emitter.get_handlers('foo.bar.baz'), (self.hook,))
+
     def test_aliased_event_emitted(self):
         aliases = {'bar': 'bear'}
         emitter = self.get_emitter(event_aliases=aliases)
@@ -222,6 +242,134 @@ class TestStopProcessing(unittest.TestCase):
         self.assertIsNone(response)
 
 
+class TestHandlerChains(unittest.TestCase):
+    def setUp(self):
+        self.emitter = HierarchicalEmitter()
+        self.hook_calls = []
+
+    def hook(self, **kwargs):
+        self.hook_calls.append(kwargs)
+
+    def other_hook(self, **kwargs):
+        self.hook_calls.append(kwargs)
+        return 'other-response'
+
+    def test_chain_emits_event(self):
+        self.emitter.register('foo.bar', self.hook)
+        chain = self.emitter.get_handler_chain('foo.bar.baz')
+        self.assertTrue(chain)
+        responses = chain.emit(arg='value')
+        self.assertEqual(responses, [(self.hook, None)])
+        self.assertEqual(
+            self.hook_calls, [{'arg': 'value', 'event_name': 'foo.bar.baz'}]
+        )
+
+    def test_empty_chain(self):
+        chain = self.emitter.get_handler_chain('foo')
+        self.assertFalse(chain)
+        self.assertEqual(chain.emit(), [])
+        self.assertEqual(chain.emit_until_response(), (None, None))
+
+    def test_chain_emit_until_response(self):
+        self.emitter.register('foo', self.hook)
+        self.emitter.register('foo', self.other_hook)
+        self.emitter.register('foo', self.hook)
+        chain = self.emitter.get_handler_chain('foo')
+        self.assertEqual(
+            chain.emit_until_response(), (self.other_hook, 'other-response')
+        )
+        self.assertEqual(len(self.hook_calls), 2)
+
+    def test_chain_resolves_handlers_once(self):
+        self.emitter.register('foo', self.hook)
+        chain = self.emitter.get_handler_chain('foo.bar')
+        with mock.patch.object(
+            self.emitter._handlers,
+            'prefix_search',
+            wraps=self.emitter._handlers.prefix_search,
+        ) as prefix_search:
+            for _ in range(3):
+                chain.emit()
+        self.assertEqual(prefix_search.call_count, 1)
+        self.assertEqual(len(self.hook_calls), 3)
+
+    def test_register_invalidates_chain(self):
+        chain = self.emitter.get_handler_chain('foo.bar')
+        self.assertEqual(chain.emit(), [])
+        self.emitter.register('foo', self.hook)
+        self.assertEqual(chain.emit(), [(self.hook, None)])
+
+    def test_unregister_invalidates_chain(self):
+        self.emitter.register('foo', self.hook)
+        chain = self.emitter.get_handler_chain('foo.bar')
+        self.assertTrue(chain)
+        self.emitter.unregister('foo', self.hook)
+        self.assertFalse(chain)
+        self.assertEqual(chain.emit(), [])
+
+    def test_chain_not_affected_by_copied_emitter(self):
+        chain = self.emitter.get_handler_chain('foo')
+        self.assertFalse(chain)
+        copied = copy.copy(self.emitter)
+        copied.register('foo', self.hook)
+        self.assertFalse(chain)
+        self.assertTrue(copied.get_handler_chain('foo'))
+
+    def test_aliased_chain(self):
+        emitter = EventAliaser(self.emitter, {'bar': 'bear'})
+        emitter.register('foo.bear', self.hook)
+        chain = emitter.get_handler_chain('foo.bar')
+        self.assertEqual(chain.event_name, 'foo.bear')
+        self.assertEqual(chain.emit(), [(self.hook, None)])
+
+
+class TestHandlerChainCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = HandlerChainCache()
+        self.emitter = HierarchicalEmitter()
+        self.service_id = ServiceId('My Service')
+
+    def test_chain_event_name(self):
+        chain = self.cache.get_handler_chain(
+            self.emitter, 'before-call', self.service_id, 'MyOperation'
+        )
+        self.assertEqual(
+            chain.event_name, 'before-call.my-service.MyOperation'
+        )
+
+    def test_chains_are_cached(self):
+        args = ('before-call', self.service_id, 'MyOperation')
+        chain = self.cache.get_handler_chain(self.emitter, *args)
+        self.assertIs(self.cache.get_handler_chain(self.emitter, *args), chain)
+        other_chain = self.cache.get_handler_chain(
+            self.emitter, 'after-call', self.service_id, 'MyOperation'
+        )
+        self.assertIsNot(other_chain, chain)
+
+    def test_new_emitter_drops_chains(self):
+        args = ('before-call', self.service_id, 'MyOperation')
+        chain = self.cache.get_handler_chain(self.emitter, *args)
+        new_emitter = HierarchicalEmitter()
+        new_chain = self.cache.get_handler_chain(new_emitter, *args)
+        self.assertIsNot(new_chain, chain)
+        new_emitter.register('before-call', lambda **kwargs: 'response')
+        self.assertTrue(new_chain)
+        self.assertFalse(chain)
+
+    def test_mock_emitter_is_emitted_to(self):
+        emitter = mock.Mock(HierarchicalEmitter)
+        emitter.emit.return_value = []
+        chain = self.cache.get_handler_chain(
+            emitter, 'before-call', self.service_id, 'MyOperation'
+        )
+        self.assertIsInstance(chain, HandlerChain)
+        self.assertTrue(chain)
+        chain.emit(arg='value')
+        emitter.emit.assert_called_with(
+            'before-call.my-service.MyOperation', arg='value'
+        )
+
+
 class TestFirstNonNoneResponse(unittest.TestCase):
     def test_all_none(self):
         self.assertIsNone(first_non_none_response([]))
@@ -0,0 +1,500 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import asyncio
+import io
+import os
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from botocore import http2session
+from botocore.awsrequest import AWSRequest
+from botocore.exceptions import (
+    ConnectionClosedError,
+    EndpointConnectionError,
+    MissingDependencyException,
+    ReadTimeoutError,
+)
+from botocore.http2session import HAS_H2, HTTP2Session, _HTTP1Only
+from botocore.httpsession import DNSCache, URLLib3Session
+from tests import mock, unittest
+
+if os.name == 'posix':
+    import fcntl
+    import resource
+
+if HAS_H2:
+    import h2.config
+    import h2.connection
+    import h2.events
+
+
+class H2Server:
+    """A local cleartext HTTP/2 server running in a background thread.
+
+    Each request is recorded as a tuple of ``(headers, body)`` and passed
+    to ``handler``, which returns ``(status, headers, body)`` or ``None`` to
+    reset the stream.  ``handler`` may be a coroutine function.
+    """
+
+    def __init__(self, handler, max_concurrent_streams=None):
+        self.handler = handler
+        self.max_concurrent_streams = max_concurrent_streams
+        self.requests = []
+        self.connections = 0
+        self._started = threading.Event()
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=asyncio.run, args=(self._run(),)
+        )
+        self._thread.daemon = True
+        self._thread.start()
+        self._started.wait()
+
+    def stop(self):
+        self._loop.call_soon_threadsafe(self._stopped.set)
+        self._thread.join()
+
+    async def _run(self):
+        self._loop = asyncio.get_running_loop()
+        self._stopped = asyncio.Event()
+        server = await asyncio.start_server(self._handle, '127.0.0.1', 0)
+        self.port = server.sockets[0].getsockname()[1]
+        self.url = f'https://127.0.0.1:{self.port}'
+        self._started.set()
+        async with server:
+            await self._stopped.wait()
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        conn = h2.connection.H2Connection(
+            config=h2.config.H2Configuration(
+                client_side=False, header_encoding=None
+            )
+        )
+        conn.initiate_connection()
+        if self.max_concurrent_streams is not None:
+            conn.update_settings(
+                {
+                    h2.settings.SettingCodes.MAX_CONCURRENT_STREAMS: (
+                        self.max_concurrent_streams
+                    )
+                }
+            )
+        writer.write(conn.data_to_send())
+        bodies = {}
+        headers = {}
+        window_open = asyncio.Event()
+        try:
+            while data := await reader.read(65536):
+                for event in conn.receive_data(data):
+                    if isinstance(event, h2.events.RequestReceived):
+                        headers[event.stream_id] = event.headers
+                        bodies[event.stream_id] = b''
+                    elif isinstance(event, h2.events.DataReceived):
+                        bodies[event.stream_id] += event.data
+                        conn.acknowledge_received_data(
+                            event.flow_controlled_length, event.stream_id
+                        )
+                    elif isinstance(event, h2.events.StreamEnded):
+                        request = (
+                            headers.pop(event.stream_id),
+                            bodies.pop(event.stream_id),
+                        )
+                        self.requests.append(request)
+                        asyncio.create_task(
+                            self._respond(
+                                conn,
+                                writer,
+                                event.stream_id,
+                                request,
+                                window_open,
+                            )
+                        )
+                    elif isinstance(event, h2.events.WindowUpdated):
+                        window_open.set()
+                writer.write(conn.data_to_send())
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, conn, writer, stream_id, request, window_open):
+        response = self.handler(*request)
+        if asyncio.iscoroutine(response):
+            response = await response
+        if response is None:
+            conn.reset_stream(stream_id)
+            writer.write(conn.data_to_send())
+            return
+        status, headers, body = response
+        conn.send_headers(
+            stream_id,
+            [(b':status', str(status).encode())] + headers,
+            end_stream=not body,
+        )
+        while body:
+            size = min(
+                len(body),
+                conn.local_flow_control_window(stream_id),
+                conn.max_outbound_frame_size,
+            )
+            if not size:
+                window_open.clear()
+                writer.write(conn.data_to_send())
+                await window_open.wait()
+                continue
+            conn.send_data(
+                stream_id, body[:size], end_stream=size == len(body)
+            )
+            body = body[size:]
+        writer.write(conn.data_to_send())
+
+
+# A file descriptor above the limit of select().
+HIGH_FD = 1100
+
+
+class CleartextHTTP2Session(HTTP2Session):
+    # The test server doesn't use TLS, so HTTP/2 is used without
+    # negotiating it.
+    def _create_socket(self, key, url):
+        host, port, _ = key
+        try:
+            sock = self._open_socket(host, port)
+        except OSError as e:
+            raise EndpointConnectionError(endpoint_url=url, error=e)
+        sock.settimeout(self._read_timeout)
+        return sock
+
+
+def ok(body=b'', headers=None):
+    return 200, headers or [], body
+
+
+def echo_path(headers, body):
+    return ok(dict(headers)[b':path'])
+
+
+@unittest.skipIf(not HAS_H2, 'Test requires h2 to be installed')
+class TestHTTP2Session(unittest.TestCase):
+    def start_server(self, handler, **kwargs):
+        server = H2Server(handler, **kwargs)
+        server.start()
+        self.addCleanup(server.stop)
+        return server
+
+    def create_session(self, **kwargs):
+        session = CleartextHTTP2Session(**kwargs)
+        self.addCleanup(session.close)
+        return session
+
+    def send(self, session, url, method='GET', **kwargs):
+        request = AWSRequest(method=method, url=url, **kwargs).prepare()
+        return session.send(request)
+
+    def test_send_returns_response(self):
+        server = self.start_server(
+            lambda headers, body: ok(b'hello', [(b'x-foo', b'bar')])
+        )
+        response = self.send(
+            self.create_session(),
+            server.url + '/path?a=b',
+            headers={
+                'X-Test': 'value',
+                'Expect': '100-continue',
+                'Host': 'example.com',
+            },
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers['X-Foo'], 'bar')
+        self.assertEqual(response.content, b'hello')
+        headers = dict(server.requests[0][0])
+        self.assertEqual(headers[b':method'], b'GET')
+        self.assertEqual(headers[b':scheme'], b'https')
+        self.assertEqual(headers[b':path'], b'/path?a=b')
+        self.assertEqual(headers[b':authority'], b'example.com')
+        self.assertEqual(headers[b'x-test'], b'value')
+        self.assertNotIn(b'expect', headers)
+        self.assertNotIn(b'host', headers)
+
+    def test_sends_request_body(self):
+        server = self.start_server(lambda headers, body: ok(body))
+        session = self.create_session()
+        # Larger than the server's flow control window.
+        large_body = b'a' * 300000
+        for body in (b'bytes body', io.BytesIO(large_body)):
+            response = self.send(session, server.url, 'PUT', data=body)
+            self.assertEqual(response.status_code, 200)
+        self.assertEqual(server.requests[0][1], b'bytes body')
+        self.assertEqual(server.requests[1][1], large_body)
+        self.assertEqual(response.content, large_body)
+
+    def test_drops_transfer_encoding(self):
+        server = self.start_server(lambda headers, body: ok())
+        self.send(
+            self.create_session(),
+            server.url,
+            'PUT',
+            data=io.BytesIO(b'chunked'),
+            headers={'Transfer-Encoding': 'chunked'},
+        )
+        headers, body = server.requests[0]
+        self.assertNotIn(b'transfer-encoding', dict(headers))
+        self.assertEqual(body, b'chunked')
+
+    def test_multiplexes_concurrent_requests(self):
+        async def handler(headers, body):
+            await asyncio.sleep(0.05)
+            return echo_path(headers, body)
+
+        server = self.start_server(handler)
+        session = self.create_session()
+        paths = [f'/{i}' for i in range(50)]
+        with ThreadPoolExecutor(len(paths)) as executor:
+            responses = list(
+                executor.map(
+                    lambda p: self.send(session, server.url + p), paths
+                )
+            )
+        self.assertEqual(
+            [response.content for response in responses],
+            [path.encode() for path in paths],
+        )
+        self.assertEqual(server.connections, 1)
+
+    def test_opens_connections_when_streams_are_exhausted(self):
+        release = asyncio.Event()
+
+        async def handler(headers, body):
+            if dict(headers)[b':path'] != b'/':
+                # Hold the responses until all six requests were received,
+                # which needs three connections of two streams each.
+                if len(server.requests) == 7:
+                    release.set()
+                await release.wait()
+            return echo_path(headers, body)
+
+        server = self.start_server(handler, max_concurrent_streams=2)
+        session = self.create_session(max_pool_connections=3)
+        # The server's settings are only known once a connection is open.
+        self.send(session, server.url)
+        with ThreadPoolExecutor(6) as executor:
+            responses = list(
+                executor.map(
+                    lambda i: self.send(session, f'{server.url}/{i}'), range(6)
+                )
+            )
+        self.assertEqual(
+            sorted(response.content for response in responses),
+            [f'/{i}'.encode() for i in range(6)],
+        )
+        self.assertEqual(server.connections, 3)
+
+    def test_streams_response_body(self):
+        body = bytes(range(256)) * 1000
+        server = self.start_server(lambda headers, _: ok(body))
+        session = self.create_session()
+        request = AWSRequest(method='GET', url=server.url).prepare()
+        request.stream_output = True
+        response = session.send(request)
+        chunks = []
+        while chunk := response.raw.read(10000):
+            chunks.append(chunk)
+        self.assertEqual(b''.join(chunks), body)
+        self.assertEqual(max(len(chunk) for chunk in chunks), 10000)
+
+    def test_releases_connection_after_reading_response(self):
+        server = self.start_server(lambda headers, body: ok(b'body'))
+        session = self.create_session()
+        for _ in range(3):
+            self.send(session, server.url)
+        connection = session._h2_connections[('127.0.0.1', server.port, None)]
+        self.assertEqual(connection[0].reserved, 0)
+
+    def test_reset_stream(self):
+        server = self.start_server(lambda headers, body: None)
+        with self.assertRaises(ConnectionClosedError):
+            self.send(self.create_session(), server.url)
+
+    def test_read_timeout(self):
+        async def handler(headers, body):
+            await asyncio.sleep(1)
+            return ok()
+
+        server = self.start_server(handler)
+        with self.assertRaises(ReadTimeoutError):
+            self.send(self.create_session(timeout=(1, 0.05)), server.url)
+
+    @unittest.skipIf(
+        os.name != 'posix'
+        or resource.getrlimit(resource.RLIMIT_NOFILE)[0] <= HIGH_FD,
+        'Test requires file descriptors of 1024 and above',
+    )
+    def test_reuses_connections_with_high_file_descriptors(self):
+        class HighFDSession(CleartextHTTP2Session):
+            # select() fails for file descriptors of 1024 and above.
+            def _create_socket(self, key, url):
+                sock = super()._create_socket(key, url)
+                fd = fcntl.fcntl(sock.fileno(), fcntl.F_DUPFD, HIGH_FD)
+                sock.close()
+                high_fd_sock = socket.socket(fileno=fd)
+                high_fd_sock.settimeout(self._read_timeout)
+                return high_fd_sock
+
+        server = self.start_server(lambda headers, body: ok(b'body'))
+        session = HighFDSession(timeout=(1, 2))
+        self.addCleanup(session.close)
+        start = time.monotonic()
+        for _ in range(3):
+            self.assertEqual(self.send(session, server.url).content, b'body')
+        self.assertLess(time.monotonic() - start, 2)
+        self.assertEqual(server.connections, 1)
+
+    def test_replaces_connection_that_times_out_when_idle(self):
+        server = self.start_server(lambda headers, body: ok(b'body'))
+        session = self.create_session(timeout=(1, 0.05))
+        self.send(session, server.url)
+        # The connection looks readable but the server sends nothing.
+        with mock.patch.object(
+            http2session._H2Connection, '_is_readable', return_value=True
+        ):
+            response = self.send(session, server.url)
+        self.assertEqual(response.content, b'body')
+        self.assertEqual(server.connections, 2)
+
+    def test_connection_refused(self):
+        sock = socket.socket()
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+        sock.close()
+        with self.assertRaises(EndpointConnectionError):
+            self.send(self.create_session(), f'https://127.0.0.1:{port}/')
+
+    def test_http_urls_are_sent_over_http1(self):
+        session = self.create_session()
+        with mock.patch.object(URLLib3Session, 'send') as send:
+            self.send(session, 'http://example.com')
+        send.assert_called_once()
+
+    def test_falls_back_to_http1_when_not_negotiated(self):
+        session = self.create_session()
+        with mock.patch.object(
+            session, '_create_socket', side_effect=_HTTP1Only
+        ) as create_socket:
+            with mock.patch.object(URLLib3Session, 'send') as send:
+                self.send(session, 'https://example.com')
+                self.send(session, 'https://example.com')
+        self.assertEqual(send.call_count, 2)
+        create_socket.assert_called_once()
+
+    def test_https_proxies_are_sent_over_http1(self):
+        session = self.create_session(
+            proxies={'https': 'https://proxy.example.com'}
+        )
+        with mock.patch.object(URLLib3Session, 'send') as send:
+            self.send(session, 'https://example.com')
+        send.assert_called_once()
+
+    def test_warm_up_opens_connections(self):
+        server = self.start_server(lambda headers, body: ok())
+        session = self.create_session()
+        self.assertEqual(session.warm_up(server.url), 1)
+        self.assertEqual(session.warm_up(server.url), 1)
+        self.send(session, server.url)
+        self.assertEqual(server.connections, 1)
+
+    def test_warm_up_in_parallel(self):
+        server = self.start_server(lambda headers, body: ok())
+        session = self.create_session(max_pool_connections=3)
+        connections = session.warm_up(server.url, connections=5, parallel=True)
+        self.assertEqual(connections, 3)
+        key = ('127.0.0.1', server.port, None)
+        self.assertEqual(len(session._h2_connections[key]), 3)
+
+    def test_warm_up_does_not_count_failed_connections(self):
+        sock = socket.socket()
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+        sock.close()
+        session = self.create_session()
+        self.assertEqual(session.warm_up(f'https://127.0.0.1:{port}/'), 0)
+
+    def test_warm_up_falls_back_to_http1(self):
+        session = self.create_session()
+        with mock.patch.object(
+            session, '_create_socket', side_effect=_HTTP1Only
+        ):
+            with mock.patch.object(
+                URLLib3Session, 'warm_up', return_value=2
+            ) as warm_up:
+                connections = session.warm_up(
+                    'https://example.com', connections=2
+                )
+        self.assertEqual(connections, 2)
+        warm_up.assert_called_once_with(
+            'https://example.com', connections=2, parallel=False
+        )
+        self.assertIn(('example.com', 443, None), session._http1_hosts)
+
+    def test_resolves_host_with_dns_cache(self):
+        server = self.start_server(lambda headers, body: ok(b'hello'))
+        port = server.url.rsplit(':', 1)[1]
+        cache = DNSCache()
+        getaddrinfo = socket.getaddrinfo
+
+        def fake_getaddrinfo(host, *args, **kwargs):
+            if host == 'example.test':
+                host = '127.0.0.1'
+            return getaddrinfo(host, *args, **kwargs)
+
+        with mock.patch(
+            'socket.getaddrinfo', side_effect=fake_getaddrinfo
+        ) as mock_getaddrinfo:
+            response = self.send(
+                self.create_session(dns_cache=cache),
+                f'https://example.test:{port}/',
+            )
+        self.assertEqual(response.content, b'hello')
+        self.assertEqual(
+            mock_getaddrinfo.call_args_list[0][0][0], 'example.test'
+        )
+        self.assertEqual(cache.get_stats().misses, 1)
+
+    def test_records_pool_stats(self):
+        async def handler(headers, body):
+            if dict(headers)[b':path'] != b'/':
+                await asyncio.sleep(0.1)
+            return ok()
+
+        server = self.start_server(handler, max_concurrent_streams=1)
+        session = self.create_session(max_pool_connections=1)
+        self.send(session, server.url)
+        self.send(session, server.url)
+        with ThreadPoolExecutor(2) as executor:
+            list(
+                executor.map(
+                    lambda i: self.send(session, f'{server.url}/{i}'), range(2)
+                )
+            )
+        stats = session.get_pool_stats()
+        self.assertEqual(stats.requests, 4)
+        self.assertEqual(stats.reused, 3)
+        self.assertEqual(stats.exhausted, 1)
+
+    def test_requires_h2(self):
+        with mock.patch.object(http2session, 'HAS_H2', False):
+            with self.assertRaises(MissingDependencyException):
+                HTTP2Session()
@@ -1,4 +1,5 @@
 import socket
+import threading
 from concurrent.futures import CancelledError
 
 import pytest
@@ -16,6 +17,7 @@ from botocore.exceptions import (
 )
 from botocore.httpsession import (
     BUFFER_SIZE,
+    DNSCache,
     ProxyConfiguration,
     URLLib3Session,
     get_cert_path,
@@ -525,3 +527,295 @@ class TestURLLib3Session(unittest.TestCase):
             self.proxy_manager_fun.return_value.clear.call_count,
             1 + len(proxies),
         )
+
+
+class KeepAliveServer:
+    """A local HTTP server answering every request with a 200."""
+
+    def __init__(self):
+        self.connections = 0
+        self.request_lines = []
+        self._sock = socket.create_server(('127.0.0.1', 0))
+        self.url = f'http://127.0.0.1:{self._sock.getsockname()[1]}/'
+        thread = threading.Thread(target=self._serve, daemon=True)
+        thread.start()
+
+    def close(self):
+        self._sock.close()
+
+    def _serve(self):
+        while True:
+            try:
+                conn, _ = self._sock.accept()
+            except OSError:
+                return
+            self.connections += 1
+            thread = threading.Thread(
+                target=self._handle, args=(conn,), daemon=True
+            )
+            thread.start()
+
+    def _handle(self, conn):
+        with conn, conn.makefile('rb') as reader:
+            while request_line := reader.readline():
+                self.request_lines.append(request_line)
+                while reader.readline() not in (b'\r\n', b''):
+                    pass
+                conn.sendall(b'HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok')
+
+
+class TestURLLib3SessionWarmUp(unittest.TestCase):
+    def setUp(self):
+        self.server = KeepAliveServer()
+        self.addCleanup(self.server.close)
+
+    def create_session(self, **kwargs):
+        session = URLLib3Session(**kwargs)
+        self.addCleanup(session.close)
+        return session
+
+    def test_warm_up_opens_connections(self):
+        session = self.create_session()
+        self.assertEqual(session.warm_up(self.server.url, connections=3), 3)
+        # The connections are already open, so nothing more is opened.
+        self.assertEqual(session.warm_up(self.server.url, connections=3), 3)
+        request = AWSRequest(method='GET', url=self.server.url).prepare()
+        self.assertEqual(session.send(request).status_code, 200)
+        self.assertEqual(self.server.connections, 3)
+
+    def test_warm_up_in_parallel(self):
+        session = self.create_session()
+        connections = session.warm_up(
+            self.server.url, connections=4, parallel=True
+        )
+        self.assertEqual(connections, 4)
+
+    def test_warm_up_is_limited_by_pool_size(self):
+        session = self.create_session(max_pool_connections=2)
+        self.assertEqual(session.warm_up(self.server.url, connections=5), 2)
+
+    def test_warm_up_does_not_count_failed_connections(self):
+        sock = socket.socket()
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+        sock.close()
+        session = self.create_session()
+        url = f'http://127.0.0.1:{port}/'
+        self.assertEqual(session.warm_up(url, connections=2), 0)
+
+    def test_warm_up_tunnels_https_through_proxy(self):
+        session = self.create_session(
+            proxies={'https': self.server.url}, timeout=5
+        )
+        # The server is not a real proxy, so the TLS handshake through the
+        # tunnel fails after the CONNECT request.
+        url = 'https://example.com/'
+        self.assertEqual(session.warm_up(url, connections=1), 0)
+        request_line = self.server.request_lines[0]
+        self.assertTrue(request_line.startswith(b'CONNECT example.com:443 '))
+
+
+class TestURLLib3SessionPoolStats(unittest.TestCase):
+    def setUp(self):
+        self.server = KeepAliveServer()
+        self.addCleanup(self.server.close)
+        self.request = AWSRequest(method='GET', url=self.server.url).prepare()
+        self.request.stream_output = True
+
+    def create_session(self, **kwargs):
+        session = URLLib3Session(**kwargs)
+        self.addCleanup(session.close)
+        return session
+
+    def test_records_reused_connections(self):
+        session = self.create_session()
+        for _ in range(3):
+            self.assertEqual(session.send(self.request).content, b'ok')
+        stats = session.get_pool_stats()
+        self.assertEqual(stats.requests, 3)
+        self.assertEqual(stats.reused, 2)
+        self.assertEqual(stats.new_connections, 1)
+        self.assertEqual(stats.tls_handshakes, 0)
+        self.assertAlmostEqual(stats.hit_rate, 2 / 3)
+
+    def test_records_exhausted_pool_and_discarded_connections(self):
+        session = self.create_session(max_pool_connections=1)
+        events = []
+        session.add_pool_listener(
+            lambda event_name, **kwargs: events.append(event_name)
+        )
+        # Neither connection is returned to the pool until its response is
+        # read, so the second request finds the pool empty.
+        first = session.send(self.request)
+        second = session.send(self.request)
+        first.content
+        second.content
+        stats = session.get_pool_stats()
+        self.assertEqual(stats.requests, 2)
+        self.assertEqual(stats.reused, 0)
+        self.assertEqual(stats.exhausted, 1)
+        self.assertEqual(stats.discarded, 1)
+        self.assertEqual(stats.new_connections, 2)
+        self.assertEqual(
+            events,
+            [
+                'connection-created',
+                'connection-pool-exhausted',
+                'connection-created',
+                'connection-discarded',
+            ],
+        )
+
+    def test_hit_rate_without_requests(self):
+        self.assertEqual(self.create_session().get_pool_stats().hit_rate, 0.0)
+
+
+def addrinfo(*addresses, port=443):
+    return [
+        (socket.AF_INET, socket.SOCK_STREAM, 6, '', (address, port))
+        for address in addresses
+    ]
+
+
+class TestDNSCache(unittest.TestCase):
+    def setUp(self):
+        self.getaddrinfo = mock.Mock(
+            return_value=addrinfo('10.0.0.1', '10.0.0.2', '10.0.0.1')
+        )
+        patcher = mock.patch('socket.getaddrinfo', self.getaddrinfo)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.now = 1000.0
+        patcher = mock.patch('time.monotonic', lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_caches_addresses(self):
+        cache = DNSCache(ttl=10)
+        self.assertEqual(
+            cache.resolve('example.com', 443), ['10.0.0.1', '10.0.0.2']
+        )
+        cache.resolve('example.com', 443)
+        self.getaddrinfo.assert_called_once()
+        stats = cache.get_stats()
+        self.assertEqual((stats.hits, stats.misses, stats.currsize), (1, 1, 1))
+
+    def test_rotates_addresses(self):
+        cache = DNSCache()
+        results = [cache.resolve('example.com', 443) for _ in range(3)]
+        self.assertEqual(
+            results,
+            [
+                ['10.0.0.1', '10.0.0.2'],
+                ['10.0.0.2', '10.0.0.1'],
+                ['10.0.0.1', '10.0.0.2'],
+            ],
+        )
+
+    def test_looks_up_expired_addresses_again(self):
+        cache = DNSCache(ttl=10)
+        cache.resolve('example.com', 443)
+        self.now += 10
+        cache.resolve('example.com', 443)
+        self.assertEqual(self.getaddrinfo.call_count, 2)
+
+    def test_caches_failed_lookups(self):
+        self.getaddrinfo.side_effect = socket.gaierror(-2, 'Name not known')
+        cache = DNSCache(negative_ttl=5)
+        for _ in range(2):
+            with self.assertRaises(socket.gaierror):
+                cache.resolve('example.com', 443)
+        self.getaddrinfo.assert_called_once()
+        self.assertEqual(cache.get_stats().negative_hits, 1)
+        self.now += 5
+        with self.assertRaises(socket.gaierror):
+            cache.resolve('example.com', 443)
+        self.assertEqual(self.getaddrinfo.call_count, 2)
+
+    def test_negative_ttl_of_zero_disables_negative_caching(self):
+        self.getaddrinfo.side_effect = socket.gaierror(-2, 'Name not known')
+        cache = DNSCache(negative_ttl=0)
+        for _ in range(2):
+            with self.assertRaises(socket.gaierror):
+                cache.resolve('example.com', 443)
+        self.assertEqual(self.getaddrinfo.call_count, 2)
+
+    def test_evicts_least_recently_used(self):
+        cache = DNSCache(max_size=2)
+        for host in ('a.example.com', 'b.example.com'):
+            cache.resolve(host, 443)
+        cache.resolve('a.example.com', 443)
+        cache.resolve('c.example.com', 443)
+        self.assertIsNotNone(cache.lookup('a.example.com'))
+        self.assertIsNone(cache.lookup('b.example.com'))
+        self.assertEqual(cache.get_stats().evictions, 1)
+
+    def test_does_not_look_up_ip_addresses(self):
+        cache = DNSCache()
+        self.assertEqual(cache.resolve('10.0.0.3', 443), ['10.0.0.3'])
+        self.assertEqual(cache.resolve('[::1]', 443), ['::1'])
+        self.getaddrinfo.assert_not_called()
+
+    def test_create_connection_tries_each_address(self):
+        sock = mock.Mock()
+        with mock.patch(
+            'socket.create_connection',
+            side_effect=[ConnectionRefusedError(), sock],
+        ) as create_connection:
+            conn = DNSCache().create_connection(('example.com', 443), 5)
+        self.assertIs(conn, sock)
+        self.assertEqual(
+            create_connection.call_args_list,
+            [
+                mock.call(('10.0.0.1', 443), 5),
+                mock.call(('10.0.0.2', 443), 5),
+            ],
+        )
+
+
+class TestURLLib3SessionDNSCache(unittest.TestCase):
+    def setUp(self):
+        self.server = KeepAliveServer()
+        self.addCleanup(self.server.close)
+        self.port = int(self.server.url.rsplit(':', 1)[1].rstrip('/'))
+        self.url = f'http://example.test:{self.port}/'
+        self.resolved = ['127.0.0.1']
+        getaddrinfo = socket.getaddrinfo
+
+        def fake_getaddrinfo(host, port, *args, **kwargs):
+            if host == 'example.test':
+                return addrinfo(*self.resolved, port=port)
+            return getaddrinfo(host, port, *args, **kwargs)
+
+        patcher = mock.patch('socket.getaddrinfo', fake_getaddrinfo)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def send(self, session, url):
+        request = AWSRequest(method='GET', url=url).prepare()
+        return session.send(request)
+
+    def test_connects_to_cached_address(self):
+        cache = DNSCache()
+        for _ in range(2):
+            session = URLLib3Session(dns_cache=cache)
+            self.addCleanup(session.close)
+            self.assertEqual(self.send(session, self.url).content, b'ok')
+        self.assertEqual(session.get_dns_cache_stats().hits, 1)
+
+    def test_falls_back_to_next_address(self):
+        # Nothing listens on the first address.
+        self.resolved = ['127.0.0.2', '127.0.0.1']
+        session = URLLib3Session(dns_cache=DNSCache())
+        self.addCleanup(session.close)
+        self.assertEqual(self.send(session, self.url).status_code, 200)
+
+    def test_failed_lookup(self):
+        session = URLLib3Session(dns_cache=DNSCache())
+        self.addCleanup(session.close)
+        with self.assertRaises(EndpointConnectionError):
+            self.send(session, 'http://unresolvable.invalid/')
+        self.assertEqual(session.get_dns_cache_stats().currsize, 1)
+
+    def test_no_dns_cache_stats_without_cache(self):
+        self.assertIsNone(URLLib3Session().get_dns_cache_stats())
@@ -10,8 +10,13 @@
 # distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
+import asyncio
+import base64
 import io
+import os
+import sys
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 
 import pytest
@@ -25,6 +30,7 @@ from botocore.exceptions import (
     MissingDependencyException,
 )
 from botocore.httpchecksum import (
+    AsyncStreamingChecksumBody,
     AwsChunkedWrapper,
     Crc32Checksum,
     CrtCrc32cChecksum,
@@ -37,7 +43,10 @@ from botocore.httpchecksum import (
     Sha256Checksum,
     Sha512Checksum,
     StreamingChecksumBody,
+    _CrcCombiner,
     apply_request_checksum,
+    combine_checksums,
+    composite_checksum,
     handle_checksum_body,
     resolve_request_checksum_algorithm,
     resolve_response_checksum_algorithms,
@@ -812,6 +821,73 @@ class TestAwsChunkedWrapper(unittest.TestCase):
         self.assertEqual(first_read, second_read)
         self.assertIn(b"checksum:DUoRhQ==", first_read)
 
+    def test_small_reads_span_chunks(self):
+        wrapper = AwsChunkedWrapper(
+            BytesIO(b"hello world"),
+            chunk_size=5,
+            checksum_cls=Crc32Checksum,
+            checksum_name="checksum",
+        )
+        reads = []
+        while data := wrapper.read(4):
+            self.assertLessEqual(len(data), 4)
+            reads.append(data)
+        expected = (
+            b"5\r\nhello\r\n5\r\n worl\r\n1\r\nd\r\n"
+            b"0\r\nchecksum:DUoRhQ==\r\n\r\n"
+        )
+        self.assertEqual(b"".join(reads), expected)
+
+    def test_large_reads_span_chunks(self):
+        # Each chunk is read into the same buffer, so data returned from
+        # one read must not change when a later chunk is read.
+        data = bytes(range(256)) * 40
+        wrapper = AwsChunkedWrapper(BytesIO(data), chunk_size=1000)
+        first = wrapper.read(2500)
+        rest = wrapper.read()
+        expected = b"".join(
+            b"%x\r\n%s\r\n" % (len(data[i : i + 1000]), data[i : i + 1000])
+            for i in range(0, len(data), 1000)
+        )
+        self.assertEqual(first + rest, expected + b"0\r\n\r\n")
+
+    def test_readinto(self):
+        wrapper = AwsChunkedWrapper(
+            BytesIO(b"hello world"),
+            chunk_size=5,
+            checksum_cls=Crc32Checksum,
+            checksum_name="checksum",
+        )
+        buffer = bytearray(7)
+        reads = []
+        while amount_read := wrapper.readinto(buffer):
+            reads.append(bytes(buffer[:amount_read]))
+        self.assertEqual([len(r) for r in reads[:-1]], [7] * (len(reads) - 1))
+        self.assertEqual(
+            b"".join(reads),
+            b"5\r\nhello\r\n5\r\n worl\r\n1\r\nd\r\n"
+            b"0\r\nchecksum:DUoRhQ==\r\n\r\n",
+        )
+
+    def test_reads_from_stream_without_readinto(self):
+        class ReadOnlyStream:
+            def __init__(self, data):
+                self._data = BytesIO(data)
+
+            def read(self, size=-1):
+                return self._data.read(size)
+
+        wrapper = AwsChunkedWrapper(
+            ReadOnlyStream(b"abcdefghijklmnopqrstuvwxyz"), chunk_size=10
+        )
+        self.assertEqual(wrapper.read(3), b"a\r\n")
+        buffer = bytearray(12)
+        self.assertEqual(wrapper.readinto(buffer), 12)
+        self.assertEqual(buffer, b"abcdefghij\r\n")
+        self.assertEqual(
+            wrapper.read(), b"a\r\nklmnopqrst\r\n6\r\nuvwxyz\r\n0\r\n\r\n"
+        )
+
     def test_wrapper_can_only_seek_to_start(self):
         wrapper = AwsChunkedWrapper(BytesIO())
         with self.assertRaises(AwsChunkedWrapperError):
@@ -870,6 +946,131 @@ def test_crt_checksum_available(algorithm, expected_class):
     assert actual_cls == expected_class
 
 
+def reference_crc(data, polynomial, width):
+    # A bitwise implementation of a reflected CRC with an initial value
+    # and final XOR of all ones.
+    mask = (1 << width) - 1
+    crc = mask
+    for byte in data:
+        crc ^= byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ polynomial if crc & 1 else crc >> 1
+    return crc ^ mask
+
+
+_CRC_PARAMETERS = {
+    "crc32": (0xEDB88320, 32),
+    "crc32c": (0x82F63B78, 32),
+    "crc64nvme": (0x9A6C9329AC4BC9B5, 64),
+}
+
+
+def b64_reference_crc(data, algorithm):
+    polynomial, width = _CRC_PARAMETERS[algorithm]
+    crc = reference_crc(data, polynomial, width)
+    return base64.b64encode(crc.to_bytes(width // 8, "big")).decode()
+
+
+@pytest.mark.parametrize("algorithm", ["crc32", "crc32c", "crc64nvme"])
+@pytest.mark.parametrize(
+    "part_sizes", [[9], [4, 5], [0, 9], [1, 3, 5], [9, 0], [300, 1000, 7]]
+)
+def test_combine_checksums(algorithm, part_sizes):
+    data = bytes(range(256)) * 6 if sum(part_sizes) > 9 else b"123456789"
+    parts = []
+    offset = 0
+    for size in part_sizes:
+        part = data[offset : offset + size]
+        parts.append((b64_reference_crc(part, algorithm), size))
+        offset += size
+    expected = b64_reference_crc(data[:offset], algorithm)
+    assert combine_checksums(algorithm, parts) == expected
+
+
+def test_combine_checksums_unsupported_algorithm():
+    with pytest.raises(FlexibleChecksumError):
+        combine_checksums("sha256", [("AAAA", 3)])
+
+
+@pytest.mark.parametrize("algorithm", ["crc32", "sha256"])
+def test_composite_checksum(algorithm):
+    checksum_cls = get_checksum_cls(algorithm)
+    part_checksums = []
+    for part in (b"hello", b" ", b"world"):
+        checksum = checksum_cls()
+        checksum.update(part)
+        part_checksums.append(checksum.b64digest())
+    checksum = checksum_cls()
+    checksum.update(b"".join(base64.b64decode(c) for c in part_checksums))
+    expected = f"{checksum.b64digest()}-3"
+    assert composite_checksum(algorithm, part_checksums) == expected
+
+
+def test_composite_checksum_unsupported_algorithm():
+    with pytest.raises(FlexibleChecksumError):
+        composite_checksum("md5", ["AAAA"])
+
+
+class TestCrcChecksums(unittest.TestCase):
+    def test_combine(self):
+        checksum = Crc32Checksum()
+        checksum.update(b"hello")
+        part = Crc32Checksum()
+        part.update(b" world")
+        checksum.combine(int.from_bytes(part.digest(), "big"), 6)
+        self.assertEqual(checksum.b64digest(), "DUoRhQ==")
+
+    def test_combiner_shared_by_threads(self):
+        # Force frequent thread switches while the combiners extend their
+        # tables of powers.
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        self.addCleanup(sys.setswitchinterval, switch_interval)
+        expected = _CrcCombiner(0x82F63B78, 32)
+        lengths = [2**60 + i for i in range(8)]
+        for _ in range(20):
+            combiner = _CrcCombiner(0x82F63B78, 32)
+            with ThreadPoolExecutor(8) as executor:
+                combined = list(
+                    executor.map(
+                        lambda length: combiner.combine(1, 2, length),
+                        lengths,
+                    )
+                )
+            self.assertEqual(
+                combined, [expected.combine(1, 2, n) for n in lengths]
+            )
+            self.assertEqual(combiner._powers, expected._powers)
+
+    def test_handles_large_files_in_parallel(self):
+        data = os.urandom(10000)
+        body = BytesIO(b"skipped" + data)
+        body.seek(7)
+        checksum = Crc32Checksum()
+        with mock.patch.object(Crc32Checksum, "_MAX_WORKERS", 3):
+            with mock.patch.object(Crc32Checksum, "_PARALLEL_PART_SIZE", 999):
+                with mock.patch(
+                    "botocore.httpchecksum.ThreadPoolExecutor",
+                    wraps=ThreadPoolExecutor,
+                ) as executor_cls:
+                    digest = checksum.handle(body)
+        executor_cls.assert_called_once_with(3)
+        expected = Crc32Checksum()
+        expected.update(data)
+        self.assertEqual(digest, expected.b64digest())
+        self.assertEqual(body.tell(), 7)
+
+    def test_handles_small_files_sequentially(self):
+        checksum = Crc32Checksum()
+        with mock.patch.object(Crc32Checksum, "_MAX_WORKERS", 3):
+            with mock.patch(
+                "botocore.httpchecksum.ThreadPoolExecutor"
+            ) as executor_cls:
+                digest = checksum.handle(BytesIO(b"hello world"))
+        executor_cls.assert_not_called()
+        self.assertEqual(digest, "DUoRhQ==")
+
+
 class TestStreamingChecksumBody(unittest.TestCase):
     def setUp(self):
         self.raw_bytes = b"hello world"
@@ -955,3 +1156,49 @@ class TestStreamingChecksumBody(unittest.TestCase):
         # Whole body has been read, next read signals the end of the stream and
         # validates the checksum of the body contents read
         self.wrapper.readinto(chunk)
+
+
+class FakeAsyncRawResponse(BytesIO):
+    async def read(self, amt=None):
+        return super().read(amt)
+
+
+class TestAsyncStreamingChecksumBody(unittest.TestCase):
+    def _make_wrapper(self, checksum):
+        return AsyncStreamingChecksumBody(
+            FakeAsyncRawResponse(b"hello world"),
+            None,
+            Crc32Checksum(),
+            checksum,
+        )
+
+    def test_read_good(self):
+        wrapper = self._make_wrapper("DUoRhQ==")
+        self.assertEqual(asyncio.run(wrapper.read()), b"hello world")
+
+    def test_many_reads_bad(self):
+        wrapper = self._make_wrapper("duorhq==")
+
+        async def read_all():
+            return [chunk async for chunk in wrapper]
+
+        with self.assertRaises(FlexibleChecksumError):
+            asyncio.run(read_all())
+
+    def test_handle_checksum_body_uses_async_body(self):
+        http_response = AWSResponse(
+            "https://example.com",
+            200,
+            {},
+            FakeAsyncRawResponse(b"hello world"),
+        )
+        response = {
+            "headers": {"x-amz-checksum-crc32": "DUoRhQ=="},
+            "body": None,
+            "context": {},
+        }
+        context = {"checksum": {"response_algorithms": ["crc32"]}}
+        operation_model = mock.Mock(has_streaming_output=True)
+        handle_checksum_body(http_response, response, context, operation_model)
+        self.assertIsInstance(response["body"], AsyncStreamingChecksumBody)
+        self.assertEqual(asyncio.run(response["body"].read()), b"hello world")
@@ -21,14 +21,23 @@
 
 import contextlib
 import copy
+import json
 import os
+import shutil
+import tempfile
+import unittest
+from collections import OrderedDict
 
 from botocore.exceptions import DataNotFoundError, UnknownServiceError
 from botocore.loaders import (
     ExtrasProcessor,
     JSONFileLoader,
+    LazyJSONObject,
     Loader,
+    ModelCache,
+    build_lazy_index,
     create_loader,
+    load_lazy_json,
 )
 from tests import BaseEnvVar, mock
 
@@ -511,3 +520,281 @@ class TestLoadersWithDirectorySearching(BaseEnvVar):
                 loader.determine_latest_version('ec2', 'service-1'),
                 '2015-03-01',
             )
+
+
+class TestModelCache(BaseEnvVar):
+    def setUp(self):
+        super().setUp()
+        self.tempdir = tempfile.mkdtemp()
+        self.data_path = os.path.join(self.tempdir, 'data')
+        self.cache_path = os.path.join(self.tempdir, 'cache')
+        self.model_dir = os.path.join(
+            self.data_path, 'myservice', '2015-03-01'
+        )
+        os.makedirs(self.model_dir)
+        self.write_model('service-2', {'foo': 'bar', 'shapes': {}})
+        self.model_cache = ModelCache(self.cache_path)
+        self.file_loader = JSONFileLoader()
+        self.file_loader.load_file = mock.Mock(
+            side_effect=self.file_loader.load_file
+        )
+
+    def tearDown(self):
+        super().tearDown()
+        shutil.rmtree(self.tempdir)
+
+    def write_model(self, name, data):
+        filename = os.path.join(self.model_dir, f'{name}.json')
+        with open(filename, 'w') as f:
+            json.dump(data, f)
+        # Ensure that rewrites within the same test are always detected,
+        # regardless of the filesystem's timestamp granularity.
+        stat = os.stat(filename)
+        os.utime(filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    def create_loader(self):
+        return Loader(
+            extra_search_paths=[self.data_path],
+            include_default_search_paths=False,
+            file_loader=self.file_loader,
+            model_cache=self.model_cache,
+        )
+
+    def test_model_loaded_from_cache(self):
+        model = self.create_loader().load_service_model(
+            'myservice', 'service-2'
+        )
+        self.assertEqual(model, {'foo': 'bar', 'shapes': {}})
+        self.file_loader.load_file.reset_mock()
+
+        cached_model = self.create_loader().load_service_model(
+            'myservice', 'service-2'
+        )
+        self.assertEqual(cached_model, model)
+        self.assertIsInstance(cached_model, OrderedDict)
+        self.file_loader.load_file.assert_not_called()
+
+    def test_extras_are_cached(self):
+        self.write_model(
+            'service-2.sdk-extras', {'merge': {'shapes': {'Foo': {}}}}
+        )
+        self.create_loader().load_service_model('myservice', 'service-2')
+        self.file_loader.load_file.reset_mock()
+
+        cached_model = self.create_loader().load_service_model(
+            'myservice', 'service-2'
+        )
+        self.assertEqual(cached_model['shapes'], {'Foo': {}})
+        self.file_loader.load_file.assert_not_called()
+
+    def test_modified_model_invalidates_cache(self):
+        self.create_loader().load_service_model('myservice', 'service-2')
+        self.write_model('service-2', {'foo': 'updated'})
+        model = self.create_loader().load_service_model(
+            'myservice', 'service-2'
+        )
+        self.assertEqual(model, {'foo': 'updated'})
+
+    def test_added_extras_invalidates_cache(self):
+        self.create_loader().load_service_model('myservice', 'service-2')
+        self.write_model(
+            'service-2.sdk-extras', {'merge': {'shapes': {'Foo': {}}}}
+        )
+        model = self.create_loader().load_service_model(
+            'myservice', 'service-2'
+        )
+        self.assertEqual(model['shapes'], {'Foo': {}})
+
+    def test_corrupt_cache_entry_is_ignored(self):
+        self.create_loader().load_service_model('myservice', 'service-2')
+        for filename in os.listdir(self.cache_path):
+            with open(os.path.join(self.cache_path, filename), 'wb') as f:
+                f.write(b'not a pickle')
+        model = self.create_loader().load_service_model(
+            'myservice', 'service-2'
+        )
+        self.assertEqual(model, {'foo': 'bar', 'shapes': {}})
+
+    def test_unwritable_cache_dir_is_ignored(self):
+        open(self.cache_path, 'w').close()
+        model = self.create_loader().load_service_model(
+            'myservice', 'service-2'
+        )
+        self.assertEqual(model, {'foo': 'bar', 'shapes': {}})
+
+    def test_create_loader_with_cache_path(self):
+        loader = create_loader(cache_path=self.cache_path)
+        self.assertIsInstance(loader.model_cache, ModelCache)
+        self.assertEqual(loader.model_cache.cache_dir, self.cache_path)
+
+    def test_create_loader_without_cache_path(self):
+        self.assertIsNone(create_loader().model_cache)
+
+
+class TestLazyLoading(BaseEnvVar):
+    def setUp(self):
+        super().setUp()
+        self.tempdir = tempfile.mkdtemp()
+        self.data_path = os.path.join(self.tempdir, 'data')
+        self.model_dir = os.path.join(
+            self.data_path, 'myservice', '2015-03-01'
+        )
+        os.makedirs(self.model_dir)
+        self.model = OrderedDict(
+            [
+                ('version', '2.0'),
+                ('metadata', {'protocol': 'json'}),
+                (
+                    'operations',
+                    OrderedDict(
+                        [
+                            ('Foo', {'input': {'shape': 'FooInput'}}),
+                            ('Bar', {'name': 'Bar'}),
+                        ]
+                    ),
+                ),
+                (
+                    'shapes',
+                    OrderedDict(
+                        [
+                            (
+                                'FooInput',
+                                {
+                                    'type': 'structure',
+                                    'members': {'A': {'shape': 'String'}},
+                                },
+                            ),
+                            ('String', {'type': 'string'}),
+                            ('Quoted"\\u00e9', {'type': 'string'}),
+                        ]
+                    ),
+                ),
+            ]
+        )
+        self.write_model('service-2', self.model)
+
+    def tearDown(self):
+        super().tearDown()
+        shutil.rmtree(self.tempdir)
+
+    def write_model(self, name, data, **kwargs):
+        filename = os.path.join(self.model_dir, f'{name}.json')
+        with open(filename, 'w') as f:
+            json.dump(data, f, **kwargs)
+
+    def create_loader(self, **kwargs):
+        return Loader(
+            extra_search_paths=[self.data_path],
+            include_default_search_paths=False,
+            lazy_load_models=True,
+            **kwargs,
+        )
+
+    def test_lazy_model_matches_eager_model(self):
+        for indent in (None, 2):
+            self.write_model('service-2', self.model, indent=indent)
+            model = self.create_loader().load_service_model(
+                'myservice', 'service-2'
+            )
+            self.assertIsInstance(model['shapes'], LazyJSONObject)
+            self.assertIsInstance(model['operations'], LazyJSONObject)
+            self.assertEqual(list(model), list(self.model))
+            self.assertEqual(list(model['shapes']), list(self.model['shapes']))
+            self.assertEqual(model, self.model)
+
+    def test_values_decoded_on_access(self):
+        model = self.create_loader().load_service_model(
+            'myservice', 'service-2'
+        )
+        shapes = model['shapes']
+        self.assertEqual(shapes.decoded_keys, [])
+        self.assertIn('String', shapes)
+        self.assertEqual(shapes.decoded_keys, [])
+        self.assertEqual(shapes['String'], {'type': 'string'})
+        self.assertIsInstance(shapes['FooInput'], OrderedDict)
+        self.assertEqual(shapes.decoded_keys, ['FooInput', 'String'])
+        # Decoded values are cached.
+        self.assertIs(shapes['String'], shapes['String'])
+
+    def test_other_model_types_not_lazy(self):
+        self.write_model('paginators-1', {'pagination': {}})
+        model = self.create_loader().load_service_model(
+            'myservice', 'paginators-1'
+        )
+        self.assertEqual(model, {'pagination': {}})
+        self.assertIsInstance(model['pagination'], OrderedDict)
+
+    def test_extras_merged_into_lazy_model(self):
+        self.write_model(
+            'service-2.sdk-extras',
+            {
+                'merge': {
+                    'shapes': {
+                        'String': {'max': 10},
+                        'NewShape': {'type': 'integer'},
+                    }
+                }
+            },
+        )
+        model = self.create_loader().load_service_model(
+            'myservice', 'service-2'
+        )
+        shapes = model['shapes']
+        self.assertIsInstance(shapes, LazyJSONObject)
+        self.assertEqual(shapes['String'], {'type': 'string', 'max': 10})
+        self.assertEqual(shapes['NewShape'], {'type': 'integer'})
+        self.assertEqual(list(shapes)[-1], 'NewShape')
+        self.assertNotIn('FooInput', shapes.decoded_keys)
+
+    def test_index_stored_in_model_cache(self):
+        model_cache = ModelCache(os.path.join(self.tempdir, 'cache'))
+        self.create_loader(model_cache=model_cache).load_service_model(
+            'myservice', 'service-2'
+        )
+        with mock.patch(
+            'botocore.loaders.build_lazy_index'
+        ) as mock_build_index:
+            model = self.create_loader(
+                model_cache=model_cache
+            ).load_service_model('myservice', 'service-2')
+        mock_build_index.assert_not_called()
+        self.assertEqual(model, self.model)
+
+    def test_invalid_json_raises_error(self):
+        filename = os.path.join(self.model_dir, 'service-2.json')
+        with open(filename, 'w') as f:
+            f.write('{"shapes": {"Foo": {"type": "string"} "Bar": {}}}')
+        with self.assertRaises(ValueError):
+            self.create_loader().load_service_model('myservice', 'service-2')
+
+
+class TestLazyJSONObject(unittest.TestCase):
+    def setUp(self):
+        self.text = '{"a": {"b": 1}, "c": [1, 2]}'
+        index = build_lazy_index(self.text, ['unused'])
+        self.obj = LazyJSONObject(
+            self.text, {key: offset for key, (offset, _) in index.items()}
+        )
+
+    def test_behaves_like_dict(self):
+        self.assertEqual(len(self.obj), 2)
+        self.assertEqual(list(self.obj), ['a', 'c'])
+        self.assertEqual(self.obj.get('c'), [1, 2])
+        self.assertIsNone(self.obj.get('missing'))
+        self.assertEqual(dict(self.obj), {'a': {'b': 1}, 'c': [1, 2]})
+
+    def test_set_and_delete(self):
+        self.obj['d'] = 'new'
+        self.obj['a'] = 'replaced'
+        del self.obj['c']
+        self.assertEqual(list(self.obj), ['a', 'd'])
+        self.assertEqual(dict(self.obj), {'a': 'replaced', 'd': 'new'})
+        with self.assertRaises(KeyError):
+            self.obj['c']
+
+    def test_load_lazy_json(self):
+        index = build_lazy_index(self.text, ['a'])
+        data = load_lazy_json(self.text, index)
+        self.assertIsInstance(data['a'], LazyJSONObject)
+        self.assertEqual(data['a']['b'], 1)
+        self.assertEqual(data['c'], [1, 2])
@@ -1,3 +1,5 @@
+import sys
+
 import pytest
 
 from botocore import model
@@ -1072,6 +1074,85 @@ class TestShapeResolver(unittest.TestCase):
             'StringType', repr(resolver.get_shape_by_name('StringType'))
         )
 
+    def test_shapes_are_memoized(self):
+        shape_map = {
+            'Foo': {
+                'type': 'structure',
+                'members': {
+                    'Bar': {'shape': 'StringType'},
+                    'Baz': {'shape': 'StringType'},
+                    'Qux': {'shape': 'StringType', 'locationName': 'other'},
+                },
+            },
+            "StringType": {"type": "string"},
+        }
+        resolver = model.ShapeResolver(shape_map)
+        self.assertIs(
+            resolver.get_shape_by_name('Foo'),
+            resolver.get_shape_by_name('Foo'),
+        )
+        members = resolver.get_shape_by_name('Foo').members
+        self.assertIs(members['Bar'], members['Baz'])
+        self.assertIsNot(members['Bar'], members['Qux'])
+        self.assertEqual(members['Qux'].serialization['name'], 'other')
+        self.assertNotIn('name', members['Bar'].serialization)
+
+    def test_member_traits_with_lists_are_memoized(self):
+        shape_map = {
+            "StringType": {"type": "string"},
+        }
+        resolver = model.ShapeResolver(shape_map)
+        shape = resolver.get_shape_by_name(
+            'StringType', {'contextParam': {'name': 'Bucket'}}
+        )
+        self.assertIs(
+            shape,
+            resolver.get_shape_by_name(
+                'StringType', {'contextParam': {'name': 'Bucket'}}
+            ),
+        )
+        self.assertIsNot(
+            shape,
+            resolver.get_shape_by_name(
+                'StringType', {'contextParam': {'name': 'Key'}}
+            ),
+        )
+
+    def test_shapes_use_slots(self):
+        shape_map = {
+            'Foo': {
+                'type': 'structure',
+                'members': {'Bar': {'shape': 'StringList'}},
+            },
+            'StringList': {
+                'type': 'list',
+                'member': {'shape': 'StringType'},
+            },
+            "StringType": {"type": "string", "enum": ["a", "b"]},
+        }
+        resolver = model.ShapeResolver(shape_map)
+        shape = resolver.get_shape_by_name('Foo')
+        self.assertFalse(hasattr(shape, '__dict__'))
+        member = shape.members['Bar'].member
+        self.assertEqual(member.enum, ['a', 'b'])
+        self.assertEqual(member.metadata, {'enum': ['a', 'b']})
+        with self.assertRaises(AttributeError):
+            shape.not_an_attribute
+        with self.assertRaises(AttributeError):
+            shape.not_an_attribute = 'foo'
+
+    def test_member_names_are_interned(self):
+        shape_map = {
+            'Foo': {
+                'type': 'structure',
+                'members': {'Bar': {'shape': 'StringType'}},
+            },
+            "StringType": {"type": "string"},
+        }
+        resolver = model.ShapeResolver(shape_map)
+        name = next(iter(resolver.get_shape_by_name('Foo').members))
+        self.assertIs(name, sys.intern('Bar'))
+
 
 class TestBuilders(unittest.TestCase):
     def test_structure_shape_builder_with_scalar_types(self):
@@ -10,10 +10,12 @@
 # distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
+import asyncio
 
 from botocore import model
 from botocore.exceptions import PaginationError
 from botocore.paginate import (
+    AsyncPaginator,
     Paginator,
     PaginatorModel,
     TokenDecoder,
@@ -377,6 +379,73 @@ class TestPagination(unittest.TestCase):
         self.assertEqual(expected_token, result['NextToken'])
 
 
+class TestAsyncPagination(unittest.TestCase):
+    def setUp(self):
+        self.method = mock.AsyncMock()
+        self.model = mock.Mock()
+        self.paginate_config = {
+            'output_token': 'NextToken',
+            'input_token': 'NextToken',
+            'result_key': 'Foo',
+        }
+        self.paginator = AsyncPaginator(
+            self.method, self.paginate_config, self.model
+        )
+
+    def collect(self, async_iterable):
+        async def run():
+            return [item async for item in async_iterable]
+
+        return asyncio.run(run())
+
+    def test_pages_are_retrieved_with_async_for(self):
+        responses = [
+            {'Foo': [1], 'NextToken': 'token1'},
+            {'Foo': [2], 'NextToken': 'token2'},
+            {'Foo': [3]},
+        ]
+        self.method.side_effect = responses
+        actual = self.collect(self.paginator.paginate(Bar='bar'))
+        self.assertEqual(actual, responses)
+        self.assertEqual(
+            self.method.await_args_list,
+            [
+                mock.call(Bar='bar'),
+                mock.call(Bar='bar', NextToken='token1'),
+                mock.call(Bar='bar', NextToken='token2'),
+            ],
+        )
+
+    def test_exception_raised_if_same_next_token(self):
+        self.method.side_effect = [
+            {'NextToken': 'token1'},
+            {'NextToken': 'token1'},
+        ]
+        with self.assertRaises(PaginationError):
+            self.collect(self.paginator.paginate())
+
+    def test_build_full_result_with_max_items(self):
+        self.method.side_effect = [
+            {'Foo': [1, 2], 'NextToken': 'token1'},
+            {'Foo': [3, 4], 'NextToken': 'token2'},
+        ]
+        pages = self.paginator.paginate(PaginationConfig={'MaxItems': 3})
+        result = asyncio.run(pages.build_full_result())
+        self.assertEqual(result['Foo'], [1, 2, 3])
+        self.assertEqual(
+            result['NextToken'],
+            encode_token({'NextToken': 'token1', 'boto_truncate_amount': 1}),
+        )
+
+    def test_search(self):
+        self.method.side_effect = [
+            {'Foo': [{'Id': 1}, {'Id': 2}], 'NextToken': 'token1'},
+            {'Foo': [{'Id': 3}]},
+        ]
+        actual = self.collect(self.paginator.paginate().search('Foo[].Id'))
+        self.assertEqual(actual, [1, 2, 3])
+
+
 class TestPaginatorPageSize(unittest.TestCase):
     def setUp(self):
         self.method = mock.Mock()
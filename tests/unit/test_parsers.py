@@ -10,7 +10,9 @@
 # distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
+import copy
 import datetime
+import io
 import itertools
 
 import pytest
@@ -18,7 +20,7 @@ from dateutil.tz import tzutc
 
 from botocore import model, parsers
 from botocore.compat import MutableMapping, json
-from tests import RawResponse, unittest
+from tests import RawResponse, mock, unittest
 
 
 # HTTP responses will typically return a custom HTTP
@@ -680,6 +682,478 @@ class TestResponseParserFactory(unittest.TestCase):
         parser = self.factory.create_parser('json')
         self.assertTrue(isinstance(parser, parsers.BaseJSONParser))
 
+    def test_compiled_parsers_share_parse_plans(self):
+        self.factory.set_parser_defaults(compiled=True)
+        first = self.factory.create_parser('json')
+        second = self.factory.create_parser('json')
+        self.assertTrue(first._compiled)
+        self.assertIs(first._compiled_shapes, second._compiled_shapes)
+        self.assertIsNot(
+            first._compiled_shapes,
+            self.factory.create_parser('rest-json')._compiled_shapes,
+        )
+
+    def test_parse_plans_not_shared_across_parser_defaults(self):
+        self.factory.set_parser_defaults(compiled=True)
+        first = self.factory.create_parser('json')
+        self.factory.set_parser_defaults(timestamp_parser=lambda x: x)
+        second = self.factory.create_parser('json')
+        self.assertIsNot(first._compiled_shapes, second._compiled_shapes)
+
+    def test_streaming_xml_parsers_share_stream_members(self):
+        self.factory.set_parser_defaults(stream_xml=True)
+        first = self.factory.create_parser('rest-xml')
+        second = self.factory.create_parser('rest-xml')
+        self.assertIs(first._stream_members, second._stream_members)
+        self.assertIsNot(
+            first._stream_members,
+            self.factory.create_parser('query')._stream_members,
+        )
+
+    def test_with_parser_defaults(self):
+        factory = self.factory.with_parser_defaults(compiled=True)
+        self.assertTrue(factory.create_parser('json')._compiled)
+        self.assertFalse(self.factory.create_parser('json')._compiled)
+        # Defaults set on the original factory are still used.
+        timestamp_parser = mock.Mock()
+        self.factory.set_parser_defaults(timestamp_parser=timestamp_parser)
+        parser = factory.create_parser('json')
+        self.assertIs(parser._timestamp_parser, timestamp_parser)
+
+
+class TestCompiledParsers(unittest.TestCase):
+    def setUp(self):
+        self.shapes = {
+            'OutputShape': {
+                'type': 'structure',
+                'members': {
+                    'Node': {'shape': 'Node'},
+                    'Timestamp': {'shape': 'TimestampType'},
+                    'Blobs': {'shape': 'BlobList'},
+                    'Attributes': {'shape': 'IntegerMap'},
+                    'Flag': {'shape': 'BooleanType'},
+                    'Renamed': {
+                        'shape': 'StringType',
+                        'locationName': 'renamed',
+                    },
+                },
+            },
+            'Node': {
+                'type': 'structure',
+                'members': {
+                    'Name': {'shape': 'StringType'},
+                    'Children': {'shape': 'NodeList'},
+                },
+            },
+            'NodeList': {'type': 'list', 'member': {'shape': 'Node'}},
+            'BlobList': {'type': 'list', 'member': {'shape': 'BlobType'}},
+            'IntegerMap': {
+                'type': 'map',
+                'key': {'shape': 'StringType'},
+                'value': {'shape': 'IntegerType'},
+            },
+            'StringType': {'type': 'string'},
+            'BooleanType': {'type': 'boolean'},
+            'BlobType': {'type': 'blob'},
+            'IntegerType': {'type': 'integer'},
+            'TimestampType': {'type': 'timestamp'},
+        }
+        resolver = model.ShapeResolver(self.shapes)
+        self.output_shape = resolver.get_shape_by_name('OutputShape')
+
+    def assert_compiled_matches_interpreted(self, protocol, body):
+        response = {
+            'body': body,
+            'headers': {'x-amzn-requestid': 'request-id'},
+            'status_code': 200,
+        }
+        interpreted = parsers.PROTOCOL_PARSERS[protocol]()
+        compiled = parsers.PROTOCOL_PARSERS[protocol](compiled=True)
+        expected = interpreted.parse(response, self.output_shape)
+        self.assertEqual(compiled.parse(response, self.output_shape), expected)
+        # The second response is parsed with the cached parse plan.
+        self.assertIn(self.output_shape, compiled._compiled_shapes)
+        self.assertEqual(compiled.parse(response, self.output_shape), expected)
+        return expected
+
+    def test_json(self):
+        body = (
+            b'{"Node": {"Name": "root", "Children": [{"Name": "child", '
+            b'"Children": [{"Name": "grandchild"}]}, null]}, '
+            b'"Timestamp": 1407538750, "Blobs": ["Zm9v", "YmFy"], '
+            b'"Attributes": {"a": 1, "b": 2}, "Flag": false, '
+            b'"renamed": "value", "Unknown": "ignored"}'
+        )
+        parsed = self.assert_compiled_matches_interpreted('json', body)
+        self.assertEqual(parsed['Node']['Children'][1], None)
+        self.assertEqual(parsed['Blobs'], [b'foo', b'bar'])
+        self.assertEqual(parsed['Renamed'], 'value')
+
+    def test_rest_json(self):
+        body = (
+            b'{"Node": {"Name": "root", "Children": [{"Name": "child"}]}, '
+            b'"Flag": "true", "Attributes": {"a": "1"}}'
+        )
+        parsed = self.assert_compiled_matches_interpreted('rest-json', body)
+        self.assertIs(parsed['Flag'], True)
+        self.assertEqual(parsed['Attributes'], {'a': 1})
+
+    def test_rest_xml(self):
+        self.shapes['NodeList']['flattened'] = True
+        self.shapes['NodeList']['member']['locationName'] = 'Child'
+        resolver = model.ShapeResolver(self.shapes)
+        self.output_shape = resolver.get_shape_by_name('OutputShape')
+        body = (
+            b'<OutputShape><Node><Name>root</Name>'
+            b'<Child><Name>child</Name><Child><Name>grandchild</Name></Child>'
+            b'</Child><Child><Name></Name></Child></Node>'
+            b'<Timestamp>2014-01-01T00:00:00Z</Timestamp>'
+            b'<Blobs><member>Zm9v</member></Blobs>'
+            b'<Attributes><entry><key>a</key><value>1</value></entry>'
+            b'</Attributes><Flag>true</Flag><renamed>value</renamed>'
+            b'</OutputShape>'
+        )
+        parsed = self.assert_compiled_matches_interpreted('rest-xml', body)
+        children = parsed['Node']['Children']
+        self.assertEqual(children[0]['Children'], [{'Name': 'grandchild'}])
+        self.assertEqual(children[1], {'Name': ''})
+        self.assertEqual(parsed['Attributes'], {'a': 1})
+        self.assertIs(parsed['Flag'], True)
+
+    def test_query(self):
+        body = (
+            b'<OperationResponse><Node><Name>root</Name><Children>'
+            b'<member><Name>child</Name></member></Children></Node>'
+            b'<Flag>false</Flag></OperationResponse>'
+        )
+        parsed = self.assert_compiled_matches_interpreted('query', body)
+        self.assertEqual(parsed['Node']['Children'], [{'Name': 'child'}])
+        self.assertIs(parsed['Flag'], False)
+
+    def test_parse_plans_published_once_complete(self):
+        # Parse plans are shared with other threads, so a structure's plan
+        # must not be visible before the plans of its members are.
+        parser = parsers.JSONParser(compiled=True)
+        compile_string = parser._compile_type_string
+        published = []
+
+        def record_published(shape):
+            published.append(
+                [
+                    s.name
+                    for s in parser._compiled_shapes
+                    if s.type_name == 'structure'
+                ]
+            )
+            return compile_string(shape)
+
+        with mock.patch.object(
+            parser, '_compile_type_string', record_published
+        ):
+            parser.parse(
+                {'body': b'{}', 'headers': {}, 'status_code': 200},
+                self.output_shape,
+            )
+        self.assertTrue(published)
+        self.assertFalse(any(published))
+        node_shape = self.output_shape.members['Node']
+        self.assertIn(self.output_shape, parser._compiled_shapes)
+        self.assertIn(node_shape, parser._compiled_shapes)
+
+    def test_uses_custom_timestamp_parser(self):
+        parser = parsers.JSONParser(
+            timestamp_parser=lambda x: int(x), compiled=True
+        )
+        parsed = parser.parse(
+            {'body': b'{"Timestamp": "1"}', 'headers': {}, 'status_code': 200},
+            self.output_shape,
+        )
+        self.assertEqual(parsed['Timestamp'], 1)
+
+
+class TestStreamingXMLParsers(unittest.TestCase):
+    def setUp(self):
+        self.shapes = {
+            'OutputShape': {
+                'type': 'structure',
+                'members': {
+                    'Versions': {'shape': 'VersionList'},
+                    'Prefixes': {'shape': 'PrefixList'},
+                    'Attributes': {'shape': 'IntegerMap'},
+                    'IsTruncated': {'shape': 'BooleanType'},
+                    'Header': {
+                        'shape': 'StringType',
+                        'location': 'header',
+                        'locationName': 'x-amz-header',
+                    },
+                },
+            },
+            'Version': {
+                'type': 'structure',
+                'members': {
+                    'Key': {'shape': 'StringType'},
+                    'LastModified': {'shape': 'TimestampType'},
+                    'Size': {'shape': 'IntegerType'},
+                    'Owner': {'shape': 'Owner'},
+                },
+            },
+            'Owner': {
+                'type': 'structure',
+                'members': {'ID': {'shape': 'StringType'}},
+            },
+            'VersionList': {
+                'type': 'list',
+                'member': {'shape': 'Version', 'locationName': 'Version'},
+                'flattened': True,
+            },
+            'PrefixList': {'type': 'list', 'member': {'shape': 'StringType'}},
+            'IntegerMap': {
+                'type': 'map',
+                'key': {'shape': 'StringType'},
+                'value': {'shape': 'IntegerType'},
+            },
+            'StringType': {'type': 'string'},
+            'BooleanType': {'type': 'boolean'},
+            'IntegerType': {'type': 'integer'},
+            'TimestampType': {'type': 'timestamp'},
+        }
+        resolver = model.ShapeResolver(self.shapes)
+        self.output_shape = resolver.get_shape_by_name('OutputShape')
+        version = (
+            b'<Version><Key>key%d</Key>'
+            b'<LastModified>2014-01-01T00:00:00Z</LastModified>'
+            b'<Size>%d</Size><Owner><ID>owner</ID></Owner>'
+            b'<Unknown><Nested>ignored</Nested></Unknown></Version>'
+        )
+        self.members = b''.join(version % (i, i) for i in range(3)) + (
+            b'<Prefixes><member>a/</member><member>b/</member></Prefixes>'
+            b'<Attributes><entry><key>a</key><value>1</value></entry>'
+            b'</Attributes><IsTruncated>true</IsTruncated>'
+        )
+
+    def assert_streaming_matches_dom(self, protocol, body, **kwargs):
+        response = {
+            'body': body,
+            'headers': {'x-amz-header': 'header'},
+            'status_code': 200,
+        }
+        parser_cls = parsers.PROTOCOL_PARSERS[protocol]
+        expected = parser_cls(**kwargs).parse(response, self.output_shape)
+        streaming = parser_cls(stream_xml=True, **kwargs)
+        self.assertEqual(
+            streaming.parse(response, self.output_shape), expected
+        )
+        return expected
+
+    def test_rest_xml(self):
+        body = b'<OutputShape>' + self.members + b'</OutputShape>'
+        parsed = self.assert_streaming_matches_dom('rest-xml', body)
+        self.assertEqual(len(parsed['Versions']), 3)
+        self.assertEqual(parsed['Versions'][2]['Size'], 2)
+        self.assertEqual(parsed['Versions'][0]['Owner'], {'ID': 'owner'})
+        self.assertEqual(parsed['Prefixes'], ['a/', 'b/'])
+        self.assertEqual(parsed['Attributes'], {'a': 1})
+        self.assertIs(parsed['IsTruncated'], True)
+        self.assertEqual(parsed['Header'], 'header')
+
+    def test_rest_xml_compiled(self):
+        body = b'<OutputShape>' + self.members + b'</OutputShape>'
+        self.assert_streaming_matches_dom('rest-xml', body, compiled=True)
+
+    def test_query(self):
+        self.shapes['OutputShape']['resultWrapper'] = 'OperationResult'
+        resolver = model.ShapeResolver(self.shapes)
+        self.output_shape = resolver.get_shape_by_name('OutputShape')
+        body = (
+            b'<OperationResponse><OperationResult>'
+            + self.members
+            + b'</OperationResult><ResponseMetadata>'
+            b'<RequestId>request-id</RequestId></ResponseMetadata>'
+            b'</OperationResponse>'
+        )
+        parsed = self.assert_streaming_matches_dom('query', body)
+        self.assertEqual(len(parsed['Versions']), 3)
+        self.assertEqual(parsed['ResponseMetadata']['RequestId'], 'request-id')
+
+    def test_ec2(self):
+        body = (
+            b'<OperationResponse><requestId>request-id</requestId>'
+            + self.members
+            + b'</OperationResponse>'
+        )
+        parsed = self.assert_streaming_matches_dom('ec2', body)
+        self.assertEqual(len(parsed['Versions']), 3)
+        self.assertEqual(parsed['ResponseMetadata']['RequestId'], 'request-id')
+
+    def test_reads_file_like_body_in_chunks(self):
+        body = b'<OutputShape>' + self.members + b'</OutputShape>'
+        parser = parsers.RestXMLParser(stream_xml=True)
+        parser.XML_STREAM_CHUNK_SIZE = 7
+        expected = parsers.RestXMLParser()._parse_body(body, self.output_shape)
+        self.assertEqual(
+            parser._parse_body(io.BytesIO(body), self.output_shape), expected
+        )
+
+    def test_discards_parsed_elements(self):
+        body = (
+            b'<OperationResponse>'
+            + self.members
+            + b'<ResponseMetadata><RequestId>request-id</RequestId>'
+            b'</ResponseMetadata></OperationResponse>'
+        )
+        parser = parsers.QueryParser(stream_xml=True)
+        members = parser._get_stream_members(self.output_shape)
+        root, parsed = parser._parse_xml_stream(body, members)
+        self.assertEqual(len(parsed['Versions']), 3)
+        # Only the children that aren't part of the output shape are kept.
+        self.assertEqual([child.tag for child in root], ['ResponseMetadata'])
+        self.assertEqual(len(root[0]), 1)
+
+    def test_invalid_xml(self):
+        parser = parsers.RestXMLParser(stream_xml=True)
+        with self.assertRaises(parsers.ResponseParserError):
+            parser.parse(
+                {
+                    'body': b'<OutputShape><IsTruncated>',
+                    'headers': {},
+                    'status_code': 200,
+                },
+                self.output_shape,
+            )
+
+
+class TestLazyParsers(unittest.TestCase):
+    def setUp(self):
+        self.shapes = {
+            'OutputShape': {
+                'type': 'structure',
+                'members': {
+                    'Items': {'shape': 'ItemList'},
+                    'Count': {'shape': 'IntegerType'},
+                    'Created': {'shape': 'TimestampType'},
+                    'Tags': {'shape': 'TagMap'},
+                },
+            },
+            'Item': {
+                'type': 'structure',
+                'members': {
+                    'Name': {'shape': 'StringType'},
+                    'Modified': {'shape': 'TimestampType'},
+                },
+            },
+            'ItemList': {
+                'type': 'list',
+                'member': {'shape': 'Item', 'locationName': 'Item'},
+            },
+            'TagMap': {
+                'type': 'map',
+                'key': {'shape': 'StringType'},
+                'value': {'shape': 'Item'},
+            },
+            'StringType': {'type': 'string'},
+            'IntegerType': {'type': 'integer'},
+            'TimestampType': {'type': 'timestamp'},
+        }
+        resolver = model.ShapeResolver(self.shapes)
+        self.output_shape = resolver.get_shape_by_name('OutputShape')
+        self.timestamp_parser = mock.Mock(
+            side_effect=parsers.DEFAULT_TIMESTAMP_PARSER
+        )
+        self.json_body = (
+            b'{"Items": [{"Name": "a", "Modified": 1407538750}, '
+            b'{"Name": "b", "Modified": 1407538751}], "Count": 2, '
+            b'"Created": 1407538750, '
+            b'"Tags": {"t": {"Name": "c", "Modified": 1407538752}}}'
+        )
+        self.xml_body = (
+            b'<OutputShape><Items><Item><Name>a</Name>'
+            b'<Modified>2014-01-01T00:00:00Z</Modified></Item></Items>'
+            b'<Count>1</Count><Created>2014-01-01T00:00:00Z</Created>'
+            b'<Tags><entry><key>t</key><value><Name>c</Name></value>'
+            b'</entry></Tags></OutputShape>'
+        )
+
+    def parse(self, protocol, body, **kwargs):
+        parser = parsers.PROTOCOL_PARSERS[protocol](
+            timestamp_parser=self.timestamp_parser, **kwargs
+        )
+        return parser.parse(
+            {
+                'body': body,
+                'headers': {'x-amzn-requestid': 'request-id'},
+                'status_code': 200,
+            },
+            self.output_shape,
+        )
+
+    def test_members_parsed_on_first_access(self):
+        parsed = self.parse('json', self.json_body, lazy=True)
+        self.assertEqual(parsed['Count'], 2)
+        self.timestamp_parser.assert_not_called()
+        items = parsed['Items']
+        self.timestamp_parser.assert_not_called()
+        self.assertEqual(items[1]['Name'], 'b')
+        self.assertEqual(
+            items[1]['Modified'],
+            datetime.datetime(2014, 8, 8, 22, 59, 11, tzinfo=tzutc()),
+        )
+        self.assertEqual(self.timestamp_parser.call_count, 1)
+        # Parsed values replace the unparsed ones.
+        self.assertIs(parsed['Items'], items)
+        self.assertEqual(self.timestamp_parser.call_count, 1)
+
+    def test_lazy_json_matches_eager(self):
+        expected = self.parse('json', self.json_body)
+        self.assertEqual(
+            self.parse('json', self.json_body, lazy=True), expected
+        )
+
+    def test_lazy_rest_xml_matches_eager(self):
+        expected = self.parse('rest-xml', self.xml_body)
+        parsed = self.parse('rest-xml', self.xml_body, lazy=True)
+        # Body members are copied into the response without parsing them.
+        self.assertIsInstance(
+            dict.__getitem__(parsed, 'Items'), parsers._LazyValue
+        )
+        self.assertEqual(parsed, expected)
+
+    def test_dict_compatibility(self):
+        expected = self.parse('json', self.json_body)
+        for convert in (
+            dict,
+            lambda parsed: {**parsed},
+            lambda parsed: dict(parsed.items()),
+            lambda parsed: dict(zip(parsed.keys(), parsed.values())),
+            copy.copy,
+            copy.deepcopy,
+            lambda parsed: parsed.copy(),
+            lambda parsed: json.loads(json.dumps(parsed, default=str)),
+        ):
+            parsed = self.parse('json', self.json_body, lazy=True)
+            self.assertIsInstance(parsed, dict)
+            self.assertEqual(
+                json.dumps(convert(parsed), default=str, sort_keys=True),
+                json.dumps(expected, default=str, sort_keys=True),
+            )
+
+    def test_dict_methods_return_parsed_values(self):
+        parsed = self.parse('json', self.json_body, lazy=True)
+        self.assertEqual(parsed.get('Created').year, 2014)
+        self.assertIsNone(parsed.get('Missing'))
+        self.assertEqual(parsed.setdefault('Tags')['t']['Name'], 'c')
+        self.assertEqual(parsed.pop('Items')[0]['Name'], 'a')
+        self.assertEqual(parsed.pop('Items', 'default'), 'default')
+        self.assertNotIn('_LazyValue', repr(parsed))
+        self.assertNotIn('_LazyValue', repr(parsed.popitem()))
+
+    def test_lazy_parse_plans_not_shared_with_eager(self):
+        factory = parsers.ResponseParserFactory()
+        factory.set_parser_defaults(compiled=True)
+        eager_plans = factory.create_parser('json')._compiled_shapes
+        factory.set_parser_defaults(lazy=True)
+        lazy_plans = factory.create_parser('json')._compiled_shapes
+        self.assertIsNot(eager_plans, lazy_plans)
+
 
 class TestCanDecorateResponseParsing(unittest.TestCase):
     def setUp(self):
@@ -142,7 +142,8 @@ def _compliance_tests(test_type=None):
 @pytest.mark.parametrize(
     "json_description, case, basename", _compliance_tests(TestType.INPUT)
 )
-def test_input_compliance(json_description, case, basename):
+@pytest.mark.parametrize("compiled", [False, True])
+def test_input_compliance(json_description, case, basename, compiled):
     service_description = copy.deepcopy(json_description)
     service_description['operations'] = {
         case.get('given', {}).get('name', 'OperationName'): case,
@@ -153,7 +154,7 @@ def test_input_compliance(json_description, case, basename):
         protocol_serializer = PROTOCOL_SERIALIZERS[protocol_type]
     except KeyError:
         raise RuntimeError(f"Unknown protocol: {protocol_type}")
-    serializer = protocol_serializer()
+    serializer = protocol_serializer(compiled=compiled)
     serializer.MAP_TYPE = OrderedDict
     operation_model = OperationModel(case['given'], model)
     case['params'] = _convert_strings_to_special_float(case['params'])
@@ -197,8 +198,14 @@ class MockRawResponse:
 @pytest.mark.parametrize(
     "json_description, case, basename", _compliance_tests(TestType.OUTPUT)
 )
-def test_output_compliance(json_description, case, basename):
+@pytest.mark.parametrize(
+    "parser_kwargs",
+    [{}, {'compiled': True}, {'stream_xml': True}, {'lazy': True}],
+    ids=['default', 'compiled', 'stream_xml', 'lazy'],
+)
+def test_output_compliance(json_description, case, basename, parser_kwargs):
     service_description = copy.deepcopy(json_description)
+    case = copy.deepcopy(case)
     operation_name = case.get('given', {}).get('name', 'OperationName')
     service_description['operations'] = {
         operation_name: case,
@@ -209,7 +216,7 @@ def test_output_compliance(json_description, case, basename):
         operation_model = OperationModel(case['given'], model)
         protocol = model.metadata['protocol']
         parser = PROTOCOL_PARSERS[protocol](
-            timestamp_parser=_compliance_timestamp_parser
+            timestamp_parser=_compliance_timestamp_parser, **parser_kwargs
         )
         # We load the json as utf-8, but the response parser is at the
         # botocore boundary, so it expects to work with bytes.
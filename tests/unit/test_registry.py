@@ -0,0 +1,130 @@
+# Copyright 2026 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You
+# may not use this file except in compliance with the License. A copy of
+# the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "license" file accompanying this file. This file is
+# distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific
+# language governing permissions and limitations under the License.
+import gc
+import threading
+from collections import OrderedDict
+
+from botocore.registry import SharedModelRegistry, get_shared_model_registry
+from tests import create_session, mock, unittest
+
+
+class SharedObject:
+    pass
+
+
+class TestSharedModelRegistry(unittest.TestCase):
+    def setUp(self):
+        self.registry = SharedModelRegistry()
+
+    def test_factory_called_once_per_key(self):
+        factory = mock.Mock(side_effect=SharedObject)
+        first = self.registry.get_or_create('kind', ('a',), factory)
+        second = self.registry.get_or_create('kind', ('a',), factory)
+        self.assertIs(first, second)
+        self.assertEqual(factory.call_count, 1)
+
+    def test_keys_are_separated_by_kind(self):
+        first = self.registry.get_or_create('kind', ('a',), SharedObject)
+        second = self.registry.get_or_create('other', ('a',), SharedObject)
+        self.assertIsNot(first, second)
+
+    def test_entries_evicted_when_unreferenced(self):
+        obj = self.registry.get_or_create('kind', ('a',), SharedObject)
+        self.assertEqual(self.registry.get_stats()['kind']['cached'], 1)
+        del obj
+        gc.collect()
+        self.assertEqual(self.registry.get_stats()['kind']['cached'], 0)
+        factory = mock.Mock(side_effect=SharedObject)
+        self.registry.get_or_create('kind', ('a',), factory)
+        self.assertEqual(factory.call_count, 1)
+
+    def test_unreferenceable_objects_are_not_shared(self):
+        first = self.registry.get_or_create('kind', ('a',), dict)
+        second = self.registry.get_or_create('kind', ('a',), dict)
+        self.assertIsNot(first, second)
+
+    def test_stats(self):
+        obj = self.registry.get_or_create('kind', ('a',), SharedObject)
+        self.registry.get_or_create('kind', ('a',), SharedObject)
+        self.registry.get_or_create('kind', ('a',), SharedObject)
+        self.assertEqual(
+            self.registry.get_stats(),
+            {'kind': {'hits': 2, 'misses': 1, 'cached': 1, 'size': 1}},
+        )
+        self.registry.clear()
+        self.assertEqual(self.registry.get_stats(), {})
+        self.assertIsNotNone(obj)
+
+    def test_stats_sum_size_estimates_of_cached_objects(self):
+        first = self.registry.get_or_create(
+            'kind', ('a',), SharedObject, size=lambda obj: 10
+        )
+        second = self.registry.get_or_create(
+            'kind', ('b',), SharedObject, size=lambda obj: 5
+        )
+        self.assertEqual(self.registry.get_stats()['kind']['size'], 15)
+        del second
+        gc.collect()
+        self.assertEqual(self.registry.get_stats()['kind']['size'], 10)
+        self.assertIsNotNone(first)
+
+    def test_stats_with_unhashable_objects(self):
+        obj = self.registry.get_or_create(
+            'kind', ('a',), lambda: OrderedDict(a=1, b=2), size=len
+        )
+        self.assertEqual(self.registry.get_stats()['kind']['size'], 2)
+        self.assertIsNotNone(obj)
+
+    def test_stats_with_shared_client_models(self):
+        session = create_session()
+        session.set_config_variable('share_service_models', True)
+        registry = get_shared_model_registry()
+        registry.clear()
+        self.addCleanup(registry.clear)
+        client = session.create_client(
+            's3',
+            region_name='us-west-2',
+            aws_access_key_id='foo',
+            aws_secret_access_key='bar',
+        )
+        stats = registry.get_stats()
+        service_model = client.meta.service_model
+        self.assertEqual(
+            stats['service-model']['size'], len(service_model.shape_names)
+        )
+        self.assertEqual(
+            stats['client-class']['size'],
+            len(service_model.operation_names),
+        )
+        self.assertEqual(stats['endpoint-rule-set']['cached'], 1)
+        self.assertEqual(stats['partitions']['cached'], 1)
+
+    def test_concurrent_creation_returns_single_object(self):
+        results = []
+        barrier = threading.Barrier(4)
+
+        def create():
+            barrier.wait()
+            results.append(
+                self.registry.get_or_create('kind', ('a',), SharedObject)
+            )
+
+        threads = [threading.Thread(target=create) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len({id(result) for result in results}), 1)
+
+    def test_global_registry_is_singleton(self):
+        self.assertIs(get_shared_model_registry(), get_shared_model_registry())
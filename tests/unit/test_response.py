@@ -10,6 +10,7 @@
 # distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
+import asyncio
 import datetime
 from io import BytesIO
 
@@ -303,6 +304,57 @@ class FakeRawResponse(BytesIO):
             yield chunk
 
 
+class FakeAsyncRawResponse(BytesIO):
+    async def read(self, amt=None):
+        return super().read(amt)
+
+
+class TestAsyncStreamingBody(unittest.TestCase):
+    def test_validates_content_length(self):
+        body = FakeAsyncRawResponse(b'1234567890')
+        stream = response.AsyncStreamingBody(body, content_length=10)
+        self.assertEqual(asyncio.run(stream.read()), b'1234567890')
+
+    def test_invalid_length(self):
+        body = FakeAsyncRawResponse(b'123456789')
+        stream = response.AsyncStreamingBody(body, content_length=10)
+        self.assertEqual(asyncio.run(stream.read(9)), b'123456789')
+        with self.assertRaises(IncompleteReadError):
+            asyncio.run(stream.read(9))
+
+    def test_iteration(self):
+        body = FakeAsyncRawResponse(b'a' * 2000)
+        stream = response.AsyncStreamingBody(body, content_length=2000)
+
+        async def collect():
+            return [chunk async for chunk in stream]
+
+        self.assertEqual(asyncio.run(collect()), [b'a' * 1024, b'a' * 976])
+
+    def test_iter_lines(self):
+        body = FakeAsyncRawResponse(b'1234567890\n1234567890\n12345')
+        stream = response.AsyncStreamingBody(body, content_length=27)
+
+        async def collect():
+            return [line async for line in stream.iter_lines(chunk_size=4)]
+
+        self.assertEqual(
+            asyncio.run(collect()), [b'1234567890', b'1234567890', b'12345']
+        )
+
+    def test_context_manager_closes_stream(self):
+        body = FakeAsyncRawResponse(b'1234567890')
+
+        async def read():
+            stream = response.AsyncStreamingBody(body, content_length=10)
+            async with stream as entered:
+                self.assertIs(entered, stream)
+                return await stream.read()
+
+        self.assertEqual(asyncio.run(read()), b'1234567890')
+        self.assertTrue(body.closed)
+
+
 class TestGetResponse(BaseResponseTest):
     maxDiff = None
 
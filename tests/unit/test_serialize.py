@@ -27,7 +27,7 @@ from botocore.serialize import (
     TIMESTAMP_PRECISION_DEFAULT,
     TIMESTAMP_PRECISION_MILLISECOND,
 )
-from tests import unittest
+from tests import mock, unittest
 
 
 class BaseModelWithBlob(unittest.TestCase):
@@ -793,3 +793,163 @@ class TestRpcV2CBORHostPrefix(unittest.TestCase):
         serialized = serializer.serialize_to_request(params, operation_model)
 
         self.assertNotIn('host_prefix', serialized)
+
+
+class TestCompiledSerializers(unittest.TestCase):
+    def setUp(self):
+        self.model = {
+            'metadata': {
+                'protocol': 'json',
+                'apiVersion': '2014-01-01',
+                'jsonVersion': '1.0',
+                'targetPrefix': 'foo',
+            },
+            'documentation': '',
+            'operations': {
+                'TestOperation': {
+                    'name': 'TestOperation',
+                    'http': {
+                        'method': 'POST',
+                        'requestUri': '/',
+                    },
+                    'input': {'shape': 'InputShape'},
+                }
+            },
+            'shapes': {
+                'InputShape': {
+                    'type': 'structure',
+                    'members': {
+                        'Node': {'shape': 'Node'},
+                        'Timestamp': {'shape': 'TimestampType'},
+                        'Blobs': {'shape': 'BlobList'},
+                        'Attributes': {'shape': 'FloatMap'},
+                        'Flag': {'shape': 'BooleanType'},
+                        'Renamed': {
+                            'shape': 'StringType',
+                            'locationName': 'renamed',
+                        },
+                    },
+                },
+                'Node': {
+                    'type': 'structure',
+                    'members': {
+                        'Name': {'shape': 'StringType'},
+                        'Children': {'shape': 'NodeList'},
+                    },
+                },
+                'NodeList': {'type': 'list', 'member': {'shape': 'Node'}},
+                'BlobList': {'type': 'list', 'member': {'shape': 'BlobType'}},
+                'FloatMap': {
+                    'type': 'map',
+                    'key': {'shape': 'StringType'},
+                    'value': {'shape': 'FloatType'},
+                },
+                'StringType': {'type': 'string'},
+                'BooleanType': {'type': 'boolean'},
+                'BlobType': {'type': 'blob'},
+                'FloatType': {'type': 'float'},
+                'TimestampType': {'type': 'timestamp'},
+            },
+        }
+        self.params = {
+            'Node': {
+                'Name': 'root',
+                'Children': [
+                    {'Name': 'child', 'Children': [{'Name': 'grandchild'}]},
+                    {'Name': 'leaf'},
+                ],
+            },
+            'Timestamp': datetime.datetime(2014, 1, 1, 12, 12, 12),
+            'Blobs': [b'foo', 'bar'],
+            'Attributes': {'a': 1.5, 'b': float('inf')},
+            'Flag': False,
+            'Renamed': 'value',
+        }
+
+    def serialize_to_request(self, protocol, compiled, params=None):
+        self.model['metadata']['protocol'] = protocol
+        service_model = ServiceModel(self.model)
+        request_serializer = serialize.create_serializer(
+            protocol, compiled=compiled
+        )
+        return request_serializer.serialize_to_request(
+            self.params if params is None else params,
+            service_model.operation_model('TestOperation'),
+        )
+
+    def assert_compiled_matches_interpreted(self, protocol):
+        interpreted = self.serialize_to_request(protocol, compiled=False)
+        compiled = self.serialize_to_request(protocol, compiled=True)
+        self.assertEqual(compiled, interpreted)
+
+    def test_json(self):
+        self.assert_compiled_matches_interpreted('json')
+
+    def test_rest_json(self):
+        self.assert_compiled_matches_interpreted('rest-json')
+
+    def test_query(self):
+        self.assert_compiled_matches_interpreted('query')
+
+    def test_ec2(self):
+        self.assert_compiled_matches_interpreted('ec2')
+
+    def test_rest_xml_ignores_compiled_mode(self):
+        self.model['shapes']['InputShape']['locationName'] = 'Input'
+        self.assert_compiled_matches_interpreted('rest-xml')
+
+    def test_compiled_functions_are_reused(self):
+        service_model = ServiceModel(self.model)
+        operation_model = service_model.operation_model('TestOperation')
+        request_serializer = serialize.JSONSerializer(compiled=True)
+        request_serializer.serialize_to_request(
+            {'Flag': True}, operation_model
+        )
+        input_shape = operation_model.input_shape
+        compiled = request_serializer._get_compiled(input_shape)
+        request_serializer.serialize_to_request(
+            {'Flag': True}, operation_model
+        )
+        self.assertIs(request_serializer._get_compiled(input_shape), compiled)
+
+    def test_compiled_functions_published_once_complete(self):
+        # Serializers are shared by threads, so a structure's function must
+        # not be visible before the functions of its members are.
+        operation_model = ServiceModel(self.model).operation_model(
+            'TestOperation'
+        )
+        for serializer_cls in (
+            serialize.QuerySerializer,
+            serialize.JSONSerializer,
+        ):
+            request_serializer = serializer_cls(compiled=True)
+            compile_blob = request_serializer._compile_type_blob
+            published = []
+
+            def record_published(shape):
+                published.append(
+                    [
+                        s.name
+                        for s in request_serializer._compiled_shapes
+                        if s.type_name == 'structure'
+                    ]
+                )
+                return compile_blob(shape)
+
+            with mock.patch.object(
+                request_serializer, '_compile_type_blob', record_published
+            ):
+                request_serializer.serialize_to_request(
+                    self.params, operation_model
+                )
+            self.assertEqual(published, [[]])
+            self.assertIn(
+                operation_model.input_shape,
+                request_serializer._compiled_shapes,
+            )
+
+    def test_compiled_mode_still_validates(self):
+        with self.assertRaises(ParamValidationError):
+            self.serialize_to_request(
+                'json', compiled=True, params={'Flag': 'not-a-boolean'}
+            )
@@ -29,7 +29,9 @@ from botocore import (
     register_initializer,
     unregister_initializer,
 )
+from botocore.asynchttpsession import AsyncioHTTPSession
 from botocore.configprovider import ConfigChainFactory
+from botocore.endpoint import AsyncEndpoint
 from botocore.hooks import HierarchicalEmitter
 from botocore.model import ServiceModel
 from botocore.paginate import PaginatorModel
@@ -587,6 +589,37 @@ class TestCreateClient(BaseSessionTest):
             auth_token=mock.ANY,
         )
 
+    def test_create_async_client(self):
+        client = self.session.create_async_client(
+            'sts',
+            'us-west-2',
+            aws_access_key_id='foo',
+            aws_secret_access_key='bar',
+        )
+        self.assertIsInstance(client, botocore.client.AsyncBaseClient)
+        self.assertIsInstance(client._endpoint, AsyncEndpoint)
+        self.assertIsInstance(
+            client._endpoint.http_session, AsyncioHTTPSession
+        )
+
+    @mock.patch('botocore.client.ClientCreator')
+    def test_create_async_client_uses_client_creator(self, client_creator):
+        config = botocore.config.Config(region_name='us-west-2')
+        self.session.create_async_client('sts', config=config)
+        client_creator.return_value.create_async_client.assert_called_with(
+            service_name=mock.ANY,
+            region_name=mock.ANY,
+            is_secure=mock.ANY,
+            endpoint_url=mock.ANY,
+            verify=mock.ANY,
+            credentials=mock.ANY,
+            scoped_config=mock.ANY,
+            client_config=config,
+            api_version=mock.ANY,
+            auth_token=mock.ANY,
+        )
+        client_creator.return_value.create_client.assert_not_called()
+
     @mock.patch('botocore.client.ClientCreator')
     def test_create_client_with_default_client_config(self, client_creator):
         config = botocore.config.Config()
@@ -1036,6 +1036,91 @@ class TestGenerateUrl(unittest.TestCase):
         )
 
 
+class TestGenerateUrls(unittest.TestCase):
+    def setUp(self):
+        self.session = botocore.session.get_session()
+        self.session.set_credentials('access_key', 'secret_key')
+        self.client = self.session.create_client(
+            's3',
+            region_name='us-east-1',
+            config=Config(signature_version='s3v4'),
+        )
+        self.requests = [
+            {
+                'ClientMethod': 'get_object',
+                'Params': {'Bucket': bucket, 'Key': key},
+            }
+            for bucket in ('mybucket', 'myotherbucket')
+            for key in ('mykey', 'myotherkey')
+        ]
+
+    def generate_presigned_urls_per_call(self, requests):
+        return [
+            self.client.generate_presigned_url(**request)
+            for request in requests
+        ]
+
+    @FreezeTime(botocore.auth.datetime, date=DATE)
+    def test_generate_presigned_urls(self):
+        urls = list(self.client.generate_presigned_urls(self.requests))
+        self.assertEqual(
+            urls, self.generate_presigned_urls_per_call(self.requests)
+        )
+
+    @FreezeTime(botocore.auth.datetime, date=DATE)
+    def test_generate_presigned_urls_with_expires_and_http_method(self):
+        self.requests[0]['ExpiresIn'] = 20
+        self.requests[1]['HttpMethod'] = 'PUT'
+        urls = list(self.client.generate_presigned_urls(self.requests))
+        self.assertIn('X-Amz-Expires=20&', urls[0])
+        self.assertEqual(
+            urls, self.generate_presigned_urls_per_call(self.requests)
+        )
+
+    @FreezeTime(botocore.auth.datetime, date=DATE)
+    def test_generate_presigned_urls_with_arn(self):
+        self.requests[0]['Params']['Bucket'] = (
+            'arn:aws:s3:us-west-2:123456789012:accesspoint/myendpoint'
+        )
+        urls = list(self.client.generate_presigned_urls(self.requests))
+        self.assertTrue(
+            urls[0].startswith(
+                'https://myendpoint-123456789012.s3-accesspoint.'
+                'us-west-2.amazonaws.com/mykey?'
+            )
+        )
+        self.assertEqual(
+            urls, self.generate_presigned_urls_per_call(self.requests)
+        )
+
+    def test_generate_presigned_urls_resolves_endpoint_per_bucket(self):
+        with mock.patch.object(
+            self.client,
+            '_resolve_endpoint_ruleset',
+            wraps=self.client._resolve_endpoint_ruleset,
+        ) as resolve_endpoint_ruleset:
+            urls = list(self.client.generate_presigned_urls(self.requests))
+        self.assertEqual(len(urls), 4)
+        self.assertEqual(resolve_endpoint_ruleset.call_count, 2)
+
+    def test_generate_presigned_urls_is_lazy(self):
+        requests = iter(self.requests)
+        urls = self.client.generate_presigned_urls(requests)
+        self.assertIn('/mykey?', next(urls))
+        self.assertEqual(len(list(requests)), 3)
+
+    def test_generate_presigned_urls_unknown_method_name(self):
+        urls = self.client.generate_presigned_urls(
+            [{'ClientMethod': 'getobject'}]
+        )
+        with self.assertRaises(UnknownClientMethodError):
+            next(urls)
+
+    def test_generate_presigned_urls_non_s3_client(self):
+        client = self.session.create_client('ec2', 'us-west-2')
+        self.assertFalse(hasattr(client, 'generate_presigned_urls'))
+
+
 class TestGeneratePresignedPost(unittest.TestCase):
     def setUp(self):
         self.session = botocore.session.get_session()
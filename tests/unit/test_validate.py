@@ -5,7 +5,7 @@ from datetime import datetime
 from botocore import validate
 from botocore.model import ShapeResolver
 from botocore.validate import ParamValidator
-from tests import unittest
+from tests import mock, unittest
 
 BOILER_PLATE_SHAPES = {'StringType': {'type': 'string'}}
 
@@ -762,3 +762,127 @@ class TestShapeHasConstraints(BaseTestValidate):
         shapes = {'TestShape': shape_model}
         resolver = ShapeResolver(shapes)
         return resolver.get_shape_by_name('TestShape')
+
+
+class TestCompiledValidators(unittest.TestCase):
+    def setUp(self):
+        self.shapes = {
+            'Input': {
+                'type': 'structure',
+                'required': ['Records'],
+                'members': {
+                    'Records': {'shape': 'RecordList'},
+                    'Attributes': {'shape': 'AttributeMap'},
+                    'Node': {'shape': 'Node'},
+                    'Timestamp': {'shape': 'TimestampType'},
+                    'Unused': {'shape': 'IncompleteList'},
+                },
+            },
+            'Record': {
+                'type': 'structure',
+                'required': ['Data'],
+                'members': {
+                    'Data': {'shape': 'BlobType'},
+                    'Key': {'shape': 'KeyType'},
+                    'Size': {'shape': 'SizeType'},
+                    'Ratio': {'shape': 'DoubleType'},
+                    'Flag': {'shape': 'BooleanType'},
+                },
+            },
+            'Node': {
+                'type': 'structure',
+                'members': {'Children': {'shape': 'NodeList'}},
+            },
+            'RecordList': {
+                'type': 'list',
+                'member': {'shape': 'Record'},
+                'min': 1,
+            },
+            'NodeList': {'type': 'list', 'member': {'shape': 'Node'}},
+            'AttributeMap': {
+                'type': 'map',
+                'key': {'shape': 'KeyType'},
+                'value': {'shape': 'StringType'},
+            },
+            # A list without a member shape is only valid as long as it
+            # isn't used.
+            'IncompleteList': {'type': 'list'},
+            'KeyType': {'type': 'string', 'min': 1},
+            'SizeType': {'type': 'integer', 'min': 0},
+            'DoubleType': {'type': 'double'},
+            'BooleanType': {'type': 'boolean'},
+            'BlobType': {'type': 'blob'},
+            'StringType': {'type': 'string'},
+            'TimestampType': {'type': 'timestamp'},
+        }
+        self.input_shape = ShapeResolver(self.shapes).get_shape_by_name(
+            'Input'
+        )
+        self.validator = ParamValidator()
+        self.valid_params = {
+            'Records': [
+                {
+                    'Data': b'data',
+                    'Key': 'key',
+                    'Size': 0,
+                    'Ratio': decimal.Decimal('0.5'),
+                    'Flag': True,
+                },
+                {'Data': io.BytesIO(b'data'), 'Ratio': 1},
+            ],
+            'Attributes': {'a': 'b'},
+            'Node': {'Children': [{'Children': [{}]}]},
+            'Timestamp': '2014-01-01T00:00:00Z',
+        }
+
+    def test_valid_params_skip_detailed_validation(self):
+        with mock.patch.object(self.validator, '_validate') as walker:
+            report = self.validator.validate(
+                self.valid_params, self.input_shape
+            )
+        self.assertFalse(report.has_errors())
+        walker.assert_not_called()
+
+    def test_compiled_validators_are_cached(self):
+        self.validator.validate(self.valid_params, self.input_shape)
+        is_valid = self.validator._compiled_validators[self.input_shape]
+        self.validator.validate(self.valid_params, self.input_shape)
+        self.assertIs(
+            self.validator._compiled_validators[self.input_shape], is_valid
+        )
+
+    def test_invalid_params_report_detailed_errors(self):
+        invalid_params = [
+            ({}, 'Missing required parameter in input: "Records"'),
+            ({'Records': []}, 'Invalid length for parameter Records'),
+            ({'Records': [{}]}, 'Missing required parameter in Records[0]'),
+            ({'Records': [{'Data': 1}]}, 'Invalid type for parameter'),
+            (
+                {'Records': [{'Data': b'', 'Key': ''}]},
+                'Invalid length for parameter Records[0].Key',
+            ),
+            (
+                {'Records': [{'Data': b'', 'Size': -1}]},
+                'Invalid value for parameter Records[0].Size',
+            ),
+            (
+                {'Records': [{'Data': b'', 'Flag': 1}]},
+                'Invalid type for parameter Records[0].Flag',
+            ),
+            (
+                {'Records': [{'Data': b''}], 'Attributes': {'': 'b'}},
+                'Invalid length for parameter Attributes (key: )',
+            ),
+            (
+                {'Records': [{'Data': b''}], 'Node': {'Children': [[]]}},
+                'Invalid type for parameter Node.Children[0]',
+            ),
+            (
+                {'Records': [{'Data': b''}], 'Timestamp': 'invalid'},
+                'Invalid type for parameter Timestamp',
+            ),
+            ({'Records': [{'Data': b''}], 'Foo': 1}, 'Unknown parameter'),
+        ]
+        for params, expected in invalid_params:
+            report = self.validator.validate(params, self.input_shape)
+            self.assertIn(expected, report.generate_report())
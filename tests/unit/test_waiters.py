@@ -10,6 +10,8 @@
 # distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
+import asyncio
+import inspect
 import io
 import os
 
@@ -18,6 +20,7 @@ from botocore.exceptions import ClientError, WaiterConfigError, WaiterError
 from botocore.loaders import Loader
 from botocore.model import ServiceModel
 from botocore.waiter import (
+    AsyncWaiter,
     NormalizedOperationMethod,
     SingleWaiterConfig,
     Waiter,
@@ -733,6 +736,59 @@ class TestWaitersObjects(unittest.TestCase):
         self.assertEqual(operation_method.call_count, 2)
 
 
+class TestAsyncWaiter(unittest.TestCase):
+    def create_waiter(self, operation_method, max_attempts=3):
+        config = SingleWaiterConfig(
+            {
+                'operation': 'MyOperation',
+                'delay': 5,
+                'maxAttempts': max_attempts,
+                'acceptors': [
+                    {
+                        'state': 'success',
+                        'matcher': 'path',
+                        'argument': 'Foo',
+                        'expected': 'SUCCESS',
+                    }
+                ],
+            }
+        )
+        return AsyncWaiter(
+            'MyWaiter', config, NormalizedOperationMethod(operation_method)
+        )
+
+    def test_waits_until_acceptor_matches(self):
+        operation_method = mock.AsyncMock(
+            side_effect=[{'Foo': 'FAILURE'}, {'Foo': 'SUCCESS'}]
+        )
+        waiter = self.create_waiter(operation_method)
+        with mock.patch('asyncio.sleep') as sleep:
+            with mock.patch('time.sleep') as blocking_sleep:
+                asyncio.run(waiter.wait(Bar='bar'))
+        self.assertEqual(operation_method.await_count, 2)
+        operation_method.assert_awaited_with(Bar='bar')
+        sleep.assert_awaited_once_with(5)
+        blocking_sleep.assert_not_called()
+
+    def test_error_response_fails_waiter(self):
+        parsed_response = {'Error': {'Code': 'Foo', 'Message': 'bar'}}
+        operation_method = mock.AsyncMock(
+            side_effect=ClientError(parsed_response, 'MyOperation')
+        )
+        waiter = self.create_waiter(operation_method)
+        with self.assertRaises(WaiterError) as context:
+            asyncio.run(waiter.wait())
+        self.assertEqual(context.exception.last_response, parsed_response)
+
+    def test_max_attempts_exceeded(self):
+        operation_method = mock.AsyncMock(return_value={'Foo': 'FAILURE'})
+        waiter = self.create_waiter(operation_method, max_attempts=2)
+        with mock.patch('asyncio.sleep'):
+            with self.assertRaisesRegex(WaiterError, 'Max attempts exceeded'):
+                asyncio.run(waiter.wait(WaiterConfig={'MaxAttempts': 3}))
+        self.assertEqual(operation_method.await_count, 3)
+
+
 class TestCreateWaiter(unittest.TestCase):
     def setUp(self):
         self.waiter_config = {
@@ -780,6 +836,13 @@ class TestCreateWaiter(unittest.TestCase):
         )
         self.assertIsInstance(waiter, Waiter)
 
+    def test_can_create_async_waiter_from_client(self):
+        waiter = create_waiter_with_client(
+            'WaiterName', self.waiter_model, self.client, AsyncWaiter
+        )
+        self.assertIsInstance(waiter, AsyncWaiter)
+        self.assertTrue(inspect.iscoroutinefunction(waiter.wait))
+
     def test_waiter_class_name(self):
         waiter_name = 'WaiterName'
         waiter = create_waiter_with_client(